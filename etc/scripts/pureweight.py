@@ -3,6 +3,8 @@ from libPython.tnpClassUtils import mkdir
 import libPython.puReweighter as pu
 
 puType = 0
+### write the weights chunk by chunk (memory independent of the sample size)
+streaming = True
 
 #for sName in tnpSamples.Moriond18_94X.keys():    
 #    sample = tnpSamples.Moriond18_94X[sName]
@@ -32,5 +34,5 @@ for sName in tnpSamples.UL2016_preVFP.keys():
         elif puType == 2 : sample.set_puTree( dirout + '%s_%s.rho.puTree.root'  % (sample.name,tree) )
         sample.set_tnpTree(trees[tree]+'/fitter_tree')
         sample.dump()
-        pu.reweight(sample, puType )
+        pu.reweight(sample, puType, streaming = streaming )
     
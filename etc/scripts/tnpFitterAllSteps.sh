@@ -19,11 +19,18 @@ for flag in ${flags[@]}; do
     echo $flag
 #    python tnpEGM_fitter.py  $script --flag $flag --createBins
 #    python tnpEGM_fitter.py  $script --flag $flag --createHists
+    ### the MC fits go first: the data fits start from their results
+    python tnpEGM_fitter.py  $script --flag $flag --doFit --mcSig
     python tnpEGM_fitter.py  $script --flag $flag --doFit
     python tnpEGM_fitter.py  $script --flag $flag --doFit --mcSig --altSig
     python tnpEGM_fitter.py  $script --flag $flag --doFit --altSig
+    python tnpEGM_fitter.py  $script --flag $flag --doFit --mcSig --altBkg
     python tnpEGM_fitter.py  $script --flag $flag --doFit --altBkg
     python tnpEGM_fitter.py  $script --flag $flag --sumUp
 done
 
+### alternatively, run all the fits of all the flags with a single pool of workers
+### (the ROOT macros are compiled and loaded only once):
+# python tnpEGM_fitServer.py $script --flags ${flags[@]}
+
 
@@ -1,7 +1,83 @@
 #include "RooCBExGaussShape.h" 
+#include "RConfigure.h"
+
+#include <cmath>
+
+#ifdef R__HAS_VDT
+#include "vdt/exp.h"
+#endif
 
 ClassImp(RooCBExGaussShape) 
 
+/// named namespace: the dictionaries of the pdfs are parsed in the same
+/// interpreter, where helpers of anonymous namespaces would clash
+namespace RooCBExGaussShapeImpl {
+#ifdef R__HAS_VDT
+  inline double fastExp(double x) { return vdt::fast_exp(x); }
+#else
+  inline double fastExp(double x) { return std::exp(x); }
+#endif
+
+  /// shape shared by the scalar and batch evaluations
+  inline double cbExGaussShape(double m, double m0, double sigma, double alpha, double n, double sigma_2, double tailLeft) {
+    Double_t rval=0;
+
+    Double_t t = (m-m0)/sigma;
+    Double_t t0 = (m-m0)/sigma_2;
+    // if (alpha < 0){ 
+    //   t = -t;
+    //   t0 = -t0;
+    // }
+
+    Double_t absAlpha = fabs((Double_t)alpha);
+    if( tailLeft >= 0 ) {
+      if (t>0) {
+        rval= fastExp(-0.5*t0*t0);
+      }
+      else if (t > -absAlpha) {
+        rval= fastExp(-0.5*t*t);
+      }
+      else {
+        //      Double_t a =  TMath::Power(n/absAlpha,n)*exp(-0.5*absAlpha*absAlpha);
+        //      Double_t b= n/absAlpha - absAlpha; 
+        //      rval= a/TMath::Power(b - t, n);
+        Double_t a = fastExp(-0.5*absAlpha*absAlpha);
+        Double_t b = fastExp(n*(t+absAlpha));
+        rval = a*b;
+      }
+    } else {
+      //// rather fit high tail for n < 0
+      if (t0<0) {
+        rval= fastExp(-0.5*t*t);
+      }
+      else if (t0 < absAlpha) {
+        rval= fastExp(-0.5*t0*t0);
+      }
+      else {
+        Double_t absN = fabs((Double_t) n );
+        Double_t a =  TMath::Power(absN/absAlpha,absN)*fastExp(-0.5*absAlpha*absAlpha);
+        Double_t b= absN/absAlpha - absAlpha;
+        rval= a/TMath::Power(b + t0, absN);
+      }
+
+    }
+
+    return rval;
+  }
+
+  /// scalar parameters come as spans of size 1
+  template<class Span>
+  inline double at(const Span& s, size_t i) { return s.size() == 1 ? s[0] : s[i]; }
+
+  template<class Span>
+  void cbExGaussShapeBatch(double* output, size_t nEvents, const Span& m, const Span& m0, const Span& sigma,
+			   const Span& alpha, const Span& n, const Span& sigma_2, const Span& tailLeft) {
+    for( size_t i = 0; i < nEvents; i++ )
+      output[i] = cbExGaussShape( at(m,i), at(m0,i), at(sigma,i), at(alpha,i), at(n,i), at(sigma_2,i), at(tailLeft,i) );
+  }
+}
+
+
 RooCBExGaussShape::RooCBExGaussShape(const char *name, const char *title, 
 				     RooAbsReal& _m,
 				     RooAbsReal& _m0,
@@ -37,47 +113,24 @@ RooCBExGaussShape::RooCBExGaussShape(const RooCBExGaussShape& other, const char*
 
 Double_t RooCBExGaussShape::evaluate() const 
 { 
-  Double_t rval=0;
-
-  Double_t t = (m-m0)/sigma;
-  Double_t t0 = (m-m0)/sigma_2;
-  // if (alpha < 0){ 
-  //   t = -t;
-  //   t0 = -t0;
-  // }
-
-  Double_t absAlpha = fabs((Double_t)alpha);
-  if( tailLeft >= 0 ) {
-    if (t>0) {
-      rval= exp(-0.5*t0*t0);
-    }
-    else if (t > -absAlpha) {
-      rval= exp(-0.5*t*t);
-    }
-    else {
-      //      Double_t a =  TMath::Power(n/absAlpha,n)*exp(-0.5*absAlpha*absAlpha);
-      //      Double_t b= n/absAlpha - absAlpha; 
-      //      rval= a/TMath::Power(b - t, n);
-      Double_t a = exp(-0.5*absAlpha*absAlpha);
-      Double_t b = exp(n*(t+absAlpha));
-      rval = a*b;
-    }
-  } else {
-    //// rather fit high tail for n < 0
-    if (t0<0) {
-      rval= exp(-0.5*t*t);
-    }
-    else if (t0 < absAlpha) {
-      rval= exp(-0.5*t0*t0);
-    }
-    else {
-      Double_t absN = fabs((Double_t) n );
-      Double_t a =  TMath::Power(absN/absAlpha,absN)*exp(-0.5*absAlpha*absAlpha);
-      Double_t b= absN/absAlpha - absAlpha;
-      rval= a/TMath::Power(b + t0, absN);
-    }
+  return RooCBExGaussShapeImpl::cbExGaussShape( m, m0, sigma, alpha, n, sigma_2, tailLeft );
+}
 
-  }
 
-  return rval;
-} 
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+void RooCBExGaussShape::doEval(RooFit::EvalContext &ctx) const
+{
+  std::span<double> output = ctx.output();
+  RooCBExGaussShapeImpl::cbExGaussShapeBatch( output.data(), output.size(), ctx.at(m), ctx.at(m0), ctx.at(sigma), ctx.at(alpha), ctx.at(n), ctx.at(sigma_2), ctx.at(tailLeft) );
+}
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,30,0)
+void RooCBExGaussShape::computeBatch(double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const
+{
+  RooCBExGaussShapeImpl::cbExGaussShapeBatch( output, nEvents, dataMap.at(m), dataMap.at(m0), dataMap.at(sigma), dataMap.at(alpha), dataMap.at(n), dataMap.at(sigma_2), dataMap.at(tailLeft) );
+}
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+void RooCBExGaussShape::computeBatch(cudaStream_t*, double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const
+{
+  RooCBExGaussShapeImpl::cbExGaussShapeBatch( output, nEvents, dataMap.at(m), dataMap.at(m0), dataMap.at(sigma), dataMap.at(alpha), dataMap.at(n), dataMap.at(sigma_2), dataMap.at(tailLeft) );
+}
+#endif
@@ -11,6 +11,13 @@
 #include "RooAbsCategory.h"
 #include "TMath.h"
 #include "Riostream.h"
+#include "RVersion.h"
+
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+#include "RooFit/EvalContext.h"
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+#include "RooFit/Detail/DataMap.h"
+#endif
 
 class RooCBExGaussShape : public RooAbsPdf {
 public:
@@ -30,6 +37,15 @@ public:
   inline virtual TObject* clone(const char* newname) const { return new RooCBExGaussShape(*this,newname);}
   inline ~RooCBExGaussShape(){}
   Double_t evaluate() const ;
+
+  /// batch evaluation (the interface depends on the ROOT version)
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+  void doEval(RooFit::EvalContext &ctx) const override;
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,30,0)
+  void computeBatch(double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const override;
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+  void computeBatch(cudaStream_t*, double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const override;
+#endif
   
   ClassDef(RooCBExGaussShape, 2)
 
@@ -21,9 +21,69 @@
  *****************************************************************************/
 
 #include "RooCMSShape.h"
+#include "RConfigure.h"
+
+#include <cassert>
+#include <cmath>
+#include <complex>
+
+#ifdef R__HAS_VDT
+#include "vdt/exp.h"
+#endif
 
 ClassImp(RooCMSShape) 
 
+/// named namespace: the dictionaries of the pdfs are parsed in the same
+/// interpreter, where helpers of anonymous namespaces would clash
+namespace RooCMSShapeImpl {
+#ifdef R__HAS_VDT
+  inline double fastExp(double x) { return vdt::fast_exp(x); }
+#else
+  inline double fastExp(double x) { return std::exp(x); }
+#endif
+
+  /// shape shared by the scalar and batch evaluations
+  inline double cmsShape(double x, double alpha, double beta, double gamma, double peak) {
+    double erf = RooMath::erfc((alpha - x) * beta);
+    double u = (x - peak)*gamma;
+
+    if(u < -70) u = 1e20;
+    else if( u>70 ) u = 0;
+    else u = fastExp(-u);   //exponential decay
+    return erf*u;
+  }
+
+  /// scalar parameters come as spans of size 1
+  template<class Span>
+  inline double at(const Span& s, size_t i) { return s.size() == 1 ? s[0] : s[i]; }
+
+  template<class Span>
+  void cmsShapeBatch(double* output, size_t nEvents, const Span& x, const Span& alpha, const Span& beta, const Span& gamma, const Span& peak) {
+    for( size_t i = 0; i < nEvents; i++ )
+      output[i] = cmsShape( at(x,i), at(alpha,i), at(beta,i), at(gamma,i), at(peak,i) );
+  }
+
+  /// primitive of erfc((alpha-x)*beta)*exp(-(x-peak)*gamma) (the cutoffs of
+  /// evaluate() at |u| > 70 are not reached in the Z mass window)
+  double cmsShapePrimitive(double x, double alpha, double beta, double gamma, double peak) {
+    if( fabs(gamma) < 1e-9 ) {
+      double z = beta*(alpha - x);
+      return -( z*RooMath::erfc(z) - std::exp(-z*z)/TMath::Sqrt(TMath::Pi()) ) / beta;
+    }
+    double term1 = -std::exp(-gamma*(x - peak)) * RooMath::erfc(beta*(alpha - x));
+    double w = beta*(x - alpha) + gamma/(2*beta);
+    double term2;
+    if( w >= 0 ) {
+      /// exp(E)*erfc(w) written with erfcx(w) = exp(w^2)*erfc(w) to avoid overflows
+      double erfcx = RooMath::faddeeva(std::complex<double>(0,w)).real();
+      term2 = -std::exp(-gamma*(x - peak) - beta*beta*(x - alpha)*(x - alpha)) * erfcx;
+    } else {
+      term2 = -std::exp(-gamma*(alpha - peak) + gamma*gamma/(4*beta*beta)) * RooMath::erfc(w);
+    }
+    return (term1 + term2) / gamma;
+  }
+}
+
  RooCMSShape::RooCMSShape(const char *name, const char *title, 
                         RooAbsReal& _x,
                         RooAbsReal& _alpha,
@@ -55,11 +115,39 @@ ClassImp(RooCMSShape)
   // ENTER EXPRESSION IN TERMS OF VARIABLE ARGUMENTS HERE 
 
   //Double_t erf = TMath::Erfc((alpha - x) * beta);
-  Double_t erf = RooMath::erfc((alpha - x) * beta);
-  Double_t u = (x - peak)*gamma;
+  return RooCMSShapeImpl::cmsShape( x, alpha, beta, gamma, peak );
+ }
+
+
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+ void RooCMSShape::doEval(RooFit::EvalContext &ctx) const
+ {
+   std::span<double> output = ctx.output();
+   RooCMSShapeImpl::cmsShapeBatch( output.data(), output.size(), ctx.at(x), ctx.at(alpha), ctx.at(beta), ctx.at(gamma), ctx.at(peak) );
+ }
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,30,0)
+ void RooCMSShape::computeBatch(double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const
+ {
+   RooCMSShapeImpl::cmsShapeBatch( output, nEvents, dataMap.at(x), dataMap.at(alpha), dataMap.at(beta), dataMap.at(gamma), dataMap.at(peak) );
+ }
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+ void RooCMSShape::computeBatch(cudaStream_t*, double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const
+ {
+   RooCMSShapeImpl::cmsShapeBatch( output, nEvents, dataMap.at(x), dataMap.at(alpha), dataMap.at(beta), dataMap.at(gamma), dataMap.at(peak) );
+ }
+#endif
+
+
+ Int_t RooCMSShape::getAnalyticalIntegral(RooArgSet& allVars, RooArgSet& analVars, const char* /*rangeName*/) const
+ {
+   if( matchArgs(allVars,analVars,x) ) return 1;
+   return 0;
+ }
+
 
-  if(u < -70) u = 1e20;
-  else if( u>70 ) u = 0;
-  else u = exp(-u);   //exponential decay
-  return erf*u;
+ Double_t RooCMSShape::analyticalIntegral(Int_t code, const char* rangeName) const
+ {
+   assert(code==1);
+   return RooCMSShapeImpl::cmsShapePrimitive( x.max(rangeName), alpha, beta, gamma, peak )
+     -    RooCMSShapeImpl::cmsShapePrimitive( x.min(rangeName), alpha, beta, gamma, peak );
  } 
@@ -28,6 +28,13 @@
 #include "RooAbsReal.h"
 #include "TMath.h"
 #include "RooMath.h"
+#include "RVersion.h"
+
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+#include "RooFit/EvalContext.h"
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+#include "RooFit/Detail/DataMap.h"
+#endif
 
 class RooCMSShape : public RooAbsPdf {
 public:
@@ -43,6 +50,18 @@ public:
   inline virtual TObject* clone(const char* newname) const { return new RooCMSShape(*this,newname); }
   inline ~RooCMSShape() {}
   Double_t evaluate() const ;
+
+  /// batch evaluation (the interface depends on the ROOT version)
+#if ROOT_VERSION_CODE >= ROOT_VERSION(6,32,0)
+  void doEval(RooFit::EvalContext &ctx) const override;
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,30,0)
+  void computeBatch(double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const override;
+#elif ROOT_VERSION_CODE >= ROOT_VERSION(6,28,0)
+  void computeBatch(cudaStream_t*, double* output, size_t nEvents, RooFit::Detail::DataMap const& dataMap) const override;
+#endif
+
+  Int_t getAnalyticalIntegral(RooArgSet& allVars, RooArgSet& analVars, const char* rangeName=0) const ;
+  Double_t analyticalIntegral(Int_t code, const char* rangeName=0) const ;
   
 
   ClassDef(RooCMSShape,2);
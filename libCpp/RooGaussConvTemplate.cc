@@ -0,0 +1,91 @@
+/*****************************************************************************
+ * Description:
+ *   Convolution of a binned template with a gaussian resolution,
+ *   see RooGaussConvTemplate.h
+ *
+ *****************************************************************************/
+
+#include "RooGaussConvTemplate.h"
+#include "RooMath.h"
+
+#include <cassert>
+
+ClassImp(RooGaussConvTemplate)
+
+namespace {
+  /// gaussian cumulative function and its primitive
+  inline double gaussCdf(double z) { return 0.5*RooMath::erfc(-z/TMath::Sqrt2()); }
+  inline double gaussCdfPrimitive(double z) { return z*gaussCdf(z) + TMath::Exp(-0.5*z*z)/TMath::Sqrt(TMath::TwoPi()); }
+}
+
+ RooGaussConvTemplate::RooGaussConvTemplate(const char *name, const char *title,
+					    RooAbsReal& _x,
+					    RooAbsReal& _mean,
+					    RooAbsReal& _sigma,
+					    RooDataHist& _templ) :
+   RooAbsPdf(name,title),
+   x("x","x",this,_x),
+   mean("mean","mean",this,_mean),
+   sigma("sigma","sigma",this,_sigma)
+ {
+   /// the template is copied once, its bins do not depend on the fit parameters
+   for( int ib = 0; ib < _templ.numEntries(); ib++ ) {
+     const RooArgSet *row = _templ.get(ib);
+     double width  = _templ.binVolume();
+     double center = row->getRealValue(_x.GetName());
+     double w      = _templ.weight();
+     if( w < 0 ) w = 0;
+     binLow    .push_back( center - 0.5*width );
+     binHigh   .push_back( center + 0.5*width );
+     binDensity.push_back( w / width );
+   }
+ }
+
+
+ RooGaussConvTemplate::RooGaussConvTemplate(const RooGaussConvTemplate& other, const char* name):
+   RooAbsPdf(other,name),
+   x("x",this,other.x),
+   mean("mean",this,other.mean),
+   sigma("sigma",this,other.sigma),
+   binLow(other.binLow),
+   binHigh(other.binHigh),
+   binDensity(other.binDensity)
+ { }
+
+
+
+ Double_t RooGaussConvTemplate::evaluate() const
+ {
+   /// sum over the template bins of box x gaussian
+   double u   = (x - mean) / sigma;
+   double val = 0;
+   for( unsigned ib = 0; ib < binDensity.size(); ib++ ) {
+     if( binDensity[ib] == 0 ) continue;
+     val += binDensity[ib] * ( gaussCdf( u - binLow[ib]/sigma ) - gaussCdf( u - binHigh[ib]/sigma ) );
+   }
+   return val;
+ }
+
+
+ Int_t RooGaussConvTemplate::getAnalyticalIntegral(RooArgSet& allVars, RooArgSet& analVars, const char* /*rangeName*/) const
+ {
+   if( matchArgs(allVars,analVars,x) ) return 1;
+   return 0;
+ }
+
+
+ Double_t RooGaussConvTemplate::analyticalIntegral(Int_t code, const char* rangeName) const
+ {
+   assert(code==1);
+   double uMin = (x.min(rangeName) - mean) / sigma;
+   double uMax = (x.max(rangeName) - mean) / sigma;
+   double val  = 0;
+   for( unsigned ib = 0; ib < binDensity.size(); ib++ ) {
+     if( binDensity[ib] == 0 ) continue;
+     double zLow  = binLow[ib]  / sigma;
+     double zHigh = binHigh[ib] / sigma;
+     val += binDensity[ib] * ( gaussCdfPrimitive( uMax - zLow  ) - gaussCdfPrimitive( uMin - zLow  )
+			     - gaussCdfPrimitive( uMax - zHigh ) + gaussCdfPrimitive( uMin - zHigh ) );
+   }
+   return val * sigma;
+ }
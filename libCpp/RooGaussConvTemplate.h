@@ -0,0 +1,55 @@
+/*****************************************************************************
+ * Description:
+ *   Convolution of a binned template (generated Z line shape) with a
+ *   gaussian resolution, computed analytically: each template bin is a
+ *   box, and a box convolved with a gaussian is a difference of two
+ *   gaussian cumulative functions. The integral over the fit range is
+ *   analytic as well, so the pdf can be used instead of
+ *   FCONV(HistPdf, Gaussian) without any FFT or cache.
+ *
+ *****************************************************************************/
+
+#ifndef ROO_GAUSS_CONV_TEMPLATE
+#define ROO_GAUSS_CONV_TEMPLATE
+
+#include "RooAbsPdf.h"
+#include "RooRealProxy.h"
+#include "RooAbsReal.h"
+#include "RooDataHist.h"
+#include "TMath.h"
+
+#include <vector>
+
+class RooGaussConvTemplate : public RooAbsPdf {
+public:
+  RooGaussConvTemplate() {};
+  RooGaussConvTemplate(const char *name, const char *title,
+		       RooAbsReal& _x,
+		       RooAbsReal& _mean,
+		       RooAbsReal& _sigma,
+		       RooDataHist& _templ);
+
+  RooGaussConvTemplate(const RooGaussConvTemplate& other, const char* name);
+  inline virtual TObject* clone(const char* newname) const { return new RooGaussConvTemplate(*this,newname); }
+  inline ~RooGaussConvTemplate() {}
+  Double_t evaluate() const ;
+
+  Int_t getAnalyticalIntegral(RooArgSet& allVars, RooArgSet& analVars, const char* rangeName=0) const ;
+  Double_t analyticalIntegral(Int_t code, const char* rangeName=0) const ;
+
+  ClassDef(RooGaussConvTemplate,1);
+
+protected:
+
+  RooRealProxy x ;
+  RooRealProxy mean ;
+  RooRealProxy sigma ;
+
+  /// template bins: low edge, high edge and density (content / width)
+  std::vector<double> binLow ;
+  std::vector<double> binHigh ;
+  std::vector<double> binDensity ;
+
+};
+
+#endif
@@ -3,10 +3,13 @@
 import sys,os
 from math import sqrt
 import ROOT as rt
+import numpy as np
 import CMS_lumi, tdrstyle
 
 from efficiencyUtils import efficiency
 from efficiencyUtils import efficiencyList
+from efficiencyUtils import efficiencyTable
+from efficiencyUtils import efficiencyStore
 import efficiencyUtils as effUtil
 
 tdrstyle.setTDRStyle()
@@ -285,16 +288,8 @@ def diagnosticErrorPlot( effgr, ierror, nameout ):
     
     return h2_sfErrorAbs
 
-def doEGM_SFs(filein, lumi, axis = ['pT','eta'] ):
-    print " Opening file: %s (plot lumi: %3.1f)" % ( filein, lumi )
-    CMS_lumi.lumi_13TeV = "%+3.1f fb^{-1}" % lumi 
-
-    nameOutBase = filein 
-    if not os.path.exists( filein ) :
-        print 'file %s does not exist' % filein
-        sys.exit(1)
-
-
+def readEffList(filein):
+    ### efficiencies of an EGM formatted txt file
     fileWithEff = open(filein, 'r')
     effGraph = efficiencyList()
     
@@ -318,6 +313,21 @@ def doEGM_SFs(filein, lumi, axis = ['pT','eta'] ):
 ### massage the numbers a bit
     effGraph.symmetrizeSystVsEta()
     effGraph.combineSyst()
+    return effGraph
+
+
+def doEGM_SFs(filein, lumi, axis = ['pT','eta'] ):
+    print " Opening file: %s (plot lumi: %3.1f)" % ( filein, lumi )
+    CMS_lumi.lumi_13TeV = "%+3.1f fb^{-1}" % lumi 
+
+    nameOutBase = filein 
+    if not os.path.exists( filein ) :
+        print 'file %s does not exist' % filein
+        sys.exit(1)
+
+    effGraph = readEffList( filein )
+    ### array copy for the 2D histograms
+    effTable = efficiencyTable(effGraph)
 
     print " ------------------------------- "
 
@@ -348,10 +358,10 @@ def doEGM_SFs(filein, lumi, axis = ['pT','eta'] ):
                               pdfout, 
                               xAxis = axis[1], yAxis = axis[0] )
 
-    h2EffData = effGraph.ptEtaScaleFactor_2DHisto(-3)
-    h2EffMC   = effGraph.ptEtaScaleFactor_2DHisto(-2)
-    h2SF      = effGraph.ptEtaScaleFactor_2DHisto(-1)
-    h2Error   = effGraph.ptEtaScaleFactor_2DHisto( 0)  ## only error bars
+    h2EffData = effTable.ptEtaScaleFactor_2DHisto(-3)
+    h2EffMC   = effTable.ptEtaScaleFactor_2DHisto(-2)
+    h2SF      = effTable.ptEtaScaleFactor_2DHisto(-1)
+    h2Error   = effTable.ptEtaScaleFactor_2DHisto( 0)  ## only error bars
 
     rt.gStyle.SetPalette(1)
     rt.gStyle.SetPaintTextFormat('1.3f');
@@ -398,19 +408,110 @@ def doEGM_SFs(filein, lumi, axis = ['pT','eta'] ):
 
     errorNames = efficiency.getSystematicNames()
     for isyst in range(len(errorNames)):
-        h2_isyst = diagnosticErrorPlot( effGraph, isyst, pdfout )
+        h2_isyst = diagnosticErrorPlot( effTable, isyst, pdfout )
         h2_isyst.Write( errorNames[isyst],rt.TObject.kOverwrite)
     cDummy.Print( pdfout + "]" )
     rootout.Close()
 
 
+def scaleFactors_nD(store, mirrorVar = None ):
+    ### same massaging of the numbers as doEGM_SFs, along mirrorVar
+    if mirrorVar is None:
+        ### eta bins are averaged with their -eta partner
+        etaVars = [ var for var in store.vars if 'eta' in var.lower() ]
+        if len(etaVars) > 0:
+            mirrorVar = etaVars[0]
+    print " variables: %s (mirrored: %s)" % (', '.join(store.vars), mirrorVar)
+    store.symmetrizeSyst( mirrorVar )
+    return store.combineSyst( mirrorVar )
+
+
+def checkEGM_SFs_nD(txtFile, npzFile, mirrorVar = None, tolerance = 1e-4 ):
+    ### the scale factors and systematics of a 2D bining computed from the npz store
+    ### (doEGM_SFs_nD) must be the ones of the txt file (doEGM_SFs)
+    effTable = efficiencyTable( readEffList( txtFile ) )
+    effTable.combineSyst()
+    averageMC = effTable.mirrorAverage( effTable.effMC )
+
+    store = efficiencyStore.load( npzFile )
+    if len(store.vars) != 2:
+        print '[checkEGM_SFs_nD] %s has %d variables, the txt file has 2' % (npzFile,len(store.vars))
+        return False
+    ### the first variable of the txt file is the one symmetrized by doEGM_SFs
+    if mirrorVar is None:
+        mirrorVar = store.vars[0]
+    sfs = scaleFactors_nD( store, mirrorVar )
+
+    errorNames = efficiency.getSystematicNames()
+    ### txt: var1 (first variable) as eta, var2 as pT (max 500)
+    var1, var2 = store.vars
+    nBins = 0
+    nDiff = 0
+    for idx in np.ndindex( store.shape() ):
+        if store.eff['dataNominal'][idx] < 0 or store.eff['mcNominal'][idx] < 0:
+            continue
+        ieta = np.where( np.isclose( effTable.etaLow , store.low [var1][idx[0]] ) &
+                         np.isclose( effTable.etaHigh, store.high[var1][idx[0]] ) )[0]
+        ipt  = np.where( np.isclose( effTable.ptLow  , store.low [var2][idx[1]] ) &
+                         np.isclose( effTable.ptHigh , min( 500, store.high[var2][idx[1]] ) ) )[0]
+        binName = '%s [%g,%g], %s [%g,%g]' % (var1,store.low[var1][idx[0]],store.high[var1][idx[0]],
+                                              var2,store.low[var2][idx[1]],store.high[var2][idx[1]])
+        if ieta.size == 0 or ipt.size == 0 or not effTable.valid[ipt[0],ieta[0]]:
+            print '[checkEGM_SFs_nD] bin %s not in %s' % (binName,txtFile)
+            nDiff = nDiff + 1
+            continue
+        cell = ( ipt[0], ieta[0] )
+        values = [ ('sf'   , effTable.effData[cell] / effTable.effMC[cell], sfs['sf'][idx]    ),
+                   ('sfErr', effTable.systCombined[cell] / averageMC[cell], sfs['sfErr'][idx] ) ]
+        for isyst in range(len(errorNames)):
+            values.append( ( errorNames[isyst], abs( effTable.syst[isyst][cell] ) / averageMC[cell], abs( sfs['syst'][isyst][idx] ) / sfs['averageMC'][idx] ) )
+        nBins = nBins + 1
+        for name, value2D, valueND in values:
+            if abs( value2D - valueND ) > tolerance:
+                print '[checkEGM_SFs_nD] bin %s, %s: %f (2D) vs %f (nD)' % (binName,name,value2D,valueND)
+                nDiff = nDiff + 1
+    print '[checkEGM_SFs_nD] %d bins compared, %d difference(s) above %g' % (nBins,nDiff,tolerance)
+    return nDiff == 0
+
+
+def doEGM_SFs_nD(filein, mirrorVar = None ):
+    ### scale factors for any number of bining variables, from the egammaEffi.npz store
+    print " Opening file: %s" % filein
+    if not os.path.exists( filein ) :
+        print 'file %s does not exist' % filein
+        sys.exit(1)
+
+    store = efficiencyStore.load( filein )
+    sfs = scaleFactors_nD( store, mirrorVar )
+
+    nameOutBase = filein.replace('.npz','')
+    effMCAverage = sfs['averageMC']
+    rootout = rt.TFile(nameOutBase + '_EGMnD.root','recreate')
+    rootout.cd()
+    store.toTHnD( 'EGamma_SFnD'     , sfs['sf']     , sfs['sfErr'] ).Write('EGamma_SFnD',rt.TObject.kOverwrite)
+    store.toTHnD( 'EGamma_EffDatanD', sfs['effData'], sfs['systCombined'] * sfs['effMC'] / effMCAverage ).Write('EGamma_EffDatanD',rt.TObject.kOverwrite)
+    store.toTHnD( 'EGamma_EffMCnD'  , sfs['effMC']  ).Write('EGamma_EffMCnD',rt.TObject.kOverwrite)
+
+    errorNames = efficiency.getSystematicNames()
+    columns = { 'sf': sfs['sf'], 'sfErr': sfs['sfErr'] }
+    for isyst in range(len(errorNames)):
+        sfSyst = np.abs( sfs['syst'][isyst] ) / effMCAverage
+        store.toTHnD( errorNames[isyst], sfSyst ).Write( errorNames[isyst],rt.TObject.kOverwrite)
+        columns[errorNames[isyst]] = sfSyst
+    rootout.Close()
+    np.savez( nameOutBase + '_SF.npz', **columns )
+    print ' SFs saved in %s_EGMnD.root and %s_SF.npz' % (nameOutBase,nameOutBase)
+
+
 if __name__ == "__main__":
 
     import argparse
     parser = argparse.ArgumentParser(description='tnp EGM scale factors')
     parser.add_argument('--lumi'  , type = float, default = -1, help = 'Lumi (just for plotting purpose)')
-    parser.add_argument('txtFile' , default = None, help = 'EGM formatted txt file')
+    parser.add_argument('txtFile' , default = None, help = 'EGM formatted txt file (or N-dimensional .npz store)')
     parser.add_argument('--PV'    , action  = 'store_true', help = 'plot 1 vs nVtx instead of pT' )
+    parser.add_argument('--mirrorVar', default = None, help = 'variable averaged over +/- bins with a .npz store (default: the eta variable)')
+    parser.add_argument('--checkStore', default = None, help = 'check that the .npz store of a 2D bining gives the scale factors of the txt file')
     args = parser.parse_args()
 
     if args.txtFile is None:
@@ -426,4 +527,10 @@ if __name__ == "__main__":
     if args.PV:
         axis = ['nVtx','eta']
 
-    doEGM_SFs(args.txtFile, args.lumi,axis)
+    if not args.checkStore is None:
+        sys.exit( 0 if checkEGM_SFs_nD(args.txtFile, args.checkStore, args.mirrorVar) else 1 )
+
+    if args.txtFile.endswith('.npz'):
+        doEGM_SFs_nD(args.txtFile, args.mirrorVar)
+    else:
+        doEGM_SFs(args.txtFile, args.lumi,axis)
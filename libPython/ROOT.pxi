@@ -39,6 +39,7 @@ cdef extern from "TFile.h":
         void Close()
         bool IsOpen()
         bool IsWritable()
+        bool cd()
 
 cdef extern from "TFile.h" namespace "TFile":
     TFile* Open(const_char*, const_char*)
@@ -180,6 +181,7 @@ cdef extern from "TH1.h":
         int Fill(double x)
         int Fill(double x, double w)
         double GetBinContent(int bin)
+        double GetBinError(int bin)
         void Sumw2()
         int Write(const_char* name)
         const_char* GetName()
@@ -187,6 +189,9 @@ cdef extern from "TH1.h":
         TAxis* GetXaxis()
         int GetNbinsX()
         void SetBinContent(int bin, double content)
+        void SetBinError(int bin, double error)
+        double GetEntries()
+        void SetEntries(double n)
     cdef cppclass TH1F:
         pass
     cdef cppclass TH1I:
@@ -196,6 +201,10 @@ cdef extern from "TH1.h":
     cdef cppclass TH1C:
         pass
 
+cdef extern from "TH1.h" namespace "TH1":
+    void AddDirectory(bool add)
+    bool AddDirectoryStatus()
+
 cdef extern from "TAxis.h":
     cdef cppclass TAxis:
         int GetNbins()
@@ -1,101 +1,308 @@
 import copy
+import os
+import json
+import pickle
+import numpy as np
+
+
+def isCompleteBining( bining ):
+    for iv in range(len(bining)):
+        if not bining[iv].has_key('type') or not bining[iv].has_key('bins'):
+            print 'bining is not complete for var %s' % bining[iv]['var']
+            return False
+    return True
 
 
 def createBins( bining, cut ):
-    binCut = None
-    nbin = 0
+    if not isCompleteBining( bining ):
+        ### same return value as before for an incomplete bining
+        return [ [ -1 ] * len(bining) ]
+    return compiledBining( bining, cut )
 
-    nbin = 1
-    index = range(len(bining))
-    for ix in range(len(index)):
-        index[ix] = -1
-    listOfIndex = []    
-    listOfIndex.append( index )
 
-    ### first map nD bins in a single list
-    for iv in range(len(bining)):
-        var = bining[iv]['var']
-        if not bining[iv].has_key('type') or not bining[iv].has_key('bins'):
-            print 'bining is not complete for var %s' % var
-            return listOfIndex
-        nb1D = 1
-        if   bining[iv]['type'] == 'float' :
-            nb1D = len(bining[iv]['bins'])-1
-        elif bining[iv]['type'] == 'int' :
-            nb1D = len(bining[iv]['bins'])
-        nbin = nbin * nb1D
-
-        listOfIndexInit = copy.deepcopy(listOfIndex)
-        for ib_v in range(nb1D):
-            if ib_v == 0 :
-                for ib in range(len(listOfIndex)):
-                    listOfIndex[ib][iv] = ib_v            
-            else: 
-                for ib in range(len(listOfIndexInit)):
-                    listOfIndexInit[ib][iv] = ib_v
-                           
-                listOfIndex.extend(copy.deepcopy(listOfIndexInit))
-
-    listOfBins = []
-    ibin = 0
-    nbins = len(listOfIndex)
-    for ix in listOfIndex:
-        ### make bin definition
-        binCut   = None
-        binName  = 'bin%02d'%ibin
-        if nbins > 100   :  binName  = 'bin%03d'%ibin
-        if nbins > 1000  :  binName  = 'bin%04d'%ibin
-        if nbins > 10000 :  binName  = 'bin%d'%ibin
+#############################################################
+########## compiled bining: N-D product of the 1D binings
+#############################################################
+class compiledBining:
+    ### the bins are not stored, bin ib has the 1D indices
+    ###    ib = i0 + n0 * ( i1 + n1 * ( i2 + ... ) )
+    ### and its name, cut, title and vars are made when asked for.
+    ### It is used as the bin definition dictionary of createBins:
+    ###    bindef['bins'][ib], len(bindef['bins']), bindef['vars'], bindef['bining'], bindef['cutBase']
+    version = 1
+
+    def __init__( self, bining, cut, additionalCuts = None ):
+        self.bining   = copy.deepcopy(bining)
+        self.cutBase  = cut
+        self.vars     = [ b['var']  for b in bining ]
+        self.types    = [ b['type'] for b in bining ]
+        self.nbins1D  = []
+        self.edges    = []
+        for b in bining:
+            if b['type'] == 'float':
+                self.nbins1D.append( len(b['bins'])-1 )
+                ### same precision as in the cut strings
+                self.edges.append( np.array( [ float('%f' % x) for x in b['bins'] ] ) )
+            else:
+                self.nbins1D.append( len(b['bins']) )
+                self.edges.append( np.array( [ int('%d' % x) for x in b['bins'] ] ) )
+        ### no variable: a single bin with the base cut
+        self.strides = []
+        self.nbins   = 1
+        for nb1D in self.nbins1D:
+            self.strides.append( self.nbins )
+            self.nbins = self.nbins * nb1D
+        self.additionalCuts = {}
+        self.binCache = {}
+        self.tuneCuts( additionalCuts )
+
+    def __len__( self ):
+        return self.nbins
+
+    ### bin definition dictionary
+    def keys( self ):
+        return [ 'vars', 'bins', 'bining', 'cutBase' ]
+
+    def has_key( self, key ):
+        return key in self.keys()
+
+    def __contains__( self, key ):
+        return self.has_key( key )
+
+    def __getitem__( self, key ):
+        if   key == 'vars'   : return list(self.vars)
+        elif key == 'bins'   : return binList( self )
+        elif key == 'bining' : return self.bining
+        elif key == 'cutBase': return self.cutBase
+        raise KeyError( key )
+
+    def __eq__( self, other ):
+        if isinstance( other, compiledBining ):
+            return self.bining == other.bining and self.cutBase == other.cutBase and self.additionalCuts == other.additionalCuts
+        ### bin list of createBins (legacy bining.pkl): same variables and same bin names and cuts
+        ### (it has no 'bining' and 'cutBase' keys)
+        if not isinstance( other, dict ) or not 'vars' in other or not 'bins' in other:
+            return False
+        if list(other['vars']) != list(self.vars) or len(other['bins']) != self.nbins:
+            return False
+        for ib in range(self.nbins):
+            binDef = self.bin(ib)
+            if other['bins'][ib]['name'] != binDef['name'] or other['bins'][ib]['cut'] != binDef['cut']:
+                return False
+        return True
+
+    def __ne__( self, other ):
+        return not self == other
+
+    def tuneCuts( self, cuts ):
+        if cuts is None:
+            return
+        for ibin in cuts.keys():
+            self.additionalCuts[ibin] = cuts[ibin]
+        self.binCache = {}
+
+    def index( self, ib ):
+        ### 1D indices of bin ib
+        return [ ( ib // self.strides[iv] ) % self.nbins1D[iv] for iv in range(len(self.vars)) ]
+
+    def flatIndex( self, index ):
+        return sum( [ index[iv] * self.strides[iv] for iv in range(len(self.vars)) ] )
 
+    def name( self, ib, ix = None ):
+        binName  = 'bin%02d'%ib
+        if self.nbins > 100   :  binName  = 'bin%03d'%ib
+        if self.nbins > 1000  :  binName  = 'bin%04d'%ib
+        if self.nbins > 10000 :  binName  = 'bin%d'%ib
+        if ix is None: ix = self.index(ib)
+        for iv in range(len(self.vars)):
+            var    = self.vars[iv]
+            bins1D = self.bining[iv]['bins']
+            if self.types[iv] == 'float' :
+                binName  = '%s_%s_%1.2fTo%1.2f'  % (binName ,var,bins1D[ix[iv]],bins1D[ix[iv]+1])
+            if self.types[iv] == 'int' :
+                binName  = '%s_%sEq%d' % (binName ,var,bins1D[ix[iv]])
+        return binName.replace('-','m').replace('.','p')
+
+    def cutAndTitle( self, ib, ix = None ):
+        binCut   = self.cutBase
         binTitle = ''
-        binVars = {}
-        if not cut is None:
-            binCut = cut
-
-        for iv in range(len(ix)):
-            var     = bining[iv]['var']
-            bins1D  = bining[iv]['bins']
-            varType = bining[iv]['type']
-            if varType == 'float' :
+        if ix is None: ix = self.index(ib)
+        for iv in range(len(self.vars)):
+            var    = self.vars[iv]
+            bins1D = self.bining[iv]['bins']
+            if self.types[iv] == 'float' :
                 if binCut is None: 
                     binCut   = '%s >= %f && %s < %f' % (var,bins1D[ix[iv]],var,bins1D[ix[iv]+1])
                     binTitle = '%1.3f < %s < %1.3f'  % (bins1D[ix[iv]],var,bins1D[ix[iv]+1])
                 else:
                     binCut   = '%s && %s >= %f && %s < %f' % (binCut  ,var,bins1D[ix[iv]],var,bins1D[ix[iv]+1])
                     binTitle = '%s; %1.3f < %s < %1.3f'    % (binTitle,bins1D[ix[iv]],var,bins1D[ix[iv]+1])
-                binName  = '%s_%s_%1.2fTo%1.2f'  % (binName ,var,bins1D[ix[iv]],bins1D[ix[iv]+1])
-                binVars[var] = { 'min': bins1D[ix[iv]], 'max': bins1D[ix[iv]+1]}
-
-                
-            if varType == 'int' :
+            if self.types[iv] == 'int' :
                 if binCut is None: 
                     binCut   = '%s == %d' % (var,bins1D[ix[iv]])
                     binTitle = '%s = %d'  % (var,bins1D[ix[iv]])
                 else:
                     binCut   = '%s && %s == %d' % (binCut,var,bins1D[ix[iv]])
                     binTitle = '%s; %s = %d'    % (binTitle,var,bins1D[ix[iv]])
-                binName  = '%s_%sEq%d' % (binName ,var,bins1D[ix[iv]])
-                binVars[var] = { 'min': bins1D[ix[iv]], 'max': bins1D[ix[iv]]}
+        if self.additionalCuts.has_key(ib):
+            binCut = '%s && %s ' % (binCut,self.additionalCuts[ib])
+        return binCut, binTitle
 
-            binName = binName.replace('-','m')
-            binName = binName.replace('.','p')
+    def cut( self, ib ):
+        return self.cutAndTitle(ib)[0]
+
+    def title( self, ib ):
+        return self.cutAndTitle(ib)[1]
+
+    def binVars( self, ib, ix = None ):
+        binVars = {}
+        if ix is None: ix = self.index(ib)
+        for iv in range(len(self.vars)):
+            bins1D = self.bining[iv]['bins']
+            if self.types[iv] == 'float' :
+                binVars[self.vars[iv]] = { 'min': bins1D[ix[iv]], 'max': bins1D[ix[iv]+1]}
+            if self.types[iv] == 'int' :
+                binVars[self.vars[iv]] = { 'min': bins1D[ix[iv]], 'max': bins1D[ix[iv]]}
+        return binVars
+
+    def bin( self, ib ):
+        ix = self.index(ib)
+        binCut, binTitle = self.cutAndTitle(ib,ix)
+        return {'cut' : binCut, 'title': binTitle, 'name' : self.name(ib,ix), 'vars' : self.binVars(ib,ix) }
+
+    def cachedBin( self, ib ):
+        ### only the bins asked for are made (once per process)
+        if not ib in self.binCache:
+            self.binCache[ib] = self.bin(ib)
+        return self.binCache[ib]
+
+    def neighbours( self, ib ):
+        ### bins sharing a boundary with bin ib (one variable in the adjacent range, the others identical)
+        ix = self.index(ib)
+        neighbours = []
+        for iv in range(len(self.vars)):
+            bins1D = self.bining[iv]['bins']
+            for jx in range(self.nbins1D[iv]):
+                if jx == ix[iv]: continue
+                if self.types[iv] == 'float':
+                    adjacent = bins1D[jx+1] == bins1D[ix[iv]] or bins1D[jx] == bins1D[ix[iv]+1]
+                else:
+                    adjacent = abs(bins1D[jx] - bins1D[ix[iv]]) == 1
+                if adjacent:
+                    neighbours.append( ib + (jx - ix[iv]) * self.strides[iv] )
+        return [ self.cachedBin(jb) for jb in sorted(neighbours) ]
+
+    def binDefinition( self ):
+        ### same dictionary as createBins (+ tuneCuts)
+        return {
+            'vars'    : list(self.vars),
+            'bins'    : [ self.bin(ib) for ib in range(self.nbins) ],
+            'bining'  : copy.deepcopy(self.bining),
+            'cutBase' : self.cutBase,
+            } 
+
+    def locate( self, values ):
+        ### bin of each entry, -1 outside the bining (the additional cuts are not applied)
+        ### values: {var: array} or list of arrays in the order of the variables
+        if isinstance( values, dict ):
+            values = [ values[var] for var in self.vars ]
+        if len(self.vars) == 0:
+            return np.zeros( 0, dtype = int )
+        ibin   = np.zeros( len(values[0]), dtype = int )
+        inside = np.ones(  len(values[0]), dtype = bool )
+        for iv in range(len(self.vars)):
+            v = np.asarray( values[iv] )
+            if self.types[iv] == 'float':
+                ix = np.searchsorted( self.edges[iv], v, side = 'right' ) - 1
+                inside &= ( ix >= 0 ) & ( ix < self.nbins1D[iv] )
+            else:
+                ix = np.full( v.shape, -1, dtype = int )
+                for ib1D in range(self.nbins1D[iv]):
+                    ix[ v == self.edges[iv][ib1D] ] = ib1D
+                inside &= ( ix >= 0 )
+            ibin += ix * self.strides[iv]
+        ibin[~inside] = -1
+        return ibin
+
+    def save( self, filename ):
+        ### definition as json (keeps the int/float types of the bins) + the edges as arrays
+        additionalCuts = dict( ('%d' % ib, c) for ib, c in self.additionalCuts.items() )
+        np.savez( filename, version = self.version,
+                  bining = json.dumps(self.bining), cutBase = json.dumps(self.cutBase),
+                  additionalCuts = json.dumps(additionalCuts),
+                  **dict( ('edges_%d' % iv, self.edges[iv]) for iv in range(len(self.vars)) ) )
+
+    @staticmethod
+    def load( filename ):
+        ### None if the file was written by another version
+        columns = np.load( filename )
+        if int(columns['version']) != compiledBining.version:
+            print 'bining file %s has version %d, expected %d' % (filename,int(columns['version']),compiledBining.version)
+            return None
+        additionalCuts = jsonStr( json.loads( str(columns['additionalCuts']) ) )
+        additionalCuts = dict( (int(ib), c) for ib, c in additionalCuts.items() )
+        return compiledBining( jsonStr( json.loads( str(columns['bining']) ) ),
+                               jsonStr( json.loads( str(columns['cutBase']) ) ),
+                               additionalCuts )
+
+
+class binList:
+    ### bindef['bins'] of a compiled bining: the bin dictionaries are made when accessed
+    def __init__( self, bining ):
+        self.bining = bining
+
+    def __len__( self ):
+        return len(self.bining)
+
+    def __getitem__( self, ib ):
+        if isinstance( ib, slice ):
+            return [ self[jb] for jb in range(*ib.indices(len(self))) ]
+        if ib < 0:
+            ib = ib + len(self)
+        if ib < 0 or ib >= len(self):
+            raise IndexError( 'bin %d out of range' % ib )
+        return self.bining.cachedBin(ib)
+
+    def __iter__( self ):
+        for ib in range(len(self)):
+            yield self.bining.cachedBin(ib)
+
+
+def jsonStr( obj ):
+    ### json gives unicode strings
+    if isinstance( obj, unicode ):
+        return str(obj)
+    if isinstance( obj, list ):
+        return [ jsonStr(x) for x in obj ]
+    if isinstance( obj, dict ):
+        return dict( (jsonStr(k),jsonStr(v)) for k, v in obj.items() )
+    return obj
+
+
+def biningExists( directory ):
+    return os.path.isfile( '%s/bining.npz' % directory ) or os.path.isfile( '%s/bining.pkl' % directory )
+
+
+def loadBining( directory ):
+    ### bining definition of a flag: the compiled bining (bining.npz), or the
+    ### pickled bin list of the directories made before (bining.pkl) if newer
+    npzFile = '%s/bining.npz' % directory
+    pklFile = '%s/bining.pkl' % directory
+    if os.path.isfile(npzFile) and ( not os.path.isfile(pklFile) or os.path.getmtime(npzFile) >= os.path.getmtime(pklFile) ):
+        bining = compiledBining.load( npzFile )
+        if not bining is None:
+            return bining
+    if not os.path.isfile(pklFile):
+        raise IOError( 'no usable bining in %s (missing or written by another version), re-run --createBins for this flag' % directory )
+    return pickle.load( open( pklFile,'rb') )
 
-        listOfBins.append({'cut' : binCut, 'title': binTitle, 'name' : binName, 'vars' : binVars })
-        ibin = ibin + 1
- 
-    listOfVars = []
-    for iv in  range(len(bining)):
-        listOfVars.append(bining[iv]['var'])
-        
-    binDefinition = {
-        'vars' : listOfVars,
-        'bins' : listOfBins
-        } 
-    return binDefinition
 
 def tuneCuts( bindef, cuts ) :
     if cuts is None:
         return
+    if isinstance( bindef, compiledBining ):
+        bindef.tuneCuts( cuts )
+        return
     
     for ibin in cuts.keys():
         cut0 = bindef['bins'][ibin]['cut']
@@ -103,3 +310,167 @@ def tuneCuts( bindef, cuts ) :
         bindef['bins'][ibin]['cut'] = '%s && %s ' % (cut0,cut1)
     
 
+
+
+def neighbourBins( bindef, ibin ):
+    ### bins sharing a boundary with bin ibin (one variable in the adjacent range, the others identical)
+    if isinstance( bindef, compiledBining ):
+        return bindef.neighbours( ibin )
+    neighbours = []
+    binVars = bindef['bins'][ibin]['vars']
+    for ib in range(len(bindef['bins'])):
+        if ib == ibin: continue
+        otherVars = bindef['bins'][ib]['vars']
+        ndiff    = 0
+        adjacent = False
+        for var in binVars.keys():
+            if otherVars[var] == binVars[var]: continue
+            ndiff = ndiff + 1
+            if binVars[var]['min'] == binVars[var]['max']:
+                adjacent = abs(otherVars[var]['min'] - binVars[var]['min']) == 1
+            else:
+                adjacent = otherVars[var]['max'] == binVars[var]['min'] or otherVars[var]['min'] == binVars[var]['max']
+        if ndiff == 1 and adjacent:
+            neighbours.append( bindef['bins'][ib] )
+    return neighbours
+
+def hasTopLevelOr( cut ):
+    ### top level || or ?: (their operands would absorb the cuts && concatenated to them)
+    depth = 0
+    for ic in range(len(cut)):
+        if   cut[ic] == '(': depth = depth + 1
+        elif cut[ic] == ')': depth = depth - 1
+        elif depth == 0 and ( cut[ic:ic+2] == '||' or cut[ic] == '?' ):
+            return True
+    return False
+
+def decomposeBinCuts( bindef ):
+    ### split the bin cuts made by createBins (+ tuneCuts) into the common base cut,
+    ### the bin edges of each variable and the additional cut of each bin.
+    ### returns None when the bin cuts cannot be decomposed (old bining, cuts edited by hand...)
+    if not bindef.has_key('bining') or not bindef.has_key('cutBase'):
+        return None
+
+    ### cuts are concatenated without parenthesis, a top level || or ?: changes their meaning
+    if not bindef['cutBase'] is None and hasTopLevelOr(bindef['cutBase']):
+        return None
+
+    bining = bindef['bining']
+    listOfVars = []
+    for iv in range(len(bining)):
+        if not bining[iv].has_key('bins') or not bining[iv].get('type') in ['float','int']:
+            return None
+        ### use the same precision as in the cut strings
+        if bining[iv]['type'] == 'float':
+            edges = [ float('%f' % b) for b in bining[iv]['bins'] ]
+            if sorted(edges) != edges:
+                return None
+        else:
+            edges = [ float('%d' % b) for b in bining[iv]['bins'] ]
+        listOfVars.append( { 'var': bining[iv]['var'], 'type': bining[iv]['type'], 'edges': edges } )
+
+    if isinstance( bindef, compiledBining ):
+        ### the additional cuts are known without making the bin cuts
+        additionalCuts = [ bindef.additionalCuts.get(ib) for ib in range(len(bindef)) ]
+        for addCut in additionalCuts:
+            if not addCut is None and hasTopLevelOr(addCut):
+                return None
+        return {
+            'cutBase'        : bindef['cutBase'],
+            'vars'           : listOfVars,
+            'additionalCuts' : additionalCuts,
+            }
+
+    refBins = createBins( bining, bindef['cutBase'] )['bins']
+    if len(refBins) != len(bindef['bins']):
+        return None
+
+    additionalCuts = []
+    for ib in range(len(refBins)):
+        cut    = bindef['bins'][ib]['cut']
+        refCut = refBins[ib]['cut']
+        if cut == refCut:
+            additionalCuts.append( None )
+        elif cut.startswith( '%s && ' % refCut ) and cut.endswith(' ') and not hasTopLevelOr(cut[len(refCut)+4:-1]):
+            additionalCuts.append( cut[len(refCut)+4:-1] )
+        else:
+            return None
+
+    return {
+        'cutBase'        : bindef['cutBase'],
+        'vars'           : listOfVars,
+        'additionalCuts' : additionalCuts,
+        }
+
+
+#############################################################
+########## cut terms shared by the bin selections
+#############################################################
+def stripOuterParenthesis( cut ):
+    cut = cut.strip()
+    while cut.startswith('(') and cut.endswith(')'):
+        depth = 0
+        for ic in range(len(cut)):
+            if   cut[ic] == '(': depth = depth + 1
+            elif cut[ic] == ')': depth = depth - 1
+            if depth == 0: break
+        if ic != len(cut)-1:
+            return cut
+        cut = cut[1:-1].strip()
+    return cut
+
+def splitCutAtoms( cut ):
+    ### terms of the top level && of a cut (recursively through parenthesis);
+    ### a cut with a top level || or ?: is a single term
+    cut = stripOuterParenthesis( cut )
+    if cut == '':
+        return []
+
+    terms = []
+    depth = 0
+    start = 0
+    for ic in range(len(cut)):
+        if   cut[ic] == '(': depth = depth + 1
+        elif cut[ic] == ')': depth = depth - 1
+        elif depth == 0 and ( cut[ic:ic+2] == '||' or cut[ic] == '?' ):
+            return [ ' '.join(cut.split()) ]
+        elif depth == 0 and cut[ic:ic+2] == '&&':
+            terms.append( cut[start:ic] )
+            start = ic + 2
+    if len(terms) == 0:
+        return [ ' '.join(cut.split()) ]
+    terms.append( cut[start:] )
+
+    atoms = []
+    for term in terms:
+        atoms.extend( splitCutAtoms( term ) )
+    return atoms
+
+def cutAtomTree( cuts ):
+    ### bin selections as && of distinct terms:
+    ###   common: terms of all the cuts (to evaluate once per event)
+    ###   atoms : the other distinct terms
+    ###   bins  : for each cut, the indices of its atoms
+    binAtoms = []
+    for cut in cuts:
+        atoms = []
+        for atom in splitCutAtoms( '' if cut is None else cut ):
+            if not atom in atoms: atoms.append( atom )
+        binAtoms.append( atoms )
+
+    common = []
+    if len(binAtoms) > 0:
+        common = [ atom for atom in binAtoms[0] if all( [ atom in atoms for atoms in binAtoms[1:] ] ) ]
+
+    tree = { 'common': common, 'atoms': [], 'bins': [] }
+    atomIndex = {}
+    for atoms in binAtoms:
+        binIndices = []
+        for atom in atoms:
+            if atom in common: continue
+            if not atomIndex.has_key(atom):
+                atomIndex[atom] = len(tree['atoms'])
+                tree['atoms'].append( atom )
+            binIndices.append( atomIndex[atom] )
+        tree['bins'].append( binIndices )
+    return tree
@@ -195,16 +195,18 @@ class efficiencyList:
                         elif effMinus.errEffData <= 0.00001 and effPlus .errEffData > 0.00001: 
                             self.effList[ptBin][etaBinMinus].errEffData = effPlus.errEffData
                         else:
-                            self.effList[ptBin][etaBinPlus ].errEffData = (effMinus.errEffData+effPlus.errEffData)/2.
-                            self.effList[ptBin][etaBinMinus].errEffData = (effMinus.errEffData+effPlus.errEffData)/2.
+                            averageErr = (effMinus.errEffData+effPlus.errEffData)/2.
+                            self.effList[ptBin][etaBinPlus ].errEffData = averageErr
+                            self.effList[ptBin][etaBinMinus].errEffData = averageErr
 
                         if   effPlus.errEffMC <= 0.00001 and effMinus.errEffMC > 0.00001: 
                             self.effList[ptBin][etaBinPlus ].errEffMC = effMinus.errEffMC
                         elif effMinus.errEffMC <= 0.00001 and effPlus.errEffMC > 0.00001: 
                             self.effList[ptBin][etaBinMinus].errEffMC = effPlus.errEffMC
                         else:
-                            self.effList[ptBin][etaBinPlus ].errEffMC = (effMinus.errEffMC+effPlus.errEffMC)/2.
-                            self.effList[ptBin][etaBinMinus].errEffMC = (effMinus.errEffMC+effPlus.errEffMC)/2.
+                            averageErr = (effMinus.errEffMC+effPlus.errEffMC)/2.
+                            self.effList[ptBin][etaBinPlus ].errEffMC = averageErr
+                            self.effList[ptBin][etaBinMinus].errEffMC = averageErr
 
                             
                         for isyst in range(4):
@@ -421,3 +423,318 @@ class efficiencyList:
 
 
     
+
+#############################################################
+########## array backed efficiency table (pt x eta grid)
+#############################################################
+def containingBin( cellLow, cellHigh, binLow, binHigh ):
+    ### index of the bin containing each cell, -1 if none
+    inside = (binLow[np.newaxis,:] <= cellLow[:,np.newaxis]) & (binHigh[np.newaxis,:] >= cellHigh[:,np.newaxis])
+    ibin = binLow.size - 1 - np.argmax( inside[:,::-1], axis = 1 )
+    ibin[~inside.any(axis = 1)] = -1
+    return ibin
+
+
+class efficiencyTable:
+    ### same content as an efficiencyList but stored in numpy arrays
+    ### indexed by [ipt,ieta] (systematics by [isyst,ipt,ieta]), made
+    ### from the list once its systematics are symmetrized vs eta
+    def __init__(self, effList):
+        ptBins  = sorted( effList.effList.keys() )
+        etaBins = set()
+        for ptBin in ptBins:
+            for etaBin in effList.effList[ptBin].keys():
+                etaBins.add(etaBin)
+        etaBins = sorted(etaBins)
+
+        self.ptBins  = ptBins
+        self.etaBins = etaBins
+        self.ptLow   = np.array( [ b[0] for b in ptBins  ], dtype = float )
+        self.ptHigh  = np.array( [ b[1] for b in ptBins  ], dtype = float )
+        self.etaLow  = np.array( [ b[0] for b in etaBins ], dtype = float )
+        self.etaHigh = np.array( [ b[1] for b in etaBins ], dtype = float )
+
+        ### eta bin mirrored wrt 0 (itself if there is none)
+        ietaOf = dict( (etaBin,ieta) for ieta, etaBin in enumerate(etaBins) )
+        self.etaMirror = np.array( [ ietaOf.get( (-etaBin[1],-etaBin[0]), ieta ) for ieta, etaBin in enumerate(etaBins) ] )
+
+        shape = ( len(ptBins), len(etaBins) )
+        self.valid        = np.zeros( shape, dtype = bool )
+        self.effData      = np.full( shape, -1. )
+        self.errEffData   = np.zeros( shape )
+        self.effMC        = np.full( shape, -1. )
+        self.errEffMC     = np.zeros( shape )
+        self.altEff       = np.full( (7,) + shape, -1. )
+        self.syst         = np.zeros( (6,) + shape )
+        self.systCombined = np.zeros( shape )
+
+        for ipt, ptBin in enumerate(ptBins):
+            for etaBin, eff in effList.effList[ptBin].items():
+                ieta = ietaOf[etaBin]
+                self.valid     [ipt,ieta] = True
+                self.effData   [ipt,ieta] = eff.effData
+                self.errEffData[ipt,ieta] = eff.errEffData
+                self.effMC     [ipt,ieta] = eff.effMC
+                self.errEffMC  [ipt,ieta] = eff.errEffMC
+                self.altEff[:,ipt,ieta]   = eff.altEff
+
+    def mirrorAverage(self, values):
+        ### average of the +eta and -eta bins (bin value if the mirrored bin is missing)
+        hasMirror = self.valid[:,self.etaMirror]
+        return np.where( hasMirror, ( values + values[:,self.etaMirror] ) / 2., values )
+
+    def combineSyst(self):
+        averageData = self.mirrorAverage( self.effData )
+        averageMC   = self.mirrorAverage( self.effMC   )
+        for iAlt, average in [ (efficiency.iAltBkgModel, averageData),
+                               (efficiency.iAltSigModel, averageData),
+                               (efficiency.iAltMCSignal, averageMC  ),
+                               (efficiency.iAltTagSelec, averageMC  ) ]:
+            self.syst[iAlt+2] = np.where( self.altEff[iAlt] < 0, 0, self.altEff[iAlt] - average )
+        self.syst[0] = self.errEffData
+        self.syst[1] = self.errEffMC
+        self.systCombined = np.sqrt( np.sum( self.syst * self.syst, axis = 0 ) )
+
+    def ptEtaScaleFactor_2DHisto(self, onlyError, relError = False):
+        ### same histograms as efficiencyList.ptEtaScaleFactor_2DHisto
+        self.combineSyst()
+
+        ### bining: all edges of the filled bins
+        etaUsed = self.valid.any(axis = 0)
+        ptUsed  = self.valid.any(axis = 1)
+        xbinsTab = np.unique( np.concatenate( [self.etaLow[etaUsed], self.etaHigh[etaUsed]] ) )
+        ybinsTab = np.unique( np.concatenate( [self.ptLow [ptUsed ], self.ptHigh [ptUsed ]] ) )
+
+        htitle = 'e/#gamma scale factors'
+        hname  = 'h2_scaleFactorsEGamma' 
+        if onlyError >= 0:
+            htitle = 'e/#gamma uncertainties'
+            hname  = 'h2_uncertaintiesEGamma'             
+
+        h2 = rt.TH2F(hname,htitle,xbinsTab.size-1,xbinsTab,ybinsTab.size-1,ybinsTab)
+
+        ### values in the e/gamma POG bins
+        averageMC = self.mirrorAverage( self.effMC )
+        with np.errstate( divide = 'ignore', invalid = 'ignore' ):
+            content = self.effData      / self.effMC
+            error   = self.systCombined / averageMC
+            if   onlyError == 0 :
+                content = self.systCombined / averageMC
+            elif onlyError == -3 :
+                content = self.effData
+                error   = self.systCombined * self.effMC / averageMC
+            elif onlyError == -2 :
+                content = self.effMC
+                error   = np.zeros( self.effMC.shape )
+            elif onlyError >= 1 and onlyError <= 6:
+                denominator = averageMC
+                if relError:
+                    denominator = self.systCombined
+                content = np.abs( self.syst[onlyError-1] ) / denominator
+
+        ### h2D bin -> POG bin containing it
+        ieta = containingBin( xbinsTab[:-1], xbinsTab[1:], self.etaLow, self.etaHigh )
+        ipt  = containingBin( ybinsTab[:-1], ybinsTab[1:], self.ptLow , self.ptHigh  )
+        iptCell, ietaCell = np.meshgrid( ipt, ieta, indexing = 'ij' )
+        inside = (iptCell >= 0) & (ietaCell >= 0)
+        inside[inside] = self.valid[iptCell[inside],ietaCell[inside]]
+
+        ## histogram efficiencies and errors init to 100% (flow bins excluded)
+        h2Content = np.zeros( (ybinsTab.size+1, xbinsTab.size+1) )
+        h2Error   = np.zeros( (ybinsTab.size+1, xbinsTab.size+1) )
+        h2Content[1:-1,1:-1] = np.where( inside, content[iptCell,ietaCell], 1 )
+        h2Error  [1:-1,1:-1] = np.where( inside, error  [iptCell,ietaCell], 1 )
+        h2.SetContent( np.ascontiguousarray( h2Content.ravel(), dtype = np.float64 ) )
+        h2.SetError(   np.ascontiguousarray( h2Error  .ravel(), dtype = np.float64 ) )
+
+        h2.GetXaxis().SetTitle("SuperCluster #eta")
+        h2.GetYaxis().SetTitle("p_{T} [GeV]")
+        return h2
+
+
+#############################################################
+########## N-dimensional store of the sumUp efficiencies
+#############################################################
+class efficiencyStore:
+    ### efficiency and error of each measurement in arrays with one axis per
+    ### bining variable, saved in a numpy .npz file (one column per array)
+    measurements = [ 'dataNominal', 'dataAltSig', 'dataAltBkg', 'mcNominal', 'mcAlt', 'tagSel' ]
+
+    def __init__(self, bindef = None):
+        self.vars = []
+        self.low  = {}
+        self.high = {}
+        self.eff  = {}
+        self.err  = {}
+        if bindef is None:
+            return
+
+        ### axes: the (min,max) ranges of each variable (min == max for int variables)
+        self.vars     = list( bindef['vars'] )
+        self.binNames = [ abin['name'] for abin in bindef['bins'] ]
+        for var in self.vars:
+            ranges = sorted( set( (abin['vars'][var]['min'],abin['vars'][var]['max']) for abin in bindef['bins'] ) )
+            self.low [var] = np.array( [ r[0] for r in ranges ], dtype = float )
+            self.high[var] = np.array( [ r[1] for r in ranges ], dtype = float )
+
+        self.binIndex = np.zeros( (len(bindef['bins']),len(self.vars)), dtype = int )
+        for ib, abin in enumerate(bindef['bins']):
+            for iv, var in enumerate(self.vars):
+                self.binIndex[ib,iv] = np.where( (self.low[var]  == abin['vars'][var]['min']) &
+                                                 (self.high[var] == abin['vars'][var]['max']) )[0][0]
+
+        for meas in self.measurements:
+            self.eff[meas] = np.full( self.shape(), -1. )
+            self.err[meas] = np.full( self.shape(), -1. )
+
+    def shape(self):
+        return tuple( self.low[var].size for var in self.vars )
+
+    def fill(self, ib, effis):
+        ### effis: {measurement: [eff,err]} as returned by getAllEffi
+        idx = tuple( self.binIndex[ib] )
+        for meas in self.measurements:
+            if meas in effis:
+                self.eff[meas][idx] = effis[meas][0]
+                self.err[meas][idx] = effis[meas][1]
+
+    def fillBins(self, effis):
+        ### effis: {measurement: array [ibin] -> [eff,err]} as returned by getAllEffiBins
+        idx = tuple( self.binIndex.T )
+        for meas in self.measurements:
+            if meas in effis:
+                self.eff[meas][idx] = effis[meas][:,0]
+                self.err[meas][idx] = effis[meas][:,1]
+
+    def save(self, filename):
+        columns = { 'vars': np.array(self.vars), 'binNames': np.array(self.binNames), 'binIndex': self.binIndex }
+        for var in self.vars:
+            columns['low_%s'  % var] = self.low [var]
+            columns['high_%s' % var] = self.high[var]
+        for meas in self.measurements:
+            columns['eff_%s' % meas] = self.eff[meas]
+            columns['err_%s' % meas] = self.err[meas]
+        np.savez( filename, **columns )
+
+    @staticmethod
+    def load(filename):
+        columns = np.load( filename )
+        store = efficiencyStore()
+        store.vars     = [ str(var)  for var  in columns['vars']     ]
+        store.binNames = [ str(name) for name in columns['binNames'] ]
+        store.binIndex = columns['binIndex']
+        for var in store.vars:
+            store.low [var] = columns['low_%s'  % var]
+            store.high[var] = columns['high_%s' % var]
+        for meas in store.measurements:
+            store.eff[meas] = columns['eff_%s' % meas]
+            store.err[meas] = columns['err_%s' % meas]
+        return store
+
+    def mirrorIndex(self, mirrorVar):
+        ### index of the bin mirrored wrt 0 along mirrorVar (itself if there is none)
+        ranges = zip( self.low[mirrorVar], self.high[mirrorVar] )
+        return [ ranges.index( (-r[1],-r[0]) ) if (-r[1],-r[0]) in ranges else ir for ir, r in enumerate(ranges) ]
+
+    def mirrored(self, values, mirrorVar):
+        return np.take( values, self.mirrorIndex(mirrorVar), axis = self.vars.index(mirrorVar) )
+
+    def mirrorAverage(self, values, mirrorVar):
+        ### average of the bins mirrored wrt 0 along mirrorVar (bin value if there is
+        ### none or if one of the two bins was not measured, i.e. is -1)
+        if mirrorVar is None:
+            return values
+        mirror = self.mirrored( values, mirrorVar )
+        return np.where( (values >= 0) & (mirror >= 0), ( values + mirror ) / 2., values )
+
+    def symmetrizeSyst(self, mirrorVar):
+        ### as efficiencyList.symmetrizeSystVsEta along mirrorVar: the statistical errors and the
+        ### alternative efficiencies of the +/- bins are averaged (bins not measured are skipped)
+        if mirrorVar is None:
+            return
+        iv     = self.vars.index(mirrorVar)
+        mirror = self.mirrorIndex(mirrorVar)
+
+        #### fix statistical errors if needed (a missing error is taken from the other bin)
+        for meas in [ 'dataNominal', 'mcNominal' ]:
+            err       = self.err[meas]
+            errMirror = self.mirrored( err, mirrorVar )
+            both      = (self.eff[meas] >= 0) & (self.mirrored( self.eff[meas], mirrorVar ) >= 0)
+            newErr = np.where( (err       <= 0.00001) & (errMirror > 0.00001), errMirror,
+                     np.where( (errMirror <= 0.00001) & (err       > 0.00001), err, (err+errMirror)/2. ) )
+            self.err[meas] = np.where( both, newErr, err )
+
+        isPlus = np.array( [ self.low[mirrorVar][ir] >= 0 and self.high[mirrorVar][ir] > 0 and mirror[ir] != ir for ir in range(len(mirror)) ] )
+        isPlus = isPlus.reshape( [ -1 if jv == iv else 1 for jv in range(len(self.vars)) ] )
+        for meas in [ 'dataAltBkg', 'dataAltSig', 'mcAlt', 'tagSel' ]:
+            eff       = self.eff[meas]
+            effMirror = self.mirrored( eff, mirrorVar )
+            both      = (eff >= 0) & (effMirror >= 0)
+            for idx in zip( *np.where( both & isPlus & (np.abs(eff - effMirror) >= 0.10) ) ):
+                print "issue, I am averaging but the efficiencies are quite different in 2 %s bins" % mirrorVar
+                print " --- syst: %s, bin: %s" % (meas, ', '.join( [ '%s [%g,%g]' % (var,self.low[var][idx[jv]],self.high[var][idx[jv]]) for jv, var in enumerate(self.vars) ] ))
+                print "   eff[+] = ", eff[idx]
+                print "   eff[-] = ", effMirror[idx]
+            self.eff[meas] = np.where( both, (eff + effMirror) / 2, eff )
+
+    def combineSyst(self, mirrorVar = None):
+        ### scale factors and uncertainties in every bin, the alternative efficiencies
+        ### are compared to the average of the +/- bins along mirrorVar (e.g. eta)
+        ### (after symmetrizeSyst, as for the 2D efficiencyList)
+        effData = self.eff['dataNominal']
+        effMC   = self.eff['mcNominal']
+        averageData = self.mirrorAverage( effData, mirrorVar )
+        averageMC   = self.mirrorAverage( effMC  , mirrorVar )
+
+        syst = np.zeros( (6,) + self.shape() )
+        syst[0] = self.err['dataNominal']
+        syst[1] = self.err['mcNominal']
+        for isyst, meas, average in [ (2, 'dataAltBkg', averageData),
+                                      (3, 'dataAltSig', averageData),
+                                      (4, 'mcAlt'     , averageMC  ),
+                                      (5, 'tagSel'    , averageMC  ) ]:
+            syst[isyst] = np.where( self.eff[meas] < 0, 0, self.eff[meas] - average )
+        systCombined = np.sqrt( np.sum( syst * syst, axis = 0 ) )
+
+        with np.errstate( divide = 'ignore', invalid = 'ignore' ):
+            return { 'effData'      : effData,
+                     'effMC'        : effMC,
+                     'averageMC'    : averageMC,
+                     'sf'           : effData / effMC,
+                     'sfErr'        : systCombined / averageMC,
+                     'syst'         : syst,
+                     'systCombined' : systCombined }
+
+    def axisEdges(self, var):
+        ### histogram edges of an axis (int values are centered in unit bins)
+        low  = self.low [var]
+        high = self.high[var]
+        if np.all( low == high ):
+            low  = low  - 0.5
+            high = high + 0.5
+        edges = np.unique( np.concatenate( [low, high] ) )
+        return edges, np.searchsorted( edges, low )
+
+    def toTHnD(self, name, values, errors = None):
+        nbins = []
+        edges = []
+        cells = []
+        for var in self.vars:
+            e, c = self.axisEdges( var )
+            edges.append( e )
+            cells.append( c )
+            nbins.append( e.size - 1 )
+
+        hn = rt.THnD( name, name, len(self.vars), np.array( nbins, dtype = np.int32 ),
+                      np.array( [ e[0] for e in edges ] ), np.array( [ e[-1] for e in edges ] ) )
+        for iv, var in enumerate(self.vars):
+            hn.SetBinEdges( iv, edges[iv] )
+            hn.GetAxis(iv).SetTitle( var )
+
+        ### THnD bin indices start at 1
+        for idx in np.ndindex( self.shape() ):
+            cell = np.array( [ cells[iv][idx[iv]] + 1 for iv in range(len(idx)) ], dtype = np.int32 )
+            hn.SetBinContent( cell, values[idx] )
+            if not errors is None:
+                hn.SetBinError( cell, errors[idx] )
+        return hn
@@ -0,0 +1,170 @@
+import ROOT as rt
+import re
+import random
+
+#############################################################
+# Fit triage: quality of the fits of a bin (fit status,
+# covariance quality, parameters at their limits, chi2/ndf of
+# the plots) and escalating strategies to refit the bad bins
+#############################################################
+
+### background yields at their lower limit are expected (no background)
+limitExempt = [ 'nBkgP', 'nBkgF' ]
+
+### strategies tried in this order until the fit is good
+### (noMinos: nominal fit only, warmStart: data only)
+triageStrategies = [
+    { 'name': 'noMinos'   , 'minos': False },
+    { 'name': 'warmStart' , 'warmStart': True },
+    { 'name': 'seed1'     , 'seed': 1 },
+    { 'name': 'seed2'     , 'seed': 2 },
+    { 'name': 'widen'     , 'widen': 2. },
+    { 'name': 'widenSeed' , 'widen': 2., 'seed': 3 },
+    ]
+
+
+def readFitObjects( fitFile, tnpBin ):
+    ### fit objects of a bin {name: object}, None if the bin was not fitted
+    rootfile = rt.TFile( fitFile, 'read' )
+    fitObjects = {}
+    for obj in [ 'resP', 'resF', 'Canv', 'ws' ]:
+        name = '%s_%s' % (tnpBin['name'],obj)
+        if rootfile.Get(name):
+            fitObjects[name] = rootfile.Get(name)
+    rootfile.Close()
+    if not '%s_resP' % tnpBin['name'] in fitObjects or not '%s_resF' % tnpBin['name'] in fitObjects:
+        return None
+    return fitObjects
+
+
+def curveChi2( objects, curve, hist, nFitPar ):
+    ### chi2/ndf of the pdf curve (its name can have a _Range[..] suffix, not a component)
+    ### and data histogram among objects (RooPlots or their items drawn in a pad)
+    rooCurve = None
+    rooHist  = None
+    for obj in objects:
+        if obj.InheritsFrom('RooPlot'):
+            items = [ obj.getObject(i) for i in range(int(obj.numItems())) ]
+            return curveChi2( items, curve, hist, nFitPar )
+        if obj.InheritsFrom('RooCurve') and ( obj.GetName() == curve or obj.GetName().startswith( curve + '_Range[' ) ):
+            rooCurve = obj
+        if obj.InheritsFrom('RooHist') and obj.GetName() == hist:
+            rooHist = obj
+    if rooCurve is None or rooHist is None:
+        return None
+    return rooCurve.chiSquare( rooHist, nFitPar )
+
+
+def plotChi2( canv, ipad, curve, hist, nFitPar ):
+    ### chi2/ndf of the fit drawn in pad ipad
+    if not canv or not canv.GetPad(ipad):
+        return None
+    return curveChi2( list( canv.GetPad(ipad).GetListOfPrimitives() ), curve, hist, nFitPar )
+
+
+def workspaceChi2( work, side, nFitPar ):
+    ### chi2/ndf of a fit done without plots (--noPlot), from its workspace (same frame as tnpFitter::drawFits)
+    if not work or not work.data('h%s' % side) or not work.pdf('pdf%s' % side):
+        return None
+    frame = work.var('x').frame(60,120)
+    work.data('h%s' % side).plotOn( frame )
+    work.pdf('pdf%s' % side).plotOn( frame )
+    return curveChi2( [ frame ], 'pdf%s_Norm[x]' % side, 'h_h%s' % side, nFitPar )
+
+
+def fitQuality( fitObjects, tnpBin, maxChi2 = 3., minCovQual = 3 ):
+    ### returns {'issues': [...], 'chi2P': chi2/ndf, 'chi2F': chi2/ndf}
+    quality = { 'issues': [], 'chi2P': None, 'chi2F': None }
+    if fitObjects is None:
+        quality['issues'].append( 'missing' )
+        return quality
+
+    fitresP = fitObjects['%s_resP' % tnpBin['name']]
+    fitresF = fitObjects['%s_resF' % tnpBin['name']]
+    ### simultaneous fit: the same result is stored for pass and fail
+    simFit = bool( fitresP.floatParsFinal().find('efficiency') )
+    for side, fitres in [ ('P',fitresP), ('F',fitresF) ]:
+        if fitres.status() != 0:
+            quality['issues'].append( 'status%s=%d' % (side,fitres.status()) )
+        if fitres.covQual() < minCovQual:
+            quality['issues'].append( 'covQual%s=%d' % (side,fitres.covQual()) )
+        fitPar = fitres.floatParsFinal()
+        for ipar in range(len(fitPar)):
+            par = fitPar[ipar]
+            if par.GetName() in limitExempt: continue
+            tolerance = 1e-3 * ( par.getMax() - par.getMin() )
+            if par.getVal() - par.getMin() < tolerance or par.getMax() - par.getVal() < tolerance:
+                quality['issues'].append( 'atLimit:%s' % par.GetName() )
+        if simFit: break
+
+    canv = fitObjects.get( '%s_Canv' % tnpBin['name'] )
+    nParP = len( fitresP.floatParsFinal() )
+    nParF = len( fitresF.floatParsFinal() )
+    if simFit:
+        nParP = nParP / 2
+        nParF = nParF / 2
+    quality['chi2P'] = plotChi2( canv, 2, 'pdfPass_Norm[x]', 'h_hPass', nParP )
+    quality['chi2F'] = plotChi2( canv, 3, 'pdfFail_Norm[x]', 'h_hFail', nParF )
+    ### no canvas (--noPlot): the fit is drawn from the workspace
+    work = fitObjects.get( '%s_ws' % tnpBin['name'] )
+    if quality['chi2P'] is None: quality['chi2P'] = workspaceChi2( work, 'Pass', nParP )
+    if quality['chi2F'] is None: quality['chi2F'] = workspaceChi2( work, 'Fail', nParF )
+    for side in [ 'P', 'F' ]:
+        chi2 = quality['chi2%s' % side]
+        if not chi2 is None and chi2 > maxChi2:
+            quality['issues'].append( 'chi2%s=%1.2f' % (side,chi2) )
+    return quality
+
+
+#############################################################
+########## new starting points of the parameters
+#############################################################
+def parseParam( par ):
+    ### 'name[val,min,max]' -> (name,val,min,max), None for constants and other strings
+    x = re.match( r'^\s*(\w+)\s*\[([^\]]*)\]\s*$', par )
+    if not x or len( x.group(2).split(',') ) != 3:
+        return None
+    pVal, pMin, pMax = [ float(v) for v in x.group(2).split(',') ]
+    return x.group(1), pVal, pMin, pMax
+
+
+def widenParams( tnpWorkspaceParam, factor ):
+    ### ranges widened by factor around their center, positive ranges stay positive
+    params = []
+    for par in tnpWorkspaceParam:
+        p = parseParam( par )
+        if not p is None:
+            pName, pVal, pMin, pMax = p
+            center    = 0.5 * ( pMax + pMin )
+            halfWidth = 0.5 * ( pMax - pMin )
+            newMin = center - factor * halfWidth
+            newMax = center + factor * halfWidth
+            if pMin >= 0 and newMin < 0:
+                newMin = pMin / factor
+            par = '%s[%f,%f,%f]' % (pName,pVal,newMin,newMax)
+        params.append( par )
+    return params
+
+
+def jitterParams( tnpWorkspaceParam, seed, scale = 0.2 ):
+    ### initial values moved randomly by up to scale x range (reproducible for a given seed)
+    rand = random.Random( seed )
+    params = []
+    for par in tnpWorkspaceParam:
+        p = parseParam( par )
+        if not p is None:
+            pName, pVal, pMin, pMax = p
+            pVal = pVal + scale * ( pMax - pMin ) * rand.uniform(-1,1)
+            pVal = min( max( pVal, pMin ), pMax )
+            par = '%s[%f,%f,%f]' % (pName,pVal,pMin,pMax)
+        params.append( par )
+    return params
+
+
+def strategyParams( tnpWorkspaceParam, strategy, ib ):
+    params = list( tnpWorkspaceParam )
+    if 'widen' in strategy:
+        params = widenParams( params, strategy['widen'] )
+    if 'seed' in strategy:
+        params = jitterParams( params, 1000 * strategy['seed'] + ib )
+    return params
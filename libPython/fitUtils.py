@@ -2,12 +2,15 @@ import ROOT as rt
 rt.gROOT.LoadMacro('./libCpp/histFitter.C+')
 rt.gROOT.LoadMacro('./libCpp/RooCBExGaussShape.cc+')
 rt.gROOT.LoadMacro('./libCpp/RooCMSShape.cc+')
+rt.gROOT.LoadMacro('./libCpp/RooGaussConvTemplate.cc+')
 rt.gROOT.SetBatch(1)
 
 from ROOT import tnpFitter
 
+import os
 import re
 import math
+import hashlib
 
 
 minPtForSwitch = 70
@@ -20,6 +23,178 @@ def ptMin( tnpBin ):
         ptmin = float(tnpBin['name'].split('et_')[1].split('p')[0])
     return ptmin
 
+#############################################################
+########## fit cache: a fit is redone only if its inputs changed
+#############################################################
+def fitCacheKey( hists, tnpWorkspace, options ):
+    ### sha1 of the histograms (axis, contents and errors), workspace and fit options
+    key = hashlib.sha1()
+    for h in hists:
+        axis = h.GetXaxis()
+        key.update( '%d %r %r;' % (axis.GetNbins(),axis.GetXmin(),axis.GetXmax()) )
+        key.update( ','.join( [ '%r:%r' % (h.GetBinContent(ib),h.GetBinError(ib)) for ib in range(axis.GetNbins()+2) ] ) )
+    key.update( ';'.join( tnpWorkspace ) )
+    key.update( ';'.join( [ '%s' % opt for opt in options ] ) )
+    return key.hexdigest()
+
+def isFitCached( rootfile, tnpBin, fitKey ):
+    storedKey = rootfile.Get( '%s_fitKey' % tnpBin['name'] )
+    if not storedKey or storedKey.GetTitle() != fitKey:
+        return False
+    for obj in [ 'resP', 'resF' ]:
+        if not rootfile.Get( '%s_%s' % (tnpBin['name'],obj) ):
+            return False
+    ### fits done without plots have their workspace instead of the canvas
+    if not rootfile.Get( '%s_Canv' % tnpBin['name'] ) and not rootfile.Get( '%s_ws' % tnpBin['name'] ):
+        return False
+    print '[fitCache] bin %s unchanged, keeping the fit in %s' % (tnpBin['name'],rootfile.GetName())
+    return True
+
+def storeFitKey( rootfile, tnpBin, fitKey ):
+    rootfile.cd()
+    rt.TNamed( '%s_fitKey' % tnpBin['name'], fitKey ).Write( '%s_fitKey' % tnpBin['name'], rt.TObject.kOverwrite )
+    ### the canvas (if any) was drawn by this fit: the objects of the previous fit are deleted
+    if rootfile.Get( '%s_Canv' % tnpBin['name'] ):
+        rt.TNamed( '%s_canvKey' % tnpBin['name'], fitKey ).Write( '%s_canvKey' % tnpBin['name'], rt.TObject.kOverwrite )
+
+def setFitKey( fitResult, tnpBin, fitKey ):
+    ### replaces the key of fit objects returned in memory (e.g. a triaged refit, kept
+    ### with the key of the nominal fit so that the next runs do not redo it)
+    for obj in [ 'fitKey', 'canvKey' ]:
+        name = '%s_%s' % (tnpBin['name'],obj)
+        if obj == 'fitKey' or name in fitResult:
+            fitResult[name] = rt.TNamed( name, fitKey )
+
+#############################################################
+########## fit outputs: either one file per bin (<fit>-<bin>.root)
+########## or in memory, the fit objects being returned to the
+########## parent process that writes all bins in <fit>.root
+#############################################################
+### canvKey: fit key of the canvas (the canvas of a fit done without plots is drawn later)
+fitObjects = [ 'resP', 'resF', 'Canv', 'ws', 'par', 'fitKey', 'canvKey' ]
+
+def binFitFile( fitFile, tnpBin ):
+    return fitFile.replace('.root', '-%s.root' % tnpBin['name'])
+
+def deleteFitObjects( rootfile, binName ):
+    ### a new fit replaces all the objects of the previous fit of the bin
+    ### (e.g. a fit without plots must not keep the canvas of an older fit)
+    for obj in fitObjects:
+        rootfile.Delete( '%s_%s;*' % (binName,obj) )
+
+def checkFitCache( fitFile, tnpBin, fitKey, inMemory ):
+    path = fitFile if inMemory else binFitFile( fitFile, tnpBin )
+    if not os.path.exists( path ):
+        return False
+    rootfile = rt.TFile(path,'read')
+    cached = isFitCached( rootfile, tnpBin, fitKey )
+    rootfile.Close()
+    return cached
+
+def openFitOutput( fitFile, tnpBin, inMemory ):
+    if inMemory:
+        return rt.TMemFile( '%s_fit.root' % tnpBin['name'], 'recreate' )
+    rootfile = rt.TFile( binFitFile( fitFile, tnpBin ), 'update' )
+    deleteFitObjects( rootfile, tnpBin['name'] )
+    return rootfile
+
+def closeFitOutput( rootfile, tnpBin, inMemory ):
+    ### in memory mode, returns the fit objects {name: object}
+    fitResults = None
+    if inMemory:
+        fitResults = {}
+        for obj in fitObjects:
+            name = '%s_%s' % (tnpBin['name'],obj)
+            if rootfile.Get(name):
+                fitResults[name] = rootfile.Get(name)
+    rootfile.Close()
+    return fitResults
+
+def writeFitResults( fitFile, fitResults ):
+    ### write the fits returned by the workers (None: fit not redone), the other bins are kept
+    ### (fit objects without fit key, e.g. canvases drawn afterwards, are added to the fit)
+    rootfile = rt.TFile( fitFile, 'update' )
+    nfits = 0
+    for fitResult in fitResults:
+        if fitResult is None: continue
+        for name in fitResult.keys():
+            if name.endswith('_fitKey'):
+                deleteFitObjects( rootfile, name[:-len('_fitKey')] )
+        for name in sorted(fitResult.keys()):
+            fitResult[name].Write( name, rt.TObject.kOverwrite )
+        nfits = nfits + 1
+    rootfile.Close()
+    print ' - %d fit(s) saved in %s' % (nfits,fitFile)
+
+def mergeBinFitFile( fitFile, tnpBin ):
+    ### copy the fit of a single bin (refit with its own file) in the merged file
+    binFile = rt.TFile( binFitFile( fitFile, tnpBin ), 'read' )
+    fitResult = {}
+    for obj in fitObjects:
+        name = '%s_%s' % (tnpBin['name'],obj)
+        if binFile.Get(name):
+            fitResult[name] = binFile.Get(name)
+    binFile.Close()
+    writeFitResults( fitFile, [fitResult] )
+
+
+#############################################################
+########## warm start: initial values of the data fit from the
+########## MC fit of the same bin (or of a neighbouring bin)
+#############################################################
+def warmStartParams( sample, fitType, warmStartBins, tnpWorkspaceParam ):
+    ### only the initial values of floating parameters change, ranges and constants are kept
+    if warmStartBins is None or sample.isMC:
+        return tnpWorkspaceParam
+    fitFile = getattr( sample.mcRef, fitType )
+    if not os.path.exists( fitFile ):
+        print '[warmStart] WARNING: no MC fit %s (run the same fit with --mcSig first), starting from the default values' % fitFile
+        return tnpWorkspaceParam
+
+    rootfile = rt.TFile(fitFile,'read')
+    mcValues = None
+    for tnpBin in warmStartBins:
+        fitresP = rootfile.Get( '%s_resP' % tnpBin['name'] )
+        fitresF = rootfile.Get( '%s_resF' % tnpBin['name'] )
+        if not fitresP or not fitresF or fitresP.status() != 0 or fitresF.status() != 0:
+            continue
+        mcValues = {}
+        for fitres in [fitresP, fitresF]:
+            fitPar = fitres.floatParsFinal()
+            for ipar in range(len(fitPar)):
+                mcValues[fitPar[ipar].GetName()] = fitPar[ipar].getVal()
+        print '[warmStart] starting from MC fit of bin %s in %s' % (tnpBin['name'],fitFile)
+        break
+    rootfile.Close()
+    if mcValues is None:
+        return tnpWorkspaceParam
+
+    yields = ['nSigP','nBkgP','nSigF','nBkgF']
+    tnpWorkspaceWarm = []
+    for par in tnpWorkspaceParam:
+        x = re.match( r'^\s*(\w+)\s*\[([^\]]*)\]\s*$', par )
+        if x and x.group(1) in mcValues and not x.group(1) in yields and len(x.group(2).split(',')) == 3:
+            pName = x.group(1)
+            pInit, pMin, pMax = x.group(2).split(',')
+            pVal = min( max( mcValues[pName], float(pMin) ), float(pMax) )
+            par = '%s[%f,%s,%s]' % (pName,pVal,pMin.strip(),pMax.strip())
+        tnpWorkspaceWarm.append( par )
+    return tnpWorkspaceWarm
+
+
+#############################################################
+########## simultaneous fit: parameters shared by pass and fail
+#############################################################
+def shareSimFitParams( tnpWorkspaceParam, tnpWorkspaceFunc, sharedPars ):
+    ### for each name in sharedPars (e.g. 'sigma'), the failing probe uses <name>P instead of <name>F
+    if len(sharedPars) == 0:
+        return tnpWorkspaceParam, tnpWorkspaceFunc
+    shared = '|'.join( sharedPars )
+    params = [ par  for par  in tnpWorkspaceParam if not re.match( r'^\s*(%s)F\s*\[' % shared, par ) ]
+    funcs  = [ re.sub( r'\b(%s)F\b' % shared, r'\1P', func ) for func in tnpWorkspaceFunc ]
+    return params, funcs
+
+
 def createWorkspaceForAltSig( sample, tnpBin, tnpWorkspaceParam ):
 
     ### tricky: use n < 0 for high pT bin (so need to remove param and add it back)
@@ -81,7 +256,7 @@ def createWorkspaceForAltSig( sample, tnpBin, tnpWorkspaceParam ):
 #############################################################
 ########## nominal fitter
 #############################################################
-def histFitterNominal( sample, tnpBin, tnpWorkspaceParam ):
+def histFitterNominal( sample, tnpBin, tnpWorkspaceParam, useCache = True, inMemory = False, warmStartBins = None, analyticConv = False, simFit = False, sharedPars = (), useMinos = True, doPlot = True, keyOnly = False ):
         
     tnpWorkspaceFunc = [
         "Gaussian::sigResPass(x,meanP,sigmaP)",
@@ -90,23 +265,22 @@ def histFitterNominal( sample, tnpBin, tnpWorkspaceParam ):
         "RooCMSShape::bkgFail(x, acmsF, betaF, gammaF, peakF)",
         ]
 
+    if simFit:
+        tnpWorkspaceParam, tnpWorkspaceFunc = shareSimFitParams( tnpWorkspaceParam, tnpWorkspaceFunc, sharedPars )
+
     tnpWorkspace = []
-    tnpWorkspace.extend(tnpWorkspaceParam)
+    tnpWorkspace.extend(warmStartParams( sample, 'nominalFit', warmStartBins, tnpWorkspaceParam ))
     tnpWorkspace.extend(tnpWorkspaceFunc)
     
-    ## init fitter
+    title = tnpBin['title'].replace(';',' - ')
+    title = title.replace('probe_sc_eta','#eta_{SC}')
+    title = title.replace('probe_Ele_pt','p_{T}')
+
+    ## input histograms
     infile = rt.TFile( sample.histFile, "read")
     hP = infile.Get('%s_Pass' % tnpBin['name'] )
     hF = infile.Get('%s_Fail' % tnpBin['name'] )
-    fitter = tnpFitter( hP, hF, tnpBin['name'] )
-    infile.Close()
 
-    ## setup
-    fitter.useMinos()
-    rootpath = sample.nominalFit.replace('.root', '-%s.root' % tnpBin['name'])
-    rootfile = rt.TFile(rootpath,'update')
-    fitter.setOutputFile( rootfile )
-    
     ## generated Z LineShape
     ## for high pT change the failing spectra to any probe to get statistics
     fileTruth  = rt.TFile(sample.mcRef.histFile,'read')
@@ -115,8 +289,37 @@ def histFitterNominal( sample, tnpBin, tnpWorkspaceParam ):
     if ptMin( tnpBin ) > minPtForSwitch: 
         histZLineShapeF = fileTruth.Get('%s_Pass'%tnpBin['name'])
 #        fitter.fixSigmaFtoSigmaP()
-    fitter.setZLineShapes(histZLineShapeP,histZLineShapeF)
 
+    fitOptions = ['nominalFit',sample.mcTruth,sample.isMC,'minos' if useMinos else 'noMinos',title]
+    if analyticConv:
+        fitOptions.append( 'analyticConv' )
+    if simFit:
+        fitOptions.extend( ['simFit'] + list(sharedPars) )
+    fitKey = fitCacheKey( [hP,hF,histZLineShapeP,histZLineShapeF], tnpWorkspace, fitOptions )
+
+    ### keyOnly: cache key of the fit, without fitting
+    if keyOnly:
+        fileTruth.Close()
+        infile.Close()
+        return fitKey
+
+    if useCache and checkFitCache( sample.nominalFit, tnpBin, fitKey, inMemory ):
+        fileTruth.Close()
+        infile.Close()
+        return None
+    rootfile = openFitOutput( sample.nominalFit, tnpBin, inMemory )
+
+    ## init fitter
+    fitter = tnpFitter( hP, hF, tnpBin['name'] )
+    infile.Close()
+
+    ## setup
+    fitter.useMinos( useMinos )
+    fitter.useAnalyticConvolution( analyticConv )
+    fitter.useSimultaneousFit( simFit )
+    fitter.setPlots( doPlot )
+    fitter.setOutputFile( rootfile )
+    fitter.setZLineShapes(histZLineShapeP,histZLineShapeF)
     fileTruth.Close()
 
     ### set workspace
@@ -125,18 +328,16 @@ def histFitterNominal( sample, tnpBin, tnpWorkspaceParam ):
         workspace.push_back(iw)
     fitter.setWorkspace( workspace )
 
-    title = tnpBin['title'].replace(';',' - ')
-    title = title.replace('probe_sc_eta','#eta_{SC}')
-    title = title.replace('probe_Ele_pt','p_{T}')
     fitter.fits(sample.mcTruth,sample.isMC,title)
-    rootfile.Close()
+    storeFitKey( rootfile, tnpBin, fitKey )
+    return closeFitOutput( rootfile, tnpBin, inMemory )
 
 
 
 #############################################################
 ########## alternate signal fitter
 #############################################################
-def histFitterAltSig( sample, tnpBin, tnpWorkspaceParam, isaddGaus=0 ):
+def histFitterAltSig( sample, tnpBin, tnpWorkspaceParam, isaddGaus=0, useCache = True, inMemory = False, warmStartBins = None, simFit = False, sharedPars = (), doPlot = True, keyOnly = False ):
 
     tnpWorkspacePar = createWorkspaceForAltSig( sample,  tnpBin, tnpWorkspaceParam )
 
@@ -152,11 +353,18 @@ def histFitterAltSig( sample, tnpBin, tnpWorkspaceParam, isaddGaus=0 ):
         if sample.isMC:
             tnpWorkspaceFunc += [ "sigFracF[0.5,0.0,1.0]", ]
 
+    if simFit:
+        tnpWorkspacePar, tnpWorkspaceFunc = shareSimFitParams( tnpWorkspacePar, tnpWorkspaceFunc, sharedPars )
+
     tnpWorkspace = []
-    tnpWorkspace.extend(tnpWorkspacePar)
+    tnpWorkspace.extend(warmStartParams( sample, 'altSigFit', warmStartBins, tnpWorkspacePar ))
     tnpWorkspace.extend(tnpWorkspaceFunc)
         
-    ## init fitter
+    title = tnpBin['title'].replace(';',' - ')
+    title = title.replace('probe_sc_eta','#eta_{SC}')
+    title = title.replace('probe_Ele_pt','p_{T}')
+
+    ## input histograms
     infile = rt.TFile( sample.histFile, "read")
     hP = infile.Get('%s_Pass' % tnpBin['name'] )
     hF = infile.Get('%s_Fail' % tnpBin['name'] )
@@ -164,18 +372,37 @@ def histFitterAltSig( sample, tnpBin, tnpWorkspaceParam, isaddGaus=0 ):
     ## MC only: this is to get MC parameters in data fit!
     if sample.isMC and ptMin( tnpBin ) > minPtForSwitch:     
         hF = infile.Get('%s_Pass' % tnpBin['name'] )
+
+    ## generated Z LineShape
+    fileTruth = rt.TFile('etc/inputs/ZeeGenLevel.root','read')
+    histZLineShape = fileTruth.Get('Mass')
+
+    fitOptions = ['altSigFit',sample.mcTruth,sample.isMC,isaddGaus,title]
+    if simFit:
+        fitOptions.extend( ['simFit'] + list(sharedPars) )
+    fitKey = fitCacheKey( [hP,hF,histZLineShape], tnpWorkspace, fitOptions )
+
+    ### keyOnly: cache key of the fit, without fitting
+    if keyOnly:
+        fileTruth.Close()
+        infile.Close()
+        return fitKey
+
+    if useCache and checkFitCache( sample.altSigFit, tnpBin, fitKey, inMemory ):
+        fileTruth.Close()
+        infile.Close()
+        return None
+    rootfile = openFitOutput( sample.altSigFit, tnpBin, inMemory )
+
+    ## init fitter
     fitter = tnpFitter( hP, hF, tnpBin['name'] )
 #    fitter.fixSigmaFtoSigmaP()
     infile.Close()
 
     ## setup
-    rootpath = sample.altSigFit.replace('.root', '-%s.root' % tnpBin['name'])
-    rootfile = rt.TFile(rootpath,'update')
+    fitter.useSimultaneousFit( simFit )
+    fitter.setPlots( doPlot )
     fitter.setOutputFile( rootfile )
-    
-    ## generated Z LineShape
-    fileTruth = rt.TFile('etc/inputs/ZeeGenLevel.root','read')
-    histZLineShape = fileTruth.Get('Mass')
     fitter.setZLineShapes(histZLineShape,histZLineShape)
     fileTruth.Close()
 
@@ -185,19 +412,16 @@ def histFitterAltSig( sample, tnpBin, tnpWorkspaceParam, isaddGaus=0 ):
         workspace.push_back(iw)
     fitter.setWorkspace( workspace, isaddGaus )
 
-    title = tnpBin['title'].replace(';',' - ')
-    title = title.replace('probe_sc_eta','#eta_{SC}')
-    title = title.replace('probe_Ele_pt','p_{T}')
     fitter.fits(sample.mcTruth,sample.isMC,title, isaddGaus)
-
-    rootfile.Close()
+    storeFitKey( rootfile, tnpBin, fitKey )
+    return closeFitOutput( rootfile, tnpBin, inMemory )
 
 
 
 #############################################################
 ########## alternate background fitter
 #############################################################
-def histFitterAltBkg( sample, tnpBin, tnpWorkspaceParam ):
+def histFitterAltBkg( sample, tnpBin, tnpWorkspaceParam, useCache = True, inMemory = False, warmStartBins = None, simFit = False, sharedPars = (), doPlot = True, keyOnly = False ):
 
     tnpWorkspaceFunc = [
         "Gaussian::sigResPass(x,meanP,sigmaP)",
@@ -206,22 +430,21 @@ def histFitterAltBkg( sample, tnpBin, tnpWorkspaceParam ):
         "Exponential::bkgFail(x, alphaF)",
         ]
 
+    if simFit:
+        tnpWorkspaceParam, tnpWorkspaceFunc = shareSimFitParams( tnpWorkspaceParam, tnpWorkspaceFunc, sharedPars )
+
     tnpWorkspace = []
-    tnpWorkspace.extend(tnpWorkspaceParam)
+    tnpWorkspace.extend(warmStartParams( sample, 'altBkgFit', warmStartBins, tnpWorkspaceParam ))
     tnpWorkspace.extend(tnpWorkspaceFunc)
             
-    ## init fitter
+    title = tnpBin['title'].replace(';',' - ')
+    title = title.replace('probe_sc_eta','#eta_{SC}')
+    title = title.replace('probe_Ele_pt','p_{T}')
+
+    ## input histograms
     infile = rt.TFile(sample.histFile,'read')
     hP = infile.Get('%s_Pass' % tnpBin['name'] )
     hF = infile.Get('%s_Fail' % tnpBin['name'] )
-    fitter = tnpFitter( hP, hF, tnpBin['name'] )
-    infile.Close()
-
-    ## setup
-    rootpath = sample.altBkgFit.replace('.root', '-%s.root' % tnpBin['name'])
-    rootfile = rt.TFile(rootpath,'update')
-    fitter.setOutputFile( rootfile )
-#    fitter.setFitRange(65,115)
 
     ## generated Z LineShape
     ## for high pT change the failing spectra to any probe to get statistics
@@ -231,6 +454,33 @@ def histFitterAltBkg( sample, tnpBin, tnpWorkspaceParam ):
     if ptMin( tnpBin ) > minPtForSwitch: 
         histZLineShapeF = fileTruth.Get('%s_Pass'%tnpBin['name'])
 #        fitter.fixSigmaFtoSigmaP()
+
+    fitOptions = ['altBkgFit',sample.mcTruth,sample.isMC,title]
+    if simFit:
+        fitOptions.extend( ['simFit'] + list(sharedPars) )
+    fitKey = fitCacheKey( [hP,hF,histZLineShapeP,histZLineShapeF], tnpWorkspace, fitOptions )
+
+    ### keyOnly: cache key of the fit, without fitting
+    if keyOnly:
+        fileTruth.Close()
+        infile.Close()
+        return fitKey
+
+    if useCache and checkFitCache( sample.altBkgFit, tnpBin, fitKey, inMemory ):
+        fileTruth.Close()
+        infile.Close()
+        return None
+    rootfile = openFitOutput( sample.altBkgFit, tnpBin, inMemory )
+
+    ## init fitter
+    fitter = tnpFitter( hP, hF, tnpBin['name'] )
+    infile.Close()
+
+    ## setup
+    fitter.useSimultaneousFit( simFit )
+    fitter.setPlots( doPlot )
+    fitter.setOutputFile( rootfile )
+#    fitter.setFitRange(65,115)
     fitter.setZLineShapes(histZLineShapeP,histZLineShapeF)
     fileTruth.Close()
 
@@ -240,10 +490,8 @@ def histFitterAltBkg( sample, tnpBin, tnpWorkspaceParam ):
         workspace.push_back(iw)
     fitter.setWorkspace( workspace )
 
-    title = tnpBin['title'].replace(';',' - ')
-    title = title.replace('probe_sc_eta','#eta_{SC}')
-    title = title.replace('probe_Ele_pt','p_{T}')
     fitter.fits(sample.mcTruth,sample.isMC,title)
-    rootfile.Close()
+    storeFitKey( rootfile, tnpBin, fitKey )
+    return closeFitOutput( rootfile, tnpBin, inMemory )
 
 
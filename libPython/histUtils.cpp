@@ -3,42 +3,13 @@
 /* BEGIN: Cython Metadata
 {
     "distutils": {
-        "depends": [], 
-        "extra_compile_args": [
-            "-fno-strict-aliasing", 
-            "-g", 
-            "-O2", 
-            "-DNDEBUG", 
-            "-g", 
-            "-fwrapv", 
-            "-O3", 
-            "-Wall", 
-            "-Wstrict-prototypes"
-        ], 
-        "extra_link_args": [
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/expat/2.1.0-bcolbf2/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/expat/2.1.0-bcolbf2/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/bz2lib/1.0.6-bcolbf2/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/bz2lib/1.0.6-bcolbf2/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/db6/6.2.32-bcolbf/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/db6/6.2.32-bcolbf/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/gdbm/1.10-bcolbf2/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/gdbm/1.10-bcolbf2/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/openssl/1.0.2d-bcolbf/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/openssl/1.0.2d-bcolbf/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/libffi/3.2.1-bcolbf/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/libffi/3.2.1-bcolbf/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/zlib/1.2.11-bcolbf/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/zlib/1.2.11-bcolbf/lib64", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/sqlite/3.22.0-bcolbf/lib", 
-            "-L/cvmfs/cms.cern.ch/slc7_amd64_gcc820/external/sqlite/3.22.0-bcolbf/lib64"
-        ], 
-        "language": "c++", 
-        "name": "histUtils", 
+        "depends": [],
+        "language": "c++",
+        "name": "histUtils",
         "sources": [
             "histUtils.pyx"
         ]
-    }, 
+    },
     "module_name": "histUtils"
 }
 END: Cython Metadata */
@@ -1049,6 +1020,9 @@ static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject
 static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
+/* None.proto */
+static CYTHON_INLINE long __Pyx_div_long(long, long);
+
 /* RaiseArgTupleInvalid.proto */
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
@@ -1061,11 +1035,51 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
 #else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+}
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+}
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
 /* PyFunctionFastCall.proto */
@@ -1091,6 +1105,13 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
     (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
 #endif
 
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
 /* PyObjectCall.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
@@ -1109,6 +1130,48 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_SubtractObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* DictGetItem.proto */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
+
 /* GetItemInt.proto */
 #define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
     (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
@@ -1131,23 +1194,31 @@ static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
 static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
                                                      int is_list, int wraparound, int boundscheck);
 
-/* DictGetItem.proto */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
-static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
-#define __Pyx_PyObject_Dict_GetItem(obj, name)\
-    (likely(PyDict_CheckExact(obj)) ?\
-     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
 #else
-#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
-#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
 #endif
 
-/* ListAppend.proto */
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* ListCompAppend.proto */
 #if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
     PyListObject* L = (PyListObject*) list;
     Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+    if (likely(L->allocated > len)) {
         Py_INCREF(x);
         PyList_SET_ITEM(list, len, x);
         __Pyx_SET_SIZE(list, len + 1);
@@ -1156,26 +1227,18 @@ static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
     return PyList_Append(list, x);
 }
 #else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
 #endif
 
-/* StringJoin.proto */
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyString_Join __Pyx_PyBytes_Join
-#define __Pyx_PyBaseString_Join(s, v) (PyUnicode_CheckExact(s) ? PyUnicode_Join(s, v) : __Pyx_PyBytes_Join(s, v))
-#else
-#define __Pyx_PyString_Join PyUnicode_Join
-#define __Pyx_PyBaseString_Join PyUnicode_Join
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-    #if PY_MAJOR_VERSION < 3
-    #define __Pyx_PyBytes_Join _PyString_Join
-    #else
-    #define __Pyx_PyBytes_Join _PyBytes_Join
-    #endif
-#else
-static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values);
-#endif
+/* SetItemInt.proto */
+#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
+                                               int is_list, int wraparound, int boundscheck);
 
 /* IncludeStringH.proto */
 #include <string.h>
@@ -1193,73 +1256,24 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
 #endif
 
-/* PyDictVersioning.proto */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
-#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
-    (version_var) = __PYX_GET_DICT_VERSION(dict);\
-    (cache_var) = (value);
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __pyx_dict_cached_value;\
-    } else {\
-        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
-        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
-    }\
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
-#else
-#define __PYX_GET_DICT_VERSION(dict)  (0)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
-#endif
-
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+/* StringJoin.proto */
+#if PY_MAJOR_VERSION < 3
+#define __Pyx_PyString_Join __Pyx_PyBytes_Join
+#define __Pyx_PyBaseString_Join(s, v) (PyUnicode_CheckExact(s) ? PyUnicode_Join(s, v) : __Pyx_PyBytes_Join(s, v))
 #else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#define __Pyx_PyString_Join PyUnicode_Join
+#define __Pyx_PyBaseString_Join PyUnicode_Join
 #endif
-
-/* ListCompAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len)) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyBytes_Join _PyString_Join
+    #else
+    #define __Pyx_PyBytes_Join _PyBytes_Join
+    #endif
 #else
-#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values);
 #endif
 
-/* IterFinish.proto */
-static CYTHON_INLINE int __Pyx_IterFinish(void);
-
 /* set_iter.proto */
 static CYTHON_INLINE PyObject* __Pyx_set_iterator(PyObject* iterable, int is_set,
                                                   Py_ssize_t* p_orig_length, int* p_source_is_set);
@@ -1268,15 +1282,32 @@ static CYTHON_INLINE int __Pyx_set_iter_next(
         Py_ssize_t* ppos, PyObject **value,
         int source_is_set);
 
-/* None.proto */
-static CYTHON_INLINE long __Pyx_div_long(long, long);
+/* PyIntCompare.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
 
-/* None.proto */
-static CYTHON_INLINE int __Pyx_mod_int(int, int);
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
+
+/* append.proto */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
 
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
 /* PyErrFetchRestore.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
@@ -1338,6 +1369,9 @@ static PyObject* __pyx_print = 0;
 static PyObject* __pyx_print_kwargs = 0;
 #endif
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -1389,6 +1423,12 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 /* PrintOne.proto */
 static int __Pyx_PrintOne(PyObject* stream, PyObject *o);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
@@ -1422,6 +1462,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* Module declarations from 'histUtils' */
 static void __pyx_f_9histUtils_removeNegativeBins(TH1D *); /*proto*/
+static int __pyx_f_9histUtils_findBin(std::vector<double>  &, bool, double); /*proto*/
 #define __Pyx_MODULE_NAME "histUtils"
 extern int __pyx_module_is_main_histUtils;
 int __pyx_module_is_main_histUtils = 0;
@@ -1430,38 +1471,56 @@ int __pyx_module_is_main_histUtils = 0;
 static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_xrange;
 static PyObject *__pyx_builtin_range;
-static const char __pyx_k_[] = ".";
+static PyObject *__pyx_builtin_sum;
+static const char __pyx_k_[] = "*";
+static const char __pyx_k_b[] = "b";
+static const char __pyx_k_c[] = "c";
+static const char __pyx_k_h[] = "h";
+static const char __pyx_k_i[] = "i";
 static const char __pyx_k_p[] = "p";
 static const char __pyx_k_s[] = "%s";
+static const char __pyx_k_v[] = "v";
 static const char __pyx_k_x[] = "x";
-static const char __pyx_k__2[] = "&";
-static const char __pyx_k__3[] = "|";
-static const char __pyx_k__4[] = "-";
-static const char __pyx_k__5[] = "(";
-static const char __pyx_k__6[] = ")";
-static const char __pyx_k__7[] = ">";
-static const char __pyx_k__8[] = "<";
-static const char __pyx_k__9[] = "=";
+static const char __pyx_k__2[] = "?";
+static const char __pyx_k__4[] = ".";
+static const char __pyx_k__5[] = " && ";
+static const char __pyx_k__6[] = ", ";
+static const char __pyx_k__7[] = "&";
+static const char __pyx_k__8[] = "|";
+static const char __pyx_k__9[] = "-";
 static const char __pyx_k_br[] = "br";
+static const char __pyx_k_ia[] = "ia";
 static const char __pyx_k_ib[] = "ib";
-static const char __pyx_k__10[] = "!";
-static const char __pyx_k__11[] = "*";
-static const char __pyx_k__12[] = "/";
-static const char __pyx_k__13[] = "[";
-static const char __pyx_k__14[] = "]";
-static const char __pyx_k__15[] = " ";
-static const char __pyx_k__16[] = "";
-static const char __pyx_k__17[] = "%";
+static const char __pyx_k_ih[] = "ih";
+static const char __pyx_k_ip[] = "ip";
+static const char __pyx_k_iv[] = "iv";
+static const char __pyx_k__10[] = "(";
+static const char __pyx_k__11[] = ")";
+static const char __pyx_k__12[] = ">";
+static const char __pyx_k__13[] = "<";
+static const char __pyx_k__14[] = "=";
+static const char __pyx_k__15[] = "!";
+static const char __pyx_k__16[] = "/";
+static const char __pyx_k__17[] = "[";
+static const char __pyx_k__18[] = "]";
+static const char __pyx_k__19[] = " ";
+static const char __pyx_k__20[] = "";
+static const char __pyx_k__21[] = "%";
 static const char __pyx_k_abs[] = "abs(";
 static const char __pyx_k_cos[] = "cos(";
 static const char __pyx_k_cut[] = "cut";
 static const char __pyx_k_eff[] = "eff";
 static const char __pyx_k_end[] = "end";
+static const char __pyx_k_int[] = "int";
 static const char __pyx_k_max[] = "max";
 static const char __pyx_k_min[] = "min";
-static const char __pyx_k_s_2[] = "s";
+static const char __pyx_k_s_2[] = "( %s )";
+static const char __pyx_k_s_3[] = "s";
 static const char __pyx_k_s_s[] = "%s && %s";
+static const char __pyx_k_sum[] = "sum";
 static const char __pyx_k_var[] = "var";
+static const char __pyx_k_Fail[] = "Fail";
+static const char __pyx_k_Pass[] = "Pass";
 static const char __pyx_k_bin1[] = "bin1";
 static const char __pyx_k_bin2[] = "bin2";
 static const char __pyx_k_bins[] = "bins";
@@ -1476,66 +1535,143 @@ static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_math[] = "math";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_path[] = "path";
-static const char __pyx_k_sqrt[] = "sqrt(";
+static const char __pyx_k_sqrt[] = "sqrt";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_tree[] = "tree";
+static const char __pyx_k_type[] = "type";
+static const char __pyx_k_vals[] = "vals";
+static const char __pyx_k_vars[] = "vars";
+static const char __pyx_k_atoms[] = "atoms";
 static const char __pyx_k_bnidx[] = "bnidx";
+static const char __pyx_k_chain[] = "chain";
 static const char __pyx_k_e_eff[] = "e_eff";
+static const char __pyx_k_edges[] = "edges";
 static const char __pyx_k_efail[] = "efail";
 static const char __pyx_k_epass[] = "epass";
 static const char __pyx_k_failI[] = "failI";
+static const char __pyx_k_flags[] = "flags";
 static const char __pyx_k_hFail[] = "hFail";
 static const char __pyx_k_hPass[] = "hPass";
+static const char __pyx_k_iatom[] = "iatom";
+static const char __pyx_k_iflag[] = "iflag";
 static const char __pyx_k_index[] = "index";
+static const char __pyx_k_ivbin[] = "ivbin";
 static const char __pyx_k_nbins[] = "nbins";
 static const char __pyx_k_nevts[] = "nevts";
+static const char __pyx_k_nvars[] = "nvars";
 static const char __pyx_k_passI[] = "passI";
 static const char __pyx_k_print[] = "print";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_s_s_2[] = "( %s ) * %s ";
 static const char __pyx_k_split[] = "split";
+static const char __pyx_k_sumw2[] = "sumw2";
 static const char __pyx_k_title[] = "title";
+static const char __pyx_k_addCut[] = "addCut";
+static const char __pyx_k_append[] = "append";
 static const char __pyx_k_bindef[] = "bindef";
+static const char __pyx_k_chunks[] = "chunks";
+static const char __pyx_k_common[] = "common";
 static const char __pyx_k_cutBin[] = "cutBin";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_merged[] = "merged";
 static const char __pyx_k_name_2[] = "__name__";
+static const char __pyx_k_natoms[] = "natoms";
+static const char __pyx_k_nflags[] = "nflags";
+static const char __pyx_k_passed[] = "passed";
 static const char __pyx_k_puTree[] = "puTree";
 static const char __pyx_k_s_Fail[] = "%s_Fail";
 static const char __pyx_k_s_Pass[] = "%s_Pass";
 static const char __pyx_k_sample[] = "sample";
-static const char __pyx_k_sqrt_2[] = "sqrt";
+static const char __pyx_k_sqrt_2[] = "sqrt(";
+static const char __pyx_k_stride[] = "stride";
 static const char __pyx_k_weight[] = "weight";
 static const char __pyx_k_xrange[] = "xrange";
+static const char __pyx_k_cutBase[] = "cutBase";
 static const char __pyx_k_mcTruth[] = "mcTruth";
+static const char __pyx_k_nChunks[] = "nChunks";
 static const char __pyx_k_outfile[] = "outfile";
 static const char __pyx_k_replace[] = "replace";
+static const char __pyx_k_atomTree[] = "atomTree";
+static const char __pyx_k_binUtils[] = "binUtils";
 static const char __pyx_k_branches[] = "branches";
+static const char __pyx_k_contents[] = "contents";
 static const char __pyx_k_histFile[] = "histFile";
+static const char __pyx_k_mcTrue_1[] = "mcTrue==1";
+static const char __pyx_k_nEntries[] = "nEntries";
 static const char __pyx_k_outcount[] = "outcount";
+static const char __pyx_k_sEntries[] = "%sEntries";
+static const char __pyx_k_binSearch[] = "binSearch";
+static const char __pyx_k_bin_atoms[] = "bin_atoms";
+static const char __pyx_k_chunkSize[] = "chunkSize";
+static const char __pyx_k_histFiles[] = "histFiles";
 static const char __pyx_k_histUtils[] = "histUtils";
 static const char __pyx_k_is_number[] = "is_number";
+static const char __pyx_k_lastEntry[] = "lastEntry";
 static const char __pyx_k_maxWeight[] = "maxWeight";
 static const char __pyx_k_pair_mass[] = " pair_mass ";
+static const char __pyx_k_s_Binning[] = "%s_Binning";
+static const char __pyx_k_s_f_s_1_0[] = "(%s < %f ? %s : 1.0 )";
+static const char __pyx_k_var_edges[] = "var_edges";
+static const char __pyx_k_var_isInt[] = "var_isInt";
 static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_atom_state[] = "atom_state";
+static const char __pyx_k_commonCuts[] = "commonCuts";
 static const char __pyx_k_cutBinList[] = "cutBinList";
+static const char __pyx_k_firstEntry[] = "firstEntry";
 static const char __pyx_k_s_mcTrue_1[] = "%s && mcTrue==1";
+static const char __pyx_k_weightExpr[] = "weightExpr";
+static const char __pyx_k_Cut_Term__d[] = "Cut_Term_%d";
+static const char __pyx_k_FailEntries[] = "FailEntries";
+static const char __pyx_k_PassEntries[] = "PassEntries";
+static const char __pyx_k_cutAtomTree[] = "cutAtomTree";
 static const char __pyx_k_pair_mass_2[] = "pair_mass";
-static const char __pyx_k_s_Selection[] = "%s_Selection";
-static const char __pyx_k_s_s_f_s_1_0[] = "( %s ) * (%s < %f ? %s : 1.0 )";
-static const char __pyx_k_bin_formulas[] = "bin_formulas";
-static const char __pyx_k_flag_formula[] = "flag_formula";
+static const char __pyx_k_var_strides[] = "var_strides";
+static const char __pyx_k_add_formulas[] = "add_formulas";
+static const char __pyx_k_contentsList[] = "contentsList";
+static const char __pyx_k_useBinSearch[] = "useBinSearch";
+static const char __pyx_k_var_formulas[] = "var_formulas";
+static const char __pyx_k_atom_formulas[] = "atom_formulas";
+static const char __pyx_k_decomposition[] = "decomposition";
+static const char __pyx_k_flag_formulas[] = "flag_formulas";
 static const char __pyx_k_formulas_list[] = "formulas_list";
 static const char __pyx_k_frac_of_nevts[] = "frac_of_nevts";
 static const char __pyx_k_histUtils_pyx[] = "histUtils.pyx";
+static const char __pyx_k_selectionList[] = "selectionList";
+static const char __pyx_k_additionalCuts[] = "additionalCuts";
+static const char __pyx_k_common_formula[] = "common_formula";
+static const char __pyx_k_entriesPerPath[] = "entriesPerPath";
+static const char __pyx_k_weight_formula[] = "weight_formula";
+static const char __pyx_k_addFormulaIndex[] = "addFormulaIndex";
 static const char __pyx_k_adding_rootfile[] = " adding rootfile: ";
+static const char __pyx_k_makeEntryChunks[] = "makeEntryChunks";
+static const char __pyx_k_decomposeBinCuts[] = "decomposeBinCuts";
 static const char __pyx_k_replace_patterns[] = "replace_patterns";
+static const char __pyx_k_Flag_Selection__d[] = "Flag_Selection_%d";
+static const char __pyx_k_addDirectoryStatus[] = "addDirectoryStatus";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_histograms_saved_in_s[] = " - histograms saved in %s";
+static const char __pyx_k_mergePassFailContents[] = "mergePassFailContents";
+static const char __pyx_k_s_AdditionalSelection[] = "%s_AdditionalSelection";
+static const char __pyx_k_using_bin_search_on_s[] = " - using bin search on %s";
+static const char __pyx_k_fillPassFailHistograms[] = "fillPassFailHistograms";
 static const char __pyx_k_makePassFailHistograms[] = "makePassFailHistograms";
+static const char __pyx_k_writePassFailHistograms[] = "writePassFailHistograms";
 static const char __pyx_k_Adding_weight_tree_s_from_file[] = " - Adding weight tree: %s from file %s ";
-static const char __pyx_k_Starting_event_loop_to_fill_hist[] = "Starting event loop to fill histograms..";
+static const char __pyx_k_bin_cuts_cannot_be_decomposed_e[] = " - bin cuts cannot be decomposed, evaluating all bin selections";
+static const char __pyx_k_d_bin_selections_from_d_distinc[] = " - %d bin selections from %d distinct cut terms (%d common to all bins)";
+static const char __pyx_k_makePassFailHistogramsMultiFlag[] = "makePassFailHistogramsMultiFlag";
+static const char __pyx_k_writePassFailHistograms_need_on[] = "[writePassFailHistograms] need one histFile per flag (%d flags, %d files)";
+static const char __pyx_k_Starting_event_loop_to_fill_hist[] = "Starting event loop to fill histograms for %d flag(s) (entries %d to %d)..";
+static const char __pyx_k_makePassFailHistogramsMultiFlag_2[] = "[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)";
 static PyObject *__pyx_kp_s_;
 static PyObject *__pyx_kp_s_Adding_weight_tree_s_from_file;
+static PyObject *__pyx_kp_s_Cut_Term__d;
+static PyObject *__pyx_n_s_Fail;
+static PyObject *__pyx_n_s_FailEntries;
+static PyObject *__pyx_kp_s_Flag_Selection__d;
+static PyObject *__pyx_n_s_Pass;
+static PyObject *__pyx_n_s_PassEntries;
 static PyObject *__pyx_kp_s_Starting_event_loop_to_fill_hist;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_kp_s__10;
@@ -1546,8 +1682,11 @@ static PyObject *__pyx_kp_s__14;
 static PyObject *__pyx_kp_s__15;
 static PyObject *__pyx_kp_s__16;
 static PyObject *__pyx_kp_s__17;
+static PyObject *__pyx_kp_s__18;
+static PyObject *__pyx_kp_s__19;
 static PyObject *__pyx_kp_s__2;
-static PyObject *__pyx_kp_s__3;
+static PyObject *__pyx_kp_s__20;
+static PyObject *__pyx_kp_s__21;
 static PyObject *__pyx_kp_s__4;
 static PyObject *__pyx_kp_s__5;
 static PyObject *__pyx_kp_s__6;
@@ -1555,63 +1694,121 @@ static PyObject *__pyx_kp_s__7;
 static PyObject *__pyx_kp_s__8;
 static PyObject *__pyx_kp_s__9;
 static PyObject *__pyx_kp_s_abs;
+static PyObject *__pyx_n_s_addCut;
+static PyObject *__pyx_n_s_addDirectoryStatus;
+static PyObject *__pyx_n_s_addFormulaIndex;
+static PyObject *__pyx_n_s_add_formulas;
 static PyObject *__pyx_kp_s_adding_rootfile;
+static PyObject *__pyx_n_s_additionalCuts;
+static PyObject *__pyx_n_s_append;
+static PyObject *__pyx_n_s_atomTree;
+static PyObject *__pyx_n_s_atom_formulas;
+static PyObject *__pyx_n_s_atom_state;
+static PyObject *__pyx_n_s_atoms;
+static PyObject *__pyx_n_s_b;
 static PyObject *__pyx_n_s_bin1;
 static PyObject *__pyx_n_s_bin2;
-static PyObject *__pyx_n_s_bin_formulas;
+static PyObject *__pyx_n_s_binSearch;
+static PyObject *__pyx_n_s_binUtils;
+static PyObject *__pyx_n_s_bin_atoms;
+static PyObject *__pyx_kp_s_bin_cuts_cannot_be_decomposed_e;
 static PyObject *__pyx_n_s_bindef;
 static PyObject *__pyx_n_s_bins;
 static PyObject *__pyx_n_s_bnidx;
 static PyObject *__pyx_n_s_br;
 static PyObject *__pyx_n_s_branches;
+static PyObject *__pyx_n_s_c;
+static PyObject *__pyx_n_s_chain;
+static PyObject *__pyx_n_s_chunkSize;
+static PyObject *__pyx_n_s_chunks;
 static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_common;
+static PyObject *__pyx_n_s_commonCuts;
+static PyObject *__pyx_n_s_common_formula;
+static PyObject *__pyx_n_s_contents;
+static PyObject *__pyx_n_s_contentsList;
 static PyObject *__pyx_kp_s_cos;
 static PyObject *__pyx_n_s_cut;
+static PyObject *__pyx_n_s_cutAtomTree;
+static PyObject *__pyx_n_s_cutBase;
 static PyObject *__pyx_n_s_cutBin;
 static PyObject *__pyx_n_s_cutBinList;
 static PyObject *__pyx_n_s_cuts;
+static PyObject *__pyx_kp_s_d_bin_selections_from_d_distinc;
+static PyObject *__pyx_n_s_decomposeBinCuts;
+static PyObject *__pyx_n_s_decomposition;
 static PyObject *__pyx_n_s_e_eff;
+static PyObject *__pyx_n_s_edges;
 static PyObject *__pyx_n_s_efail;
 static PyObject *__pyx_n_s_eff;
 static PyObject *__pyx_n_s_encode;
 static PyObject *__pyx_n_s_end;
+static PyObject *__pyx_n_s_entriesPerPath;
 static PyObject *__pyx_n_s_epass;
 static PyObject *__pyx_kp_s_fabs;
 static PyObject *__pyx_n_s_failI;
 static PyObject *__pyx_n_s_file;
+static PyObject *__pyx_n_s_fillPassFailHistograms;
+static PyObject *__pyx_n_s_firstEntry;
 static PyObject *__pyx_n_s_flag;
-static PyObject *__pyx_n_s_flag_formula;
+static PyObject *__pyx_n_s_flag_formulas;
+static PyObject *__pyx_n_s_flags;
 static PyObject *__pyx_n_s_formulas_list;
 static PyObject *__pyx_n_s_frac_of_nevts;
+static PyObject *__pyx_n_s_h;
 static PyObject *__pyx_n_s_hFail;
 static PyObject *__pyx_n_s_hPass;
 static PyObject *__pyx_n_s_histFile;
+static PyObject *__pyx_n_s_histFiles;
 static PyObject *__pyx_n_s_histUtils;
 static PyObject *__pyx_kp_s_histUtils_pyx;
+static PyObject *__pyx_kp_s_histograms_saved_in_s;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_ia;
+static PyObject *__pyx_n_s_iatom;
 static PyObject *__pyx_n_s_ib;
+static PyObject *__pyx_n_s_iflag;
+static PyObject *__pyx_n_s_ih;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_index;
+static PyObject *__pyx_n_s_int;
+static PyObject *__pyx_n_s_ip;
 static PyObject *__pyx_n_s_isMC;
 static PyObject *__pyx_n_s_is_number;
 static PyObject *__pyx_n_s_itot;
+static PyObject *__pyx_n_s_iv;
+static PyObject *__pyx_n_s_ivbin;
 static PyObject *__pyx_n_s_join;
+static PyObject *__pyx_n_s_lastEntry;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_makeEntryChunks;
 static PyObject *__pyx_n_s_makePassFailHistograms;
+static PyObject *__pyx_n_s_makePassFailHistogramsMultiFlag;
+static PyObject *__pyx_kp_s_makePassFailHistogramsMultiFlag_2;
 static PyObject *__pyx_n_s_math;
 static PyObject *__pyx_n_s_max;
 static PyObject *__pyx_n_s_maxWeight;
+static PyObject *__pyx_kp_s_mcTrue_1;
 static PyObject *__pyx_n_s_mcTruth;
+static PyObject *__pyx_n_s_mergePassFailContents;
+static PyObject *__pyx_n_s_merged;
 static PyObject *__pyx_n_s_min;
+static PyObject *__pyx_n_s_nChunks;
+static PyObject *__pyx_n_s_nEntries;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
+static PyObject *__pyx_n_s_natoms;
 static PyObject *__pyx_n_s_nbins;
 static PyObject *__pyx_n_s_nevts;
+static PyObject *__pyx_n_s_nflags;
+static PyObject *__pyx_n_s_nvars;
 static PyObject *__pyx_n_s_outcount;
 static PyObject *__pyx_n_s_outfile;
 static PyObject *__pyx_n_s_p;
 static PyObject *__pyx_kp_s_pair_mass;
 static PyObject *__pyx_n_s_pair_mass_2;
 static PyObject *__pyx_n_s_passI;
+static PyObject *__pyx_n_s_passed;
 static PyObject *__pyx_n_s_path;
 static PyObject *__pyx_n_s_print;
 static PyObject *__pyx_n_s_puTree;
@@ -1619,36 +1816,77 @@ static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_replace;
 static PyObject *__pyx_n_s_replace_patterns;
 static PyObject *__pyx_kp_s_s;
-static PyObject *__pyx_n_s_s_2;
+static PyObject *__pyx_kp_s_sEntries;
+static PyObject *__pyx_kp_s_s_2;
+static PyObject *__pyx_n_s_s_3;
+static PyObject *__pyx_kp_s_s_AdditionalSelection;
+static PyObject *__pyx_kp_s_s_Binning;
 static PyObject *__pyx_kp_s_s_Fail;
 static PyObject *__pyx_kp_s_s_Pass;
-static PyObject *__pyx_kp_s_s_Selection;
+static PyObject *__pyx_kp_s_s_f_s_1_0;
 static PyObject *__pyx_kp_s_s_mcTrue_1;
 static PyObject *__pyx_kp_s_s_s;
 static PyObject *__pyx_kp_s_s_s_2;
-static PyObject *__pyx_kp_s_s_s_f_s_1_0;
 static PyObject *__pyx_n_s_sample;
+static PyObject *__pyx_n_s_selectionList;
 static PyObject *__pyx_n_s_split;
-static PyObject *__pyx_kp_s_sqrt;
-static PyObject *__pyx_n_s_sqrt_2;
+static PyObject *__pyx_n_s_sqrt;
+static PyObject *__pyx_kp_s_sqrt_2;
+static PyObject *__pyx_n_s_stride;
+static PyObject *__pyx_n_s_sum;
+static PyObject *__pyx_n_s_sumw2;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_title;
 static PyObject *__pyx_n_s_tree;
+static PyObject *__pyx_n_s_type;
+static PyObject *__pyx_n_s_useBinSearch;
+static PyObject *__pyx_kp_s_using_bin_search_on_s;
+static PyObject *__pyx_n_s_v;
+static PyObject *__pyx_n_s_vals;
 static PyObject *__pyx_n_s_var;
+static PyObject *__pyx_n_s_var_edges;
+static PyObject *__pyx_n_s_var_formulas;
+static PyObject *__pyx_n_s_var_isInt;
+static PyObject *__pyx_n_s_var_strides;
+static PyObject *__pyx_n_s_vars;
 static PyObject *__pyx_n_s_weight;
+static PyObject *__pyx_n_s_weightExpr;
+static PyObject *__pyx_n_s_weight_formula;
+static PyObject *__pyx_n_s_writePassFailHistograms;
+static PyObject *__pyx_kp_s_writePassFailHistograms_need_on;
 static PyObject *__pyx_n_s_x;
 static PyObject *__pyx_n_s_xrange;
 static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_s); /* proto */
 static PyObject *__pyx_pf_9histUtils_2makePassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flag, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var); /* proto */
+static PyObject *__pyx_pf_9histUtils_4makePassFailHistogramsMultiFlag(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flags, PyObject *__pyx_v_histFiles, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_binSearch); /* proto */
+static PyObject *__pyx_pf_9histUtils_6makeEntryChunks(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_nChunks); /* proto */
+static PyObject *__pyx_pf_9histUtils_8mergePassFailContents(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_contentsList); /* proto */
+static PyObject *__pyx_pf_9histUtils_10writePassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_histFiles, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_contents); /* proto */
+static PyObject *__pyx_pf_9histUtils_12fillPassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flags, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_firstEntry, PyObject *__pyx_v_nEntries, PyObject *__pyx_v_entriesPerPath, PyObject *__pyx_v_binSearch); /* proto */
 static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_20;
 static PyObject *__pyx_int_999;
-static PyObject *__pyx_tuple__18;
-static PyObject *__pyx_tuple__20;
-static PyObject *__pyx_codeobj__19;
-static PyObject *__pyx_codeobj__21;
+static PyObject *__pyx_int_neg_1;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__22;
+static PyObject *__pyx_tuple__24;
+static PyObject *__pyx_tuple__26;
+static PyObject *__pyx_tuple__28;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_tuple__32;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_codeobj__23;
+static PyObject *__pyx_codeobj__25;
+static PyObject *__pyx_codeobj__27;
+static PyObject *__pyx_codeobj__29;
+static PyObject *__pyx_codeobj__31;
+static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
 /* Late includes */
 
-/* "histUtils.pyx":10
+/* "histUtils.pyx":12
  * 
  * # Check if a string can be a number
  * def is_number(s):             # <<<<<<<<<<<<<<
@@ -1686,7 +1924,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_number", 0);
 
-  /* "histUtils.pyx":11
+  /* "histUtils.pyx":13
  * # Check if a string can be a number
  * def is_number(s):
  *     try:             # <<<<<<<<<<<<<<
@@ -1702,16 +1940,16 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "histUtils.pyx":12
+      /* "histUtils.pyx":14
  * def is_number(s):
  *     try:
  *         float(s)             # <<<<<<<<<<<<<<
  *         return True
  *     except ValueError:
  */
-      __pyx_t_4 = __Pyx_PyObject_AsDouble(__pyx_v_s); if (unlikely(__pyx_t_4 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 12, __pyx_L3_error)
+      __pyx_t_4 = __Pyx_PyObject_AsDouble(__pyx_v_s); if (unlikely(__pyx_t_4 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L3_error)
 
-      /* "histUtils.pyx":13
+      /* "histUtils.pyx":15
  *     try:
  *         float(s)
  *         return True             # <<<<<<<<<<<<<<
@@ -1723,7 +1961,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
       __pyx_r = Py_True;
       goto __pyx_L7_try_return;
 
-      /* "histUtils.pyx":11
+      /* "histUtils.pyx":13
  * # Check if a string can be a number
  * def is_number(s):
  *     try:             # <<<<<<<<<<<<<<
@@ -1733,7 +1971,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
     }
     __pyx_L3_error:;
 
-    /* "histUtils.pyx":14
+    /* "histUtils.pyx":16
  *         float(s)
  *         return True
  *     except ValueError:             # <<<<<<<<<<<<<<
@@ -1743,12 +1981,12 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
     __pyx_t_5 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ValueError);
     if (__pyx_t_5) {
       __Pyx_AddTraceback("histUtils.is_number", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 14, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8) < 0) __PYX_ERR(0, 16, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
       __Pyx_GOTREF(__pyx_t_8);
 
-      /* "histUtils.pyx":15
+      /* "histUtils.pyx":17
  *         return True
  *     except ValueError:
  *         return False             # <<<<<<<<<<<<<<
@@ -1766,7 +2004,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "histUtils.pyx":11
+    /* "histUtils.pyx":13
  * # Check if a string can be a number
  * def is_number(s):
  *     try:             # <<<<<<<<<<<<<<
@@ -1792,7 +2030,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
     goto __pyx_L0;
   }
 
-  /* "histUtils.pyx":10
+  /* "histUtils.pyx":12
  * 
  * # Check if a string can be a number
  * def is_number(s):             # <<<<<<<<<<<<<<
@@ -1813,7 +2051,7 @@ static PyObject *__pyx_pf_9histUtils_is_number(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "histUtils.pyx":17
+/* "histUtils.pyx":19
  *         return False
  * 
  * cdef void removeNegativeBins(TH1D* h):             # <<<<<<<<<<<<<<
@@ -1830,7 +2068,7 @@ static void __pyx_f_9histUtils_removeNegativeBins(TH1D *__pyx_v_h) {
   int __pyx_t_4;
   __Pyx_RefNannySetupContext("removeNegativeBins", 0);
 
-  /* "histUtils.pyx":18
+  /* "histUtils.pyx":20
  * 
  * cdef void removeNegativeBins(TH1D* h):
  *     for i in xrange(h.GetNbinsX()):             # <<<<<<<<<<<<<<
@@ -1842,7 +2080,7 @@ static void __pyx_f_9histUtils_removeNegativeBins(TH1D *__pyx_v_h) {
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_i = __pyx_t_3;
 
-    /* "histUtils.pyx":19
+    /* "histUtils.pyx":21
  * cdef void removeNegativeBins(TH1D* h):
  *     for i in xrange(h.GetNbinsX()):
  *         if (h.GetBinContent(i) < 0):             # <<<<<<<<<<<<<<
@@ -1852,16 +2090,16 @@ static void __pyx_f_9histUtils_removeNegativeBins(TH1D *__pyx_v_h) {
     __pyx_t_4 = ((__pyx_v_h->GetBinContent(__pyx_v_i) < 0.0) != 0);
     if (__pyx_t_4) {
 
-      /* "histUtils.pyx":20
+      /* "histUtils.pyx":22
  *     for i in xrange(h.GetNbinsX()):
  *         if (h.GetBinContent(i) < 0):
  *             h.SetBinContent(i, 0)             # <<<<<<<<<<<<<<
  * 
- * ##################################
+ * # Find the bin of x in the edges of a float variable (binary search)
  */
       __pyx_v_h->SetBinContent(__pyx_v_i, 0.0);
 
-      /* "histUtils.pyx":19
+      /* "histUtils.pyx":21
  * cdef void removeNegativeBins(TH1D* h):
  *     for i in xrange(h.GetNbinsX()):
  *         if (h.GetBinContent(i) < 0):             # <<<<<<<<<<<<<<
@@ -1871,7 +2109,7 @@ static void __pyx_f_9histUtils_removeNegativeBins(TH1D *__pyx_v_h) {
     }
   }
 
-  /* "histUtils.pyx":17
+  /* "histUtils.pyx":19
  *         return False
  * 
  * cdef void removeNegativeBins(TH1D* h):             # <<<<<<<<<<<<<<
@@ -1884,38 +2122,272 @@ static void __pyx_f_9histUtils_removeNegativeBins(TH1D *__pyx_v_h) {
 }
 
 /* "histUtils.pyx":26
- * ##################################
- * 
- * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
- * 
- *     #####################
+ * # Find the bin of x in the edges of a float variable (binary search)
+ * # or in the list of values of an int variable, -1 if not found
+ * cdef int findBin(vector[double]& edges, bool isInt, double x):             # <<<<<<<<<<<<<<
+ *     cdef int lo = 0
+ *     cdef int hi = edges.size() - 1
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_9histUtils_3makePassFailHistograms = {"makePassFailHistograms", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_3makePassFailHistograms, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_sample = 0;
-  PyObject *__pyx_v_flag = 0;
-  PyObject *__pyx_v_bindef = 0;
-  PyObject *__pyx_v_var = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
+static int __pyx_f_9histUtils_findBin(std::vector<double>  &__pyx_v_edges, bool __pyx_v_isInt, double __pyx_v_x) {
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_mid;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("makePassFailHistograms (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sample,&__pyx_n_s_flag,&__pyx_n_s_bindef,&__pyx_n_s_var,0};
-    PyObject* values[4] = {0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
+  int __pyx_t_1;
+  std::vector<double> ::size_type __pyx_t_2;
+  std::vector<double> ::size_type __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("findBin", 0);
+
+  /* "histUtils.pyx":27
+ * # or in the list of values of an int variable, -1 if not found
+ * cdef int findBin(vector[double]& edges, bool isInt, double x):
+ *     cdef int lo = 0             # <<<<<<<<<<<<<<
+ *     cdef int hi = edges.size() - 1
+ *     cdef int mid
+ */
+  __pyx_v_lo = 0;
+
+  /* "histUtils.pyx":28
+ * cdef int findBin(vector[double]& edges, bool isInt, double x):
+ *     cdef int lo = 0
+ *     cdef int hi = edges.size() - 1             # <<<<<<<<<<<<<<
+ *     cdef int mid
+ *     if isInt:
+ */
+  __pyx_v_hi = (__pyx_v_edges.size() - 1);
+
+  /* "histUtils.pyx":30
+ *     cdef int hi = edges.size() - 1
+ *     cdef int mid
+ *     if isInt:             # <<<<<<<<<<<<<<
+ *         for mid in range(edges.size()):
+ *             if edges[mid] == x:
+ */
+  __pyx_t_1 = (__pyx_v_isInt != 0);
+  if (__pyx_t_1) {
+
+    /* "histUtils.pyx":31
+ *     cdef int mid
+ *     if isInt:
+ *         for mid in range(edges.size()):             # <<<<<<<<<<<<<<
+ *             if edges[mid] == x:
+ *                 return mid
+ */
+    __pyx_t_2 = __pyx_v_edges.size();
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_mid = __pyx_t_4;
+
+      /* "histUtils.pyx":32
+ *     if isInt:
+ *         for mid in range(edges.size()):
+ *             if edges[mid] == x:             # <<<<<<<<<<<<<<
+ *                 return mid
+ *         return -1
+ */
+      __pyx_t_1 = (((__pyx_v_edges[__pyx_v_mid]) == __pyx_v_x) != 0);
+      if (__pyx_t_1) {
+
+        /* "histUtils.pyx":33
+ *         for mid in range(edges.size()):
+ *             if edges[mid] == x:
+ *                 return mid             # <<<<<<<<<<<<<<
+ *         return -1
+ *     # same convention as the bin cuts: low edge included, high edge excluded
+ */
+        __pyx_r = __pyx_v_mid;
+        goto __pyx_L0;
+
+        /* "histUtils.pyx":32
+ *     if isInt:
+ *         for mid in range(edges.size()):
+ *             if edges[mid] == x:             # <<<<<<<<<<<<<<
+ *                 return mid
+ *         return -1
+ */
+      }
+    }
+
+    /* "histUtils.pyx":34
+ *             if edges[mid] == x:
+ *                 return mid
+ *         return -1             # <<<<<<<<<<<<<<
+ *     # same convention as the bin cuts: low edge included, high edge excluded
+ *     if not (x >= edges[lo] and x < edges[hi]):
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "histUtils.pyx":30
+ *     cdef int hi = edges.size() - 1
+ *     cdef int mid
+ *     if isInt:             # <<<<<<<<<<<<<<
+ *         for mid in range(edges.size()):
+ *             if edges[mid] == x:
+ */
+  }
+
+  /* "histUtils.pyx":36
+ *         return -1
+ *     # same convention as the bin cuts: low edge included, high edge excluded
+ *     if not (x >= edges[lo] and x < edges[hi]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     while hi - lo > 1:
+ */
+  __pyx_t_5 = ((__pyx_v_x >= (__pyx_v_edges[__pyx_v_lo])) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_5 = ((__pyx_v_x < (__pyx_v_edges[__pyx_v_hi])) != 0);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_L8_bool_binop_done:;
+  __pyx_t_5 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_5) {
+
+    /* "histUtils.pyx":37
+ *     # same convention as the bin cuts: low edge included, high edge excluded
+ *     if not (x >= edges[lo] and x < edges[hi]):
+ *         return -1             # <<<<<<<<<<<<<<
+ *     while hi - lo > 1:
+ *         mid = (lo + hi) / 2
+ */
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "histUtils.pyx":36
+ *         return -1
+ *     # same convention as the bin cuts: low edge included, high edge excluded
+ *     if not (x >= edges[lo] and x < edges[hi]):             # <<<<<<<<<<<<<<
+ *         return -1
+ *     while hi - lo > 1:
+ */
+  }
+
+  /* "histUtils.pyx":38
+ *     if not (x >= edges[lo] and x < edges[hi]):
+ *         return -1
+ *     while hi - lo > 1:             # <<<<<<<<<<<<<<
+ *         mid = (lo + hi) / 2
+ *         if x >= edges[mid]:
+ */
+  while (1) {
+    __pyx_t_5 = (((__pyx_v_hi - __pyx_v_lo) > 1) != 0);
+    if (!__pyx_t_5) break;
+
+    /* "histUtils.pyx":39
+ *         return -1
+ *     while hi - lo > 1:
+ *         mid = (lo + hi) / 2             # <<<<<<<<<<<<<<
+ *         if x >= edges[mid]:
+ *             lo = mid
+ */
+    __pyx_v_mid = __Pyx_div_long((__pyx_v_lo + __pyx_v_hi), 2);
+
+    /* "histUtils.pyx":40
+ *     while hi - lo > 1:
+ *         mid = (lo + hi) / 2
+ *         if x >= edges[mid]:             # <<<<<<<<<<<<<<
+ *             lo = mid
+ *         else:
+ */
+    __pyx_t_5 = ((__pyx_v_x >= (__pyx_v_edges[__pyx_v_mid])) != 0);
+    if (__pyx_t_5) {
+
+      /* "histUtils.pyx":41
+ *         mid = (lo + hi) / 2
+ *         if x >= edges[mid]:
+ *             lo = mid             # <<<<<<<<<<<<<<
+ *         else:
+ *             hi = mid
+ */
+      __pyx_v_lo = __pyx_v_mid;
+
+      /* "histUtils.pyx":40
+ *     while hi - lo > 1:
+ *         mid = (lo + hi) / 2
+ *         if x >= edges[mid]:             # <<<<<<<<<<<<<<
+ *             lo = mid
+ *         else:
+ */
+      goto __pyx_L12;
+    }
+
+    /* "histUtils.pyx":43
+ *             lo = mid
+ *         else:
+ *             hi = mid             # <<<<<<<<<<<<<<
+ *     return lo
+ * 
+ */
+    /*else*/ {
+      __pyx_v_hi = __pyx_v_mid;
+    }
+    __pyx_L12:;
+  }
+
+  /* "histUtils.pyx":44
+ *         else:
+ *             hi = mid
+ *     return lo             # <<<<<<<<<<<<<<
+ * 
+ * ##################################
+ */
+  __pyx_r = __pyx_v_lo;
+  goto __pyx_L0;
+
+  /* "histUtils.pyx":26
+ * # Find the bin of x in the edges of a float variable (binary search)
+ * # or in the list of values of an int variable, -1 if not found
+ * cdef int findBin(vector[double]& edges, bool isInt, double x):             # <<<<<<<<<<<<<<
+ *     cdef int lo = 0
+ *     cdef int hi = edges.size() - 1
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "histUtils.pyx":50
+ * ##################################
+ * 
+ * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
+ *     makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_3makePassFailHistograms = {"makePassFailHistograms", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_3makePassFailHistograms, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sample = 0;
+  PyObject *__pyx_v_flag = 0;
+  PyObject *__pyx_v_bindef = 0;
+  PyObject *__pyx_v_var = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("makePassFailHistograms (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sample,&__pyx_n_s_flag,&__pyx_n_s_bindef,&__pyx_n_s_var,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -1932,23 +2404,23 @@ static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_sel
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_flag)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 1); __PYX_ERR(0, 26, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 1); __PYX_ERR(0, 50, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bindef)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 2); __PYX_ERR(0, 26, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 2); __PYX_ERR(0, 50, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_var)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 3); __PYX_ERR(0, 26, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, 3); __PYX_ERR(0, 50, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "makePassFailHistograms") < 0)) __PYX_ERR(0, 26, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "makePassFailHistograms") < 0)) __PYX_ERR(0, 50, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -1965,7 +2437,7 @@ static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_sel
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 26, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("makePassFailHistograms", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 50, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("histUtils.makePassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1979,1148 +2451,5243 @@ static PyObject *__pyx_pw_9histUtils_3makePassFailHistograms(PyObject *__pyx_sel
 }
 
 static PyObject *__pyx_pf_9histUtils_2makePassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flag, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var) {
-  float __pyx_v_pair_mass;
-  int __pyx_v_nbins;
-  int __pyx_v_nevts;
-  int __pyx_v_frac_of_nevts;
-  int __pyx_v_index;
-  int __pyx_v_bnidx;
-  int __pyx_v_outcount;
-  double __pyx_v_weight;
-  TChain *__pyx_v_tree;
-  TTreeFormula *__pyx_v_flag_formula;
-  std::vector<TTreeFormula *>  __pyx_v_bin_formulas;
-  std::vector<TH1D *>  __pyx_v_hPass;
-  std::vector<TH1D *>  __pyx_v_hFail;
-  TList __pyx_v_formulas_list;
-  double __pyx_v_epass;
-  double __pyx_v_efail;
-  PyObject *__pyx_v_p = NULL;
-  TFile *__pyx_v_outfile;
-  PyObject *__pyx_v_cutBinList = NULL;
-  Py_ssize_t __pyx_v_ib;
-  PyObject *__pyx_v_cuts = NULL;
-  PyObject *__pyx_v_cutBin = NULL;
-  PyObject *__pyx_v_replace_patterns = NULL;
-  PyObject *__pyx_v_branches = NULL;
-  PyObject *__pyx_v_br = NULL;
-  long __pyx_v_bin1;
-  int __pyx_v_bin2;
-  double __pyx_v_passI;
-  double __pyx_v_failI;
-  CYTHON_UNUSED double __pyx_v_eff;
-  CYTHON_UNUSED PyObject *__pyx_v_e_eff = NULL;
-  double __pyx_v_itot;
-  PyObject *__pyx_v_x = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  const char *__pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *(*__pyx_t_5)(PyObject *);
-  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  const char *__pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  int __pyx_t_13;
-  double __pyx_t_14;
-  double __pyx_t_15;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  PyObject *__pyx_t_18 = NULL;
-  int __pyx_t_19;
-  int __pyx_t_20;
-  int __pyx_t_21;
-  int __pyx_t_22;
-  int __pyx_t_23;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("makePassFailHistograms", 0);
 
-  /* "histUtils.pyx":36
+  /* "histUtils.pyx":51
  * 
- *     # For the loop
- *     cdef int nbins = 0             # <<<<<<<<<<<<<<
- *     cdef int nevts
- *     cdef int frac_of_nevts
- */
-  __pyx_v_nbins = 0;
-
-  /* "histUtils.pyx":41
- *     cdef int index
- *     cdef int bnidx
- *     cdef int outcount = 0             # <<<<<<<<<<<<<<
- *     cdef double weight
+ * def makePassFailHistograms( sample, flag, bindef, var ):
+ *     makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )             # <<<<<<<<<<<<<<
  * 
+ * #####################################################
  */
-  __pyx_v_outcount = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_makePassFailHistogramsMultiFlag); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_flag);
+  __Pyx_GIVEREF(__pyx_v_flag);
+  PyList_SET_ITEM(__pyx_t_3, 0, __pyx_v_flag);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_histFile); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[6] = {__pyx_t_4, __pyx_v_sample, __pyx_t_3, __pyx_t_5, __pyx_v_bindef, __pyx_v_var};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 5+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[6] = {__pyx_t_4, __pyx_v_sample, __pyx_t_3, __pyx_t_5, __pyx_v_bindef, __pyx_v_var};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_6, 5+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(5+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_sample);
+    __Pyx_GIVEREF(__pyx_v_sample);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_sample);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 2+__pyx_t_6, __pyx_t_5);
+    __Pyx_INCREF(__pyx_v_bindef);
+    __Pyx_GIVEREF(__pyx_v_bindef);
+    PyTuple_SET_ITEM(__pyx_t_7, 3+__pyx_t_6, __pyx_v_bindef);
+    __Pyx_INCREF(__pyx_v_var);
+    __Pyx_GIVEREF(__pyx_v_var);
+    PyTuple_SET_ITEM(__pyx_t_7, 4+__pyx_t_6, __pyx_v_var);
+    __pyx_t_3 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "histUtils.pyx":54
- *     cdef TList formulas_list
+  /* "histUtils.pyx":50
+ * ##################################
  * 
- *     cdef double epass = -1.0             # <<<<<<<<<<<<<<
- *     cdef double efail = -1.0
+ * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
+ *     makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )
  * 
  */
-  __pyx_v_epass = -1.0;
 
-  /* "histUtils.pyx":55
- * 
- *     cdef double epass = -1.0
- *     cdef double efail = -1.0             # <<<<<<<<<<<<<<
- * 
- *     ###############################
- */
-  __pyx_v_efail = -1.0;
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("histUtils.makePassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "histUtils.pyx":61
- *     ###############################
- * 
- *     tree = new TChain(sample.tree)             # <<<<<<<<<<<<<<
+/* "histUtils.pyx":58
+ * #####################################################
  * 
- *     for p in sample.path:
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):             # <<<<<<<<<<<<<<
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_tree); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L1_error)
-  __pyx_v_tree = new TChain(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "histUtils.pyx":63
- *     tree = new TChain(sample.tree)
- * 
- *     for p in sample.path:             # <<<<<<<<<<<<<<
- *         print ' adding rootfile: ', p
- *         tree.Add(str.encode(p))
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
-    __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3); __pyx_t_4 = 0;
-    __pyx_t_5 = NULL;
-  } else {
-    __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 63, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 63, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_5)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 63, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
-      } else {
-        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 63, __pyx_L1_error)
-        #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        #endif
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_5makePassFailHistogramsMultiFlag(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_5makePassFailHistogramsMultiFlag = {"makePassFailHistogramsMultiFlag", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_5makePassFailHistogramsMultiFlag, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9histUtils_5makePassFailHistogramsMultiFlag(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sample = 0;
+  PyObject *__pyx_v_flags = 0;
+  PyObject *__pyx_v_histFiles = 0;
+  PyObject *__pyx_v_bindef = 0;
+  PyObject *__pyx_v_var = 0;
+  PyObject *__pyx_v_binSearch = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("makePassFailHistogramsMultiFlag (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sample,&__pyx_n_s_flags,&__pyx_n_s_histFiles,&__pyx_n_s_bindef,&__pyx_n_s_var,&__pyx_n_s_binSearch,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    values[5] = ((PyObject *)Py_True);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
       }
-    } else {
-      __pyx_t_1 = __pyx_t_5(__pyx_t_3);
-      if (unlikely(!__pyx_t_1)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 63, __pyx_L1_error)
-        }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sample)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_flags)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistogramsMultiFlag", 0, 5, 6, 1); __PYX_ERR(0, 58, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_histFiles)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistogramsMultiFlag", 0, 5, 6, 2); __PYX_ERR(0, 58, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bindef)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistogramsMultiFlag", 0, 5, 6, 3); __PYX_ERR(0, 58, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_var)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("makePassFailHistogramsMultiFlag", 0, 5, 6, 4); __PYX_ERR(0, 58, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_binSearch);
+          if (value) { values[5] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "makePassFailHistogramsMultiFlag") < 0)) __PYX_ERR(0, 58, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_sample = values[0];
+    __pyx_v_flags = values[1];
+    __pyx_v_histFiles = values[2];
+    __pyx_v_bindef = values[3];
+    __pyx_v_var = values[4];
+    __pyx_v_binSearch = values[5];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("makePassFailHistogramsMultiFlag", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 58, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("histUtils.makePassFailHistogramsMultiFlag", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9histUtils_4makePassFailHistogramsMultiFlag(__pyx_self, __pyx_v_sample, __pyx_v_flags, __pyx_v_histFiles, __pyx_v_bindef, __pyx_v_var, __pyx_v_binSearch);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9histUtils_4makePassFailHistogramsMultiFlag(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flags, PyObject *__pyx_v_histFiles, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_binSearch) {
+  PyObject *__pyx_v_contents = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("makePassFailHistogramsMultiFlag", 0);
+
+  /* "histUtils.pyx":59
+ * 
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):
+ *     if len(flags) != len(histFiles):             # <<<<<<<<<<<<<<
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ *         return
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_flags); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_v_histFiles); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_t_3 = ((__pyx_t_1 != __pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "histUtils.pyx":60
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+    __pyx_t_2 = PyObject_Length(__pyx_v_flags); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = PyObject_Length(__pyx_v_histFiles); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5);
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_makePassFailHistogramsMultiFlag_2, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_5) < 0) __PYX_ERR(0, 60, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "histUtils.pyx":61
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     contents = fillPassFailHistograms( sample, flags, bindef, var, binSearch = binSearch )
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "histUtils.pyx":59
+ * 
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):
+ *     if len(flags) != len(histFiles):             # <<<<<<<<<<<<<<
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ *         return
+ */
+  }
+
+  /* "histUtils.pyx":63
+ *         return
+ * 
+ *     contents = fillPassFailHistograms( sample, flags, bindef, var, binSearch = binSearch )             # <<<<<<<<<<<<<<
+ *     writePassFailHistograms( histFiles, bindef, var, contents )
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_fillPassFailHistograms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_INCREF(__pyx_v_sample);
+  __Pyx_GIVEREF(__pyx_v_sample);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_sample);
+  __Pyx_INCREF(__pyx_v_flags);
+  __Pyx_GIVEREF(__pyx_v_flags);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_flags);
+  __Pyx_INCREF(__pyx_v_bindef);
+  __Pyx_GIVEREF(__pyx_v_bindef);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_v_bindef);
+  __Pyx_INCREF(__pyx_v_var);
+  __Pyx_GIVEREF(__pyx_v_var);
+  PyTuple_SET_ITEM(__pyx_t_6, 3, __pyx_v_var);
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_binSearch, __pyx_v_binSearch) < 0) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_contents = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "histUtils.pyx":64
+ * 
+ *     contents = fillPassFailHistograms( sample, flags, bindef, var, binSearch = binSearch )
+ *     writePassFailHistograms( histFiles, bindef, var, contents )             # <<<<<<<<<<<<<<
+ * 
+ * #####################################################
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_writePassFailHistograms); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_6 = NULL;
+  __pyx_t_8 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_v_histFiles, __pyx_v_bindef, __pyx_v_var, __pyx_v_contents};
+    __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_7);
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+    PyObject *__pyx_temp[5] = {__pyx_t_6, __pyx_v_histFiles, __pyx_v_bindef, __pyx_v_var, __pyx_v_contents};
+    __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_7);
+  } else
+  #endif
+  {
+    __pyx_t_5 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_INCREF(__pyx_v_histFiles);
+    __Pyx_GIVEREF(__pyx_v_histFiles);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_8, __pyx_v_histFiles);
+    __Pyx_INCREF(__pyx_v_bindef);
+    __Pyx_GIVEREF(__pyx_v_bindef);
+    PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_8, __pyx_v_bindef);
+    __Pyx_INCREF(__pyx_v_var);
+    __Pyx_GIVEREF(__pyx_v_var);
+    PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_8, __pyx_v_var);
+    __Pyx_INCREF(__pyx_v_contents);
+    __Pyx_GIVEREF(__pyx_v_contents);
+    PyTuple_SET_ITEM(__pyx_t_5, 3+__pyx_t_8, __pyx_v_contents);
+    __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "histUtils.pyx":58
+ * #####################################################
+ * 
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):             # <<<<<<<<<<<<<<
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("histUtils.makePassFailHistogramsMultiFlag", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_contents);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "histUtils.pyx":71
+ * #####################################################
+ * 
+ * def makeEntryChunks( sample, nChunks ):             # <<<<<<<<<<<<<<
+ *     cdef TChain* chain
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_7makeEntryChunks(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_7makeEntryChunks = {"makeEntryChunks", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_7makeEntryChunks, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9histUtils_7makeEntryChunks(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sample = 0;
+  PyObject *__pyx_v_nChunks = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("makeEntryChunks (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sample,&__pyx_n_s_nChunks,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sample)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nChunks)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("makeEntryChunks", 1, 2, 2, 1); __PYX_ERR(0, 71, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "makeEntryChunks") < 0)) __PYX_ERR(0, 71, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_sample = values[0];
+    __pyx_v_nChunks = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("makeEntryChunks", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 71, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("histUtils.makeEntryChunks", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9histUtils_6makeEntryChunks(__pyx_self, __pyx_v_sample, __pyx_v_nChunks);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9histUtils_6makeEntryChunks(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_nChunks) {
+  TChain *__pyx_v_chain;
+  PyObject *__pyx_v_entriesPerPath = NULL;
+  PyObject *__pyx_v_p = NULL;
+  PyObject *__pyx_v_nevts = NULL;
+  PyObject *__pyx_v_chunkSize = NULL;
+  PyObject *__pyx_v_chunks = NULL;
+  PyObject *__pyx_v_firstEntry = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  const char *__pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  long __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("makeEntryChunks", 0);
+
+  /* "histUtils.pyx":76
+ *     # with known entries per file, the chain does not need to open
+ *     # all the files before the first entry of the chunk
+ *     entriesPerPath = []             # <<<<<<<<<<<<<<
+ *     for p in sample.path:
+ *         chain = new TChain(sample.tree)
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_entriesPerPath = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":77
+ *     # all the files before the first entry of the chunk
+ *     entriesPerPath = []
+ *     for p in sample.path:             # <<<<<<<<<<<<<<
+ *         chain = new TChain(sample.tree)
+ *         chain.Add(str.encode(p))
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 77, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 77, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_4(__pyx_t_2);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 77, __pyx_L1_error)
+        }
         break;
       }
       __Pyx_GOTREF(__pyx_t_1);
     }
-    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_1);
-    __pyx_t_1 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":78
+ *     entriesPerPath = []
+ *     for p in sample.path:
+ *         chain = new TChain(sample.tree)             # <<<<<<<<<<<<<<
+ *         chain.Add(str.encode(p))
+ *         entriesPerPath.append(chain.GetEntries())
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_tree); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 78, __pyx_L1_error)
+    __pyx_v_chain = new TChain(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":79
+ *     for p in sample.path:
+ *         chain = new TChain(sample.tree)
+ *         chain.Add(str.encode(p))             # <<<<<<<<<<<<<<
+ *         entriesPerPath.append(chain.GetEntries())
+ *         del chain
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_p);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L1_error)
+    (void)(__pyx_v_chain->Add(__pyx_t_5));
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":80
+ *         chain = new TChain(sample.tree)
+ *         chain.Add(str.encode(p))
+ *         entriesPerPath.append(chain.GetEntries())             # <<<<<<<<<<<<<<
+ *         del chain
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_chain->GetEntries()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_entriesPerPath, __pyx_t_1); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":81
+ *         chain.Add(str.encode(p))
+ *         entriesPerPath.append(chain.GetEntries())
+ *         del chain             # <<<<<<<<<<<<<<
+ * 
+ *     nevts = sum(entriesPerPath)
+ */
+    delete __pyx_v_chain;
+
+    /* "histUtils.pyx":77
+ *     # all the files before the first entry of the chunk
+ *     entriesPerPath = []
+ *     for p in sample.path:             # <<<<<<<<<<<<<<
+ *         chain = new TChain(sample.tree)
+ *         chain.Add(str.encode(p))
+ */
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "histUtils.pyx":83
+ *         del chain
+ * 
+ *     nevts = sum(entriesPerPath)             # <<<<<<<<<<<<<<
+ *     for p in sample.path:
+ *         if '*' in p or '?' in p:
+ */
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_sum, __pyx_v_entriesPerPath); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_nevts = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "histUtils.pyx":84
+ * 
+ *     nevts = sum(entriesPerPath)
+ *     for p in sample.path:             # <<<<<<<<<<<<<<
+ *         if '*' in p or '?' in p:
+ *             entriesPerPath = None
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_path); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+    __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 84, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 84, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 84, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
+    } else {
+      __pyx_t_2 = __pyx_t_4(__pyx_t_1);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 84, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "histUtils.pyx":85
+ *     nevts = sum(entriesPerPath)
+ *     for p in sample.path:
+ *         if '*' in p or '?' in p:             # <<<<<<<<<<<<<<
+ *             entriesPerPath = None
+ *             break
+ */
+    __pyx_t_10 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_p, Py_EQ)); if (unlikely(__pyx_t_10 < 0)) __PYX_ERR(0, 85, __pyx_L1_error)
+    __pyx_t_11 = (__pyx_t_10 != 0);
+    if (!__pyx_t_11) {
+    } else {
+      __pyx_t_9 = __pyx_t_11;
+      goto __pyx_L8_bool_binop_done;
+    }
+    __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_p, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) __PYX_ERR(0, 85, __pyx_L1_error)
+    __pyx_t_10 = (__pyx_t_11 != 0);
+    __pyx_t_9 = __pyx_t_10;
+    __pyx_L8_bool_binop_done:;
+    if (__pyx_t_9) {
+
+      /* "histUtils.pyx":86
+ *     for p in sample.path:
+ *         if '*' in p or '?' in p:
+ *             entriesPerPath = None             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+      __Pyx_INCREF(Py_None);
+      __Pyx_DECREF_SET(__pyx_v_entriesPerPath, ((PyObject*)Py_None));
+
+      /* "histUtils.pyx":87
+ *         if '*' in p or '?' in p:
+ *             entriesPerPath = None
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     chunkSize = max(1, (nevts + nChunks - 1) / nChunks)
+ */
+      goto __pyx_L6_break;
+
+      /* "histUtils.pyx":85
+ *     nevts = sum(entriesPerPath)
+ *     for p in sample.path:
+ *         if '*' in p or '?' in p:             # <<<<<<<<<<<<<<
+ *             entriesPerPath = None
+ *             break
+ */
+    }
+
+    /* "histUtils.pyx":84
+ * 
+ *     nevts = sum(entriesPerPath)
+ *     for p in sample.path:             # <<<<<<<<<<<<<<
+ *         if '*' in p or '?' in p:
+ *             entriesPerPath = None
+ */
+  }
+  __pyx_L6_break:;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":89
+ *             break
+ * 
+ *     chunkSize = max(1, (nevts + nChunks - 1) / nChunks)             # <<<<<<<<<<<<<<
+ *     chunks = []
+ *     for firstEntry in range(0, nevts, chunkSize):
+ */
+  __pyx_t_1 = PyNumber_Add(__pyx_v_nevts, __pyx_v_nChunks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_SubtractObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_v_nChunks); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_12 = 1;
+  __pyx_t_6 = __Pyx_PyInt_From_long(__pyx_t_12); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyObject_RichCompare(__pyx_t_1, __pyx_t_6, Py_GT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__pyx_t_9) {
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_t_1;
+  } else {
+    __pyx_t_7 = __Pyx_PyInt_From_long(__pyx_t_12); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_2 = __pyx_t_7;
+    __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_t_2;
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_chunkSize = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":90
+ * 
+ *     chunkSize = max(1, (nevts + nChunks - 1) / nChunks)
+ *     chunks = []             # <<<<<<<<<<<<<<
+ *     for firstEntry in range(0, nevts, chunkSize):
+ *         chunks.append( { 'firstEntry'     : firstEntry,
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_chunks = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":91
+ *     chunkSize = max(1, (nevts + nChunks - 1) / nChunks)
+ *     chunks = []
+ *     for firstEntry in range(0, nevts, chunkSize):             # <<<<<<<<<<<<<<
+ *         chunks.append( { 'firstEntry'     : firstEntry,
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ */
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_int_0);
+  __Pyx_GIVEREF(__pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
+  __Pyx_INCREF(__pyx_v_nevts);
+  __Pyx_GIVEREF(__pyx_v_nevts);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_nevts);
+  __Pyx_INCREF(__pyx_v_chunkSize);
+  __Pyx_GIVEREF(__pyx_v_chunkSize);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_chunkSize);
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
+    __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 91, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 91, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 91, __pyx_L1_error)
+        #else
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        #endif
+      }
+    } else {
+      __pyx_t_2 = __pyx_t_4(__pyx_t_1);
+      if (unlikely(!__pyx_t_2)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 91, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_firstEntry, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "histUtils.pyx":92
+ *     chunks = []
+ *     for firstEntry in range(0, nevts, chunkSize):
+ *         chunks.append( { 'firstEntry'     : firstEntry,             # <<<<<<<<<<<<<<
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ *                          'entriesPerPath' : entriesPerPath } )
+ */
+    __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_firstEntry, __pyx_v_firstEntry) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+
+    /* "histUtils.pyx":93
+ *     for firstEntry in range(0, nevts, chunkSize):
+ *         chunks.append( { 'firstEntry'     : firstEntry,
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),             # <<<<<<<<<<<<<<
+ *                          'entriesPerPath' : entriesPerPath } )
+ *     return chunks
+ */
+    __pyx_t_7 = PyNumber_Subtract(__pyx_v_nevts, __pyx_v_firstEntry); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_v_chunkSize);
+    __pyx_t_6 = __pyx_v_chunkSize;
+    __pyx_t_14 = PyObject_RichCompare(__pyx_t_7, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_14); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (__pyx_t_9) {
+      __Pyx_INCREF(__pyx_t_7);
+      __pyx_t_13 = __pyx_t_7;
+    } else {
+      __Pyx_INCREF(__pyx_t_6);
+      __pyx_t_13 = __pyx_t_6;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_nEntries, __pyx_t_13) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+    /* "histUtils.pyx":94
+ *         chunks.append( { 'firstEntry'     : firstEntry,
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ *                          'entriesPerPath' : entriesPerPath } )             # <<<<<<<<<<<<<<
+ *     return chunks
+ * 
+ */
+    if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_entriesPerPath, __pyx_v_entriesPerPath) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+
+    /* "histUtils.pyx":92
+ *     chunks = []
+ *     for firstEntry in range(0, nevts, chunkSize):
+ *         chunks.append( { 'firstEntry'     : firstEntry,             # <<<<<<<<<<<<<<
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ *                          'entriesPerPath' : entriesPerPath } )
+ */
+    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_chunks, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 92, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "histUtils.pyx":91
+ *     chunkSize = max(1, (nevts + nChunks - 1) / nChunks)
+ *     chunks = []
+ *     for firstEntry in range(0, nevts, chunkSize):             # <<<<<<<<<<<<<<
+ *         chunks.append( { 'firstEntry'     : firstEntry,
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":95
+ *                          'nEntries'       : min(chunkSize, nevts - firstEntry),
+ *                          'entriesPerPath' : entriesPerPath } )
+ *     return chunks             # <<<<<<<<<<<<<<
+ * 
+ * #####################################################
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_chunks);
+  __pyx_r = __pyx_v_chunks;
+  goto __pyx_L0;
+
+  /* "histUtils.pyx":71
+ * #####################################################
+ * 
+ * def makeEntryChunks( sample, nChunks ):             # <<<<<<<<<<<<<<
+ *     cdef TChain* chain
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("histUtils.makeEntryChunks", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_entriesPerPath);
+  __Pyx_XDECREF(__pyx_v_p);
+  __Pyx_XDECREF(__pyx_v_nevts);
+  __Pyx_XDECREF(__pyx_v_chunkSize);
+  __Pyx_XDECREF(__pyx_v_chunks);
+  __Pyx_XDECREF(__pyx_v_firstEntry);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "histUtils.pyx":101
+ * #####################################################
+ * 
+ * def mergePassFailContents( contentsList ):             # <<<<<<<<<<<<<<
+ *     merged = None
+ *     for contents in contentsList:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_9mergePassFailContents(PyObject *__pyx_self, PyObject *__pyx_v_contentsList); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_9mergePassFailContents = {"mergePassFailContents", (PyCFunction)__pyx_pw_9histUtils_9mergePassFailContents, METH_O, 0};
+static PyObject *__pyx_pw_9histUtils_9mergePassFailContents(PyObject *__pyx_self, PyObject *__pyx_v_contentsList) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("mergePassFailContents (wrapper)", 0);
+  __pyx_r = __pyx_pf_9histUtils_8mergePassFailContents(__pyx_self, ((PyObject *)__pyx_v_contentsList));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9histUtils_8mergePassFailContents(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_contentsList) {
+  PyObject *__pyx_v_merged = NULL;
+  PyObject *__pyx_v_contents = NULL;
+  PyObject *__pyx_v_h = NULL;
+  Py_ssize_t __pyx_v_ih;
+  PyObject *__pyx_v_vals = NULL;
+  PyObject *__pyx_v_sumw2 = NULL;
+  Py_ssize_t __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  Py_ssize_t __pyx_t_11;
+  PyObject *(*__pyx_t_12)(PyObject *);
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *(*__pyx_t_16)(PyObject *);
+  Py_ssize_t __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
+  Py_ssize_t __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  Py_ssize_t __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("mergePassFailContents", 0);
+
+  /* "histUtils.pyx":102
+ * 
+ * def mergePassFailContents( contentsList ):
+ *     merged = None             # <<<<<<<<<<<<<<
+ *     for contents in contentsList:
+ *         if merged is None:
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_merged = ((PyObject*)Py_None);
+
+  /* "histUtils.pyx":103
+ * def mergePassFailContents( contentsList ):
+ *     merged = None
+ *     for contents in contentsList:             # <<<<<<<<<<<<<<
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ */
+  if (likely(PyList_CheckExact(__pyx_v_contentsList)) || PyTuple_CheckExact(__pyx_v_contentsList)) {
+    __pyx_t_1 = __pyx_v_contentsList; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_contentsList); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 103, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(0, 103, __pyx_L1_error)
+        #else
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      }
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 103, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_contents, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "histUtils.pyx":104
+ *     merged = None
+ *     for contents in contentsList:
+ *         if merged is None:             # <<<<<<<<<<<<<<
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:
+ */
+    __pyx_t_5 = (__pyx_v_merged == ((PyObject*)Py_None));
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "histUtils.pyx":105
+ *     for contents in contentsList:
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }             # <<<<<<<<<<<<<<
+ *             for h in ['Pass', 'Fail']:
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ */
+      __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_7 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_nflags); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_nflags, __pyx_t_7) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_nbins); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_nbins, __pyx_t_7) < 0) __PYX_ERR(0, 105, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF_SET(__pyx_v_merged, ((PyObject*)__pyx_t_4));
+      __pyx_t_4 = 0;
+
+      /* "histUtils.pyx":106
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:             # <<<<<<<<<<<<<<
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ */
+      __pyx_t_4 = __pyx_tuple__3; __Pyx_INCREF(__pyx_t_4); __pyx_t_8 = 0;
+      for (;;) {
+        if (__pyx_t_8 >= 2) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 106, __pyx_L1_error)
+        #else
+        __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 106, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+        __Pyx_XDECREF_SET(__pyx_v_h, __pyx_t_7);
+        __pyx_t_7 = 0;
+
+        /* "histUtils.pyx":107
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]             # <<<<<<<<<<<<<<
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ *             continue
+ */
+        __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 107, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_contents, __pyx_v_h); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 107, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+          __pyx_t_10 = __pyx_t_9; __Pyx_INCREF(__pyx_t_10); __pyx_t_11 = 0;
+          __pyx_t_12 = NULL;
+        } else {
+          __pyx_t_11 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 107, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_12 = Py_TYPE(__pyx_t_10)->tp_iternext; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 107, __pyx_L1_error)
+        }
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        for (;;) {
+          if (likely(!__pyx_t_12)) {
+            if (likely(PyList_CheckExact(__pyx_t_10))) {
+              if (__pyx_t_11 >= PyList_GET_SIZE(__pyx_t_10)) break;
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_9 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_11); __Pyx_INCREF(__pyx_t_9); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 107, __pyx_L1_error)
+              #else
+              __pyx_t_9 = PySequence_ITEM(__pyx_t_10, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 107, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              #endif
+            } else {
+              if (__pyx_t_11 >= PyTuple_GET_SIZE(__pyx_t_10)) break;
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_11); __Pyx_INCREF(__pyx_t_9); __pyx_t_11++; if (unlikely(0 < 0)) __PYX_ERR(0, 107, __pyx_L1_error)
+              #else
+              __pyx_t_9 = PySequence_ITEM(__pyx_t_10, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 107, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_9);
+              #endif
+            }
+          } else {
+            __pyx_t_9 = __pyx_t_12(__pyx_t_10);
+            if (unlikely(!__pyx_t_9)) {
+              PyObject* exc_type = PyErr_Occurred();
+              if (exc_type) {
+                if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                else __PYX_ERR(0, 107, __pyx_L1_error)
+              }
+              break;
+            }
+            __Pyx_GOTREF(__pyx_t_9);
+          }
+          if ((likely(PyTuple_CheckExact(__pyx_t_9))) || (PyList_CheckExact(__pyx_t_9))) {
+            PyObject* sequence = __pyx_t_9;
+            Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+            if (unlikely(size != 2)) {
+              if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+              else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+              __PYX_ERR(0, 107, __pyx_L1_error)
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            if (likely(PyTuple_CheckExact(sequence))) {
+              __pyx_t_13 = PyTuple_GET_ITEM(sequence, 0); 
+              __pyx_t_14 = PyTuple_GET_ITEM(sequence, 1); 
+            } else {
+              __pyx_t_13 = PyList_GET_ITEM(sequence, 0); 
+              __pyx_t_14 = PyList_GET_ITEM(sequence, 1); 
+            }
+            __Pyx_INCREF(__pyx_t_13);
+            __Pyx_INCREF(__pyx_t_14);
+            #else
+            __pyx_t_13 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 107, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_13);
+            __pyx_t_14 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 107, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            #endif
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          } else {
+            Py_ssize_t index = -1;
+            __pyx_t_15 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 107, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            __pyx_t_16 = Py_TYPE(__pyx_t_15)->tp_iternext;
+            index = 0; __pyx_t_13 = __pyx_t_16(__pyx_t_15); if (unlikely(!__pyx_t_13)) goto __pyx_L10_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_13);
+            index = 1; __pyx_t_14 = __pyx_t_16(__pyx_t_15); if (unlikely(!__pyx_t_14)) goto __pyx_L10_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_14);
+            if (__Pyx_IternextUnpackEndCheck(__pyx_t_16(__pyx_t_15), 2) < 0) __PYX_ERR(0, 107, __pyx_L1_error)
+            __pyx_t_16 = NULL;
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            goto __pyx_L11_unpacking_done;
+            __pyx_L10_unpacking_failed:;
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+            __pyx_t_16 = NULL;
+            if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+            __PYX_ERR(0, 107, __pyx_L1_error)
+            __pyx_L11_unpacking_done:;
+          }
+          __Pyx_XDECREF_SET(__pyx_v_vals, __pyx_t_13);
+          __pyx_t_13 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_sumw2, __pyx_t_14);
+          __pyx_t_14 = 0;
+          __pyx_t_9 = PySequence_List(__pyx_v_vals); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 107, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_14 = PySequence_List(__pyx_v_sumw2); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 107, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_13 = PyList_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 107, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_GIVEREF(__pyx_t_9);
+          PyList_SET_ITEM(__pyx_t_13, 0, __pyx_t_9);
+          __Pyx_GIVEREF(__pyx_t_14);
+          PyList_SET_ITEM(__pyx_t_13, 1, __pyx_t_14);
+          __pyx_t_9 = 0;
+          __pyx_t_14 = 0;
+          if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 107, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(PyDict_SetItem(__pyx_v_merged, __pyx_v_h, __pyx_t_7) < 0)) __PYX_ERR(0, 107, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "histUtils.pyx":108
+ *             for h in ['Pass', 'Fail']:
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])             # <<<<<<<<<<<<<<
+ *             continue
+ *         for h in ['Pass', 'Fail']:
+ */
+        __pyx_t_7 = __Pyx_PyString_FormatSafe(__pyx_kp_s_sEntries, __pyx_v_h); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_v_contents, __pyx_t_7); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_7 = PySequence_List(__pyx_t_10); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_PyString_FormatSafe(__pyx_kp_s_sEntries, __pyx_v_h); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        if (unlikely(PyDict_SetItem(__pyx_v_merged, __pyx_t_10, __pyx_t_7) < 0)) __PYX_ERR(0, 108, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+        /* "histUtils.pyx":106
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:             # <<<<<<<<<<<<<<
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ */
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "histUtils.pyx":109
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ *             continue             # <<<<<<<<<<<<<<
+ *         for h in ['Pass', 'Fail']:
+ *             for ih in range(len(merged[h])):
+ */
+      goto __pyx_L3_continue;
+
+      /* "histUtils.pyx":104
+ *     merged = None
+ *     for contents in contentsList:
+ *         if merged is None:             # <<<<<<<<<<<<<<
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:
+ */
+    }
+
+    /* "histUtils.pyx":110
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ *             continue
+ *         for h in ['Pass', 'Fail']:             # <<<<<<<<<<<<<<
+ *             for ih in range(len(merged[h])):
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+ */
+    __pyx_t_4 = __pyx_tuple__3; __Pyx_INCREF(__pyx_t_4); __pyx_t_8 = 0;
+    for (;;) {
+      if (__pyx_t_8 >= 2) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_7); __pyx_t_8++; if (unlikely(0 < 0)) __PYX_ERR(0, 110, __pyx_L1_error)
+      #else
+      __pyx_t_7 = PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 110, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_h, __pyx_t_7);
+      __pyx_t_7 = 0;
+
+      /* "histUtils.pyx":111
+ *             continue
+ *         for h in ['Pass', 'Fail']:
+ *             for ih in range(len(merged[h])):             # <<<<<<<<<<<<<<
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+ *                 vals  = merged[h][ih][0]
+ */
+      if (unlikely(__pyx_v_merged == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 111, __pyx_L1_error)
+      }
+      __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_v_merged, __pyx_v_h); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 111, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_11 = PyObject_Length(__pyx_t_7); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 111, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_17 = __pyx_t_11;
+      for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+        __pyx_v_ih = __pyx_t_18;
+
+        /* "histUtils.pyx":112
+ *         for h in ['Pass', 'Fail']:
+ *             for ih in range(len(merged[h])):
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]             # <<<<<<<<<<<<<<
+ *                 vals  = merged[h][ih][0]
+ *                 sumw2 = merged[h][ih][1]
+ */
+        if (unlikely(__pyx_v_merged == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 112, __pyx_L1_error)
+        }
+        __pyx_t_7 = __Pyx_PyString_FormatSafe(__pyx_kp_s_sEntries, __pyx_v_h); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_10 = __Pyx_PyDict_GetItem(__pyx_v_merged, __pyx_t_7); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_19 = __pyx_v_ih;
+        __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_10, __pyx_t_19, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_13 = __Pyx_PyString_FormatSafe(__pyx_kp_s_sEntries, __pyx_v_h); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_14 = __Pyx_PyObject_GetItem(__pyx_v_contents, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_13 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_ih, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __pyx_t_14 = PyNumber_InPlaceAdd(__pyx_t_7, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        if (unlikely(__Pyx_SetItemInt(__pyx_t_10, __pyx_t_19, __pyx_t_14, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 112, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+        /* "histUtils.pyx":113
+ *             for ih in range(len(merged[h])):
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+ *                 vals  = merged[h][ih][0]             # <<<<<<<<<<<<<<
+ *                 sumw2 = merged[h][ih][1]
+ *                 for i in range(len(vals)):
+ */
+        if (unlikely(__pyx_v_merged == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 113, __pyx_L1_error)
+        }
+        __pyx_t_10 = __Pyx_PyDict_GetItem(__pyx_v_merged, __pyx_v_h); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_10, __pyx_v_ih, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_14, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_vals, __pyx_t_10);
+        __pyx_t_10 = 0;
+
+        /* "histUtils.pyx":114
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+ *                 vals  = merged[h][ih][0]
+ *                 sumw2 = merged[h][ih][1]             # <<<<<<<<<<<<<<
+ *                 for i in range(len(vals)):
+ *                     vals[i]  += contents[h][ih][0][i]
+ */
+        if (unlikely(__pyx_v_merged == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 114, __pyx_L1_error)
+        }
+        __pyx_t_10 = __Pyx_PyDict_GetItem(__pyx_v_merged, __pyx_v_h); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 114, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_10, __pyx_v_ih, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 114, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_14, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 114, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_sumw2, __pyx_t_10);
+        __pyx_t_10 = 0;
+
+        /* "histUtils.pyx":115
+ *                 vals  = merged[h][ih][0]
+ *                 sumw2 = merged[h][ih][1]
+ *                 for i in range(len(vals)):             # <<<<<<<<<<<<<<
+ *                     vals[i]  += contents[h][ih][0][i]
+ *                     sumw2[i] += contents[h][ih][1][i]
+ */
+        __pyx_t_19 = PyObject_Length(__pyx_v_vals); if (unlikely(__pyx_t_19 == ((Py_ssize_t)-1))) __PYX_ERR(0, 115, __pyx_L1_error)
+        __pyx_t_20 = __pyx_t_19;
+        for (__pyx_t_21 = 0; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+          __pyx_v_i = __pyx_t_21;
+
+          /* "histUtils.pyx":116
+ *                 sumw2 = merged[h][ih][1]
+ *                 for i in range(len(vals)):
+ *                     vals[i]  += contents[h][ih][0][i]             # <<<<<<<<<<<<<<
+ *                     sumw2[i] += contents[h][ih][1][i]
+ *     return merged
+ */
+          __pyx_t_22 = __pyx_v_i;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_vals, __pyx_t_22, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_14 = __Pyx_PyObject_GetItem(__pyx_v_contents, __pyx_v_h); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_13 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_ih, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_13, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_13 = __Pyx_GetItemInt(__pyx_t_14, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __pyx_t_14 = PyNumber_InPlaceAdd(__pyx_t_10, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          if (unlikely(__Pyx_SetItemInt(__pyx_v_vals, __pyx_t_22, __pyx_t_14, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 116, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+          /* "histUtils.pyx":117
+ *                 for i in range(len(vals)):
+ *                     vals[i]  += contents[h][ih][0][i]
+ *                     sumw2[i] += contents[h][ih][1][i]             # <<<<<<<<<<<<<<
+ *     return merged
+ * 
+ */
+          __pyx_t_22 = __pyx_v_i;
+          __pyx_t_14 = __Pyx_GetItemInt(__pyx_v_sumw2, __pyx_t_22, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_13 = __Pyx_PyObject_GetItem(__pyx_v_contents, __pyx_v_h); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_ih, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_13 = __Pyx_GetItemInt(__pyx_t_10, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_10 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_13 = PyNumber_InPlaceAdd(__pyx_t_14, __pyx_t_10); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (unlikely(__Pyx_SetItemInt(__pyx_v_sumw2, __pyx_t_22, __pyx_t_13, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1) < 0)) __PYX_ERR(0, 117, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        }
+      }
+
+      /* "histUtils.pyx":110
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ *             continue
+ *         for h in ['Pass', 'Fail']:             # <<<<<<<<<<<<<<
+ *             for ih in range(len(merged[h])):
+ *                 merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+ */
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "histUtils.pyx":103
+ * def mergePassFailContents( contentsList ):
+ *     merged = None
+ *     for contents in contentsList:             # <<<<<<<<<<<<<<
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ */
+    __pyx_L3_continue:;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":118
+ *                     vals[i]  += contents[h][ih][0][i]
+ *                     sumw2[i] += contents[h][ih][1][i]
+ *     return merged             # <<<<<<<<<<<<<<
+ * 
+ * #####################################################
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_merged);
+  __pyx_r = __pyx_v_merged;
+  goto __pyx_L0;
+
+  /* "histUtils.pyx":101
+ * #####################################################
+ * 
+ * def mergePassFailContents( contentsList ):             # <<<<<<<<<<<<<<
+ *     merged = None
+ *     for contents in contentsList:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_AddTraceback("histUtils.mergePassFailContents", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_merged);
+  __Pyx_XDECREF(__pyx_v_contents);
+  __Pyx_XDECREF(__pyx_v_h);
+  __Pyx_XDECREF(__pyx_v_vals);
+  __Pyx_XDECREF(__pyx_v_sumw2);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "histUtils.pyx":124
+ * #####################################################
+ * 
+ * def writePassFailHistograms( histFiles, bindef, var, contents ):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nbins = contents['nbins']
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_11writePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_11writePassFailHistograms = {"writePassFailHistograms", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_11writePassFailHistograms, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9histUtils_11writePassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_histFiles = 0;
+  PyObject *__pyx_v_bindef = 0;
+  PyObject *__pyx_v_var = 0;
+  PyObject *__pyx_v_contents = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("writePassFailHistograms (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_histFiles,&__pyx_n_s_bindef,&__pyx_n_s_var,&__pyx_n_s_contents,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_histFiles)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bindef)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("writePassFailHistograms", 1, 4, 4, 1); __PYX_ERR(0, 124, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_var)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("writePassFailHistograms", 1, 4, 4, 2); __PYX_ERR(0, 124, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_contents)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("writePassFailHistograms", 1, 4, 4, 3); __PYX_ERR(0, 124, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePassFailHistograms") < 0)) __PYX_ERR(0, 124, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_histFiles = values[0];
+    __pyx_v_bindef = values[1];
+    __pyx_v_var = values[2];
+    __pyx_v_contents = values[3];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writePassFailHistograms", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 124, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("histUtils.writePassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9histUtils_10writePassFailHistograms(__pyx_self, __pyx_v_histFiles, __pyx_v_bindef, __pyx_v_var, __pyx_v_contents);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9histUtils_10writePassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_histFiles, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_contents) {
+  int __pyx_v_nbins;
+  int __pyx_v_iflag;
+  int __pyx_v_ib;
+  int __pyx_v_ih;
+  int __pyx_v_i;
+  TH1D *__pyx_v_hPass;
+  TH1D *__pyx_v_hFail;
+  TFile *__pyx_v_outfile;
+  bool __pyx_v_addDirectoryStatus;
+  double __pyx_v_epass;
+  double __pyx_v_efail;
+  long __pyx_v_bin1;
+  int __pyx_v_bin2;
+  double __pyx_v_passI;
+  double __pyx_v_failI;
+  CYTHON_UNUSED double __pyx_v_eff;
+  CYTHON_UNUSED PyObject *__pyx_v_e_eff = NULL;
+  double __pyx_v_itot;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  const char *__pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  const char *__pyx_t_13;
+  int __pyx_t_14;
+  double __pyx_t_15;
+  double __pyx_t_16;
+  long __pyx_t_17;
+  long __pyx_t_18;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("writePassFailHistograms", 0);
+
+  /* "histUtils.pyx":126
+ * def writePassFailHistograms( histFiles, bindef, var, contents ):
+ * 
+ *     cdef int nbins = contents['nbins']             # <<<<<<<<<<<<<<
+ *     cdef int iflag
+ *     cdef int ib
+ */
+  __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_nbins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_nbins = __pyx_t_2;
+
+  /* "histUtils.pyx":139
+ *     cdef bool addDirectoryStatus
+ * 
+ *     cdef double epass = -1.0             # <<<<<<<<<<<<<<
+ *     cdef double efail = -1.0
+ * 
+ */
+  __pyx_v_epass = -1.0;
+
+  /* "histUtils.pyx":140
+ * 
+ *     cdef double epass = -1.0
+ *     cdef double efail = -1.0             # <<<<<<<<<<<<<<
+ * 
+ *     if len(histFiles) != contents['nflags']:
+ */
+  __pyx_v_efail = -1.0;
+
+  /* "histUtils.pyx":142
+ *     cdef double efail = -1.0
+ * 
+ *     if len(histFiles) != contents['nflags']:             # <<<<<<<<<<<<<<
+ *         print '[writePassFailHistograms] need one histFile per flag (%d flags, %d files)' % (contents['nflags'], len(histFiles))
+ *         return
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v_histFiles); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_nflags); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_1, __pyx_t_4, Py_NE); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_6) {
+
+    /* "histUtils.pyx":143
+ * 
+ *     if len(histFiles) != contents['nflags']:
+ *         print '[writePassFailHistograms] need one histFile per flag (%d flags, %d files)' % (contents['nflags'], len(histFiles))             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+    __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_nflags); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = PyObject_Length(__pyx_v_histFiles); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 143, __pyx_L1_error)
+    __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4);
+    __pyx_t_5 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_writePassFailHistograms_need_on, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_4) < 0) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "histUtils.pyx":144
+ *     if len(histFiles) != contents['nflags']:
+ *         print '[writePassFailHistograms] need one histFile per flag (%d flags, %d files)' % (contents['nflags'], len(histFiles))
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     for iflag in range(len(histFiles)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "histUtils.pyx":142
+ *     cdef double efail = -1.0
+ * 
+ *     if len(histFiles) != contents['nflags']:             # <<<<<<<<<<<<<<
+ *         print '[writePassFailHistograms] need one histFile per flag (%d flags, %d files)' % (contents['nflags'], len(histFiles))
+ *         return
+ */
+  }
+
+  /* "histUtils.pyx":146
+ *         return
+ * 
+ *     for iflag in range(len(histFiles)):             # <<<<<<<<<<<<<<
+ *         outfile = new TFile(str.encode(histFiles[iflag]),'recreate')
+ *         outfile.cd()
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v_histFiles); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_7 = __pyx_t_3;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_7; __pyx_t_2+=1) {
+    __pyx_v_iflag = __pyx_t_2;
+
+    /* "histUtils.pyx":147
+ * 
+ *     for iflag in range(len(histFiles)):
+ *         outfile = new TFile(str.encode(histFiles[iflag]),'recreate')             # <<<<<<<<<<<<<<
+ *         outfile.cd()
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_histFiles, __pyx_v_iflag, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_8, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_9) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
+    __pyx_v_outfile = new TFile(__pyx_t_9, ((const char *)"recreate"));
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "histUtils.pyx":148
+ *     for iflag in range(len(histFiles)):
+ *         outfile = new TFile(str.encode(histFiles[iflag]),'recreate')
+ *         outfile.cd()             # <<<<<<<<<<<<<<
+ * 
+ *         addDirectoryStatus = AddDirectoryStatus()
+ */
+    (void)(__pyx_v_outfile->cd());
+
+    /* "histUtils.pyx":150
+ *         outfile.cd()
+ * 
+ *         addDirectoryStatus = AddDirectoryStatus()             # <<<<<<<<<<<<<<
+ *         AddDirectory(False)
+ * 
+ */
+    __pyx_v_addDirectoryStatus = TH1::AddDirectoryStatus();
+
+    /* "histUtils.pyx":151
+ * 
+ *         addDirectoryStatus = AddDirectoryStatus()
+ *         AddDirectory(False)             # <<<<<<<<<<<<<<
+ * 
+ *         for ib in range(nbins):
+ */
+    TH1::AddDirectory(0);
+
+    /* "histUtils.pyx":153
+ *         AddDirectory(False)
+ * 
+ *         for ib in range(nbins):             # <<<<<<<<<<<<<<
+ *             ih = iflag * nbins + ib
+ *             hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ */
+    __pyx_t_10 = __pyx_v_nbins;
+    __pyx_t_11 = __pyx_t_10;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+      __pyx_v_ib = __pyx_t_12;
+
+      /* "histUtils.pyx":154
+ * 
+ *         for ib in range(nbins):
+ *             ih = iflag * nbins + ib             # <<<<<<<<<<<<<<
+ *             hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ */
+      __pyx_v_ih = ((__pyx_v_iflag * __pyx_v_nbins) + __pyx_v_ib);
+
+      /* "histUtils.pyx":155
+ *         for ib in range(nbins):
+ *             ih = iflag * nbins + ib
+ *             hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])             # <<<<<<<<<<<<<<
+ *             hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hPass.Sumw2()
+ */
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ib, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Pass, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_9 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_9) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ib, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_t_5, __pyx_n_s_title); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_13 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_13) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_14 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_14 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_16 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_16 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_hPass = new TH1D(__pyx_t_9, __pyx_t_13, __pyx_t_14, __pyx_t_15, __pyx_t_16);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "histUtils.pyx":156
+ *             ih = iflag * nbins + ib
+ *             hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])             # <<<<<<<<<<<<<<
+ *             hPass.Sumw2()
+ *             hFail.Sumw2()
+ */
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ib, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Fail, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_13 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_13) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ib, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_t_5, __pyx_n_s_title); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_9 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_9) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_14 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_14 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_16 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_16 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_hFail = new TH1D(__pyx_t_13, __pyx_t_9, __pyx_t_14, __pyx_t_16, __pyx_t_15);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "histUtils.pyx":157
+ *             hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hPass.Sumw2()             # <<<<<<<<<<<<<<
+ *             hFail.Sumw2()
+ * 
+ */
+      __pyx_v_hPass->Sumw2();
+
+      /* "histUtils.pyx":158
+ *             hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+ *             hPass.Sumw2()
+ *             hFail.Sumw2()             # <<<<<<<<<<<<<<
+ * 
+ *             # bin 0 and nbins+1 are the under/overflow
+ */
+      __pyx_v_hFail->Sumw2();
+
+      /* "histUtils.pyx":161
+ * 
+ *             # bin 0 and nbins+1 are the under/overflow
+ *             for i in range(hPass.GetNbinsX()+2):             # <<<<<<<<<<<<<<
+ *                 hPass.SetBinContent(i, contents['Pass'][ih][0][i])
+ *                 hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))
+ */
+      __pyx_t_17 = (__pyx_v_hPass->GetNbinsX() + 2);
+      __pyx_t_18 = __pyx_t_17;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_18; __pyx_t_14+=1) {
+        __pyx_v_i = __pyx_t_14;
+
+        /* "histUtils.pyx":162
+ *             # bin 0 and nbins+1 are the under/overflow
+ *             for i in range(hPass.GetNbinsX()+2):
+ *                 hPass.SetBinContent(i, contents['Pass'][ih][0][i])             # <<<<<<<<<<<<<<
+ *                 hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))
+ *                 hFail.SetBinContent(i, contents['Fail'][ih][0][i])
+ */
+        __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_Pass); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_v_hPass->SetBinContent(__pyx_v_i, __pyx_t_15);
+
+        /* "histUtils.pyx":163
+ *             for i in range(hPass.GetNbinsX()+2):
+ *                 hPass.SetBinContent(i, contents['Pass'][ih][0][i])
+ *                 hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))             # <<<<<<<<<<<<<<
+ *                 hFail.SetBinContent(i, contents['Fail'][ih][0][i])
+ *                 hFail.SetBinError(  i, math.sqrt(contents['Fail'][ih][1][i]))
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_math); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_Pass); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_8, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_5, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_8);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 163, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_v_hPass->SetBinError(__pyx_v_i, __pyx_t_15);
+
+        /* "histUtils.pyx":164
+ *                 hPass.SetBinContent(i, contents['Pass'][ih][0][i])
+ *                 hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))
+ *                 hFail.SetBinContent(i, contents['Fail'][ih][0][i])             # <<<<<<<<<<<<<<
+ *                 hFail.SetBinError(  i, math.sqrt(contents['Fail'][ih][1][i]))
+ * 
+ */
+        __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_Fail); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_5, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_v_hFail->SetBinContent(__pyx_v_i, __pyx_t_15);
+
+        /* "histUtils.pyx":165
+ *                 hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))
+ *                 hFail.SetBinContent(i, contents['Fail'][ih][0][i])
+ *                 hFail.SetBinError(  i, math.sqrt(contents['Fail'][ih][1][i]))             # <<<<<<<<<<<<<<
+ * 
+ *             removeNegativeBins(hPass)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_math); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_Fail); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_8);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_8, function);
+          }
+        }
+        __pyx_t_5 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_1, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_v_hFail->SetBinError(__pyx_v_i, __pyx_t_15);
+      }
+
+      /* "histUtils.pyx":167
+ *                 hFail.SetBinError(  i, math.sqrt(contents['Fail'][ih][1][i]))
+ * 
+ *             removeNegativeBins(hPass)             # <<<<<<<<<<<<<<
+ *             removeNegativeBins(hFail)
+ * 
+ */
+      __pyx_f_9histUtils_removeNegativeBins(__pyx_v_hPass);
+
+      /* "histUtils.pyx":168
+ * 
+ *             removeNegativeBins(hPass)
+ *             removeNegativeBins(hFail)             # <<<<<<<<<<<<<<
+ * 
+ *             # SetBinContent counts one entry per call, use the number of fills
+ */
+      __pyx_f_9histUtils_removeNegativeBins(__pyx_v_hFail);
+
+      /* "histUtils.pyx":171
+ * 
+ *             # SetBinContent counts one entry per call, use the number of fills
+ *             hPass.SetEntries(contents['PassEntries'][ih])             # <<<<<<<<<<<<<<
+ *             hFail.SetEntries(contents['FailEntries'][ih])
+ * 
+ */
+      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_PassEntries); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 171, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_5, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 171, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_8); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 171, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_v_hPass->SetEntries(__pyx_t_15);
+
+      /* "histUtils.pyx":172
+ *             # SetBinContent counts one entry per call, use the number of fills
+ *             hPass.SetEntries(contents['PassEntries'][ih])
+ *             hFail.SetEntries(contents['FailEntries'][ih])             # <<<<<<<<<<<<<<
+ * 
+ *             hPass.Write(hPass.GetName())
+ */
+      __pyx_t_8 = __Pyx_PyObject_Dict_GetItem(__pyx_v_contents, __pyx_n_s_FailEntries); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 172, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_8, __pyx_v_ih, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 172, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_v_hFail->SetEntries(__pyx_t_15);
+
+      /* "histUtils.pyx":174
+ *             hFail.SetEntries(contents['FailEntries'][ih])
+ * 
+ *             hPass.Write(hPass.GetName())             # <<<<<<<<<<<<<<
+ *             hFail.Write(hFail.GetName())
+ * 
+ */
+      (void)(__pyx_v_hPass->Write(__pyx_v_hPass->GetName()));
+
+      /* "histUtils.pyx":175
+ * 
+ *             hPass.Write(hPass.GetName())
+ *             hFail.Write(hFail.GetName())             # <<<<<<<<<<<<<<
+ * 
+ *             bin1 = 1
+ */
+      (void)(__pyx_v_hFail->Write(__pyx_v_hFail->GetName()));
+
+      /* "histUtils.pyx":177
+ *             hFail.Write(hFail.GetName())
+ * 
+ *             bin1 = 1             # <<<<<<<<<<<<<<
+ *             bin2 = hPass.GetXaxis().GetNbins()
+ *             passI = hPass.IntegralAndError(bin1,bin2,epass)
+ */
+      __pyx_v_bin1 = 1;
+
+      /* "histUtils.pyx":178
+ * 
+ *             bin1 = 1
+ *             bin2 = hPass.GetXaxis().GetNbins()             # <<<<<<<<<<<<<<
+ *             passI = hPass.IntegralAndError(bin1,bin2,epass)
+ *             failI = hFail.IntegralAndError(bin1,bin2,efail)
+ */
+      __pyx_v_bin2 = __pyx_v_hPass->GetXaxis()->GetNbins();
+
+      /* "histUtils.pyx":179
+ *             bin1 = 1
+ *             bin2 = hPass.GetXaxis().GetNbins()
+ *             passI = hPass.IntegralAndError(bin1,bin2,epass)             # <<<<<<<<<<<<<<
+ *             failI = hFail.IntegralAndError(bin1,bin2,efail)
+ *             eff   = 0
+ */
+      __pyx_v_passI = __pyx_v_hPass->IntegralAndError(__pyx_v_bin1, __pyx_v_bin2, __pyx_v_epass);
+
+      /* "histUtils.pyx":180
+ *             bin2 = hPass.GetXaxis().GetNbins()
+ *             passI = hPass.IntegralAndError(bin1,bin2,epass)
+ *             failI = hFail.IntegralAndError(bin1,bin2,efail)             # <<<<<<<<<<<<<<
+ *             eff   = 0
+ *             e_eff = 0
+ */
+      __pyx_v_failI = __pyx_v_hFail->IntegralAndError(__pyx_v_bin1, __pyx_v_bin2, __pyx_v_efail);
+
+      /* "histUtils.pyx":181
+ *             passI = hPass.IntegralAndError(bin1,bin2,epass)
+ *             failI = hFail.IntegralAndError(bin1,bin2,efail)
+ *             eff   = 0             # <<<<<<<<<<<<<<
+ *             e_eff = 0
+ *             if passI > 0 :
+ */
+      __pyx_v_eff = 0.0;
+
+      /* "histUtils.pyx":182
+ *             failI = hFail.IntegralAndError(bin1,bin2,efail)
+ *             eff   = 0
+ *             e_eff = 0             # <<<<<<<<<<<<<<
+ *             if passI > 0 :
+ *                 itot  = (passI+failI)
+ */
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_XDECREF_SET(__pyx_v_e_eff, __pyx_int_0);
+
+      /* "histUtils.pyx":183
+ *             eff   = 0
+ *             e_eff = 0
+ *             if passI > 0 :             # <<<<<<<<<<<<<<
+ *                 itot  = (passI+failI)
+ *                 eff   = passI / (passI+failI)
+ */
+      __pyx_t_6 = ((__pyx_v_passI > 0.0) != 0);
+      if (__pyx_t_6) {
+
+        /* "histUtils.pyx":184
+ *             e_eff = 0
+ *             if passI > 0 :
+ *                 itot  = (passI+failI)             # <<<<<<<<<<<<<<
+ *                 eff   = passI / (passI+failI)
+ *                 e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
+ */
+        __pyx_v_itot = (__pyx_v_passI + __pyx_v_failI);
+
+        /* "histUtils.pyx":185
+ *             if passI > 0 :
+ *                 itot  = (passI+failI)
+ *                 eff   = passI / (passI+failI)             # <<<<<<<<<<<<<<
+ *                 e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
+ *             #print cuts
+ */
+        __pyx_t_15 = (__pyx_v_passI + __pyx_v_failI);
+        if (unlikely(__pyx_t_15 == 0)) {
+          PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+          __PYX_ERR(0, 185, __pyx_L1_error)
+        }
+        __pyx_v_eff = (__pyx_v_passI / __pyx_t_15);
+
+        /* "histUtils.pyx":186
+ *                 itot  = (passI+failI)
+ *                 eff   = passI / (passI+failI)
+ *                 e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)             # <<<<<<<<<<<<<<
+ *             #print cuts
+ *             #print '    ==> pass: %.1f +/- %.1f ; fail : %.1f +/- %.1f : eff: %1.3f +/- %1.3f' % (passI,epass,failI,efail,eff,e_eff)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_math); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_8 = PyFloat_FromDouble(((((__pyx_v_passI * __pyx_v_passI) * __pyx_v_efail) * __pyx_v_efail) + (((__pyx_v_failI * __pyx_v_failI) * __pyx_v_epass) * __pyx_v_epass))); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_1 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_1)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_1);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_5 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_1, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_8);
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = PyFloat_FromDouble((__pyx_v_itot * __pyx_v_itot)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_8 = __Pyx_PyNumber_Divide(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 186, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF_SET(__pyx_v_e_eff, __pyx_t_8);
+        __pyx_t_8 = 0;
+
+        /* "histUtils.pyx":183
+ *             eff   = 0
+ *             e_eff = 0
+ *             if passI > 0 :             # <<<<<<<<<<<<<<
+ *                 itot  = (passI+failI)
+ *                 eff   = passI / (passI+failI)
+ */
+      }
+
+      /* "histUtils.pyx":190
+ *             #print '    ==> pass: %.1f +/- %.1f ; fail : %.1f +/- %.1f : eff: %1.3f +/- %1.3f' % (passI,epass,failI,efail,eff,e_eff)
+ * 
+ *             del hPass             # <<<<<<<<<<<<<<
+ *             del hFail
+ * 
+ */
+      delete __pyx_v_hPass;
+
+      /* "histUtils.pyx":191
+ * 
+ *             del hPass
+ *             del hFail             # <<<<<<<<<<<<<<
+ * 
+ *         AddDirectory(addDirectoryStatus)
+ */
+      delete __pyx_v_hFail;
+    }
+
+    /* "histUtils.pyx":193
+ *             del hFail
+ * 
+ *         AddDirectory(addDirectoryStatus)             # <<<<<<<<<<<<<<
+ * 
+ *         outfile.Close()
+ */
+    TH1::AddDirectory(__pyx_v_addDirectoryStatus);
+
+    /* "histUtils.pyx":195
+ *         AddDirectory(addDirectoryStatus)
+ * 
+ *         outfile.Close()             # <<<<<<<<<<<<<<
+ *         del outfile
+ *         print ' - histograms saved in %s' % histFiles[iflag]
+ */
+    __pyx_v_outfile->Close();
+
+    /* "histUtils.pyx":196
+ * 
+ *         outfile.Close()
+ *         del outfile             # <<<<<<<<<<<<<<
+ *         print ' - histograms saved in %s' % histFiles[iflag]
+ * 
+ */
+    delete __pyx_v_outfile;
+
+    /* "histUtils.pyx":197
+ *         outfile.Close()
+ *         del outfile
+ *         print ' - histograms saved in %s' % histFiles[iflag]             # <<<<<<<<<<<<<<
+ * 
+ * #####################################################
+ */
+    __pyx_t_8 = __Pyx_GetItemInt(__pyx_v_histFiles, __pyx_v_iflag, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_histograms_saved_in_s, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_4) < 0) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+
+  /* "histUtils.pyx":124
+ * #####################################################
+ * 
+ * def writePassFailHistograms( histFiles, bindef, var, contents ):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nbins = contents['nbins']
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("histUtils.writePassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_eff);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "histUtils.pyx":207
+ * #####################################################
+ * 
+ * def fillPassFailHistograms( sample, flags, bindef, var, firstEntry = 0, nEntries = -1, entriesPerPath = None, binSearch = True ):             # <<<<<<<<<<<<<<
+ * 
+ *     #####################
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9histUtils_13fillPassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_9histUtils_13fillPassFailHistograms = {"fillPassFailHistograms", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9histUtils_13fillPassFailHistograms, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_9histUtils_13fillPassFailHistograms(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sample = 0;
+  PyObject *__pyx_v_flags = 0;
+  PyObject *__pyx_v_bindef = 0;
+  PyObject *__pyx_v_var = 0;
+  PyObject *__pyx_v_firstEntry = 0;
+  PyObject *__pyx_v_nEntries = 0;
+  PyObject *__pyx_v_entriesPerPath = 0;
+  PyObject *__pyx_v_binSearch = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fillPassFailHistograms (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sample,&__pyx_n_s_flags,&__pyx_n_s_bindef,&__pyx_n_s_var,&__pyx_n_s_firstEntry,&__pyx_n_s_nEntries,&__pyx_n_s_entriesPerPath,&__pyx_n_s_binSearch,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[4] = ((PyObject *)__pyx_int_0);
+    values[5] = ((PyObject *)__pyx_int_neg_1);
+    values[6] = ((PyObject *)Py_None);
+    values[7] = ((PyObject *)Py_True);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sample)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_flags)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("fillPassFailHistograms", 0, 4, 8, 1); __PYX_ERR(0, 207, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bindef)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("fillPassFailHistograms", 0, 4, 8, 2); __PYX_ERR(0, 207, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_var)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("fillPassFailHistograms", 0, 4, 8, 3); __PYX_ERR(0, 207, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_firstEntry);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_nEntries);
+          if (value) { values[5] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_entriesPerPath);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_binSearch);
+          if (value) { values[7] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "fillPassFailHistograms") < 0)) __PYX_ERR(0, 207, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_sample = values[0];
+    __pyx_v_flags = values[1];
+    __pyx_v_bindef = values[2];
+    __pyx_v_var = values[3];
+    __pyx_v_firstEntry = values[4];
+    __pyx_v_nEntries = values[5];
+    __pyx_v_entriesPerPath = values[6];
+    __pyx_v_binSearch = values[7];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fillPassFailHistograms", 0, 4, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 207, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("histUtils.fillPassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9histUtils_12fillPassFailHistograms(__pyx_self, __pyx_v_sample, __pyx_v_flags, __pyx_v_bindef, __pyx_v_var, __pyx_v_firstEntry, __pyx_v_nEntries, __pyx_v_entriesPerPath, __pyx_v_binSearch);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9histUtils_12fillPassFailHistograms(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sample, PyObject *__pyx_v_flags, PyObject *__pyx_v_bindef, PyObject *__pyx_v_var, PyObject *__pyx_v_firstEntry, PyObject *__pyx_v_nEntries, PyObject *__pyx_v_entriesPerPath, PyObject *__pyx_v_binSearch) {
+  float __pyx_v_pair_mass;
+  int __pyx_v_nbins;
+  int __pyx_v_nflags;
+  int __pyx_v_nevts;
+  int __pyx_v_lastEntry;
+  int __pyx_v_frac_of_nevts;
+  int __pyx_v_index;
+  int __pyx_v_bnidx;
+  int __pyx_v_iflag;
+  int __pyx_v_ih;
+  int __pyx_v_outcount;
+  double __pyx_v_weight;
+  TChain *__pyx_v_tree;
+  std::vector<TTreeFormula *>  __pyx_v_flag_formulas;
+  bool __pyx_v_useBinSearch;
+  int __pyx_v_nvars;
+  int __pyx_v_iv;
+  int __pyx_v_ivbin;
+  std::vector<TTreeFormula *>  __pyx_v_var_formulas;
+  std::vector<std::vector<double> >  __pyx_v_var_edges;
+  std::vector<double>  __pyx_v_edges;
+  std::vector<bool>  __pyx_v_var_isInt;
+  std::vector<int>  __pyx_v_var_strides;
+  std::vector<TTreeFormula *>  __pyx_v_add_formulas;
+  TTreeFormula *__pyx_v_common_formula;
+  TTreeFormula *__pyx_v_weight_formula;
+  int __pyx_v_natoms;
+  int __pyx_v_ia;
+  int __pyx_v_iatom;
+  bool __pyx_v_passed;
+  std::vector<TTreeFormula *>  __pyx_v_atom_formulas;
+  std::vector<std::vector<int> >  __pyx_v_bin_atoms;
+  std::vector<int>  __pyx_v_atoms;
+  std::vector<int>  __pyx_v_atom_state;
+  std::vector<TH1D *>  __pyx_v_hPass;
+  std::vector<TH1D *>  __pyx_v_hFail;
+  TList __pyx_v_formulas_list;
+  bool __pyx_v_addDirectoryStatus;
+  Py_ssize_t __pyx_v_ip;
+  PyObject *__pyx_v_p = NULL;
+  PyObject *__pyx_v_cutBinList = NULL;
+  PyObject *__pyx_v_selectionList = NULL;
+  PyObject *__pyx_v_weightExpr = NULL;
+  Py_ssize_t __pyx_v_ib;
+  PyObject *__pyx_v_cuts = NULL;
+  PyObject *__pyx_v_cutBin = NULL;
+  PyObject *__pyx_v_decomposition = NULL;
+  PyObject *__pyx_v_stride = NULL;
+  PyObject *__pyx_v_v = NULL;
+  PyObject *__pyx_v_b = NULL;
+  PyObject *__pyx_v_commonCuts = NULL;
+  PyObject *__pyx_v_addFormulaIndex = NULL;
+  PyObject *__pyx_v_addCut = NULL;
+  PyObject *__pyx_v_atomTree = NULL;
+  PyObject *__pyx_v_replace_patterns = NULL;
+  PyObject *__pyx_v_branches = NULL;
+  PyObject *__pyx_v_br = NULL;
+  PyObject *__pyx_v_contents = NULL;
+  PyObject *__pyx_v_c = NULL;
+  PyObject *__pyx_v_x = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  const char *__pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PY_LONG_LONG __pyx_t_10;
+  const char *__pyx_t_11;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  PyObject *(*__pyx_t_17)(PyObject *);
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *(*__pyx_t_19)(PyObject *);
+  double __pyx_t_20;
+  bool __pyx_t_21;
+  int __pyx_t_22;
+  std::vector<TTreeFormula *> ::size_type __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
+  int __pyx_t_26;
+  int __pyx_t_27;
+  double __pyx_t_28;
+  long __pyx_t_29;
+  std::vector<int> ::size_type __pyx_t_30;
+  std::vector<int> ::size_type __pyx_t_31;
+  int __pyx_t_32;
+  __Pyx_FakeReference<int> __pyx_t_33;
+  int __pyx_t_34;
+  int __pyx_t_35;
+  std::vector<TH1D *> ::size_type __pyx_t_36;
+  std::vector<TH1D *> ::size_type __pyx_t_37;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fillPassFailHistograms", 0);
+
+  /* "histUtils.pyx":217
+ * 
+ *     # For the loop
+ *     cdef int nbins = 0             # <<<<<<<<<<<<<<
+ *     cdef int nflags = 0
+ *     cdef int nevts
+ */
+  __pyx_v_nbins = 0;
+
+  /* "histUtils.pyx":218
+ *     # For the loop
+ *     cdef int nbins = 0
+ *     cdef int nflags = 0             # <<<<<<<<<<<<<<
+ *     cdef int nevts
+ *     cdef int lastEntry
+ */
+  __pyx_v_nflags = 0;
+
+  /* "histUtils.pyx":226
+ *     cdef int iflag
+ *     cdef int ih
+ *     cdef int outcount = 0             # <<<<<<<<<<<<<<
+ *     cdef double weight
+ * 
+ */
+  __pyx_v_outcount = 0;
+
+  /* "histUtils.pyx":234
+ * 
+ *     # For the bin search (binning from createBins with float/int variables only)
+ *     cdef bool useBinSearch = False             # <<<<<<<<<<<<<<
+ *     cdef int nvars = 0
+ *     cdef int iv
+ */
+  __pyx_v_useBinSearch = 0;
+
+  /* "histUtils.pyx":235
+ *     # For the bin search (binning from createBins with float/int variables only)
+ *     cdef bool useBinSearch = False
+ *     cdef int nvars = 0             # <<<<<<<<<<<<<<
+ *     cdef int iv
+ *     cdef int ivbin
+ */
+  __pyx_v_nvars = 0;
+
+  /* "histUtils.pyx":244
+ *     cdef vector[int] var_strides
+ *     cdef vector[TTreeFormula*] add_formulas
+ *     cdef TTreeFormula* common_formula = NULL             # <<<<<<<<<<<<<<
+ *     cdef TTreeFormula* weight_formula = NULL
+ * 
+ */
+  __pyx_v_common_formula = NULL;
+
+  /* "histUtils.pyx":245
+ *     cdef vector[TTreeFormula*] add_formulas
+ *     cdef TTreeFormula* common_formula = NULL
+ *     cdef TTreeFormula* weight_formula = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     # For the bin selections as && of distinct cut terms (when the bin search is not possible)
+ */
+  __pyx_v_weight_formula = NULL;
+
+  /* "histUtils.pyx":248
+ * 
+ *     # For the bin selections as && of distinct cut terms (when the bin search is not possible)
+ *     cdef int natoms = 0             # <<<<<<<<<<<<<<
+ *     cdef int ia
+ *     cdef int iatom
+ */
+  __pyx_v_natoms = 0;
+
+  /* "histUtils.pyx":269
+ *     ###############################
+ * 
+ *     print(sample.tree)             # <<<<<<<<<<<<<<
+ *     tree = new TChain(sample.tree)
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_tree); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_PrintOne(0, __pyx_t_1) < 0) __PYX_ERR(0, 269, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":270
+ * 
+ *     print(sample.tree)
+ *     tree = new TChain(sample.tree)             # <<<<<<<<<<<<<<
+ * 
+ *     for ip in range(len(sample.path)):
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_tree); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 270, __pyx_L1_error)
+  __pyx_v_tree = new TChain(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":272
+ *     tree = new TChain(sample.tree)
+ * 
+ *     for ip in range(len(sample.path)):             # <<<<<<<<<<<<<<
+ *         p = sample.path[ip]
+ *         print ' adding rootfile: ', p
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_ip = __pyx_t_5;
+
+    /* "histUtils.pyx":273
+ * 
+ *     for ip in range(len(sample.path)):
+ *         p = sample.path[ip]             # <<<<<<<<<<<<<<
+ *         print ' adding rootfile: ', p
+ *         if entriesPerPath is None:
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_path); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ip, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "histUtils.pyx":274
+ *     for ip in range(len(sample.path)):
+ *         p = sample.path[ip]
+ *         print ' adding rootfile: ', p             # <<<<<<<<<<<<<<
+ *         if entriesPerPath is None:
+ *             tree.Add(str.encode(p))
+ */
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_kp_s_adding_rootfile);
+    __Pyx_GIVEREF(__pyx_kp_s_adding_rootfile);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_kp_s_adding_rootfile);
+    __Pyx_INCREF(__pyx_v_p);
+    __Pyx_GIVEREF(__pyx_v_p);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_p);
+    if (__Pyx_Print(0, __pyx_t_6, 1) < 0) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "histUtils.pyx":275
+ *         p = sample.path[ip]
+ *         print ' adding rootfile: ', p
+ *         if entriesPerPath is None:             # <<<<<<<<<<<<<<
+ *             tree.Add(str.encode(p))
+ *         else:
+ */
+    __pyx_t_7 = (__pyx_v_entriesPerPath == Py_None);
+    __pyx_t_8 = (__pyx_t_7 != 0);
+    if (__pyx_t_8) {
+
+      /* "histUtils.pyx":276
+ *         print ' adding rootfile: ', p
+ *         if entriesPerPath is None:
+ *             tree.Add(str.encode(p))             # <<<<<<<<<<<<<<
+ *         else:
+ *             tree.Add(str.encode(p), entriesPerPath[ip])
+ */
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+        }
+      }
+      __pyx_t_6 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_9, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_p);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 276, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 276, __pyx_L1_error)
+      (void)(__pyx_v_tree->Add(__pyx_t_2));
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+      /* "histUtils.pyx":275
+ *         p = sample.path[ip]
+ *         print ' adding rootfile: ', p
+ *         if entriesPerPath is None:             # <<<<<<<<<<<<<<
+ *             tree.Add(str.encode(p))
+ *         else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "histUtils.pyx":278
+ *             tree.Add(str.encode(p))
+ *         else:
+ *             tree.Add(str.encode(p), entriesPerPath[ip])             # <<<<<<<<<<<<<<
+ * 
+ *     if not sample.puTree is None:
+ */
+    /*else*/ {
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_9 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_9)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_9);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+        }
+      }
+      __pyx_t_6 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_9, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_p);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 278, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 278, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_entriesPerPath, __pyx_v_ip, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_10 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_1); if (unlikely((__pyx_t_10 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 278, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      (void)(__pyx_v_tree->Add(__pyx_t_2, __pyx_t_10));
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+    __pyx_L5:;
+  }
+
+  /* "histUtils.pyx":280
+ *             tree.Add(str.encode(p), entriesPerPath[ip])
+ * 
+ *     if not sample.puTree is None:             # <<<<<<<<<<<<<<
+ *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
+ *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_8 = (__pyx_t_6 != Py_None);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_7 = (__pyx_t_8 != 0);
+  if (__pyx_t_7) {
+
+    /* "histUtils.pyx":281
+ * 
+ *     if not sample.puTree is None:
+ *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)             # <<<<<<<<<<<<<<
+ *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_split); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_kp_s__4) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_kp_s__4);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_6, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_6);
+    __pyx_t_9 = 0;
+    __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_Adding_weight_tree_s_from_file, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_6) < 0) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "histUtils.pyx":282
+ *     if not sample.puTree is None:
+ *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
+ *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)             # <<<<<<<<<<<<<<
+ * 
+ *     ######################
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_split); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_kp_s__4) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_kp_s__4);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_6, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_9); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L1_error)
+    (void)(__pyx_v_tree->AddFriend(__pyx_t_2, __pyx_t_11));
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "histUtils.pyx":280
+ *             tree.Add(str.encode(p), entriesPerPath[ip])
+ * 
+ *     if not sample.puTree is None:             # <<<<<<<<<<<<<<
+ *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
+ *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+ */
+  }
+
+  /* "histUtils.pyx":288
+ *     ######################
+ * 
+ *     cutBinList = []             # <<<<<<<<<<<<<<
+ *     selectionList = []
+ * 
+ */
+  __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_v_cutBinList = ((PyObject*)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "histUtils.pyx":289
+ * 
+ *     cutBinList = []
+ *     selectionList = []             # <<<<<<<<<<<<<<
+ * 
+ *     for iflag in range(len(flags)):
+ */
+  __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_v_selectionList = ((PyObject*)__pyx_t_6);
+  __pyx_t_6 = 0;
+
+  /* "histUtils.pyx":291
+ *     selectionList = []
+ * 
+ *     for iflag in range(len(flags)):             # <<<<<<<<<<<<<<
+ *         flag_formulas.push_back(new TTreeFormula('Flag_Selection_%d' % iflag, str.encode(flags[iflag]), tree))
+ *         nflags = nflags + 1
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v_flags); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
+    __pyx_v_iflag = __pyx_t_12;
+
+    /* "histUtils.pyx":292
+ * 
+ *     for iflag in range(len(flags)):
+ *         flag_formulas.push_back(new TTreeFormula('Flag_Selection_%d' % iflag, str.encode(flags[iflag]), tree))             # <<<<<<<<<<<<<<
+ *         nflags = nflags + 1
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_iflag); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_9 = __Pyx_PyString_Format(__pyx_kp_s_Flag_Selection__d, __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_9); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 292, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_13 = __Pyx_GetItemInt(__pyx_v_flags, __pyx_v_iflag, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_14)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_14);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_14, __pyx_t_13) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_13);
+    __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 292, __pyx_L1_error)
+    try {
+      __pyx_v_flag_formulas.push_back(new TTreeFormula(__pyx_t_11, __pyx_t_2, __pyx_v_tree));
+    } catch(...) {
+      __Pyx_CppExn2PyErr();
+      __PYX_ERR(0, 292, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "histUtils.pyx":293
+ *     for iflag in range(len(flags)):
+ *         flag_formulas.push_back(new TTreeFormula('Flag_Selection_%d' % iflag, str.encode(flags[iflag]), tree))
+ *         nflags = nflags + 1             # <<<<<<<<<<<<<<
+ * 
+ *     if sample.isMC and not sample.weight is None:
+ */
+    __pyx_v_nflags = (__pyx_v_nflags + 1);
+  }
+
+  /* "histUtils.pyx":295
+ *         nflags = nflags + 1
+ * 
+ *     if sample.isMC and not sample.weight is None:             # <<<<<<<<<<<<<<
+ *         weightExpr = '%s' % sample.weight
+ *         if sample.maxWeight < 999:
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_isMC); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (__pyx_t_8) {
+  } else {
+    __pyx_t_7 = __pyx_t_8;
+    goto __pyx_L10_bool_binop_done;
+  }
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 295, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_8 = (__pyx_t_6 != Py_None);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_15 = (__pyx_t_8 != 0);
+  __pyx_t_7 = __pyx_t_15;
+  __pyx_L10_bool_binop_done:;
+  if (__pyx_t_7) {
+
+    /* "histUtils.pyx":296
+ * 
+ *     if sample.isMC and not sample.weight is None:
+ *         weightExpr = '%s' % sample.weight             # <<<<<<<<<<<<<<
+ *         if sample.maxWeight < 999:
+ *             weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_9 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s, __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_v_weightExpr = ((PyObject*)__pyx_t_9);
+    __pyx_t_9 = 0;
+
+    /* "histUtils.pyx":297
+ *     if sample.isMC and not sample.weight is None:
+ *         weightExpr = '%s' % sample.weight
+ *         if sample.maxWeight < 999:             # <<<<<<<<<<<<<<
+ *             weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)
+ *     else:
+ */
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_maxWeight); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 297, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_6 = PyObject_RichCompare(__pyx_t_9, __pyx_int_999, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 297, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 297, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":298
+ *         weightExpr = '%s' % sample.weight
+ *         if sample.maxWeight < 999:
+ *             weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)             # <<<<<<<<<<<<<<
+ *     else:
+ *         weightExpr = None
+ */
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_maxWeight); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_13 = PyTuple_New(3); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_9);
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_13, 2, __pyx_t_1);
+      __pyx_t_6 = 0;
+      __pyx_t_9 = 0;
+      __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_s_f_s_1_0, __pyx_t_13); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_DECREF_SET(__pyx_v_weightExpr, ((PyObject*)__pyx_t_1));
+      __pyx_t_1 = 0;
+
+      /* "histUtils.pyx":297
+ *     if sample.isMC and not sample.weight is None:
+ *         weightExpr = '%s' % sample.weight
+ *         if sample.maxWeight < 999:             # <<<<<<<<<<<<<<
+ *             weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)
+ *     else:
+ */
+    }
+
+    /* "histUtils.pyx":295
+ *         nflags = nflags + 1
+ * 
+ *     if sample.isMC and not sample.weight is None:             # <<<<<<<<<<<<<<
+ *         weightExpr = '%s' % sample.weight
+ *         if sample.maxWeight < 999:
+ */
+    goto __pyx_L9;
+  }
+
+  /* "histUtils.pyx":300
+ *             weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)
+ *     else:
+ *         weightExpr = None             # <<<<<<<<<<<<<<
+ * 
+ *     for ib in range(len(bindef['bins'])):
+ */
+  /*else*/ {
+    __Pyx_INCREF(Py_None);
+    __pyx_v_weightExpr = ((PyObject*)Py_None);
+  }
+  __pyx_L9:;
+
+  /* "histUtils.pyx":302
+ *         weightExpr = None
+ * 
+ *     for ib in range(len(bindef['bins'])):             # <<<<<<<<<<<<<<
+ *         cuts = bindef['bins'][ib]['cut']
+ *         if sample.mcTruth :
+ */
+  __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 302, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_ib = __pyx_t_5;
+
+    /* "histUtils.pyx":303
+ * 
+ *     for ib in range(len(bindef['bins'])):
+ *         cuts = bindef['bins'][ib]['cut']             # <<<<<<<<<<<<<<
+ *         if sample.mcTruth :
+ *             cuts = '%s && mcTrue==1' % cuts
+ */
+    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_13 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 303, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_t_13, __pyx_n_s_cut); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_cuts, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":304
+ *     for ib in range(len(bindef['bins'])):
+ *         cuts = bindef['bins'][ib]['cut']
+ *         if sample.mcTruth :             # <<<<<<<<<<<<<<
+ *             cuts = '%s && mcTrue==1' % cuts
+ *         if not sample.cut is None :
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_mcTruth); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 304, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 304, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":305
+ *         cuts = bindef['bins'][ib]['cut']
+ *         if sample.mcTruth :
+ *             cuts = '%s && mcTrue==1' % cuts             # <<<<<<<<<<<<<<
+ *         if not sample.cut is None :
+ *             cuts = '%s && %s' % (cuts,sample.cut)
+ */
+      __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_mcTrue_1, __pyx_v_cuts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 305, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF_SET(__pyx_v_cuts, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "histUtils.pyx":304
+ *     for ib in range(len(bindef['bins'])):
+ *         cuts = bindef['bins'][ib]['cut']
+ *         if sample.mcTruth :             # <<<<<<<<<<<<<<
+ *             cuts = '%s && mcTrue==1' % cuts
+ *         if not sample.cut is None :
+ */
+    }
+
+    /* "histUtils.pyx":306
+ *         if sample.mcTruth :
+ *             cuts = '%s && mcTrue==1' % cuts
+ *         if not sample.cut is None :             # <<<<<<<<<<<<<<
+ *             cuts = '%s && %s' % (cuts,sample.cut)
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_cut); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = (__pyx_t_1 != Py_None);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_15 = (__pyx_t_7 != 0);
+    if (__pyx_t_15) {
+
+      /* "histUtils.pyx":307
+ *             cuts = '%s && mcTrue==1' % cuts
+ *         if not sample.cut is None :
+ *             cuts = '%s && %s' % (cuts,sample.cut)             # <<<<<<<<<<<<<<
+ * 
+ *         if not weightExpr is None:
+ */
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_cut); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_INCREF(__pyx_v_cuts);
+      __Pyx_GIVEREF(__pyx_v_cuts);
+      PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_cuts);
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_s_s, __pyx_t_13); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_DECREF_SET(__pyx_v_cuts, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "histUtils.pyx":306
+ *         if sample.mcTruth :
+ *             cuts = '%s && mcTrue==1' % cuts
+ *         if not sample.cut is None :             # <<<<<<<<<<<<<<
+ *             cuts = '%s && %s' % (cuts,sample.cut)
+ * 
+ */
+    }
+
+    /* "histUtils.pyx":309
+ *             cuts = '%s && %s' % (cuts,sample.cut)
+ * 
+ *         if not weightExpr is None:             # <<<<<<<<<<<<<<
+ *             cutBin = '( %s ) * %s ' % (cuts, weightExpr)
+ *         else:
+ */
+    __pyx_t_15 = (__pyx_v_weightExpr != ((PyObject*)Py_None));
+    __pyx_t_7 = (__pyx_t_15 != 0);
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":310
+ * 
+ *         if not weightExpr is None:
+ *             cutBin = '( %s ) * %s ' % (cuts, weightExpr)             # <<<<<<<<<<<<<<
+ *         else:
+ *             cutBin = '%s' % cuts
+ */
+      __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_INCREF(__pyx_v_cuts);
+      __Pyx_GIVEREF(__pyx_v_cuts);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_cuts);
+      __Pyx_INCREF(__pyx_v_weightExpr);
+      __Pyx_GIVEREF(__pyx_v_weightExpr);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_weightExpr);
+      __pyx_t_13 = __Pyx_PyString_Format(__pyx_kp_s_s_s_2, __pyx_t_1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_cutBin, ((PyObject*)__pyx_t_13));
+      __pyx_t_13 = 0;
+
+      /* "histUtils.pyx":309
+ *             cuts = '%s && %s' % (cuts,sample.cut)
+ * 
+ *         if not weightExpr is None:             # <<<<<<<<<<<<<<
+ *             cutBin = '( %s ) * %s ' % (cuts, weightExpr)
+ *         else:
+ */
+      goto __pyx_L17;
+    }
 
-    /* "histUtils.pyx":64
+    /* "histUtils.pyx":312
+ *             cutBin = '( %s ) * %s ' % (cuts, weightExpr)
+ *         else:
+ *             cutBin = '%s' % cuts             # <<<<<<<<<<<<<<
  * 
- *     for p in sample.path:
- *         print ' adding rootfile: ', p             # <<<<<<<<<<<<<<
- *         tree.Add(str.encode(p))
+ *         cutBinList.append(cutBin)
+ */
+    /*else*/ {
+      __pyx_t_13 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s, __pyx_v_cuts); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_XDECREF_SET(__pyx_v_cutBin, ((PyObject*)__pyx_t_13));
+      __pyx_t_13 = 0;
+    }
+    __pyx_L17:;
+
+    /* "histUtils.pyx":314
+ *             cutBin = '%s' % cuts
  * 
+ *         cutBinList.append(cutBin)             # <<<<<<<<<<<<<<
+ *         selectionList.append(cuts)
+ *         nbins = nbins + 1
  */
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_kp_s_adding_rootfile);
-    __Pyx_GIVEREF(__pyx_kp_s_adding_rootfile);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_s_adding_rootfile);
-    __Pyx_INCREF(__pyx_v_p);
-    __Pyx_GIVEREF(__pyx_v_p);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_p);
-    if (__Pyx_Print(0, __pyx_t_1, 1) < 0) __PYX_ERR(0, 64, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_cutBinList, __pyx_v_cutBin); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 314, __pyx_L1_error)
 
-    /* "histUtils.pyx":65
- *     for p in sample.path:
- *         print ' adding rootfile: ', p
- *         tree.Add(str.encode(p))             # <<<<<<<<<<<<<<
+    /* "histUtils.pyx":315
+ * 
+ *         cutBinList.append(cutBin)
+ *         selectionList.append(cuts)             # <<<<<<<<<<<<<<
+ *         nbins = nbins + 1
  * 
- *     if not sample.puTree is None:
  */
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-      if (likely(__pyx_t_7)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-        __Pyx_INCREF(__pyx_t_7);
+    __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_selectionList, __pyx_v_cuts); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 315, __pyx_L1_error)
+
+    /* "histUtils.pyx":316
+ *         cutBinList.append(cutBin)
+ *         selectionList.append(cuts)
+ *         nbins = nbins + 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Fast path: look up the bin from the binning variables and only evaluate
+ */
+    __pyx_v_nbins = (__pyx_v_nbins + 1);
+  }
+
+  /* "histUtils.pyx":320
+ *     # Fast path: look up the bin from the binning variables and only evaluate
+ *     # the common cut and the additional cut of this bin
+ *     decomposition = None             # <<<<<<<<<<<<<<
+ *     if binSearch:
+ *         decomposition = decomposeBinCuts( bindef )
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_decomposition = Py_None;
+
+  /* "histUtils.pyx":321
+ *     # the common cut and the additional cut of this bin
+ *     decomposition = None
+ *     if binSearch:             # <<<<<<<<<<<<<<
+ *         decomposition = decomposeBinCuts( bindef )
+ *         if decomposition is None:
+ */
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_v_binSearch); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (__pyx_t_7) {
+
+    /* "histUtils.pyx":322
+ *     decomposition = None
+ *     if binSearch:
+ *         decomposition = decomposeBinCuts( bindef )             # <<<<<<<<<<<<<<
+ *         if decomposition is None:
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_decomposeBinCuts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_9);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
       }
     }
-    __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_v_p) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_p);
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 65, __pyx_L1_error)
-    (void)(__pyx_v_tree->Add(__pyx_t_2));
+    __pyx_t_13 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_9, __pyx_v_bindef) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_bindef);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_decomposition, __pyx_t_13);
+    __pyx_t_13 = 0;
 
-    /* "histUtils.pyx":63
- *     tree = new TChain(sample.tree)
+    /* "histUtils.pyx":323
+ *     if binSearch:
+ *         decomposition = decomposeBinCuts( bindef )
+ *         if decomposition is None:             # <<<<<<<<<<<<<<
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'
  * 
- *     for p in sample.path:             # <<<<<<<<<<<<<<
- *         print ' adding rootfile: ', p
- *         tree.Add(str.encode(p))
+ */
+    __pyx_t_7 = (__pyx_v_decomposition == Py_None);
+    __pyx_t_15 = (__pyx_t_7 != 0);
+    if (__pyx_t_15) {
+
+      /* "histUtils.pyx":324
+ *         decomposition = decomposeBinCuts( bindef )
+ *         if decomposition is None:
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'             # <<<<<<<<<<<<<<
+ * 
+ *     if not decomposition is None:
+ */
+      if (__Pyx_PrintOne(0, __pyx_kp_s_bin_cuts_cannot_be_decomposed_e) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
+
+      /* "histUtils.pyx":323
+ *     if binSearch:
+ *         decomposition = decomposeBinCuts( bindef )
+ *         if decomposition is None:             # <<<<<<<<<<<<<<
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'
+ * 
+ */
+    }
+
+    /* "histUtils.pyx":321
+ *     # the common cut and the additional cut of this bin
+ *     decomposition = None
+ *     if binSearch:             # <<<<<<<<<<<<<<
+ *         decomposition = decomposeBinCuts( bindef )
+ *         if decomposition is None:
  */
   }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "histUtils.pyx":67
- *         tree.Add(str.encode(p))
+  /* "histUtils.pyx":326
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'
+ * 
+ *     if not decomposition is None:             # <<<<<<<<<<<<<<
+ *         useBinSearch = True
  * 
- *     if not sample.puTree is None:             # <<<<<<<<<<<<<<
- *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
- *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_8 = (__pyx_t_3 != Py_None);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_9 = (__pyx_t_8 != 0);
-  if (__pyx_t_9) {
+  __pyx_t_15 = (__pyx_v_decomposition != Py_None);
+  __pyx_t_7 = (__pyx_t_15 != 0);
+  if (__pyx_t_7) {
 
-    /* "histUtils.pyx":68
+    /* "histUtils.pyx":327
  * 
- *     if not sample.puTree is None:
- *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)             # <<<<<<<<<<<<<<
- *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+ *     if not decomposition is None:
+ *         useBinSearch = True             # <<<<<<<<<<<<<<
  * 
+ *         stride = 1
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_split); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
-      if (likely(__pyx_t_1)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-        __Pyx_INCREF(__pyx_t_1);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_6, function);
+    __pyx_v_useBinSearch = 1;
+
+    /* "histUtils.pyx":329
+ *         useBinSearch = True
+ * 
+ *         stride = 1             # <<<<<<<<<<<<<<
+ *         for v in decomposition['vars']:
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+ */
+    __Pyx_INCREF(__pyx_int_1);
+    __pyx_v_stride = __pyx_int_1;
+
+    /* "histUtils.pyx":330
+ * 
+ *         stride = 1
+ *         for v in decomposition['vars']:             # <<<<<<<<<<<<<<
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ */
+    __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_decomposition, __pyx_n_s_vars); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
+      __pyx_t_1 = __pyx_t_13; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_17 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 330, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_1))) {
+          if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 330, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 330, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        } else {
+          if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 330, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 330, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        }
+      } else {
+        __pyx_t_13 = __pyx_t_17(__pyx_t_1);
+        if (unlikely(!__pyx_t_13)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 330, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_13);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_13);
+      __pyx_t_13 = 0;
+
+      /* "histUtils.pyx":331
+ *         stride = 1
+ *         for v in decomposition['vars']:
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))             # <<<<<<<<<<<<<<
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ *             edges.clear()
+ */
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_var); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_9 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Binning, __pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_9); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_14 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_var); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_18 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_18)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_18);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      __pyx_t_13 = (__pyx_t_18) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_18, __pyx_t_14) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_14);
+      __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_13); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 331, __pyx_L1_error)
+      try {
+        __pyx_v_var_formulas.push_back(new TTreeFormula(__pyx_t_2, __pyx_t_11, __pyx_v_tree));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 331, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+      /* "histUtils.pyx":332
+ *         for v in decomposition['vars']:
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+ *             formulas_list.Add(<TObject*>var_formulas.back())             # <<<<<<<<<<<<<<
+ *             edges.clear()
+ *             for b in v['edges']:
+ */
+      __pyx_v_formulas_list.Add(((TObject *)__pyx_v_var_formulas.back()));
+
+      /* "histUtils.pyx":333
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ *             edges.clear()             # <<<<<<<<<<<<<<
+ *             for b in v['edges']:
+ *                 edges.push_back(b)
+ */
+      __pyx_v_edges.clear();
+
+      /* "histUtils.pyx":334
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ *             edges.clear()
+ *             for b in v['edges']:             # <<<<<<<<<<<<<<
+ *                 edges.push_back(b)
+ *             var_edges.push_back(edges)
+ */
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_edges); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 334, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
+        __pyx_t_9 = __pyx_t_13; __Pyx_INCREF(__pyx_t_9); __pyx_t_4 = 0;
+        __pyx_t_19 = NULL;
+      } else {
+        __pyx_t_4 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 334, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_19 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 334, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_19)) {
+          if (likely(PyList_CheckExact(__pyx_t_9))) {
+            if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_9)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_13 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 334, __pyx_L1_error)
+            #else
+            __pyx_t_13 = PySequence_ITEM(__pyx_t_9, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 334, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_13);
+            #endif
+          } else {
+            if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_13 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 334, __pyx_L1_error)
+            #else
+            __pyx_t_13 = PySequence_ITEM(__pyx_t_9, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 334, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_13);
+            #endif
+          }
+        } else {
+          __pyx_t_13 = __pyx_t_19(__pyx_t_9);
+          if (unlikely(!__pyx_t_13)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 334, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_13);
+        }
+        __Pyx_XDECREF_SET(__pyx_v_b, __pyx_t_13);
+        __pyx_t_13 = 0;
+
+        /* "histUtils.pyx":335
+ *             edges.clear()
+ *             for b in v['edges']:
+ *                 edges.push_back(b)             # <<<<<<<<<<<<<<
+ *             var_edges.push_back(edges)
+ *             var_isInt.push_back(v['type'] == 'int')
+ */
+        __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_b); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 335, __pyx_L1_error)
+        try {
+          __pyx_v_edges.push_back(__pyx_t_20);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 335, __pyx_L1_error)
+        }
+
+        /* "histUtils.pyx":334
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ *             edges.clear()
+ *             for b in v['edges']:             # <<<<<<<<<<<<<<
+ *                 edges.push_back(b)
+ *             var_edges.push_back(edges)
+ */
+      }
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+      /* "histUtils.pyx":336
+ *             for b in v['edges']:
+ *                 edges.push_back(b)
+ *             var_edges.push_back(edges)             # <<<<<<<<<<<<<<
+ *             var_isInt.push_back(v['type'] == 'int')
+ *             var_strides.push_back(stride)
+ */
+      try {
+        __pyx_v_var_edges.push_back(__pyx_v_edges);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 336, __pyx_L1_error)
+      }
+
+      /* "histUtils.pyx":337
+ *                 edges.push_back(b)
+ *             var_edges.push_back(edges)
+ *             var_isInt.push_back(v['type'] == 'int')             # <<<<<<<<<<<<<<
+ *             var_strides.push_back(stride)
+ *             if v['type'] == 'int':
+ */
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_type); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 337, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_13 = PyObject_RichCompare(__pyx_t_9, __pyx_n_s_int, Py_EQ); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 337, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_21 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_21 == ((bool)-1)) && PyErr_Occurred())) __PYX_ERR(0, 337, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      try {
+        __pyx_v_var_isInt.push_back(__pyx_t_21);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 337, __pyx_L1_error)
+      }
+
+      /* "histUtils.pyx":338
+ *             var_edges.push_back(edges)
+ *             var_isInt.push_back(v['type'] == 'int')
+ *             var_strides.push_back(stride)             # <<<<<<<<<<<<<<
+ *             if v['type'] == 'int':
+ *                 stride = stride * len(v['edges'])
+ */
+      __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_v_stride); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L1_error)
+      try {
+        __pyx_v_var_strides.push_back(__pyx_t_12);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 338, __pyx_L1_error)
+      }
+
+      /* "histUtils.pyx":339
+ *             var_isInt.push_back(v['type'] == 'int')
+ *             var_strides.push_back(stride)
+ *             if v['type'] == 'int':             # <<<<<<<<<<<<<<
+ *                 stride = stride * len(v['edges'])
+ *             else:
+ */
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_type); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_7 = (__Pyx_PyString_Equals(__pyx_t_13, __pyx_n_s_int, Py_EQ)); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":340
+ *             var_strides.push_back(stride)
+ *             if v['type'] == 'int':
+ *                 stride = stride * len(v['edges'])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 stride = stride * (len(v['edges']) - 1)
+ */
+        __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_edges); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 340, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_4 = PyObject_Length(__pyx_t_13); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 340, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_13 = PyInt_FromSsize_t(__pyx_t_4); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 340, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_9 = PyNumber_Multiply(__pyx_v_stride, __pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 340, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __Pyx_DECREF_SET(__pyx_v_stride, __pyx_t_9);
+        __pyx_t_9 = 0;
+
+        /* "histUtils.pyx":339
+ *             var_isInt.push_back(v['type'] == 'int')
+ *             var_strides.push_back(stride)
+ *             if v['type'] == 'int':             # <<<<<<<<<<<<<<
+ *                 stride = stride * len(v['edges'])
+ *             else:
+ */
+        goto __pyx_L25;
+      }
+
+      /* "histUtils.pyx":342
+ *                 stride = stride * len(v['edges'])
+ *             else:
+ *                 stride = stride * (len(v['edges']) - 1)             # <<<<<<<<<<<<<<
+ *             nvars = nvars + 1
+ * 
+ */
+      /*else*/ {
+        __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_edges); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 342, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_4 = PyObject_Length(__pyx_t_9); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 342, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = PyInt_FromSsize_t((__pyx_t_4 - 1)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 342, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_13 = PyNumber_Multiply(__pyx_v_stride, __pyx_t_9); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 342, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF_SET(__pyx_v_stride, __pyx_t_13);
+        __pyx_t_13 = 0;
       }
+      __pyx_L25:;
+
+      /* "histUtils.pyx":343
+ *             else:
+ *                 stride = stride * (len(v['edges']) - 1)
+ *             nvars = nvars + 1             # <<<<<<<<<<<<<<
+ * 
+ *         commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]
+ */
+      __pyx_v_nvars = (__pyx_v_nvars + 1);
+
+      /* "histUtils.pyx":330
+ * 
+ *         stride = 1
+ *         for v in decomposition['vars']:             # <<<<<<<<<<<<<<
+ *             var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+ *             formulas_list.Add(<TObject*>var_formulas.back())
+ */
     }
-    __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_kp_s_) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_kp_s_);
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
-    __pyx_t_6 = 0;
-    __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_Adding_weight_tree_s_from_file, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (__Pyx_PrintOne(0, __pyx_t_3) < 0) __PYX_ERR(0, 68, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "histUtils.pyx":69
- *     if not sample.puTree is None:
- *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
- *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)             # <<<<<<<<<<<<<<
+    /* "histUtils.pyx":345
+ *             nvars = nvars + 1
  * 
- *     #################################
+ *         commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]             # <<<<<<<<<<<<<<
+ *         if len(commonCuts) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_split); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_decomposition, __pyx_n_s_cutBase); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_mcTruth); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
-      if (likely(__pyx_t_1)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-        __Pyx_INCREF(__pyx_t_1);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_6, function);
-      }
-    }
-    __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_kp_s_) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_kp_s_);
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 69, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 69, __pyx_L1_error)
+    if (__pyx_t_7) {
+      __Pyx_INCREF(__pyx_kp_s_mcTrue_1);
+      __pyx_t_9 = __pyx_kp_s_mcTrue_1;
+    } else {
+      __Pyx_INCREF(Py_None);
+      __pyx_t_9 = Py_None;
+    }
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_cut); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 69, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_puTree); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 69, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 69, __pyx_L1_error)
-    (void)(__pyx_v_tree->AddFriend(__pyx_t_2, __pyx_t_10));
+    __pyx_t_14 = PyTuple_New(3); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 345, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_13);
+    PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_13);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_14, 2, __pyx_t_6);
+    __pyx_t_13 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_6 = 0;
+    __pyx_t_6 = __pyx_t_14; __Pyx_INCREF(__pyx_t_6); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    for (;;) {
+      if (__pyx_t_3 >= 3) break;
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_14); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 345, __pyx_L1_error)
+      #else
+      __pyx_t_14 = PySequence_ITEM(__pyx_t_6, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 345, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_c, __pyx_t_14);
+      __pyx_t_14 = 0;
+      __pyx_t_7 = (__pyx_v_c != Py_None);
+      __pyx_t_15 = (__pyx_t_7 != 0);
+      if (__pyx_t_15) {
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_v_c))) __PYX_ERR(0, 345, __pyx_L1_error)
+      }
+    }
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_commonCuts = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
 
-    /* "histUtils.pyx":67
- *         tree.Add(str.encode(p))
+    /* "histUtils.pyx":346
  * 
- *     if not sample.puTree is None:             # <<<<<<<<<<<<<<
- *         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
- *         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+ *         commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]
+ *         if len(commonCuts) > 0:             # <<<<<<<<<<<<<<
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)
  */
-  }
+    __pyx_t_3 = PyList_GET_SIZE(__pyx_v_commonCuts); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_15 = ((__pyx_t_3 > 0) != 0);
+    if (__pyx_t_15) {
+
+      /* "histUtils.pyx":347
+ *         commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]
+ *         if len(commonCuts) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)             # <<<<<<<<<<<<<<
+ *             formulas_list.Add(<TObject*>common_formula)
+ * 
+ */
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_14 = PyList_New(0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_9 = __pyx_v_commonCuts; __Pyx_INCREF(__pyx_t_9); __pyx_t_3 = 0;
+      for (;;) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_9)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_13 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 347, __pyx_L1_error)
+        #else
+        __pyx_t_13 = PySequence_ITEM(__pyx_t_9, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        #endif
+        __Pyx_XDECREF_SET(__pyx_v_c, __pyx_t_13);
+        __pyx_t_13 = 0;
+        __pyx_t_13 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_2, __pyx_v_c); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_14, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 347, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyString_Join(__pyx_kp_s__5, __pyx_t_14); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_14 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_14)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_14);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_14, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_9);
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 347, __pyx_L1_error)
+      __pyx_v_common_formula = new TTreeFormula(((const char *)"Common_Selection"), __pyx_t_11, __pyx_v_tree);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "histUtils.pyx":75
- *     #################################
+      /* "histUtils.pyx":348
+ *         if len(commonCuts) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)             # <<<<<<<<<<<<<<
  * 
- *     cdef TFile* outfile = new TFile(str.encode(sample.histFile),'recreate')             # <<<<<<<<<<<<<<
+ *         # bins sharing the same additional cut share the formula
+ */
+      __pyx_v_formulas_list.Add(((TObject *)__pyx_v_common_formula));
+
+      /* "histUtils.pyx":346
  * 
- *     cutBinList = []
+ *         commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]
+ *         if len(commonCuts) > 0:             # <<<<<<<<<<<<<<
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)
  */
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_histFile); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-    if (likely(__pyx_t_7)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_7);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_6, function);
     }
-  }
-  __pyx_t_3 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_7, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L1_error)
-  __pyx_v_outfile = new TFile(__pyx_t_10, ((const char *)"recreate"));
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "histUtils.pyx":77
- *     cdef TFile* outfile = new TFile(str.encode(sample.histFile),'recreate')
+    /* "histUtils.pyx":351
  * 
- *     cutBinList = []             # <<<<<<<<<<<<<<
+ *         # bins sharing the same additional cut share the formula
+ *         addFormulaIndex = {}             # <<<<<<<<<<<<<<
+ *         for ib in range(nbins):
+ *             addCut = decomposition['additionalCuts'][ib]
+ */
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_addFormulaIndex = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "histUtils.pyx":352
+ *         # bins sharing the same additional cut share the formula
+ *         addFormulaIndex = {}
+ *         for ib in range(nbins):             # <<<<<<<<<<<<<<
+ *             addCut = decomposition['additionalCuts'][ib]
+ *             if addCut is None:
+ */
+    __pyx_t_12 = __pyx_v_nbins;
+    __pyx_t_22 = __pyx_t_12;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_22; __pyx_t_3+=1) {
+      __pyx_v_ib = __pyx_t_3;
+
+      /* "histUtils.pyx":353
+ *         addFormulaIndex = {}
+ *         for ib in range(nbins):
+ *             addCut = decomposition['additionalCuts'][ib]             # <<<<<<<<<<<<<<
+ *             if addCut is None:
+ *                 add_formulas.push_back(NULL)
+ */
+      __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_decomposition, __pyx_n_s_additionalCuts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 353, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_addCut, __pyx_t_6);
+      __pyx_t_6 = 0;
+
+      /* "histUtils.pyx":354
+ *         for ib in range(nbins):
+ *             addCut = decomposition['additionalCuts'][ib]
+ *             if addCut is None:             # <<<<<<<<<<<<<<
+ *                 add_formulas.push_back(NULL)
+ *             elif addFormulaIndex.has_key(addCut):
+ */
+      __pyx_t_15 = (__pyx_v_addCut == Py_None);
+      __pyx_t_7 = (__pyx_t_15 != 0);
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":355
+ *             addCut = decomposition['additionalCuts'][ib]
+ *             if addCut is None:
+ *                 add_formulas.push_back(NULL)             # <<<<<<<<<<<<<<
+ *             elif addFormulaIndex.has_key(addCut):
+ *                 add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])
+ */
+        try {
+          __pyx_v_add_formulas.push_back(NULL);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 355, __pyx_L1_error)
+        }
+
+        /* "histUtils.pyx":354
+ *         for ib in range(nbins):
+ *             addCut = decomposition['additionalCuts'][ib]
+ *             if addCut is None:             # <<<<<<<<<<<<<<
+ *                 add_formulas.push_back(NULL)
+ *             elif addFormulaIndex.has_key(addCut):
+ */
+        goto __pyx_L34;
+      }
+
+      /* "histUtils.pyx":356
+ *             if addCut is None:
+ *                 add_formulas.push_back(NULL)
+ *             elif addFormulaIndex.has_key(addCut):             # <<<<<<<<<<<<<<
+ *                 add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])
+ *             else:
+ */
+      __pyx_t_7 = PyDict_Contains(__pyx_v_addFormulaIndex, __pyx_v_addCut); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 356, __pyx_L1_error)
+      __pyx_t_15 = (__pyx_t_7 != 0);
+      if (__pyx_t_15) {
+
+        /* "histUtils.pyx":357
+ *                 add_formulas.push_back(NULL)
+ *             elif addFormulaIndex.has_key(addCut):
+ *                 add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 addFormulaIndex[addCut] = ib
+ */
+        __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_addFormulaIndex, __pyx_v_addCut); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 357, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_23 = __Pyx_PyInt_As_size_t(__pyx_t_6); if (unlikely((__pyx_t_23 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 357, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        try {
+          __pyx_v_add_formulas.push_back((__pyx_v_add_formulas[__pyx_t_23]));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 357, __pyx_L1_error)
+        }
+
+        /* "histUtils.pyx":356
+ *             if addCut is None:
+ *                 add_formulas.push_back(NULL)
+ *             elif addFormulaIndex.has_key(addCut):             # <<<<<<<<<<<<<<
+ *                 add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])
+ *             else:
+ */
+        goto __pyx_L34;
+      }
+
+      /* "histUtils.pyx":359
+ *                 add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])
+ *             else:
+ *                 addFormulaIndex[addCut] = ib             # <<<<<<<<<<<<<<
+ *                 add_formulas.push_back(new TTreeFormula('%s_AdditionalSelection' % bindef['bins'][ib]['name'], str.encode(addCut), tree))
+ *                 formulas_list.Add(<TObject*>add_formulas.back())
+ */
+      /*else*/ {
+        __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_ib); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 359, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        if (unlikely(PyDict_SetItem(__pyx_v_addFormulaIndex, __pyx_v_addCut, __pyx_t_6) < 0)) __PYX_ERR(0, 359, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+        /* "histUtils.pyx":360
+ *             else:
+ *                 addFormulaIndex[addCut] = ib
+ *                 add_formulas.push_back(new TTreeFormula('%s_AdditionalSelection' % bindef['bins'][ib]['name'], str.encode(addCut), tree))             # <<<<<<<<<<<<<<
+ *                 formulas_list.Add(<TObject*>add_formulas.back())
  * 
- *     flag_formula = new TTreeFormula('Flag_Selection', str.encode(flag), tree)
  */
-  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 77, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_v_cutBinList = ((PyObject*)__pyx_t_3);
-  __pyx_t_3 = 0;
+        __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_AdditionalSelection, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 360, __pyx_L1_error)
+        __pyx_t_9 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_14 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+          __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_9);
+          if (likely(__pyx_t_14)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+            __Pyx_INCREF(__pyx_t_14);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_9, function);
+          }
+        }
+        __pyx_t_6 = (__pyx_t_14) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_14, __pyx_v_addCut) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_addCut);
+        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 360, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 360, __pyx_L1_error)
+        try {
+          __pyx_v_add_formulas.push_back(new TTreeFormula(__pyx_t_11, __pyx_t_2, __pyx_v_tree));
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 360, __pyx_L1_error)
+        }
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "histUtils.pyx":79
- *     cutBinList = []
+        /* "histUtils.pyx":361
+ *                 addFormulaIndex[addCut] = ib
+ *                 add_formulas.push_back(new TTreeFormula('%s_AdditionalSelection' % bindef['bins'][ib]['name'], str.encode(addCut), tree))
+ *                 formulas_list.Add(<TObject*>add_formulas.back())             # <<<<<<<<<<<<<<
  * 
- *     flag_formula = new TTreeFormula('Flag_Selection', str.encode(flag), tree)             # <<<<<<<<<<<<<<
- * 
- *     for ib in range(len(bindef['bins'])):
+ *         print ' - using bin search on %s' % ', '.join([ v['var'] for v in decomposition['vars'] ])
  */
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_1 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_6);
-    if (likely(__pyx_t_1)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_v_formulas_list.Add(((TObject *)__pyx_v_add_formulas.back()));
+      }
+      __pyx_L34:;
     }
-  }
-  __pyx_t_3 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_1, __pyx_v_flag) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_flag);
-  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L1_error)
-  __pyx_v_flag_formula = new TTreeFormula(((const char *)"Flag_Selection"), __pyx_t_10, __pyx_v_tree);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "histUtils.pyx":81
- *     flag_formula = new TTreeFormula('Flag_Selection', str.encode(flag), tree)
+    /* "histUtils.pyx":363
+ *                 formulas_list.Add(<TObject*>add_formulas.back())
  * 
- *     for ib in range(len(bindef['bins'])):             # <<<<<<<<<<<<<<
- *         hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- */
-  __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 81, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_11 = __pyx_t_4;
-  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-    __pyx_v_ib = __pyx_t_12;
-
-    /* "histUtils.pyx":82
+ *         print ' - using bin search on %s' % ', '.join([ v['var'] for v in decomposition['vars'] ])             # <<<<<<<<<<<<<<
  * 
- *     for ib in range(len(bindef['bins'])):
- *         hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))             # <<<<<<<<<<<<<<
- *         hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hPass[ib].Sumw2()
+ *     else:
  */
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_6, __pyx_n_s_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Pass, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_title); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_13 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_13 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_14 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_14 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_decomposition, __pyx_n_s_vars); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 82, __pyx_L1_error)
+    if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+      __pyx_t_9 = __pyx_t_1; __Pyx_INCREF(__pyx_t_9); __pyx_t_3 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_3 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 363, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_17 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 363, __pyx_L1_error)
+    }
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    try {
-      __pyx_v_hPass.push_back(new TH1D(__pyx_t_10, __pyx_t_2, __pyx_t_13, __pyx_t_14, __pyx_t_15));
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 82, __pyx_L1_error)
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_9))) {
+          if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 363, __pyx_L1_error)
+          #else
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          #endif
+        } else {
+          if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 363, __pyx_L1_error)
+          #else
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_9, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          #endif
+        }
+      } else {
+        __pyx_t_1 = __pyx_t_17(__pyx_t_9);
+        if (unlikely(!__pyx_t_1)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 363, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_1);
+      __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_v, __pyx_n_s_var); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 363, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_6, (PyObject*)__pyx_t_1))) __PYX_ERR(0, 363, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_9 = __Pyx_PyString_Join(__pyx_kp_s__6, __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 363, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-    /* "histUtils.pyx":83
- *     for ib in range(len(bindef['bins'])):
- *         hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))             # <<<<<<<<<<<<<<
- *         hPass[ib].Sumw2()
- *         hFail[ib].Sumw2()
- */
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_6, __pyx_n_s_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Fail, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 83, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_using_bin_search_on_s, __pyx_t_9); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_n_s_title); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_13 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_13 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_15 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_15 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_14 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_14 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    try {
-      __pyx_v_hFail.push_back(new TH1D(__pyx_t_2, __pyx_t_10, __pyx_t_13, __pyx_t_15, __pyx_t_14));
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 83, __pyx_L1_error)
-    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_6) < 0) __PYX_ERR(0, 363, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "histUtils.pyx":84
- *         hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hPass[ib].Sumw2()             # <<<<<<<<<<<<<<
- *         hFail[ib].Sumw2()
+    /* "histUtils.pyx":326
+ *             print ' - bin cuts cannot be decomposed, evaluating all bin selections'
+ * 
+ *     if not decomposition is None:             # <<<<<<<<<<<<<<
+ *         useBinSearch = True
  * 
  */
-    (__pyx_v_hPass[__pyx_v_ib])->Sumw2();
+    goto __pyx_L20;
+  }
 
-    /* "histUtils.pyx":85
- *         hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
- *         hPass[ib].Sumw2()
- *         hFail[ib].Sumw2()             # <<<<<<<<<<<<<<
- * 
- *         cuts = bindef['bins'][ib]['cut']
+  /* "histUtils.pyx":368
+ *         # Generic path: the bin cuts are split in their && terms, the terms common to
+ *         # all bins are evaluated once, the other ones at most once per event
+ *         atomTree = cutAtomTree( selectionList )             # <<<<<<<<<<<<<<
+ *         if len(atomTree['common']) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)
  */
-    (__pyx_v_hFail[__pyx_v_ib])->Sumw2();
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_cutAtomTree); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_1 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+      if (likely(__pyx_t_1)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_9, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_v_selectionList) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_v_selectionList);
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 368, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_v_atomTree = __pyx_t_6;
+    __pyx_t_6 = 0;
 
-    /* "histUtils.pyx":87
- *         hFail[ib].Sumw2()
- * 
- *         cuts = bindef['bins'][ib]['cut']             # <<<<<<<<<<<<<<
- *         if sample.mcTruth :
- *             cuts = '%s && mcTrue==1' % cuts
+    /* "histUtils.pyx":369
+ *         # all bins are evaluated once, the other ones at most once per event
+ *         atomTree = cutAtomTree( selectionList )
+ *         if len(atomTree['common']) > 0:             # <<<<<<<<<<<<<<
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)
  */
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 87, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_common); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 369, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_6, __pyx_n_s_cut); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_3 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 369, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_cuts, __pyx_t_3);
-    __pyx_t_3 = 0;
-
-    /* "histUtils.pyx":88
+    __pyx_t_15 = ((__pyx_t_3 > 0) != 0);
+    if (__pyx_t_15) {
+
+      /* "histUtils.pyx":370
+ *         atomTree = cutAtomTree( selectionList )
+ *         if len(atomTree['common']) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)             # <<<<<<<<<<<<<<
+ *             formulas_list.Add(<TObject*>common_formula)
  * 
- *         cuts = bindef['bins'][ib]['cut']
- *         if sample.mcTruth :             # <<<<<<<<<<<<<<
- *             cuts = '%s && mcTrue==1' % cuts
- *         if not sample.cut is None :
- */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_mcTruth); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 88, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (__pyx_t_9) {
-
-      /* "histUtils.pyx":89
- *         cuts = bindef['bins'][ib]['cut']
- *         if sample.mcTruth :
- *             cuts = '%s && mcTrue==1' % cuts             # <<<<<<<<<<<<<<
- *         if not sample.cut is None :
- *             cuts = '%s && %s' % (cuts,sample.cut)
  */
-      __pyx_t_3 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_mcTrue_1, __pyx_v_cuts); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 89, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF_SET(__pyx_v_cuts, __pyx_t_3);
-      __pyx_t_3 = 0;
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_14 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_common); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      if (likely(PyList_CheckExact(__pyx_t_14)) || PyTuple_CheckExact(__pyx_t_14)) {
+        __pyx_t_13 = __pyx_t_14; __Pyx_INCREF(__pyx_t_13); __pyx_t_3 = 0;
+        __pyx_t_17 = NULL;
+      } else {
+        __pyx_t_3 = -1; __pyx_t_13 = PyObject_GetIter(__pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_17 = Py_TYPE(__pyx_t_13)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 370, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_17)) {
+          if (likely(PyList_CheckExact(__pyx_t_13))) {
+            if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_13)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_14 = PyList_GET_ITEM(__pyx_t_13, __pyx_t_3); __Pyx_INCREF(__pyx_t_14); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 370, __pyx_L1_error)
+            #else
+            __pyx_t_14 = PySequence_ITEM(__pyx_t_13, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 370, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            #endif
+          } else {
+            if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_13)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_13, __pyx_t_3); __Pyx_INCREF(__pyx_t_14); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 370, __pyx_L1_error)
+            #else
+            __pyx_t_14 = PySequence_ITEM(__pyx_t_13, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 370, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_14);
+            #endif
+          }
+        } else {
+          __pyx_t_14 = __pyx_t_17(__pyx_t_13);
+          if (unlikely(!__pyx_t_14)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 370, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_14);
+        }
+        __Pyx_XDECREF_SET(__pyx_v_c, __pyx_t_14);
+        __pyx_t_14 = 0;
+        __pyx_t_14 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_2, __pyx_v_c); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 370, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __Pyx_PyString_Join(__pyx_kp_s__5, __pyx_t_1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_9))) {
+        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_9);
+        if (likely(__pyx_t_1)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+          __Pyx_INCREF(__pyx_t_1);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_9, function);
+        }
+      }
+      __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_1, __pyx_t_13) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_t_13);
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_v_common_formula = new TTreeFormula(((const char *)"Common_Selection"), __pyx_t_2, __pyx_v_tree);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "histUtils.pyx":88
+      /* "histUtils.pyx":371
+ *         if len(atomTree['common']) > 0:
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)             # <<<<<<<<<<<<<<
  * 
- *         cuts = bindef['bins'][ib]['cut']
- *         if sample.mcTruth :             # <<<<<<<<<<<<<<
- *             cuts = '%s && mcTrue==1' % cuts
- *         if not sample.cut is None :
+ *         for iatom in range(len(atomTree['atoms'])):
+ */
+      __pyx_v_formulas_list.Add(((TObject *)__pyx_v_common_formula));
+
+      /* "histUtils.pyx":369
+ *         # all bins are evaluated once, the other ones at most once per event
+ *         atomTree = cutAtomTree( selectionList )
+ *         if len(atomTree['common']) > 0:             # <<<<<<<<<<<<<<
+ *             common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)
+ *             formulas_list.Add(<TObject*>common_formula)
  */
     }
 
-    /* "histUtils.pyx":90
- *         if sample.mcTruth :
- *             cuts = '%s && mcTrue==1' % cuts
- *         if not sample.cut is None :             # <<<<<<<<<<<<<<
- *             cuts = '%s && %s' % (cuts,sample.cut)
+    /* "histUtils.pyx":373
+ *             formulas_list.Add(<TObject*>common_formula)
  * 
+ *         for iatom in range(len(atomTree['atoms'])):             # <<<<<<<<<<<<<<
+ *             atom_formulas.push_back(new TTreeFormula('Cut_Term_%d' % iatom, str.encode(atomTree['atoms'][iatom]), tree))
+ *             formulas_list.Add(<TObject*>atom_formulas.back())
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_cut); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_9 = (__pyx_t_3 != Py_None);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_8 = (__pyx_t_9 != 0);
-    if (__pyx_t_8) {
+    __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_atoms); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_3 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 373, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
+      __pyx_v_iatom = __pyx_t_12;
 
-      /* "histUtils.pyx":91
- *             cuts = '%s && mcTrue==1' % cuts
- *         if not sample.cut is None :
- *             cuts = '%s && %s' % (cuts,sample.cut)             # <<<<<<<<<<<<<<
+      /* "histUtils.pyx":374
  * 
- *         if sample.isMC and not sample.weight is None:
+ *         for iatom in range(len(atomTree['atoms'])):
+ *             atom_formulas.push_back(new TTreeFormula('Cut_Term_%d' % iatom, str.encode(atomTree['atoms'][iatom]), tree))             # <<<<<<<<<<<<<<
+ *             formulas_list.Add(<TObject*>atom_formulas.back())
+ *             natoms = natoms + 1
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_cut); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_iatom); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 374, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_INCREF(__pyx_v_cuts);
-      __Pyx_GIVEREF(__pyx_v_cuts);
-      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_cuts);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
-      __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_s_s, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 91, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_PyString_Format(__pyx_kp_s_Cut_Term__d, __pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_9); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 374, __pyx_L1_error)
+      __pyx_t_13 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_atoms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_iatom, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_13))) {
+        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_13);
+        if (likely(__pyx_t_1)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_13);
+          __Pyx_INCREF(__pyx_t_1);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_13, function);
+        }
+      }
+      __pyx_t_6 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_13, __pyx_t_1, __pyx_t_14) : __Pyx_PyObject_CallOneArg(__pyx_t_13, __pyx_t_14);
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_6); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 374, __pyx_L1_error)
+      try {
+        __pyx_v_atom_formulas.push_back(new TTreeFormula(__pyx_t_2, __pyx_t_11, __pyx_v_tree));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 374, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF_SET(__pyx_v_cuts, __pyx_t_3);
-      __pyx_t_3 = 0;
 
-      /* "histUtils.pyx":90
- *         if sample.mcTruth :
- *             cuts = '%s && mcTrue==1' % cuts
- *         if not sample.cut is None :             # <<<<<<<<<<<<<<
- *             cuts = '%s && %s' % (cuts,sample.cut)
+      /* "histUtils.pyx":375
+ *         for iatom in range(len(atomTree['atoms'])):
+ *             atom_formulas.push_back(new TTreeFormula('Cut_Term_%d' % iatom, str.encode(atomTree['atoms'][iatom]), tree))
+ *             formulas_list.Add(<TObject*>atom_formulas.back())             # <<<<<<<<<<<<<<
+ *             natoms = natoms + 1
  * 
  */
-    }
+      __pyx_v_formulas_list.Add(((TObject *)__pyx_v_atom_formulas.back()));
 
-    /* "histUtils.pyx":93
- *             cuts = '%s && %s' % (cuts,sample.cut)
+      /* "histUtils.pyx":376
+ *             atom_formulas.push_back(new TTreeFormula('Cut_Term_%d' % iatom, str.encode(atomTree['atoms'][iatom]), tree))
+ *             formulas_list.Add(<TObject*>atom_formulas.back())
+ *             natoms = natoms + 1             # <<<<<<<<<<<<<<
  * 
- *         if sample.isMC and not sample.weight is None:             # <<<<<<<<<<<<<<
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)
- *             if sample.maxWeight < 999:
+ *         for ib in range(nbins):
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_isMC); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_9 < 0)) __PYX_ERR(0, 93, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (__pyx_t_9) {
-    } else {
-      __pyx_t_8 = __pyx_t_9;
-      goto __pyx_L11_bool_binop_done;
+      __pyx_v_natoms = (__pyx_v_natoms + 1);
     }
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_9 = (__pyx_t_3 != Py_None);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_16 = (__pyx_t_9 != 0);
-    __pyx_t_8 = __pyx_t_16;
-    __pyx_L11_bool_binop_done:;
-    if (__pyx_t_8) {
 
-      /* "histUtils.pyx":94
+    /* "histUtils.pyx":378
+ *             natoms = natoms + 1
  * 
- *         if sample.isMC and not sample.weight is None:
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)             # <<<<<<<<<<<<<<
- *             if sample.maxWeight < 999:
- *                 cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)
+ *         for ib in range(nbins):             # <<<<<<<<<<<<<<
+ *             atoms.clear()
+ *             for iatom in atomTree['bins'][ib]:
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __pyx_t_12 = __pyx_v_nbins;
+    __pyx_t_22 = __pyx_t_12;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_22; __pyx_t_3+=1) {
+      __pyx_v_ib = __pyx_t_3;
+
+      /* "histUtils.pyx":379
+ * 
+ *         for ib in range(nbins):
+ *             atoms.clear()             # <<<<<<<<<<<<<<
+ *             for iatom in atomTree['bins'][ib]:
+ *                 atoms.push_back(iatom)
+ */
+      __pyx_v_atoms.clear();
+
+      /* "histUtils.pyx":380
+ *         for ib in range(nbins):
+ *             atoms.clear()
+ *             for iatom in atomTree['bins'][ib]:             # <<<<<<<<<<<<<<
+ *                 atoms.push_back(iatom)
+ *             bin_atoms.push_back(atoms)
+ */
+      __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_bins); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 380, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_INCREF(__pyx_v_cuts);
-      __Pyx_GIVEREF(__pyx_v_cuts);
-      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_cuts);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_3);
-      __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_s_s_2, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 94, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 380, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_cutBin, ((PyObject*)__pyx_t_3));
-      __pyx_t_3 = 0;
-
-      /* "histUtils.pyx":95
- *         if sample.isMC and not sample.weight is None:
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)
- *             if sample.maxWeight < 999:             # <<<<<<<<<<<<<<
- *                 cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)
- *         else:
+      if (likely(PyList_CheckExact(__pyx_t_9)) || PyTuple_CheckExact(__pyx_t_9)) {
+        __pyx_t_6 = __pyx_t_9; __Pyx_INCREF(__pyx_t_6); __pyx_t_4 = 0;
+        __pyx_t_17 = NULL;
+      } else {
+        __pyx_t_4 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_9); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 380, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_17 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 380, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_17)) {
+          if (likely(PyList_CheckExact(__pyx_t_6))) {
+            if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_6)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_9 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_4); __Pyx_INCREF(__pyx_t_9); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 380, __pyx_L1_error)
+            #else
+            __pyx_t_9 = PySequence_ITEM(__pyx_t_6, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 380, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            #endif
+          } else {
+            if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_9 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_4); __Pyx_INCREF(__pyx_t_9); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 380, __pyx_L1_error)
+            #else
+            __pyx_t_9 = PySequence_ITEM(__pyx_t_6, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 380, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            #endif
+          }
+        } else {
+          __pyx_t_9 = __pyx_t_17(__pyx_t_6);
+          if (unlikely(!__pyx_t_9)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 380, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_9);
+        }
+        __pyx_t_24 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_24 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 380, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_v_iatom = __pyx_t_24;
+
+        /* "histUtils.pyx":381
+ *             atoms.clear()
+ *             for iatom in atomTree['bins'][ib]:
+ *                 atoms.push_back(iatom)             # <<<<<<<<<<<<<<
+ *             bin_atoms.push_back(atoms)
+ * 
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_maxWeight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyObject_RichCompare(__pyx_t_3, __pyx_int_999, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 95, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (__pyx_t_8) {
+        try {
+          __pyx_v_atoms.push_back(__pyx_v_iatom);
+        } catch(...) {
+          __Pyx_CppExn2PyErr();
+          __PYX_ERR(0, 381, __pyx_L1_error)
+        }
 
-        /* "histUtils.pyx":96
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)
- *             if sample.maxWeight < 999:
- *                 cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)             # <<<<<<<<<<<<<<
- *         else:
- *             cutBin = '%s' % cuts
- */
-        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_maxWeight); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_weight); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_INCREF(__pyx_v_cuts);
-        __Pyx_GIVEREF(__pyx_v_cuts);
-        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_cuts);
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_3);
-        __Pyx_GIVEREF(__pyx_t_1);
-        PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_1);
-        __pyx_t_6 = 0;
-        __pyx_t_3 = 0;
-        __pyx_t_1 = 0;
-        __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_s_s_f_s_1_0, __pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_DECREF_SET(__pyx_v_cutBin, ((PyObject*)__pyx_t_1));
-        __pyx_t_1 = 0;
-
-        /* "histUtils.pyx":95
- *         if sample.isMC and not sample.weight is None:
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)
- *             if sample.maxWeight < 999:             # <<<<<<<<<<<<<<
- *                 cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)
- *         else:
+        /* "histUtils.pyx":380
+ *         for ib in range(nbins):
+ *             atoms.clear()
+ *             for iatom in atomTree['bins'][ib]:             # <<<<<<<<<<<<<<
+ *                 atoms.push_back(iatom)
+ *             bin_atoms.push_back(atoms)
  */
       }
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "histUtils.pyx":93
- *             cuts = '%s && %s' % (cuts,sample.cut)
+      /* "histUtils.pyx":382
+ *             for iatom in atomTree['bins'][ib]:
+ *                 atoms.push_back(iatom)
+ *             bin_atoms.push_back(atoms)             # <<<<<<<<<<<<<<
  * 
- *         if sample.isMC and not sample.weight is None:             # <<<<<<<<<<<<<<
- *             cutBin = '( %s ) * %s ' % (cuts, sample.weight)
- *             if sample.maxWeight < 999:
+ *         print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (nbins, natoms, len(atomTree['common']))
  */
-      goto __pyx_L10;
+      try {
+        __pyx_v_bin_atoms.push_back(__pyx_v_atoms);
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 382, __pyx_L1_error)
+      }
     }
 
-    /* "histUtils.pyx":98
- *                 cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)
- *         else:
- *             cutBin = '%s' % cuts             # <<<<<<<<<<<<<<
+    /* "histUtils.pyx":384
+ *             bin_atoms.push_back(atoms)
  * 
- *         cutBinList.append(cutBin)
+ *         print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (nbins, natoms, len(atomTree['common']))             # <<<<<<<<<<<<<<
+ * 
+ *     if not weightExpr is None:
  */
-    /*else*/ {
-      __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s, __pyx_v_cuts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_XDECREF_SET(__pyx_v_cutBin, ((PyObject*)__pyx_t_1));
-      __pyx_t_1 = 0;
-    }
-    __pyx_L10:;
+    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nbins); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_natoms); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_atomTree, __pyx_n_s_common); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_3 = PyObject_Length(__pyx_t_13); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = PyTuple_New(3); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_13);
+    PyTuple_SET_ITEM(__pyx_t_14, 2, __pyx_t_13);
+    __pyx_t_6 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyString_Format(__pyx_kp_s_d_bin_selections_from_d_distinc, __pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (__Pyx_PrintOne(0, __pyx_t_13) < 0) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  }
+  __pyx_L20:;
 
-    /* "histUtils.pyx":100
- *             cutBin = '%s' % cuts
- * 
- *         cutBinList.append(cutBin)             # <<<<<<<<<<<<<<
+  /* "histUtils.pyx":386
+ *         print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (nbins, natoms, len(atomTree['common']))
  * 
- *         bin_formulas.push_back(new TTreeFormula('%s_Selection' % bindef['bins'][ib]['name'], str.encode(cutBin), tree))
+ *     if not weightExpr is None:             # <<<<<<<<<<<<<<
+ *         weight_formula = new TTreeFormula('Weight', str.encode(weightExpr), tree)
+ *         formulas_list.Add(<TObject*>weight_formula)
  */
-    __pyx_t_17 = __Pyx_PyList_Append(__pyx_v_cutBinList, __pyx_v_cutBin); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_15 = (__pyx_v_weightExpr != ((PyObject*)Py_None));
+  __pyx_t_7 = (__pyx_t_15 != 0);
+  if (__pyx_t_7) {
 
-    /* "histUtils.pyx":102
- *         cutBinList.append(cutBin)
+    /* "histUtils.pyx":387
  * 
- *         bin_formulas.push_back(new TTreeFormula('%s_Selection' % bindef['bins'][ib]['name'], str.encode(cutBin), tree))             # <<<<<<<<<<<<<<
+ *     if not weightExpr is None:
+ *         weight_formula = new TTreeFormula('Weight', str.encode(weightExpr), tree)             # <<<<<<<<<<<<<<
+ *         formulas_list.Add(<TObject*>weight_formula)
  * 
- *         formulas_list.Add(<TObject*>bin_formulas[nbins])
  */
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Dict_GetItem(__pyx_t_7, __pyx_n_s_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Selection, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_10 = __Pyx_PyObject_AsString(__pyx_t_7); if (unlikely((!__pyx_t_10) && PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_6);
+    __pyx_t_14 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_14);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
+        __Pyx_INCREF(__pyx_t_9);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __Pyx_DECREF_SET(__pyx_t_14, function);
       }
     }
-    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_v_cutBin) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_cutBin);
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_1); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L1_error)
-    try {
-      __pyx_v_bin_formulas.push_back(new TTreeFormula(__pyx_t_10, __pyx_t_2, __pyx_v_tree));
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 102, __pyx_L1_error)
-    }
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_13 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_9, __pyx_v_weightExpr) : __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_v_weightExpr);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_13); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 387, __pyx_L1_error)
+    __pyx_v_weight_formula = new TTreeFormula(((const char *)"Weight"), __pyx_t_11, __pyx_v_tree);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+    /* "histUtils.pyx":388
+ *     if not weightExpr is None:
+ *         weight_formula = new TTreeFormula('Weight', str.encode(weightExpr), tree)
+ *         formulas_list.Add(<TObject*>weight_formula)             # <<<<<<<<<<<<<<
+ * 
+ *     for iflag in range(nflags):
+ */
+    __pyx_v_formulas_list.Add(((TObject *)__pyx_v_weight_formula));
+
+    /* "histUtils.pyx":386
+ *         print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (nbins, natoms, len(atomTree['common']))
+ * 
+ *     if not weightExpr is None:             # <<<<<<<<<<<<<<
+ *         weight_formula = new TTreeFormula('Weight', str.encode(weightExpr), tree)
+ *         formulas_list.Add(<TObject*>weight_formula)
+ */
+  }
+
+  /* "histUtils.pyx":390
+ *         formulas_list.Add(<TObject*>weight_formula)
+ * 
+ *     for iflag in range(nflags):             # <<<<<<<<<<<<<<
+ *         formulas_list.Add(<TObject*>flag_formulas[iflag])
+ *     tree.SetNotify(<TObject*> &formulas_list)
+ */
+  __pyx_t_12 = __pyx_v_nflags;
+  __pyx_t_22 = __pyx_t_12;
+  for (__pyx_t_24 = 0; __pyx_t_24 < __pyx_t_22; __pyx_t_24+=1) {
+    __pyx_v_iflag = __pyx_t_24;
+
+    /* "histUtils.pyx":391
+ * 
+ *     for iflag in range(nflags):
+ *         formulas_list.Add(<TObject*>flag_formulas[iflag])             # <<<<<<<<<<<<<<
+ *     tree.SetNotify(<TObject*> &formulas_list)
+ * 
+ */
+    __pyx_v_formulas_list.Add(((TObject *)(__pyx_v_flag_formulas[__pyx_v_iflag])));
+  }
+
+  /* "histUtils.pyx":392
+ *     for iflag in range(nflags):
+ *         formulas_list.Add(<TObject*>flag_formulas[iflag])
+ *     tree.SetNotify(<TObject*> &formulas_list)             # <<<<<<<<<<<<<<
+ * 
+ *     # hists are kept in memory, their contents are returned after the loop
+ */
+  __pyx_v_tree->SetNotify(((TObject *)(&__pyx_v_formulas_list)));
 
-    /* "histUtils.pyx":104
- *         bin_formulas.push_back(new TTreeFormula('%s_Selection' % bindef['bins'][ib]['name'], str.encode(cutBin), tree))
+  /* "histUtils.pyx":395
  * 
- *         formulas_list.Add(<TObject*>bin_formulas[nbins])             # <<<<<<<<<<<<<<
+ *     # hists are kept in memory, their contents are returned after the loop
+ *     addDirectoryStatus = AddDirectoryStatus()             # <<<<<<<<<<<<<<
+ *     AddDirectory(False)
  * 
- *         nbins = nbins + 1
  */
-    __pyx_v_formulas_list.Add(((TObject *)(__pyx_v_bin_formulas[__pyx_v_nbins])));
+  __pyx_v_addDirectoryStatus = TH1::AddDirectoryStatus();
 
-    /* "histUtils.pyx":106
- *         formulas_list.Add(<TObject*>bin_formulas[nbins])
+  /* "histUtils.pyx":396
+ *     # hists are kept in memory, their contents are returned after the loop
+ *     addDirectoryStatus = AddDirectoryStatus()
+ *     AddDirectory(False)             # <<<<<<<<<<<<<<
  * 
- *         nbins = nbins + 1             # <<<<<<<<<<<<<<
+ *     for iflag in range(nflags):
+ */
+  TH1::AddDirectory(0);
+
+  /* "histUtils.pyx":398
+ *     AddDirectory(False)
  * 
- *     formulas_list.Add(<TObject*>flag_formula)
+ *     for iflag in range(nflags):             # <<<<<<<<<<<<<<
+ *         for ib in range(nbins):
+ *             hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
  */
-    __pyx_v_nbins = (__pyx_v_nbins + 1);
-  }
+  __pyx_t_12 = __pyx_v_nflags;
+  __pyx_t_22 = __pyx_t_12;
+  for (__pyx_t_24 = 0; __pyx_t_24 < __pyx_t_22; __pyx_t_24+=1) {
+    __pyx_v_iflag = __pyx_t_24;
 
-  /* "histUtils.pyx":108
- *         nbins = nbins + 1
+    /* "histUtils.pyx":399
  * 
- *     formulas_list.Add(<TObject*>flag_formula)             # <<<<<<<<<<<<<<
- *     tree.SetNotify(<TObject*> &formulas_list)
+ *     for iflag in range(nflags):
+ *         for ib in range(nbins):             # <<<<<<<<<<<<<<
+ *             hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ */
+    __pyx_t_25 = __pyx_v_nbins;
+    __pyx_t_26 = __pyx_t_25;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_26; __pyx_t_3+=1) {
+      __pyx_v_ib = __pyx_t_3;
+
+      /* "histUtils.pyx":400
+ *     for iflag in range(nflags):
+ *         for ib in range(nbins):
+ *             hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))             # <<<<<<<<<<<<<<
+ *             hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hPass.back().Sumw2()
+ */
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_t_14, __pyx_n_s_name); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_14 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Pass, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_14); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_t_9, __pyx_n_s_title); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_13); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_27 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_27 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_28 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      try {
+        __pyx_v_hPass.push_back(new TH1D(__pyx_t_11, __pyx_t_2, __pyx_t_27, __pyx_t_20, __pyx_t_28));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 400, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+      /* "histUtils.pyx":401
+ *         for ib in range(nbins):
+ *             hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))             # <<<<<<<<<<<<<<
+ *             hPass.back().Sumw2()
+ *             hFail.back().Sumw2()
+ */
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_14 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_t_14, __pyx_n_s_name); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_14 = __Pyx_PyString_FormatSafe(__pyx_kp_s_s_Fail, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_t_14); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_13, __pyx_v_ib, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_t_9, __pyx_n_s_title); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_t_13); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_27 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_27 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_min); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_28 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_28 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_9 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_max); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      try {
+        __pyx_v_hFail.push_back(new TH1D(__pyx_t_2, __pyx_t_11, __pyx_t_27, __pyx_t_28, __pyx_t_20));
+      } catch(...) {
+        __Pyx_CppExn2PyErr();
+        __PYX_ERR(0, 401, __pyx_L1_error)
+      }
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+      /* "histUtils.pyx":402
+ *             hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hPass.back().Sumw2()             # <<<<<<<<<<<<<<
+ *             hFail.back().Sumw2()
  * 
  */
-  __pyx_v_formulas_list.Add(((TObject *)__pyx_v_flag_formula));
+      __pyx_v_hPass.back()->Sumw2();
 
-  /* "histUtils.pyx":109
+      /* "histUtils.pyx":403
+ *             hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+ *             hPass.back().Sumw2()
+ *             hFail.back().Sumw2()             # <<<<<<<<<<<<<<
  * 
- *     formulas_list.Add(<TObject*>flag_formula)
- *     tree.SetNotify(<TObject*> &formulas_list)             # <<<<<<<<<<<<<<
+ *     AddDirectory(addDirectoryStatus)
+ */
+      __pyx_v_hFail.back()->Sumw2();
+    }
+  }
+
+  /* "histUtils.pyx":405
+ *             hFail.back().Sumw2()
+ * 
+ *     AddDirectory(addDirectoryStatus)             # <<<<<<<<<<<<<<
  * 
  *     ######################################
  */
-  __pyx_v_tree->SetNotify(((TObject *)(&__pyx_v_formulas_list)));
+  TH1::AddDirectory(__pyx_v_addDirectoryStatus);
 
-  /* "histUtils.pyx":116
+  /* "histUtils.pyx":412
  * 
  *     # Find out with variables are used to activate the corresponding branches
  *     replace_patterns = ['&', '|', '-', 'cos(', 'sqrt(', 'fabs(', 'abs(', '(', ')', '>', '<', '=', '!', '*', '/', '[', ']']             # <<<<<<<<<<<<<<
- *     branches = " ".join(cutBinList) + " pair_mass " + flag
+ *     branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)
  *     for p in replace_patterns:
  */
-  __pyx_t_1 = PyList_New(17); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_kp_s__2);
-  __Pyx_GIVEREF(__pyx_kp_s__2);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_kp_s__2);
-  __Pyx_INCREF(__pyx_kp_s__3);
-  __Pyx_GIVEREF(__pyx_kp_s__3);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_kp_s__3);
-  __Pyx_INCREF(__pyx_kp_s__4);
-  __Pyx_GIVEREF(__pyx_kp_s__4);
-  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_kp_s__4);
-  __Pyx_INCREF(__pyx_kp_s_cos);
-  __Pyx_GIVEREF(__pyx_kp_s_cos);
-  PyList_SET_ITEM(__pyx_t_1, 3, __pyx_kp_s_cos);
-  __Pyx_INCREF(__pyx_kp_s_sqrt);
-  __Pyx_GIVEREF(__pyx_kp_s_sqrt);
-  PyList_SET_ITEM(__pyx_t_1, 4, __pyx_kp_s_sqrt);
-  __Pyx_INCREF(__pyx_kp_s_fabs);
-  __Pyx_GIVEREF(__pyx_kp_s_fabs);
-  PyList_SET_ITEM(__pyx_t_1, 5, __pyx_kp_s_fabs);
-  __Pyx_INCREF(__pyx_kp_s_abs);
-  __Pyx_GIVEREF(__pyx_kp_s_abs);
-  PyList_SET_ITEM(__pyx_t_1, 6, __pyx_kp_s_abs);
-  __Pyx_INCREF(__pyx_kp_s__5);
-  __Pyx_GIVEREF(__pyx_kp_s__5);
-  PyList_SET_ITEM(__pyx_t_1, 7, __pyx_kp_s__5);
-  __Pyx_INCREF(__pyx_kp_s__6);
-  __Pyx_GIVEREF(__pyx_kp_s__6);
-  PyList_SET_ITEM(__pyx_t_1, 8, __pyx_kp_s__6);
+  __pyx_t_13 = PyList_New(17); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
   __Pyx_INCREF(__pyx_kp_s__7);
   __Pyx_GIVEREF(__pyx_kp_s__7);
-  PyList_SET_ITEM(__pyx_t_1, 9, __pyx_kp_s__7);
+  PyList_SET_ITEM(__pyx_t_13, 0, __pyx_kp_s__7);
   __Pyx_INCREF(__pyx_kp_s__8);
   __Pyx_GIVEREF(__pyx_kp_s__8);
-  PyList_SET_ITEM(__pyx_t_1, 10, __pyx_kp_s__8);
+  PyList_SET_ITEM(__pyx_t_13, 1, __pyx_kp_s__8);
   __Pyx_INCREF(__pyx_kp_s__9);
   __Pyx_GIVEREF(__pyx_kp_s__9);
-  PyList_SET_ITEM(__pyx_t_1, 11, __pyx_kp_s__9);
+  PyList_SET_ITEM(__pyx_t_13, 2, __pyx_kp_s__9);
+  __Pyx_INCREF(__pyx_kp_s_cos);
+  __Pyx_GIVEREF(__pyx_kp_s_cos);
+  PyList_SET_ITEM(__pyx_t_13, 3, __pyx_kp_s_cos);
+  __Pyx_INCREF(__pyx_kp_s_sqrt_2);
+  __Pyx_GIVEREF(__pyx_kp_s_sqrt_2);
+  PyList_SET_ITEM(__pyx_t_13, 4, __pyx_kp_s_sqrt_2);
+  __Pyx_INCREF(__pyx_kp_s_fabs);
+  __Pyx_GIVEREF(__pyx_kp_s_fabs);
+  PyList_SET_ITEM(__pyx_t_13, 5, __pyx_kp_s_fabs);
+  __Pyx_INCREF(__pyx_kp_s_abs);
+  __Pyx_GIVEREF(__pyx_kp_s_abs);
+  PyList_SET_ITEM(__pyx_t_13, 6, __pyx_kp_s_abs);
   __Pyx_INCREF(__pyx_kp_s__10);
   __Pyx_GIVEREF(__pyx_kp_s__10);
-  PyList_SET_ITEM(__pyx_t_1, 12, __pyx_kp_s__10);
+  PyList_SET_ITEM(__pyx_t_13, 7, __pyx_kp_s__10);
   __Pyx_INCREF(__pyx_kp_s__11);
   __Pyx_GIVEREF(__pyx_kp_s__11);
-  PyList_SET_ITEM(__pyx_t_1, 13, __pyx_kp_s__11);
+  PyList_SET_ITEM(__pyx_t_13, 8, __pyx_kp_s__11);
   __Pyx_INCREF(__pyx_kp_s__12);
   __Pyx_GIVEREF(__pyx_kp_s__12);
-  PyList_SET_ITEM(__pyx_t_1, 14, __pyx_kp_s__12);
+  PyList_SET_ITEM(__pyx_t_13, 9, __pyx_kp_s__12);
   __Pyx_INCREF(__pyx_kp_s__13);
   __Pyx_GIVEREF(__pyx_kp_s__13);
-  PyList_SET_ITEM(__pyx_t_1, 15, __pyx_kp_s__13);
+  PyList_SET_ITEM(__pyx_t_13, 10, __pyx_kp_s__13);
   __Pyx_INCREF(__pyx_kp_s__14);
   __Pyx_GIVEREF(__pyx_kp_s__14);
-  PyList_SET_ITEM(__pyx_t_1, 16, __pyx_kp_s__14);
-  __pyx_v_replace_patterns = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "histUtils.pyx":117
+  PyList_SET_ITEM(__pyx_t_13, 11, __pyx_kp_s__14);
+  __Pyx_INCREF(__pyx_kp_s__15);
+  __Pyx_GIVEREF(__pyx_kp_s__15);
+  PyList_SET_ITEM(__pyx_t_13, 12, __pyx_kp_s__15);
+  __Pyx_INCREF(__pyx_kp_s_);
+  __Pyx_GIVEREF(__pyx_kp_s_);
+  PyList_SET_ITEM(__pyx_t_13, 13, __pyx_kp_s_);
+  __Pyx_INCREF(__pyx_kp_s__16);
+  __Pyx_GIVEREF(__pyx_kp_s__16);
+  PyList_SET_ITEM(__pyx_t_13, 14, __pyx_kp_s__16);
+  __Pyx_INCREF(__pyx_kp_s__17);
+  __Pyx_GIVEREF(__pyx_kp_s__17);
+  PyList_SET_ITEM(__pyx_t_13, 15, __pyx_kp_s__17);
+  __Pyx_INCREF(__pyx_kp_s__18);
+  __Pyx_GIVEREF(__pyx_kp_s__18);
+  PyList_SET_ITEM(__pyx_t_13, 16, __pyx_kp_s__18);
+  __pyx_v_replace_patterns = ((PyObject*)__pyx_t_13);
+  __pyx_t_13 = 0;
+
+  /* "histUtils.pyx":413
  *     # Find out with variables are used to activate the corresponding branches
  *     replace_patterns = ['&', '|', '-', 'cos(', 'sqrt(', 'fabs(', 'abs(', '(', ')', '>', '<', '=', '!', '*', '/', '[', ']']
- *     branches = " ".join(cutBinList) + " pair_mass " + flag             # <<<<<<<<<<<<<<
+ *     branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)             # <<<<<<<<<<<<<<
  *     for p in replace_patterns:
  *         branches = branches.replace(p, ' ')
  */
-  __pyx_t_1 = __Pyx_PyString_Join(__pyx_kp_s__15, __pyx_v_cutBinList); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = PyNumber_Add(__pyx_t_1, __pyx_kp_s_pair_mass); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Add(__pyx_t_7, __pyx_v_flag); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_v_branches = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "histUtils.pyx":118
+  __pyx_t_13 = __Pyx_PyString_Join(__pyx_kp_s__19, __pyx_v_cutBinList); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = PyNumber_Add(__pyx_t_13, __pyx_kp_s_pair_mass); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyString_Join(__pyx_kp_s__19, __pyx_v_flags); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_9 = PyNumber_Add(__pyx_t_14, __pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_v_branches = __pyx_t_9;
+  __pyx_t_9 = 0;
+
+  /* "histUtils.pyx":414
  *     replace_patterns = ['&', '|', '-', 'cos(', 'sqrt(', 'fabs(', 'abs(', '(', ')', '>', '<', '=', '!', '*', '/', '[', ']']
- *     branches = " ".join(cutBinList) + " pair_mass " + flag
+ *     branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)
  *     for p in replace_patterns:             # <<<<<<<<<<<<<<
  *         branches = branches.replace(p, ' ')
  * 
  */
-  __pyx_t_1 = __pyx_v_replace_patterns; __Pyx_INCREF(__pyx_t_1); __pyx_t_4 = 0;
+  __pyx_t_9 = __pyx_v_replace_patterns; __Pyx_INCREF(__pyx_t_9); __pyx_t_3 = 0;
   for (;;) {
-    if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_9)) break;
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_7); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __pyx_t_13 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 414, __pyx_L1_error)
     #else
-    __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 118, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_13 = PySequence_ITEM(__pyx_t_9, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 414, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
     #endif
-    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_7);
-    __pyx_t_7 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_13);
+    __pyx_t_13 = 0;
 
-    /* "histUtils.pyx":119
- *     branches = " ".join(cutBinList) + " pair_mass " + flag
+    /* "histUtils.pyx":415
+ *     branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)
  *     for p in replace_patterns:
  *         branches = branches.replace(p, ' ')             # <<<<<<<<<<<<<<
  * 
  *     # Note: with str.encode we convert a string to bytes, which is needed for C++ functions
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_branches, __pyx_n_s_replace); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 119, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_branches, __pyx_n_s_replace); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 415, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
     __pyx_t_6 = NULL;
-    __pyx_t_13 = 0;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    __pyx_t_12 = 0;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_14);
       if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
         __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_13 = 1;
+        __Pyx_DECREF_SET(__pyx_t_14, function);
+        __pyx_t_12 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p, __pyx_kp_s__15};
-      __pyx_t_7 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_13, 2+__pyx_t_13); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 119, __pyx_L1_error)
+    if (PyFunction_Check(__pyx_t_14)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p, __pyx_kp_s__19};
+      __pyx_t_13 = __Pyx_PyFunction_FastCall(__pyx_t_14, __pyx_temp+1-__pyx_t_12, 2+__pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 415, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GOTREF(__pyx_t_13);
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p, __pyx_kp_s__15};
-      __pyx_t_7 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_13, 2+__pyx_t_13); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 119, __pyx_L1_error)
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_14)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_p, __pyx_kp_s__19};
+      __pyx_t_13 = __Pyx_PyCFunction_FastCall(__pyx_t_14, __pyx_temp+1-__pyx_t_12, 2+__pyx_t_12); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 415, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GOTREF(__pyx_t_13);
     } else
     #endif
     {
-      __pyx_t_18 = PyTuple_New(2+__pyx_t_13); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 119, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_18);
+      __pyx_t_1 = PyTuple_New(2+__pyx_t_12); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 415, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       if (__pyx_t_6) {
-        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_18, 0, __pyx_t_6); __pyx_t_6 = NULL;
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6); __pyx_t_6 = NULL;
       }
       __Pyx_INCREF(__pyx_v_p);
       __Pyx_GIVEREF(__pyx_v_p);
-      PyTuple_SET_ITEM(__pyx_t_18, 0+__pyx_t_13, __pyx_v_p);
-      __Pyx_INCREF(__pyx_kp_s__15);
-      __Pyx_GIVEREF(__pyx_kp_s__15);
-      PyTuple_SET_ITEM(__pyx_t_18, 1+__pyx_t_13, __pyx_kp_s__15);
-      __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_18, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 119, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+      PyTuple_SET_ITEM(__pyx_t_1, 0+__pyx_t_12, __pyx_v_p);
+      __Pyx_INCREF(__pyx_kp_s__19);
+      __Pyx_GIVEREF(__pyx_kp_s__19);
+      PyTuple_SET_ITEM(__pyx_t_1, 1+__pyx_t_12, __pyx_kp_s__19);
+      __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_t_1, NULL); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 415, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF_SET(__pyx_v_branches, __pyx_t_7);
-    __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __Pyx_DECREF_SET(__pyx_v_branches, __pyx_t_13);
+    __pyx_t_13 = 0;
 
-    /* "histUtils.pyx":118
+    /* "histUtils.pyx":414
  *     replace_patterns = ['&', '|', '-', 'cos(', 'sqrt(', 'fabs(', 'abs(', '(', ')', '>', '<', '=', '!', '*', '/', '[', ']']
- *     branches = " ".join(cutBinList) + " pair_mass " + flag
+ *     branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)
  *     for p in replace_patterns:             # <<<<<<<<<<<<<<
  *         branches = branches.replace(p, ' ')
  * 
  */
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "histUtils.pyx":122
+  /* "histUtils.pyx":418
  * 
  *     # Note: with str.encode we convert a string to bytes, which is needed for C++ functions
  *     branches = set([str.encode(x) for x in branches.split(" ") if x != '' and not is_number(x)])             # <<<<<<<<<<<<<<
  * 
  *     # Activate only branches which matter for the tag selection
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_branches, __pyx_n_s_split); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_18 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_18)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_18);
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_branches, __pyx_n_s_split); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_1 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_14))) {
+    __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_14);
+    if (likely(__pyx_t_1)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
+      __Pyx_INCREF(__pyx_t_1);
       __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __Pyx_DECREF_SET(__pyx_t_14, function);
     }
   }
-  __pyx_t_7 = (__pyx_t_18) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_18, __pyx_kp_s__15) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_s__15);
-  __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-  if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_7)) || PyTuple_CheckExact(__pyx_t_7)) {
-    __pyx_t_3 = __pyx_t_7; __Pyx_INCREF(__pyx_t_3); __pyx_t_4 = 0;
-    __pyx_t_5 = NULL;
+  __pyx_t_13 = (__pyx_t_1) ? __Pyx_PyObject_Call2Args(__pyx_t_14, __pyx_t_1, __pyx_kp_s__19) : __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_kp_s__19);
+  __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
+    __pyx_t_14 = __pyx_t_13; __Pyx_INCREF(__pyx_t_14); __pyx_t_3 = 0;
+    __pyx_t_17 = NULL;
   } else {
-    __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __pyx_t_3 = -1; __pyx_t_14 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_17 = Py_TYPE(__pyx_t_14)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 418, __pyx_L1_error)
   }
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
   for (;;) {
-    if (likely(!__pyx_t_5)) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
+    if (likely(!__pyx_t_17)) {
+      if (likely(PyList_CheckExact(__pyx_t_14))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_14)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_7); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
+        __pyx_t_13 = PyList_GET_ITEM(__pyx_t_14, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
         #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_13 = PySequence_ITEM(__pyx_t_14, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 418, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
         #endif
       } else {
-        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_14)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_7); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
+        __pyx_t_13 = PyTuple_GET_ITEM(__pyx_t_14, __pyx_t_3); __Pyx_INCREF(__pyx_t_13); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
         #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
+        __pyx_t_13 = PySequence_ITEM(__pyx_t_14, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 418, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
         #endif
       }
     } else {
-      __pyx_t_7 = __pyx_t_5(__pyx_t_3);
-      if (unlikely(!__pyx_t_7)) {
+      __pyx_t_13 = __pyx_t_17(__pyx_t_14);
+      if (unlikely(!__pyx_t_13)) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 122, __pyx_L1_error)
+          else __PYX_ERR(0, 418, __pyx_L1_error)
         }
         break;
       }
-      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GOTREF(__pyx_t_13);
     }
-    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_7);
-    __pyx_t_7 = 0;
-    __pyx_t_16 = (__Pyx_PyString_Equals(__pyx_v_x, __pyx_kp_s__16, Py_NE)); if (unlikely(__pyx_t_16 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
-    if (__pyx_t_16) {
+    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_13);
+    __pyx_t_13 = 0;
+    __pyx_t_15 = (__Pyx_PyString_Equals(__pyx_v_x, __pyx_kp_s__20, Py_NE)); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
+    if (__pyx_t_15) {
     } else {
-      __pyx_t_8 = __pyx_t_16;
-      goto __pyx_L19_bool_binop_done;
+      __pyx_t_7 = __pyx_t_15;
+      goto __pyx_L58_bool_binop_done;
     }
-    __Pyx_GetModuleGlobalName(__pyx_t_18, __pyx_n_s_is_number); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 122, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_18);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_is_number); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_6 = NULL;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_18))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_18);
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
       if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_18);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
         __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_18, function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
       }
     }
-    __pyx_t_7 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_18, __pyx_t_6, __pyx_v_x) : __Pyx_PyObject_CallOneArg(__pyx_t_18, __pyx_v_x);
+    __pyx_t_13 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_v_x) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_x);
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-    __pyx_t_16 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_16 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_9 = ((!__pyx_t_16) != 0);
-    __pyx_t_8 = __pyx_t_9;
-    __pyx_L19_bool_binop_done:;
-    if (__pyx_t_8) {
-      __pyx_t_18 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_18);
+    if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_15 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_8 = ((!__pyx_t_15) != 0);
+    __pyx_t_7 = __pyx_t_8;
+    __pyx_L58_bool_binop_done:;
+    if (__pyx_t_7) {
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)(&PyString_Type)), __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 418, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       __pyx_t_6 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_18))) {
-        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_18);
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
         if (likely(__pyx_t_6)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_18);
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
           __Pyx_INCREF(__pyx_t_6);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_18, function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
         }
       }
-      __pyx_t_7 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_18, __pyx_t_6, __pyx_v_x) : __Pyx_PyObject_CallOneArg(__pyx_t_18, __pyx_v_x);
+      __pyx_t_13 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_v_x) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_x);
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 418, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_9, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 418, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
     }
   }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PySet_New(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF_SET(__pyx_v_branches, __pyx_t_3);
-  __pyx_t_3 = 0;
-
-  /* "histUtils.pyx":125
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = PySet_New(__pyx_t_9); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF_SET(__pyx_v_branches, __pyx_t_14);
+  __pyx_t_14 = 0;
+
+  /* "histUtils.pyx":421
  * 
  *     # Activate only branches which matter for the tag selection
  *     tree.SetBranchStatus("*", 0)             # <<<<<<<<<<<<<<
@@ -3129,40 +7696,40 @@ static PyObject *__pyx_pf_9histUtils_2makePassFailHistograms(CYTHON_UNUSED PyObj
  */
   __pyx_v_tree->SetBranchStatus(((const char *)"*"), 0);
 
-  /* "histUtils.pyx":127
+  /* "histUtils.pyx":423
  *     tree.SetBranchStatus("*", 0)
  * 
  *     for br in branches:             # <<<<<<<<<<<<<<
  *         tree.SetBranchStatus(br, 1)
  * 
  */
-  __pyx_t_4 = 0;
-  __pyx_t_1 = __Pyx_set_iterator(__pyx_v_branches, 1, (&__pyx_t_11), (&__pyx_t_13)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __pyx_t_3 = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_9 = __Pyx_set_iterator(__pyx_v_branches, 1, (&__pyx_t_4), (&__pyx_t_12)); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_14);
+  __pyx_t_14 = __pyx_t_9;
+  __pyx_t_9 = 0;
   while (1) {
-    __pyx_t_19 = __Pyx_set_iter_next(__pyx_t_3, __pyx_t_11, &__pyx_t_4, &__pyx_t_1, __pyx_t_13);
-    if (unlikely(__pyx_t_19 == 0)) break;
-    if (unlikely(__pyx_t_19 == -1)) __PYX_ERR(0, 127, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_XDECREF_SET(__pyx_v_br, __pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "histUtils.pyx":128
+    __pyx_t_22 = __Pyx_set_iter_next(__pyx_t_14, __pyx_t_4, &__pyx_t_3, &__pyx_t_9, __pyx_t_12);
+    if (unlikely(__pyx_t_22 == 0)) break;
+    if (unlikely(__pyx_t_22 == -1)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_XDECREF_SET(__pyx_v_br, __pyx_t_9);
+    __pyx_t_9 = 0;
+
+    /* "histUtils.pyx":424
  * 
  *     for br in branches:
  *         tree.SetBranchStatus(br, 1)             # <<<<<<<<<<<<<<
  * 
  *     # Set adress of pair mass
  */
-    __pyx_t_2 = __Pyx_PyObject_AsString(__pyx_v_br); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 128, __pyx_L1_error)
-    __pyx_v_tree->SetBranchStatus(__pyx_t_2, 1);
+    __pyx_t_11 = __Pyx_PyObject_AsString(__pyx_v_br); if (unlikely((!__pyx_t_11) && PyErr_Occurred())) __PYX_ERR(0, 424, __pyx_L1_error)
+    __pyx_v_tree->SetBranchStatus(__pyx_t_11, 1);
   }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
 
-  /* "histUtils.pyx":131
+  /* "histUtils.pyx":427
  * 
  *     # Set adress of pair mass
  *     tree.SetBranchAddress("pair_mass", <void*>&pair_mass)             # <<<<<<<<<<<<<<
@@ -3171,436 +7738,1361 @@ static PyObject *__pyx_pf_9histUtils_2makePassFailHistograms(CYTHON_UNUSED PyObj
  */
   __pyx_v_tree->SetBranchAddress(((const char *)"pair_mass"), ((void *)(&__pyx_v_pair_mass)));
 
-  /* "histUtils.pyx":137
+  /* "histUtils.pyx":433
  *     ################
  * 
  *     nevts = tree.GetEntries()             # <<<<<<<<<<<<<<
- *     frac_of_nevts = nevts/20
- * 
+ *     lastEntry = nevts
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:
  */
   __pyx_v_nevts = __pyx_v_tree->GetEntries();
 
-  /* "histUtils.pyx":138
+  /* "histUtils.pyx":434
  * 
  *     nevts = tree.GetEntries()
- *     frac_of_nevts = nevts/20             # <<<<<<<<<<<<<<
+ *     lastEntry = nevts             # <<<<<<<<<<<<<<
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:
+ *         lastEntry = firstEntry + nEntries
+ */
+  __pyx_v_lastEntry = __pyx_v_nevts;
+
+  /* "histUtils.pyx":435
+ *     nevts = tree.GetEntries()
+ *     lastEntry = nevts
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:             # <<<<<<<<<<<<<<
+ *         lastEntry = firstEntry + nEntries
+ *     frac_of_nevts = max(1, (lastEntry - firstEntry)/20)
+ */
+  __pyx_t_14 = PyObject_RichCompare(__pyx_v_nEntries, __pyx_int_0, Py_GE); __Pyx_XGOTREF(__pyx_t_14); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  if (__pyx_t_8) {
+  } else {
+    __pyx_t_7 = __pyx_t_8;
+    goto __pyx_L63_bool_binop_done;
+  }
+  __pyx_t_14 = PyNumber_Add(__pyx_v_firstEntry, __pyx_v_nEntries); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_nevts); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_13 = PyObject_RichCompare(__pyx_t_14, __pyx_t_9, Py_LT); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_7 = __pyx_t_8;
+  __pyx_L63_bool_binop_done:;
+  if (__pyx_t_7) {
+
+    /* "histUtils.pyx":436
+ *     lastEntry = nevts
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:
+ *         lastEntry = firstEntry + nEntries             # <<<<<<<<<<<<<<
+ *     frac_of_nevts = max(1, (lastEntry - firstEntry)/20)
  * 
- *     print("Starting event loop to fill histograms..")
  */
-  __pyx_v_frac_of_nevts = __Pyx_div_long(__pyx_v_nevts, 20);
+    __pyx_t_13 = PyNumber_Add(__pyx_v_firstEntry, __pyx_v_nEntries); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 436, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_t_13); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 436, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_v_lastEntry = __pyx_t_12;
 
-  /* "histUtils.pyx":140
- *     frac_of_nevts = nevts/20
+    /* "histUtils.pyx":435
+ *     nevts = tree.GetEntries()
+ *     lastEntry = nevts
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:             # <<<<<<<<<<<<<<
+ *         lastEntry = firstEntry + nEntries
+ *     frac_of_nevts = max(1, (lastEntry - firstEntry)/20)
+ */
+  }
+
+  /* "histUtils.pyx":437
+ *     if nEntries >= 0 and firstEntry + nEntries < nevts:
+ *         lastEntry = firstEntry + nEntries
+ *     frac_of_nevts = max(1, (lastEntry - firstEntry)/20)             # <<<<<<<<<<<<<<
+ * 
+ *     print("Starting event loop to fill histograms for %d flag(s) (entries %d to %d).." % (nflags, firstEntry, lastEntry))
+ */
+  __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_lastEntry); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_9 = PyNumber_Subtract(__pyx_t_13, __pyx_v_firstEntry); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyNumber_Divide(__pyx_t_9, __pyx_int_20); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_29 = 1;
+  __pyx_t_14 = __Pyx_PyInt_From_long(__pyx_t_29); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_13, __pyx_t_14, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_7) {
+    __Pyx_INCREF(__pyx_t_13);
+    __pyx_t_9 = __pyx_t_13;
+  } else {
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_t_29); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 437, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = __pyx_t_1;
+    __pyx_t_1 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_t_9); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 437, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_frac_of_nevts = __pyx_t_12;
+
+  /* "histUtils.pyx":439
+ *     frac_of_nevts = max(1, (lastEntry - firstEntry)/20)
  * 
- *     print("Starting event loop to fill histograms..")             # <<<<<<<<<<<<<<
+ *     print("Starting event loop to fill histograms for %d flag(s) (entries %d to %d).." % (nflags, firstEntry, lastEntry))             # <<<<<<<<<<<<<<
  * 
- *     for index in range(nevts):
+ *     for index in range(firstEntry, lastEntry):
  */
-  if (__Pyx_PrintOne(0, __pyx_kp_s_Starting_event_loop_to_fill_hist) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_nflags); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_lastEntry); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_9);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_9);
+  __Pyx_INCREF(__pyx_v_firstEntry);
+  __Pyx_GIVEREF(__pyx_v_firstEntry);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_firstEntry);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_13);
+  __pyx_t_9 = 0;
+  __pyx_t_13 = 0;
+  __pyx_t_13 = __Pyx_PyString_Format(__pyx_kp_s_Starting_event_loop_to_fill_hist, __pyx_t_1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__Pyx_PrintOne(0, __pyx_t_13) < 0) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
 
-  /* "histUtils.pyx":142
- *     print("Starting event loop to fill histograms..")
+  /* "histUtils.pyx":441
+ *     print("Starting event loop to fill histograms for %d flag(s) (entries %d to %d).." % (nflags, firstEntry, lastEntry))
  * 
- *     for index in range(nevts):             # <<<<<<<<<<<<<<
- *         if index % frac_of_nevts == 0:
+ *     for index in range(firstEntry, lastEntry):             # <<<<<<<<<<<<<<
+ *         if (index - firstEntry) % frac_of_nevts == 0:
  *             print outcount, "%", sample.name
  */
-  __pyx_t_13 = __pyx_v_nevts;
-  __pyx_t_19 = __pyx_t_13;
-  for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
-    __pyx_v_index = __pyx_t_20;
+  __pyx_t_12 = __pyx_v_lastEntry;
+  __pyx_t_29 = __Pyx_PyInt_As_long(__pyx_v_firstEntry); if (unlikely((__pyx_t_29 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 441, __pyx_L1_error)
+  __pyx_t_22 = __pyx_t_12;
+  for (__pyx_t_24 = __pyx_t_29; __pyx_t_24 < __pyx_t_22; __pyx_t_24+=1) {
+    __pyx_v_index = __pyx_t_24;
 
-    /* "histUtils.pyx":143
+    /* "histUtils.pyx":442
  * 
- *     for index in range(nevts):
- *         if index % frac_of_nevts == 0:             # <<<<<<<<<<<<<<
+ *     for index in range(firstEntry, lastEntry):
+ *         if (index - firstEntry) % frac_of_nevts == 0:             # <<<<<<<<<<<<<<
  *             print outcount, "%", sample.name
  *             outcount = outcount + 5
  */
-    if (unlikely(__pyx_v_frac_of_nevts == 0)) {
-      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      __PYX_ERR(0, 143, __pyx_L1_error)
-    }
-    __pyx_t_8 = ((__Pyx_mod_int(__pyx_v_index, __pyx_v_frac_of_nevts) == 0) != 0);
-    if (__pyx_t_8) {
-
-      /* "histUtils.pyx":144
- *     for index in range(nevts):
- *         if index % frac_of_nevts == 0:
+    __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_1 = PyNumber_Subtract(__pyx_t_13, __pyx_v_firstEntry); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_frac_of_nevts); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_9 = PyNumber_Remainder(__pyx_t_1, __pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyInt_EqObjC(__pyx_t_9, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":443
+ *     for index in range(firstEntry, lastEntry):
+ *         if (index - firstEntry) % frac_of_nevts == 0:
  *             print outcount, "%", sample.name             # <<<<<<<<<<<<<<
  *             outcount = outcount + 5
  * 
  */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_outcount); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 144, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+      __pyx_t_13 = __Pyx_PyInt_From_int(__pyx_v_outcount); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_sample, __pyx_n_s_name); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 443, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 144, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3);
-      __Pyx_INCREF(__pyx_kp_s__17);
-      __Pyx_GIVEREF(__pyx_kp_s__17);
-      PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_kp_s__17);
-      __Pyx_GIVEREF(__pyx_t_1);
-      PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_1);
-      __pyx_t_3 = 0;
-      __pyx_t_1 = 0;
-      if (__Pyx_Print(0, __pyx_t_7, 1) < 0) __PYX_ERR(0, 144, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GIVEREF(__pyx_t_13);
+      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_13);
+      __Pyx_INCREF(__pyx_kp_s__21);
+      __Pyx_GIVEREF(__pyx_kp_s__21);
+      PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_kp_s__21);
+      __Pyx_GIVEREF(__pyx_t_9);
+      PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_9);
+      __pyx_t_13 = 0;
+      __pyx_t_9 = 0;
+      if (__Pyx_Print(0, __pyx_t_1, 1) < 0) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "histUtils.pyx":145
- *         if index % frac_of_nevts == 0:
+      /* "histUtils.pyx":444
+ *         if (index - firstEntry) % frac_of_nevts == 0:
  *             print outcount, "%", sample.name
  *             outcount = outcount + 5             # <<<<<<<<<<<<<<
  * 
- *         tree.GetEntry(index)
+ *         tree.GetEntry(index)
+ */
+      __pyx_v_outcount = (__pyx_v_outcount + 5);
+
+      /* "histUtils.pyx":442
+ * 
+ *     for index in range(firstEntry, lastEntry):
+ *         if (index - firstEntry) % frac_of_nevts == 0:             # <<<<<<<<<<<<<<
+ *             print outcount, "%", sample.name
+ *             outcount = outcount + 5
+ */
+    }
+
+    /* "histUtils.pyx":446
+ *             outcount = outcount + 5
+ * 
+ *         tree.GetEntry(index)             # <<<<<<<<<<<<<<
+ * 
+ *         if useBinSearch:
+ */
+    (void)(__pyx_v_tree->GetEntry(__pyx_v_index));
+
+    /* "histUtils.pyx":448
+ *         tree.GetEntry(index)
+ * 
+ *         if useBinSearch:             # <<<<<<<<<<<<<<
+ *             # bins are ordered with the first variable running fastest (see createBins)
+ *             bnidx = 0
+ */
+    __pyx_t_7 = (__pyx_v_useBinSearch != 0);
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":450
+ *         if useBinSearch:
+ *             # bins are ordered with the first variable running fastest (see createBins)
+ *             bnidx = 0             # <<<<<<<<<<<<<<
+ *             for iv in range(nvars):
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+ */
+      __pyx_v_bnidx = 0;
+
+      /* "histUtils.pyx":451
+ *             # bins are ordered with the first variable running fastest (see createBins)
+ *             bnidx = 0
+ *             for iv in range(nvars):             # <<<<<<<<<<<<<<
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+ *                 if ivbin < 0:
+ */
+      __pyx_t_25 = __pyx_v_nvars;
+      __pyx_t_26 = __pyx_t_25;
+      for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
+        __pyx_v_iv = __pyx_t_27;
+
+        /* "histUtils.pyx":452
+ *             bnidx = 0
+ *             for iv in range(nvars):
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))             # <<<<<<<<<<<<<<
+ *                 if ivbin < 0:
+ *                     bnidx = -1
+ */
+        __pyx_v_ivbin = __pyx_f_9histUtils_findBin((__pyx_v_var_edges[__pyx_v_iv]), (__pyx_v_var_isInt[__pyx_v_iv]), (__pyx_v_var_formulas[__pyx_v_iv])->EvalInstance(0));
+
+        /* "histUtils.pyx":453
+ *             for iv in range(nvars):
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+ *                 if ivbin < 0:             # <<<<<<<<<<<<<<
+ *                     bnidx = -1
+ *                     break
+ */
+        __pyx_t_7 = ((__pyx_v_ivbin < 0) != 0);
+        if (__pyx_t_7) {
+
+          /* "histUtils.pyx":454
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+ *                 if ivbin < 0:
+ *                     bnidx = -1             # <<<<<<<<<<<<<<
+ *                     break
+ *                 bnidx = bnidx + ivbin * var_strides[iv]
+ */
+          __pyx_v_bnidx = -1;
+
+          /* "histUtils.pyx":455
+ *                 if ivbin < 0:
+ *                     bnidx = -1
+ *                     break             # <<<<<<<<<<<<<<
+ *                 bnidx = bnidx + ivbin * var_strides[iv]
+ * 
+ */
+          goto __pyx_L70_break;
+
+          /* "histUtils.pyx":453
+ *             for iv in range(nvars):
+ *                 ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+ *                 if ivbin < 0:             # <<<<<<<<<<<<<<
+ *                     bnidx = -1
+ *                     break
+ */
+        }
+
+        /* "histUtils.pyx":456
+ *                     bnidx = -1
+ *                     break
+ *                 bnidx = bnidx + ivbin * var_strides[iv]             # <<<<<<<<<<<<<<
+ * 
+ *             if bnidx < 0:
+ */
+        __pyx_v_bnidx = (__pyx_v_bnidx + (__pyx_v_ivbin * (__pyx_v_var_strides[__pyx_v_iv])));
+      }
+      __pyx_L70_break:;
+
+      /* "histUtils.pyx":458
+ *                 bnidx = bnidx + ivbin * var_strides[iv]
+ * 
+ *             if bnidx < 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ */
+      __pyx_t_7 = ((__pyx_v_bnidx < 0) != 0);
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":459
+ * 
+ *             if bnidx < 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ *                 continue
+ */
+        goto __pyx_L65_continue;
+
+        /* "histUtils.pyx":458
+ *                 bnidx = bnidx + ivbin * var_strides[iv]
+ * 
+ *             if bnidx < 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ */
+      }
+
+      /* "histUtils.pyx":460
+ *             if bnidx < 0:
+ *                 continue
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):
+ */
+      __pyx_t_8 = ((__pyx_v_common_formula != NULL) != 0);
+      if (__pyx_t_8) {
+      } else {
+        __pyx_t_7 = __pyx_t_8;
+        goto __pyx_L74_bool_binop_done;
+      }
+      __pyx_t_8 = ((!(__pyx_v_common_formula->EvalInstance(0) != 0)) != 0);
+      __pyx_t_7 = __pyx_t_8;
+      __pyx_L74_bool_binop_done:;
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":461
+ *                 continue
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ *                 continue             # <<<<<<<<<<<<<<
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):
+ *                 continue
+ */
+        goto __pyx_L65_continue;
+
+        /* "histUtils.pyx":460
+ *             if bnidx < 0:
+ *                 continue
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                 continue
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):
+ */
+      }
+
+      /* "histUtils.pyx":462
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ *                 continue
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      __pyx_t_8 = (((__pyx_v_add_formulas[__pyx_v_bnidx]) != NULL) != 0);
+      if (__pyx_t_8) {
+      } else {
+        __pyx_t_7 = __pyx_t_8;
+        goto __pyx_L77_bool_binop_done;
+      }
+      __pyx_t_8 = ((!((__pyx_v_add_formulas[__pyx_v_bnidx])->EvalInstance(0) != 0)) != 0);
+      __pyx_t_7 = __pyx_t_8;
+      __pyx_L77_bool_binop_done:;
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":463
+ *                 continue
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             weight = 1.0
+ */
+        goto __pyx_L65_continue;
+
+        /* "histUtils.pyx":462
+ *             if common_formula != NULL and not common_formula.EvalInstance(0):
+ *                 continue
+ *             if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      }
+
+      /* "histUtils.pyx":465
+ *                 continue
+ * 
+ *             weight = 1.0             # <<<<<<<<<<<<<<
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
+ */
+      __pyx_v_weight = 1.0;
+
+      /* "histUtils.pyx":466
+ * 
+ *             weight = 1.0
+ *             if weight_formula != NULL:             # <<<<<<<<<<<<<<
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if not weight:
+ */
+      __pyx_t_7 = ((__pyx_v_weight_formula != NULL) != 0);
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":467
+ *             weight = 1.0
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)             # <<<<<<<<<<<<<<
+ *             if not weight:
+ *                 continue
+ */
+        __pyx_v_weight = __pyx_v_weight_formula->EvalInstance(0);
+
+        /* "histUtils.pyx":466
+ * 
+ *             weight = 1.0
+ *             if weight_formula != NULL:             # <<<<<<<<<<<<<<
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if not weight:
+ */
+      }
+
+      /* "histUtils.pyx":468
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if not weight:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      __pyx_t_7 = ((!(__pyx_v_weight != 0)) != 0);
+      if (__pyx_t_7) {
+
+        /* "histUtils.pyx":469
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if not weight:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             for iflag in range(nflags):
+ */
+        goto __pyx_L65_continue;
+
+        /* "histUtils.pyx":468
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if not weight:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+      }
+
+      /* "histUtils.pyx":471
+ *                 continue
+ * 
+ *             for iflag in range(nflags):             # <<<<<<<<<<<<<<
+ *                 ih = iflag * nbins + bnidx
+ *                 if flag_formulas[iflag].EvalInstance(0):
+ */
+      __pyx_t_25 = __pyx_v_nflags;
+      __pyx_t_26 = __pyx_t_25;
+      for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
+        __pyx_v_iflag = __pyx_t_27;
+
+        /* "histUtils.pyx":472
+ * 
+ *             for iflag in range(nflags):
+ *                 ih = iflag * nbins + bnidx             # <<<<<<<<<<<<<<
+ *                 if flag_formulas[iflag].EvalInstance(0):
+ *                     hPass[ih].Fill(pair_mass, weight)
+ */
+        __pyx_v_ih = ((__pyx_v_iflag * __pyx_v_nbins) + __pyx_v_bnidx);
+
+        /* "histUtils.pyx":473
+ *             for iflag in range(nflags):
+ *                 ih = iflag * nbins + bnidx
+ *                 if flag_formulas[iflag].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                     hPass[ih].Fill(pair_mass, weight)
+ *                 else:
+ */
+        __pyx_t_7 = ((__pyx_v_flag_formulas[__pyx_v_iflag])->EvalInstance(0) != 0);
+        if (__pyx_t_7) {
+
+          /* "histUtils.pyx":474
+ *                 ih = iflag * nbins + bnidx
+ *                 if flag_formulas[iflag].EvalInstance(0):
+ *                     hPass[ih].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     hFail[ih].Fill(pair_mass, weight)
+ */
+          (void)((__pyx_v_hPass[__pyx_v_ih])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
+
+          /* "histUtils.pyx":473
+ *             for iflag in range(nflags):
+ *                 ih = iflag * nbins + bnidx
+ *                 if flag_formulas[iflag].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                     hPass[ih].Fill(pair_mass, weight)
+ *                 else:
+ */
+          goto __pyx_L83;
+        }
+
+        /* "histUtils.pyx":476
+ *                     hPass[ih].Fill(pair_mass, weight)
+ *                 else:
+ *                     hFail[ih].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+        /*else*/ {
+          (void)((__pyx_v_hFail[__pyx_v_ih])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
+        }
+        __pyx_L83:;
+      }
+
+      /* "histUtils.pyx":477
+ *                 else:
+ *                     hFail[ih].Fill(pair_mass, weight)
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         if common_formula != NULL and not common_formula.EvalInstance(0):
+ */
+      goto __pyx_L65_continue;
+
+      /* "histUtils.pyx":448
+ *         tree.GetEntry(index)
+ * 
+ *         if useBinSearch:             # <<<<<<<<<<<<<<
+ *             # bins are ordered with the first variable running fastest (see createBins)
+ *             bnidx = 0
+ */
+    }
+
+    /* "histUtils.pyx":479
+ *             continue
+ * 
+ *         if common_formula != NULL and not common_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    __pyx_t_8 = ((__pyx_v_common_formula != NULL) != 0);
+    if (__pyx_t_8) {
+    } else {
+      __pyx_t_7 = __pyx_t_8;
+      goto __pyx_L85_bool_binop_done;
+    }
+    __pyx_t_8 = ((!(__pyx_v_common_formula->EvalInstance(0) != 0)) != 0);
+    __pyx_t_7 = __pyx_t_8;
+    __pyx_L85_bool_binop_done:;
+    if (__pyx_t_7) {
+
+      /* "histUtils.pyx":480
+ * 
+ *         if common_formula != NULL and not common_formula.EvalInstance(0):
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         # -1: term not evaluated yet for this event
  */
-      __pyx_v_outcount = (__pyx_v_outcount + 5);
+      goto __pyx_L65_continue;
 
-      /* "histUtils.pyx":143
+      /* "histUtils.pyx":479
+ *             continue
+ * 
+ *         if common_formula != NULL and not common_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
+ *             continue
  * 
- *     for index in range(nevts):
- *         if index % frac_of_nevts == 0:             # <<<<<<<<<<<<<<
- *             print outcount, "%", sample.name
- *             outcount = outcount + 5
  */
     }
 
-    /* "histUtils.pyx":147
- *             outcount = outcount + 5
- * 
- *         tree.GetEntry(index)             # <<<<<<<<<<<<<<
+    /* "histUtils.pyx":483
  * 
+ *         # -1: term not evaluated yet for this event
+ *         atom_state.assign(natoms, -1)             # <<<<<<<<<<<<<<
  *         for bnidx in range(nbins):
+ *             passed = True
  */
-    (void)(__pyx_v_tree->GetEntry(__pyx_v_index));
+    __pyx_v_atom_state.assign(__pyx_v_natoms, -1);
 
-    /* "histUtils.pyx":149
- *         tree.GetEntry(index)
- * 
+    /* "histUtils.pyx":484
+ *         # -1: term not evaluated yet for this event
+ *         atom_state.assign(natoms, -1)
  *         for bnidx in range(nbins):             # <<<<<<<<<<<<<<
- *             weight = bin_formulas[bnidx].EvalInstance(0)
- *             if weight:
+ *             passed = True
+ *             for ia in range(bin_atoms[bnidx].size()):
  */
-    __pyx_t_21 = __pyx_v_nbins;
-    __pyx_t_22 = __pyx_t_21;
-    for (__pyx_t_23 = 0; __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
-      __pyx_v_bnidx = __pyx_t_23;
+    __pyx_t_25 = __pyx_v_nbins;
+    __pyx_t_26 = __pyx_t_25;
+    for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
+      __pyx_v_bnidx = __pyx_t_27;
 
-      /* "histUtils.pyx":150
- * 
+      /* "histUtils.pyx":485
+ *         atom_state.assign(natoms, -1)
  *         for bnidx in range(nbins):
- *             weight = bin_formulas[bnidx].EvalInstance(0)             # <<<<<<<<<<<<<<
- *             if weight:
- *                 if flag_formula.EvalInstance(0):
+ *             passed = True             # <<<<<<<<<<<<<<
+ *             for ia in range(bin_atoms[bnidx].size()):
+ *                 iatom = bin_atoms[bnidx][ia]
  */
-      __pyx_v_weight = (__pyx_v_bin_formulas[__pyx_v_bnidx])->EvalInstance(0);
+      __pyx_v_passed = 1;
 
-      /* "histUtils.pyx":151
+      /* "histUtils.pyx":486
  *         for bnidx in range(nbins):
- *             weight = bin_formulas[bnidx].EvalInstance(0)
- *             if weight:             # <<<<<<<<<<<<<<
- *                 if flag_formula.EvalInstance(0):
- *                     hPass[bnidx].Fill(pair_mass, weight)
+ *             passed = True
+ *             for ia in range(bin_atoms[bnidx].size()):             # <<<<<<<<<<<<<<
+ *                 iatom = bin_atoms[bnidx][ia]
+ *                 if atom_state[iatom] < 0:
  */
-      __pyx_t_8 = (__pyx_v_weight != 0);
-      if (__pyx_t_8) {
-
-        /* "histUtils.pyx":152
- *             weight = bin_formulas[bnidx].EvalInstance(0)
- *             if weight:
- *                 if flag_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
- *                     hPass[bnidx].Fill(pair_mass, weight)
- *                 else:
+      __pyx_t_30 = (__pyx_v_bin_atoms[__pyx_v_bnidx]).size();
+      __pyx_t_31 = __pyx_t_30;
+      for (__pyx_t_32 = 0; __pyx_t_32 < __pyx_t_31; __pyx_t_32+=1) {
+        __pyx_v_ia = __pyx_t_32;
+
+        /* "histUtils.pyx":487
+ *             passed = True
+ *             for ia in range(bin_atoms[bnidx].size()):
+ *                 iatom = bin_atoms[bnidx][ia]             # <<<<<<<<<<<<<<
+ *                 if atom_state[iatom] < 0:
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
  */
-        __pyx_t_8 = (__pyx_v_flag_formula->EvalInstance(0) != 0);
-        if (__pyx_t_8) {
-
-          /* "histUtils.pyx":153
- *             if weight:
- *                 if flag_formula.EvalInstance(0):
- *                     hPass[bnidx].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
- *                 else:
- *                     hFail[bnidx].Fill(pair_mass, weight)
+        __pyx_v_iatom = ((__pyx_v_bin_atoms[__pyx_v_bnidx])[__pyx_v_ia]);
+
+        /* "histUtils.pyx":488
+ *             for ia in range(bin_atoms[bnidx].size()):
+ *                 iatom = bin_atoms[bnidx][ia]
+ *                 if atom_state[iatom] < 0:             # <<<<<<<<<<<<<<
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+ *                 if atom_state[iatom] == 0:
+ */
+        __pyx_t_7 = (((__pyx_v_atom_state[__pyx_v_iatom]) < 0) != 0);
+        if (__pyx_t_7) {
+
+          /* "histUtils.pyx":489
+ *                 iatom = bin_atoms[bnidx][ia]
+ *                 if atom_state[iatom] < 0:
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0             # <<<<<<<<<<<<<<
+ *                 if atom_state[iatom] == 0:
+ *                     passed = False
  */
-          (void)((__pyx_v_hPass[__pyx_v_bnidx])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
+          if (((__pyx_v_atom_formulas[__pyx_v_iatom])->EvalInstance(0) != 0)) {
+            __pyx_t_33 = 1;
+          } else {
+            __pyx_t_33 = 0;
+          }
+          (__pyx_v_atom_state[__pyx_v_iatom]) = __pyx_t_33;
+
+          /* "histUtils.pyx":488
+ *             for ia in range(bin_atoms[bnidx].size()):
+ *                 iatom = bin_atoms[bnidx][ia]
+ *                 if atom_state[iatom] < 0:             # <<<<<<<<<<<<<<
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+ *                 if atom_state[iatom] == 0:
+ */
+        }
 
-          /* "histUtils.pyx":152
- *             weight = bin_formulas[bnidx].EvalInstance(0)
- *             if weight:
- *                 if flag_formula.EvalInstance(0):             # <<<<<<<<<<<<<<
- *                     hPass[bnidx].Fill(pair_mass, weight)
- *                 else:
+        /* "histUtils.pyx":490
+ *                 if atom_state[iatom] < 0:
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+ *                 if atom_state[iatom] == 0:             # <<<<<<<<<<<<<<
+ *                     passed = False
+ *                     break
+ */
+        __pyx_t_7 = (((__pyx_v_atom_state[__pyx_v_iatom]) == 0) != 0);
+        if (__pyx_t_7) {
+
+          /* "histUtils.pyx":491
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+ *                 if atom_state[iatom] == 0:
+ *                     passed = False             # <<<<<<<<<<<<<<
+ *                     break
+ *             if not passed:
+ */
+          __pyx_v_passed = 0;
+
+          /* "histUtils.pyx":492
+ *                 if atom_state[iatom] == 0:
+ *                     passed = False
+ *                     break             # <<<<<<<<<<<<<<
+ *             if not passed:
+ *                 continue
+ */
+          goto __pyx_L90_break;
+
+          /* "histUtils.pyx":490
+ *                 if atom_state[iatom] < 0:
+ *                     atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+ *                 if atom_state[iatom] == 0:             # <<<<<<<<<<<<<<
+ *                     passed = False
+ *                     break
  */
-          goto __pyx_L29;
         }
+      }
+      __pyx_L90_break:;
 
-        /* "histUtils.pyx":155
- *                     hPass[bnidx].Fill(pair_mass, weight)
- *                 else:
- *                     hFail[bnidx].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
- *                 break
+      /* "histUtils.pyx":493
+ *                     passed = False
+ *                     break
+ *             if not passed:             # <<<<<<<<<<<<<<
+ *                 continue
  * 
  */
-        /*else*/ {
-          (void)((__pyx_v_hFail[__pyx_v_bnidx])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
-        }
-        __pyx_L29:;
+      __pyx_t_7 = ((!(__pyx_v_passed != 0)) != 0);
+      if (__pyx_t_7) {
 
-        /* "histUtils.pyx":156
- *                 else:
- *                     hFail[bnidx].Fill(pair_mass, weight)
- *                 break             # <<<<<<<<<<<<<<
+        /* "histUtils.pyx":494
+ *                     break
+ *             if not passed:
+ *                 continue             # <<<<<<<<<<<<<<
  * 
- *     #####################
+ *             weight = 1.0
  */
-        goto __pyx_L27_break;
+        goto __pyx_L87_continue;
 
-        /* "histUtils.pyx":151
- *         for bnidx in range(nbins):
- *             weight = bin_formulas[bnidx].EvalInstance(0)
- *             if weight:             # <<<<<<<<<<<<<<
- *                 if flag_formula.EvalInstance(0):
- *                     hPass[bnidx].Fill(pair_mass, weight)
+        /* "histUtils.pyx":493
+ *                     passed = False
+ *                     break
+ *             if not passed:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
  */
       }
-    }
-    __pyx_L27_break:;
-  }
 
-  /* "histUtils.pyx":162
- *     #####################
+      /* "histUtils.pyx":496
+ *                 continue
  * 
- *     for ib in range(len(bindef['bins'])):             # <<<<<<<<<<<<<<
- *         removeNegativeBins(hPass[ib])
- *         removeNegativeBins(hFail[ib])
+ *             weight = 1.0             # <<<<<<<<<<<<<<
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
  */
-  __pyx_t_7 = __Pyx_PyObject_Dict_GetItem(__pyx_v_bindef, __pyx_n_s_bins); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 162, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_11 = PyObject_Length(__pyx_t_7); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 162, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_4 = __pyx_t_11;
-  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
-    __pyx_v_ib = __pyx_t_12;
+      __pyx_v_weight = 1.0;
 
-    /* "histUtils.pyx":163
- * 
- *     for ib in range(len(bindef['bins'])):
- *         removeNegativeBins(hPass[ib])             # <<<<<<<<<<<<<<
- *         removeNegativeBins(hFail[ib])
+      /* "histUtils.pyx":497
  * 
+ *             weight = 1.0
+ *             if weight_formula != NULL:             # <<<<<<<<<<<<<<
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if weight:
  */
-    __pyx_f_9histUtils_removeNegativeBins((__pyx_v_hPass[__pyx_v_ib]));
+      __pyx_t_7 = ((__pyx_v_weight_formula != NULL) != 0);
+      if (__pyx_t_7) {
 
-    /* "histUtils.pyx":164
- *     for ib in range(len(bindef['bins'])):
- *         removeNegativeBins(hPass[ib])
- *         removeNegativeBins(hFail[ib])             # <<<<<<<<<<<<<<
- * 
- *         hPass[ib].Write(hPass[ib].GetName())
+        /* "histUtils.pyx":498
+ *             weight = 1.0
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)             # <<<<<<<<<<<<<<
+ *             if weight:
+ *                 for iflag in range(nflags):
  */
-    __pyx_f_9histUtils_removeNegativeBins((__pyx_v_hFail[__pyx_v_ib]));
+        __pyx_v_weight = __pyx_v_weight_formula->EvalInstance(0);
 
-    /* "histUtils.pyx":166
- *         removeNegativeBins(hFail[ib])
- * 
- *         hPass[ib].Write(hPass[ib].GetName())             # <<<<<<<<<<<<<<
- *         hFail[ib].Write(hFail[ib].GetName())
+        /* "histUtils.pyx":497
  * 
+ *             weight = 1.0
+ *             if weight_formula != NULL:             # <<<<<<<<<<<<<<
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if weight:
  */
-    (void)((__pyx_v_hPass[__pyx_v_ib])->Write((__pyx_v_hPass[__pyx_v_ib])->GetName()));
+      }
 
-    /* "histUtils.pyx":167
- * 
- *         hPass[ib].Write(hPass[ib].GetName())
- *         hFail[ib].Write(hFail[ib].GetName())             # <<<<<<<<<<<<<<
- * 
- *         bin1 = 1
+      /* "histUtils.pyx":499
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if weight:             # <<<<<<<<<<<<<<
+ *                 for iflag in range(nflags):
+ *                     ih = iflag * nbins + bnidx
  */
-    (void)((__pyx_v_hFail[__pyx_v_ib])->Write((__pyx_v_hFail[__pyx_v_ib])->GetName()));
+      __pyx_t_7 = (__pyx_v_weight != 0);
+      if (__pyx_t_7) {
 
-    /* "histUtils.pyx":169
- *         hFail[ib].Write(hFail[ib].GetName())
- * 
- *         bin1 = 1             # <<<<<<<<<<<<<<
- *         bin2 = hPass[ib].GetXaxis().GetNbins()
- *         passI = hPass[ib].IntegralAndError(bin1,bin2,epass)
+        /* "histUtils.pyx":500
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if weight:
+ *                 for iflag in range(nflags):             # <<<<<<<<<<<<<<
+ *                     ih = iflag * nbins + bnidx
+ *                     if flag_formulas[iflag].EvalInstance(0):
+ */
+        __pyx_t_32 = __pyx_v_nflags;
+        __pyx_t_34 = __pyx_t_32;
+        for (__pyx_t_35 = 0; __pyx_t_35 < __pyx_t_34; __pyx_t_35+=1) {
+          __pyx_v_iflag = __pyx_t_35;
+
+          /* "histUtils.pyx":501
+ *             if weight:
+ *                 for iflag in range(nflags):
+ *                     ih = iflag * nbins + bnidx             # <<<<<<<<<<<<<<
+ *                     if flag_formulas[iflag].EvalInstance(0):
+ *                         hPass[ih].Fill(pair_mass, weight)
+ */
+          __pyx_v_ih = ((__pyx_v_iflag * __pyx_v_nbins) + __pyx_v_bnidx);
+
+          /* "histUtils.pyx":502
+ *                 for iflag in range(nflags):
+ *                     ih = iflag * nbins + bnidx
+ *                     if flag_formulas[iflag].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                         hPass[ih].Fill(pair_mass, weight)
+ *                     else:
+ */
+          __pyx_t_7 = ((__pyx_v_flag_formulas[__pyx_v_iflag])->EvalInstance(0) != 0);
+          if (__pyx_t_7) {
+
+            /* "histUtils.pyx":503
+ *                     ih = iflag * nbins + bnidx
+ *                     if flag_formulas[iflag].EvalInstance(0):
+ *                         hPass[ih].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         hFail[ih].Fill(pair_mass, weight)
+ */
+            (void)((__pyx_v_hPass[__pyx_v_ih])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
+
+            /* "histUtils.pyx":502
+ *                 for iflag in range(nflags):
+ *                     ih = iflag * nbins + bnidx
+ *                     if flag_formulas[iflag].EvalInstance(0):             # <<<<<<<<<<<<<<
+ *                         hPass[ih].Fill(pair_mass, weight)
+ *                     else:
  */
-    __pyx_v_bin1 = 1;
+            goto __pyx_L98;
+          }
 
-    /* "histUtils.pyx":170
+          /* "histUtils.pyx":505
+ *                         hPass[ih].Fill(pair_mass, weight)
+ *                     else:
+ *                         hFail[ih].Fill(pair_mass, weight)             # <<<<<<<<<<<<<<
+ *             break
  * 
- *         bin1 = 1
- *         bin2 = hPass[ib].GetXaxis().GetNbins()             # <<<<<<<<<<<<<<
- *         passI = hPass[ib].IntegralAndError(bin1,bin2,epass)
- *         failI = hFail[ib].IntegralAndError(bin1,bin2,efail)
  */
-    __pyx_v_bin2 = (__pyx_v_hPass[__pyx_v_ib])->GetXaxis()->GetNbins();
+          /*else*/ {
+            (void)((__pyx_v_hFail[__pyx_v_ih])->Fill(__pyx_v_pair_mass, __pyx_v_weight));
+          }
+          __pyx_L98:;
+        }
 
-    /* "histUtils.pyx":171
- *         bin1 = 1
- *         bin2 = hPass[ib].GetXaxis().GetNbins()
- *         passI = hPass[ib].IntegralAndError(bin1,bin2,epass)             # <<<<<<<<<<<<<<
- *         failI = hFail[ib].IntegralAndError(bin1,bin2,efail)
- *         eff   = 0
+        /* "histUtils.pyx":499
+ *             if weight_formula != NULL:
+ *                 weight = weight_formula.EvalInstance(0)
+ *             if weight:             # <<<<<<<<<<<<<<
+ *                 for iflag in range(nflags):
+ *                     ih = iflag * nbins + bnidx
  */
-    __pyx_v_passI = (__pyx_v_hPass[__pyx_v_ib])->IntegralAndError(__pyx_v_bin1, __pyx_v_bin2, __pyx_v_epass);
+      }
 
-    /* "histUtils.pyx":172
- *         bin2 = hPass[ib].GetXaxis().GetNbins()
- *         passI = hPass[ib].IntegralAndError(bin1,bin2,epass)
- *         failI = hFail[ib].IntegralAndError(bin1,bin2,efail)             # <<<<<<<<<<<<<<
- *         eff   = 0
- *         e_eff = 0
+      /* "histUtils.pyx":506
+ *                     else:
+ *                         hFail[ih].Fill(pair_mass, weight)
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *     #####################
  */
-    __pyx_v_failI = (__pyx_v_hFail[__pyx_v_ib])->IntegralAndError(__pyx_v_bin1, __pyx_v_bin2, __pyx_v_efail);
+      goto __pyx_L88_break;
+      __pyx_L87_continue:;
+    }
+    __pyx_L88_break:;
+    __pyx_L65_continue:;
+  }
 
-    /* "histUtils.pyx":173
- *         passI = hPass[ib].IntegralAndError(bin1,bin2,epass)
- *         failI = hFail[ib].IntegralAndError(bin1,bin2,efail)
- *         eff   = 0             # <<<<<<<<<<<<<<
- *         e_eff = 0
- *         if passI > 0 :
+  /* "histUtils.pyx":513
+ * 
+ *     # bin 0 and nbins+1 are the under/overflow
+ *     contents = { 'nflags': nflags, 'nbins': nbins, 'Pass': [], 'Fail': [], 'PassEntries': [], 'FailEntries': [] }             # <<<<<<<<<<<<<<
+ *     for ih in range(hPass.size()):
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )
  */
-    __pyx_v_eff = 0.0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_nflags); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_nflags, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_nbins); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_nbins, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_Pass, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_Fail, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_PassEntries, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_FailEntries, __pyx_t_9) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_v_contents = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-    /* "histUtils.pyx":174
- *         failI = hFail[ib].IntegralAndError(bin1,bin2,efail)
- *         eff   = 0
- *         e_eff = 0             # <<<<<<<<<<<<<<
- *         if passI > 0 :
- *             itot  = (passI+failI)
+  /* "histUtils.pyx":514
+ *     # bin 0 and nbins+1 are the under/overflow
+ *     contents = { 'nflags': nflags, 'nbins': nbins, 'Pass': [], 'Fail': [], 'PassEntries': [], 'FailEntries': [] }
+ *     for ih in range(hPass.size()):             # <<<<<<<<<<<<<<
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )
  */
-    __Pyx_INCREF(__pyx_int_0);
-    __Pyx_XDECREF_SET(__pyx_v_e_eff, __pyx_int_0);
+  __pyx_t_36 = __pyx_v_hPass.size();
+  __pyx_t_37 = __pyx_t_36;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_37; __pyx_t_12+=1) {
+    __pyx_v_ih = __pyx_t_12;
+
+    /* "histUtils.pyx":515
+ *     contents = { 'nflags': nflags, 'nbins': nbins, 'Pass': [], 'Fail': [], 'PassEntries': [], 'FailEntries': [] }
+ *     for ih in range(hPass.size()):
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )             # <<<<<<<<<<<<<<
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ */
+    __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_contents, __pyx_n_s_PassEntries); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 515, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = PyFloat_FromDouble((__pyx_v_hPass[__pyx_v_ih])->GetEntries()); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 515, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_16 = __Pyx_PyObject_Append(__pyx_t_1, __pyx_t_9); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 515, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "histUtils.pyx":516
+ *     for ih in range(hPass.size()):
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )             # <<<<<<<<<<<<<<
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ */
+    __pyx_t_9 = __Pyx_PyDict_GetItem(__pyx_v_contents, __pyx_n_s_FailEntries); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_hFail[__pyx_v_ih])->GetEntries()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_16 = __Pyx_PyObject_Append(__pyx_t_9, __pyx_t_1); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "histUtils.pyx":175
- *         eff   = 0
- *         e_eff = 0
- *         if passI > 0 :             # <<<<<<<<<<<<<<
- *             itot  = (passI+failI)
- *             eff   = passI / (passI+failI)
+    /* "histUtils.pyx":517
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],             # <<<<<<<<<<<<<<
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
  */
-    __pyx_t_8 = ((__pyx_v_passI > 0.0) != 0);
-    if (__pyx_t_8) {
+    __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_contents, __pyx_n_s_Pass); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_14 = __Pyx_PyInt_AddObjC(__pyx_t_13, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
+      __pyx_t_14 = __pyx_t_13; __Pyx_INCREF(__pyx_t_14); __pyx_t_4 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_4 = -1; __pyx_t_14 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 517, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_17 = Py_TYPE(__pyx_t_14)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 517, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_14))) {
+          if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_14)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyList_GET_ITEM(__pyx_t_14, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 517, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_14, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 517, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        } else {
+          if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_14)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyTuple_GET_ITEM(__pyx_t_14, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 517, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_14, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 517, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        }
+      } else {
+        __pyx_t_13 = __pyx_t_17(__pyx_t_14);
+        if (unlikely(!__pyx_t_13)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 517, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_13);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_13);
+      __pyx_t_13 = 0;
+      __pyx_t_22 = __Pyx_PyInt_As_int(__pyx_v_i); if (unlikely((__pyx_t_22 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 517, __pyx_L1_error)
+      __pyx_t_13 = PyFloat_FromDouble((__pyx_v_hPass[__pyx_v_ih])->GetBinContent(__pyx_t_22)); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 517, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_9, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 517, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+    /* "histUtils.pyx":518
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )             # <<<<<<<<<<<<<<
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hFail[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ */
+    __pyx_t_14 = PyList_New(0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_t_13, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_13 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_6); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
+      __pyx_t_6 = __pyx_t_13; __Pyx_INCREF(__pyx_t_6); __pyx_t_4 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_4 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 518, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_17 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 518, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_6))) {
+          if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 518, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_6, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 518, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        } else {
+          if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_13 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_4); __Pyx_INCREF(__pyx_t_13); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 518, __pyx_L1_error)
+          #else
+          __pyx_t_13 = PySequence_ITEM(__pyx_t_6, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 518, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+          #endif
+        }
+      } else {
+        __pyx_t_13 = __pyx_t_17(__pyx_t_6);
+        if (unlikely(!__pyx_t_13)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 518, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_13);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_13);
+      __pyx_t_13 = 0;
+      __pyx_t_22 = __Pyx_PyInt_As_int(__pyx_v_i); if (unlikely((__pyx_t_22 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 518, __pyx_L1_error)
+      __pyx_t_13 = PyFloat_FromDouble(pow((__pyx_v_hPass[__pyx_v_ih])->GetBinError(__pyx_t_22), 2.0)); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 518, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_14, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 518, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "histUtils.pyx":176
- *         e_eff = 0
- *         if passI > 0 :
- *             itot  = (passI+failI)             # <<<<<<<<<<<<<<
- *             eff   = passI / (passI+failI)
- *             e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
+    /* "histUtils.pyx":517
+ *         contents['PassEntries'].append( hPass[ih].GetEntries() )
+ *         contents['FailEntries'].append( hFail[ih].GetEntries() )
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],             # <<<<<<<<<<<<<<
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
  */
-      __pyx_v_itot = (__pyx_v_passI + __pyx_v_failI);
+    __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_14);
+    PyList_SET_ITEM(__pyx_t_6, 1, __pyx_t_14);
+    __pyx_t_9 = 0;
+    __pyx_t_14 = 0;
+    __pyx_t_16 = __Pyx_PyObject_Append(__pyx_t_1, __pyx_t_6); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "histUtils.pyx":177
- *         if passI > 0 :
- *             itot  = (passI+failI)
- *             eff   = passI / (passI+failI)             # <<<<<<<<<<<<<<
- *             e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
- *         #print cuts
- */
-      __pyx_t_14 = (__pyx_v_passI + __pyx_v_failI);
-      if (unlikely(__pyx_t_14 == 0)) {
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 177, __pyx_L1_error)
+    /* "histUtils.pyx":519
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],             # <<<<<<<<<<<<<<
+ *                                    [ hFail[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_contents, __pyx_n_s_Fail); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_14 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_9 = __Pyx_PyInt_AddObjC(__pyx_t_14, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __pyx_t_14 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_9); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_14)) || PyTuple_CheckExact(__pyx_t_14)) {
+      __pyx_t_9 = __pyx_t_14; __Pyx_INCREF(__pyx_t_9); __pyx_t_4 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_4 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_14); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_17 = Py_TYPE(__pyx_t_9)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 519, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_9))) {
+          if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_14 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_4); __Pyx_INCREF(__pyx_t_14); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 519, __pyx_L1_error)
+          #else
+          __pyx_t_14 = PySequence_ITEM(__pyx_t_9, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 519, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          #endif
+        } else {
+          if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_9)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_4); __Pyx_INCREF(__pyx_t_14); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 519, __pyx_L1_error)
+          #else
+          __pyx_t_14 = PySequence_ITEM(__pyx_t_9, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 519, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          #endif
+        }
+      } else {
+        __pyx_t_14 = __pyx_t_17(__pyx_t_9);
+        if (unlikely(!__pyx_t_14)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 519, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_14);
       }
-      __pyx_v_eff = (__pyx_v_passI / __pyx_t_14);
-
-      /* "histUtils.pyx":178
- *             itot  = (passI+failI)
- *             eff   = passI / (passI+failI)
- *             e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)             # <<<<<<<<<<<<<<
- *         #print cuts
- *         #print '    ==> pass: %.1f +/- %.1f ; fail : %.1f +/- %.1f : eff: %1.3f +/- %1.3f' % (passI,epass,failI,efail,eff,e_eff)
+      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_14);
+      __pyx_t_14 = 0;
+      __pyx_t_22 = __Pyx_PyInt_As_int(__pyx_v_i); if (unlikely((__pyx_t_22 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 519, __pyx_L1_error)
+      __pyx_t_14 = PyFloat_FromDouble((__pyx_v_hFail[__pyx_v_ih])->GetBinContent(__pyx_t_22)); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+    /* "histUtils.pyx":520
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hFail[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )             # <<<<<<<<<<<<<<
+ * 
+ *     ##########
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_math); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_sqrt_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyFloat_FromDouble(((((__pyx_v_passI * __pyx_v_passI) * __pyx_v_efail) * __pyx_v_efail) + (((__pyx_v_failI * __pyx_v_failI) * __pyx_v_epass) * __pyx_v_epass))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_18 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_18)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_18);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+    __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 520, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_14 = __Pyx_PyObject_Dict_GetItem(__pyx_v_var, __pyx_n_s_nbins); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 520, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_13 = __Pyx_PyInt_AddObjC(__pyx_t_14, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 520, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    __pyx_t_14 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 520, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_14)) || PyTuple_CheckExact(__pyx_t_14)) {
+      __pyx_t_13 = __pyx_t_14; __Pyx_INCREF(__pyx_t_13); __pyx_t_4 = 0;
+      __pyx_t_17 = NULL;
+    } else {
+      __pyx_t_4 = -1; __pyx_t_13 = PyObject_GetIter(__pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 520, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_17 = Py_TYPE(__pyx_t_13)->tp_iternext; if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 520, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_17)) {
+        if (likely(PyList_CheckExact(__pyx_t_13))) {
+          if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_13)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_14 = PyList_GET_ITEM(__pyx_t_13, __pyx_t_4); __Pyx_INCREF(__pyx_t_14); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 520, __pyx_L1_error)
+          #else
+          __pyx_t_14 = PySequence_ITEM(__pyx_t_13, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 520, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          #endif
+        } else {
+          if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_13)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_14 = PyTuple_GET_ITEM(__pyx_t_13, __pyx_t_4); __Pyx_INCREF(__pyx_t_14); __pyx_t_4++; if (unlikely(0 < 0)) __PYX_ERR(0, 520, __pyx_L1_error)
+          #else
+          __pyx_t_14 = PySequence_ITEM(__pyx_t_13, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 520, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_14);
+          #endif
+        }
+      } else {
+        __pyx_t_14 = __pyx_t_17(__pyx_t_13);
+        if (unlikely(!__pyx_t_14)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 520, __pyx_L1_error)
+          }
+          break;
         }
+        __Pyx_GOTREF(__pyx_t_14);
       }
-      __pyx_t_7 = (__pyx_t_18) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_18, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_1);
-      __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyFloat_FromDouble((__pyx_v_itot * __pyx_v_itot)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_t_7, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF_SET(__pyx_v_e_eff, __pyx_t_1);
-      __pyx_t_1 = 0;
-
-      /* "histUtils.pyx":175
- *         eff   = 0
- *         e_eff = 0
- *         if passI > 0 :             # <<<<<<<<<<<<<<
- *             itot  = (passI+failI)
- *             eff   = passI / (passI+failI)
+      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_14);
+      __pyx_t_14 = 0;
+      __pyx_t_22 = __Pyx_PyInt_As_int(__pyx_v_i); if (unlikely((__pyx_t_22 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 520, __pyx_L1_error)
+      __pyx_t_14 = PyFloat_FromDouble(pow((__pyx_v_hFail[__pyx_v_ih])->GetBinError(__pyx_t_22), 2.0)); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 520, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_9, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 520, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+    /* "histUtils.pyx":519
+ *         contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+ *                                    [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ *         contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],             # <<<<<<<<<<<<<<
+ *                                    [ hFail[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+ * 
  */
-    }
+    __pyx_t_13 = PyList_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyList_SET_ITEM(__pyx_t_13, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_9);
+    PyList_SET_ITEM(__pyx_t_13, 1, __pyx_t_9);
+    __pyx_t_1 = 0;
+    __pyx_t_9 = 0;
+    __pyx_t_16 = __Pyx_PyObject_Append(__pyx_t_6, __pyx_t_13); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
   }
 
-  /* "histUtils.pyx":186
+  /* "histUtils.pyx":526
  *     ##########
  * 
- *     outfile.Close()             # <<<<<<<<<<<<<<
+ *     for ih in range(hPass.size()):             # <<<<<<<<<<<<<<
+ *         del hPass[ih]
+ *         del hFail[ih]
+ */
+  __pyx_t_36 = __pyx_v_hPass.size();
+  __pyx_t_37 = __pyx_t_36;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_37; __pyx_t_12+=1) {
+    __pyx_v_ih = __pyx_t_12;
+
+    /* "histUtils.pyx":527
+ * 
+ *     for ih in range(hPass.size()):
+ *         del hPass[ih]             # <<<<<<<<<<<<<<
+ *         del hFail[ih]
+ * 
+ */
+    delete (__pyx_v_hPass[__pyx_v_ih]);
+
+    /* "histUtils.pyx":528
+ *     for ih in range(hPass.size()):
+ *         del hPass[ih]
+ *         del hFail[ih]             # <<<<<<<<<<<<<<
+ * 
  *     tree.Delete()
  */
-  __pyx_v_outfile->Close();
+    delete (__pyx_v_hFail[__pyx_v_ih]);
+  }
 
-  /* "histUtils.pyx":187
+  /* "histUtils.pyx":530
+ *         del hFail[ih]
  * 
- *     outfile.Close()
  *     tree.Delete()             # <<<<<<<<<<<<<<
+ * 
+ *     return contents
  */
   __pyx_v_tree->Delete();
 
-  /* "histUtils.pyx":26
- * ##################################
+  /* "histUtils.pyx":532
+ *     tree.Delete()
  * 
- * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
+ *     return contents             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_contents);
+  __pyx_r = __pyx_v_contents;
+  goto __pyx_L0;
+
+  /* "histUtils.pyx":207
+ * #####################################################
+ * 
+ * def fillPassFailHistograms( sample, flags, bindef, var, firstEntry = 0, nEntries = -1, entriesPerPath = None, binSearch = True ):             # <<<<<<<<<<<<<<
  * 
  *     #####################
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
   __Pyx_XDECREF(__pyx_t_18);
-  __Pyx_AddTraceback("histUtils.makePassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("histUtils.fillPassFailHistograms", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_p);
   __Pyx_XDECREF(__pyx_v_cutBinList);
+  __Pyx_XDECREF(__pyx_v_selectionList);
+  __Pyx_XDECREF(__pyx_v_weightExpr);
   __Pyx_XDECREF(__pyx_v_cuts);
   __Pyx_XDECREF(__pyx_v_cutBin);
+  __Pyx_XDECREF(__pyx_v_decomposition);
+  __Pyx_XDECREF(__pyx_v_stride);
+  __Pyx_XDECREF(__pyx_v_v);
+  __Pyx_XDECREF(__pyx_v_b);
+  __Pyx_XDECREF(__pyx_v_commonCuts);
+  __Pyx_XDECREF(__pyx_v_addFormulaIndex);
+  __Pyx_XDECREF(__pyx_v_addCut);
+  __Pyx_XDECREF(__pyx_v_atomTree);
   __Pyx_XDECREF(__pyx_v_replace_patterns);
   __Pyx_XDECREF(__pyx_v_branches);
   __Pyx_XDECREF(__pyx_v_br);
-  __Pyx_XDECREF(__pyx_v_e_eff);
+  __Pyx_XDECREF(__pyx_v_contents);
+  __Pyx_XDECREF(__pyx_v_c);
   __Pyx_XDECREF(__pyx_v_x);
+  __Pyx_XDECREF(__pyx_v_i);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -3654,6 +9146,12 @@ static struct PyModuleDef __pyx_moduledef = {
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 1, 0},
   {&__pyx_kp_s_Adding_weight_tree_s_from_file, __pyx_k_Adding_weight_tree_s_from_file, sizeof(__pyx_k_Adding_weight_tree_s_from_file), 0, 0, 1, 0},
+  {&__pyx_kp_s_Cut_Term__d, __pyx_k_Cut_Term__d, sizeof(__pyx_k_Cut_Term__d), 0, 0, 1, 0},
+  {&__pyx_n_s_Fail, __pyx_k_Fail, sizeof(__pyx_k_Fail), 0, 0, 1, 1},
+  {&__pyx_n_s_FailEntries, __pyx_k_FailEntries, sizeof(__pyx_k_FailEntries), 0, 0, 1, 1},
+  {&__pyx_kp_s_Flag_Selection__d, __pyx_k_Flag_Selection__d, sizeof(__pyx_k_Flag_Selection__d), 0, 0, 1, 0},
+  {&__pyx_n_s_Pass, __pyx_k_Pass, sizeof(__pyx_k_Pass), 0, 0, 1, 1},
+  {&__pyx_n_s_PassEntries, __pyx_k_PassEntries, sizeof(__pyx_k_PassEntries), 0, 0, 1, 1},
   {&__pyx_kp_s_Starting_event_loop_to_fill_hist, __pyx_k_Starting_event_loop_to_fill_hist, sizeof(__pyx_k_Starting_event_loop_to_fill_hist), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_kp_s__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 0, 1, 0},
@@ -3664,8 +9162,11 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s__15, __pyx_k__15, sizeof(__pyx_k__15), 0, 0, 1, 0},
   {&__pyx_kp_s__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 0, 1, 0},
   {&__pyx_kp_s__17, __pyx_k__17, sizeof(__pyx_k__17), 0, 0, 1, 0},
+  {&__pyx_kp_s__18, __pyx_k__18, sizeof(__pyx_k__18), 0, 0, 1, 0},
+  {&__pyx_kp_s__19, __pyx_k__19, sizeof(__pyx_k__19), 0, 0, 1, 0},
   {&__pyx_kp_s__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 0},
-  {&__pyx_kp_s__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 0, 1, 0},
+  {&__pyx_kp_s__20, __pyx_k__20, sizeof(__pyx_k__20), 0, 0, 1, 0},
+  {&__pyx_kp_s__21, __pyx_k__21, sizeof(__pyx_k__21), 0, 0, 1, 0},
   {&__pyx_kp_s__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 1, 0},
   {&__pyx_kp_s__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 1, 0},
   {&__pyx_kp_s__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 0, 1, 0},
@@ -3673,63 +9174,121 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s__8, __pyx_k__8, sizeof(__pyx_k__8), 0, 0, 1, 0},
   {&__pyx_kp_s__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 0, 1, 0},
   {&__pyx_kp_s_abs, __pyx_k_abs, sizeof(__pyx_k_abs), 0, 0, 1, 0},
+  {&__pyx_n_s_addCut, __pyx_k_addCut, sizeof(__pyx_k_addCut), 0, 0, 1, 1},
+  {&__pyx_n_s_addDirectoryStatus, __pyx_k_addDirectoryStatus, sizeof(__pyx_k_addDirectoryStatus), 0, 0, 1, 1},
+  {&__pyx_n_s_addFormulaIndex, __pyx_k_addFormulaIndex, sizeof(__pyx_k_addFormulaIndex), 0, 0, 1, 1},
+  {&__pyx_n_s_add_formulas, __pyx_k_add_formulas, sizeof(__pyx_k_add_formulas), 0, 0, 1, 1},
   {&__pyx_kp_s_adding_rootfile, __pyx_k_adding_rootfile, sizeof(__pyx_k_adding_rootfile), 0, 0, 1, 0},
+  {&__pyx_n_s_additionalCuts, __pyx_k_additionalCuts, sizeof(__pyx_k_additionalCuts), 0, 0, 1, 1},
+  {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
+  {&__pyx_n_s_atomTree, __pyx_k_atomTree, sizeof(__pyx_k_atomTree), 0, 0, 1, 1},
+  {&__pyx_n_s_atom_formulas, __pyx_k_atom_formulas, sizeof(__pyx_k_atom_formulas), 0, 0, 1, 1},
+  {&__pyx_n_s_atom_state, __pyx_k_atom_state, sizeof(__pyx_k_atom_state), 0, 0, 1, 1},
+  {&__pyx_n_s_atoms, __pyx_k_atoms, sizeof(__pyx_k_atoms), 0, 0, 1, 1},
+  {&__pyx_n_s_b, __pyx_k_b, sizeof(__pyx_k_b), 0, 0, 1, 1},
   {&__pyx_n_s_bin1, __pyx_k_bin1, sizeof(__pyx_k_bin1), 0, 0, 1, 1},
   {&__pyx_n_s_bin2, __pyx_k_bin2, sizeof(__pyx_k_bin2), 0, 0, 1, 1},
-  {&__pyx_n_s_bin_formulas, __pyx_k_bin_formulas, sizeof(__pyx_k_bin_formulas), 0, 0, 1, 1},
+  {&__pyx_n_s_binSearch, __pyx_k_binSearch, sizeof(__pyx_k_binSearch), 0, 0, 1, 1},
+  {&__pyx_n_s_binUtils, __pyx_k_binUtils, sizeof(__pyx_k_binUtils), 0, 0, 1, 1},
+  {&__pyx_n_s_bin_atoms, __pyx_k_bin_atoms, sizeof(__pyx_k_bin_atoms), 0, 0, 1, 1},
+  {&__pyx_kp_s_bin_cuts_cannot_be_decomposed_e, __pyx_k_bin_cuts_cannot_be_decomposed_e, sizeof(__pyx_k_bin_cuts_cannot_be_decomposed_e), 0, 0, 1, 0},
   {&__pyx_n_s_bindef, __pyx_k_bindef, sizeof(__pyx_k_bindef), 0, 0, 1, 1},
   {&__pyx_n_s_bins, __pyx_k_bins, sizeof(__pyx_k_bins), 0, 0, 1, 1},
   {&__pyx_n_s_bnidx, __pyx_k_bnidx, sizeof(__pyx_k_bnidx), 0, 0, 1, 1},
   {&__pyx_n_s_br, __pyx_k_br, sizeof(__pyx_k_br), 0, 0, 1, 1},
   {&__pyx_n_s_branches, __pyx_k_branches, sizeof(__pyx_k_branches), 0, 0, 1, 1},
+  {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
+  {&__pyx_n_s_chain, __pyx_k_chain, sizeof(__pyx_k_chain), 0, 0, 1, 1},
+  {&__pyx_n_s_chunkSize, __pyx_k_chunkSize, sizeof(__pyx_k_chunkSize), 0, 0, 1, 1},
+  {&__pyx_n_s_chunks, __pyx_k_chunks, sizeof(__pyx_k_chunks), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_common, __pyx_k_common, sizeof(__pyx_k_common), 0, 0, 1, 1},
+  {&__pyx_n_s_commonCuts, __pyx_k_commonCuts, sizeof(__pyx_k_commonCuts), 0, 0, 1, 1},
+  {&__pyx_n_s_common_formula, __pyx_k_common_formula, sizeof(__pyx_k_common_formula), 0, 0, 1, 1},
+  {&__pyx_n_s_contents, __pyx_k_contents, sizeof(__pyx_k_contents), 0, 0, 1, 1},
+  {&__pyx_n_s_contentsList, __pyx_k_contentsList, sizeof(__pyx_k_contentsList), 0, 0, 1, 1},
   {&__pyx_kp_s_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 0, 0, 1, 0},
   {&__pyx_n_s_cut, __pyx_k_cut, sizeof(__pyx_k_cut), 0, 0, 1, 1},
+  {&__pyx_n_s_cutAtomTree, __pyx_k_cutAtomTree, sizeof(__pyx_k_cutAtomTree), 0, 0, 1, 1},
+  {&__pyx_n_s_cutBase, __pyx_k_cutBase, sizeof(__pyx_k_cutBase), 0, 0, 1, 1},
   {&__pyx_n_s_cutBin, __pyx_k_cutBin, sizeof(__pyx_k_cutBin), 0, 0, 1, 1},
   {&__pyx_n_s_cutBinList, __pyx_k_cutBinList, sizeof(__pyx_k_cutBinList), 0, 0, 1, 1},
   {&__pyx_n_s_cuts, __pyx_k_cuts, sizeof(__pyx_k_cuts), 0, 0, 1, 1},
+  {&__pyx_kp_s_d_bin_selections_from_d_distinc, __pyx_k_d_bin_selections_from_d_distinc, sizeof(__pyx_k_d_bin_selections_from_d_distinc), 0, 0, 1, 0},
+  {&__pyx_n_s_decomposeBinCuts, __pyx_k_decomposeBinCuts, sizeof(__pyx_k_decomposeBinCuts), 0, 0, 1, 1},
+  {&__pyx_n_s_decomposition, __pyx_k_decomposition, sizeof(__pyx_k_decomposition), 0, 0, 1, 1},
   {&__pyx_n_s_e_eff, __pyx_k_e_eff, sizeof(__pyx_k_e_eff), 0, 0, 1, 1},
+  {&__pyx_n_s_edges, __pyx_k_edges, sizeof(__pyx_k_edges), 0, 0, 1, 1},
   {&__pyx_n_s_efail, __pyx_k_efail, sizeof(__pyx_k_efail), 0, 0, 1, 1},
   {&__pyx_n_s_eff, __pyx_k_eff, sizeof(__pyx_k_eff), 0, 0, 1, 1},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
   {&__pyx_n_s_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 0, 1, 1},
+  {&__pyx_n_s_entriesPerPath, __pyx_k_entriesPerPath, sizeof(__pyx_k_entriesPerPath), 0, 0, 1, 1},
   {&__pyx_n_s_epass, __pyx_k_epass, sizeof(__pyx_k_epass), 0, 0, 1, 1},
   {&__pyx_kp_s_fabs, __pyx_k_fabs, sizeof(__pyx_k_fabs), 0, 0, 1, 0},
   {&__pyx_n_s_failI, __pyx_k_failI, sizeof(__pyx_k_failI), 0, 0, 1, 1},
   {&__pyx_n_s_file, __pyx_k_file, sizeof(__pyx_k_file), 0, 0, 1, 1},
+  {&__pyx_n_s_fillPassFailHistograms, __pyx_k_fillPassFailHistograms, sizeof(__pyx_k_fillPassFailHistograms), 0, 0, 1, 1},
+  {&__pyx_n_s_firstEntry, __pyx_k_firstEntry, sizeof(__pyx_k_firstEntry), 0, 0, 1, 1},
   {&__pyx_n_s_flag, __pyx_k_flag, sizeof(__pyx_k_flag), 0, 0, 1, 1},
-  {&__pyx_n_s_flag_formula, __pyx_k_flag_formula, sizeof(__pyx_k_flag_formula), 0, 0, 1, 1},
+  {&__pyx_n_s_flag_formulas, __pyx_k_flag_formulas, sizeof(__pyx_k_flag_formulas), 0, 0, 1, 1},
+  {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
   {&__pyx_n_s_formulas_list, __pyx_k_formulas_list, sizeof(__pyx_k_formulas_list), 0, 0, 1, 1},
   {&__pyx_n_s_frac_of_nevts, __pyx_k_frac_of_nevts, sizeof(__pyx_k_frac_of_nevts), 0, 0, 1, 1},
+  {&__pyx_n_s_h, __pyx_k_h, sizeof(__pyx_k_h), 0, 0, 1, 1},
   {&__pyx_n_s_hFail, __pyx_k_hFail, sizeof(__pyx_k_hFail), 0, 0, 1, 1},
   {&__pyx_n_s_hPass, __pyx_k_hPass, sizeof(__pyx_k_hPass), 0, 0, 1, 1},
   {&__pyx_n_s_histFile, __pyx_k_histFile, sizeof(__pyx_k_histFile), 0, 0, 1, 1},
+  {&__pyx_n_s_histFiles, __pyx_k_histFiles, sizeof(__pyx_k_histFiles), 0, 0, 1, 1},
   {&__pyx_n_s_histUtils, __pyx_k_histUtils, sizeof(__pyx_k_histUtils), 0, 0, 1, 1},
   {&__pyx_kp_s_histUtils_pyx, __pyx_k_histUtils_pyx, sizeof(__pyx_k_histUtils_pyx), 0, 0, 1, 0},
+  {&__pyx_kp_s_histograms_saved_in_s, __pyx_k_histograms_saved_in_s, sizeof(__pyx_k_histograms_saved_in_s), 0, 0, 1, 0},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_ia, __pyx_k_ia, sizeof(__pyx_k_ia), 0, 0, 1, 1},
+  {&__pyx_n_s_iatom, __pyx_k_iatom, sizeof(__pyx_k_iatom), 0, 0, 1, 1},
   {&__pyx_n_s_ib, __pyx_k_ib, sizeof(__pyx_k_ib), 0, 0, 1, 1},
+  {&__pyx_n_s_iflag, __pyx_k_iflag, sizeof(__pyx_k_iflag), 0, 0, 1, 1},
+  {&__pyx_n_s_ih, __pyx_k_ih, sizeof(__pyx_k_ih), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
+  {&__pyx_n_s_int, __pyx_k_int, sizeof(__pyx_k_int), 0, 0, 1, 1},
+  {&__pyx_n_s_ip, __pyx_k_ip, sizeof(__pyx_k_ip), 0, 0, 1, 1},
   {&__pyx_n_s_isMC, __pyx_k_isMC, sizeof(__pyx_k_isMC), 0, 0, 1, 1},
   {&__pyx_n_s_is_number, __pyx_k_is_number, sizeof(__pyx_k_is_number), 0, 0, 1, 1},
   {&__pyx_n_s_itot, __pyx_k_itot, sizeof(__pyx_k_itot), 0, 0, 1, 1},
+  {&__pyx_n_s_iv, __pyx_k_iv, sizeof(__pyx_k_iv), 0, 0, 1, 1},
+  {&__pyx_n_s_ivbin, __pyx_k_ivbin, sizeof(__pyx_k_ivbin), 0, 0, 1, 1},
   {&__pyx_n_s_join, __pyx_k_join, sizeof(__pyx_k_join), 0, 0, 1, 1},
+  {&__pyx_n_s_lastEntry, __pyx_k_lastEntry, sizeof(__pyx_k_lastEntry), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_makeEntryChunks, __pyx_k_makeEntryChunks, sizeof(__pyx_k_makeEntryChunks), 0, 0, 1, 1},
   {&__pyx_n_s_makePassFailHistograms, __pyx_k_makePassFailHistograms, sizeof(__pyx_k_makePassFailHistograms), 0, 0, 1, 1},
+  {&__pyx_n_s_makePassFailHistogramsMultiFlag, __pyx_k_makePassFailHistogramsMultiFlag, sizeof(__pyx_k_makePassFailHistogramsMultiFlag), 0, 0, 1, 1},
+  {&__pyx_kp_s_makePassFailHistogramsMultiFlag_2, __pyx_k_makePassFailHistogramsMultiFlag_2, sizeof(__pyx_k_makePassFailHistogramsMultiFlag_2), 0, 0, 1, 0},
   {&__pyx_n_s_math, __pyx_k_math, sizeof(__pyx_k_math), 0, 0, 1, 1},
   {&__pyx_n_s_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 0, 1, 1},
   {&__pyx_n_s_maxWeight, __pyx_k_maxWeight, sizeof(__pyx_k_maxWeight), 0, 0, 1, 1},
+  {&__pyx_kp_s_mcTrue_1, __pyx_k_mcTrue_1, sizeof(__pyx_k_mcTrue_1), 0, 0, 1, 0},
   {&__pyx_n_s_mcTruth, __pyx_k_mcTruth, sizeof(__pyx_k_mcTruth), 0, 0, 1, 1},
+  {&__pyx_n_s_mergePassFailContents, __pyx_k_mergePassFailContents, sizeof(__pyx_k_mergePassFailContents), 0, 0, 1, 1},
+  {&__pyx_n_s_merged, __pyx_k_merged, sizeof(__pyx_k_merged), 0, 0, 1, 1},
   {&__pyx_n_s_min, __pyx_k_min, sizeof(__pyx_k_min), 0, 0, 1, 1},
+  {&__pyx_n_s_nChunks, __pyx_k_nChunks, sizeof(__pyx_k_nChunks), 0, 0, 1, 1},
+  {&__pyx_n_s_nEntries, __pyx_k_nEntries, sizeof(__pyx_k_nEntries), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+  {&__pyx_n_s_natoms, __pyx_k_natoms, sizeof(__pyx_k_natoms), 0, 0, 1, 1},
   {&__pyx_n_s_nbins, __pyx_k_nbins, sizeof(__pyx_k_nbins), 0, 0, 1, 1},
   {&__pyx_n_s_nevts, __pyx_k_nevts, sizeof(__pyx_k_nevts), 0, 0, 1, 1},
+  {&__pyx_n_s_nflags, __pyx_k_nflags, sizeof(__pyx_k_nflags), 0, 0, 1, 1},
+  {&__pyx_n_s_nvars, __pyx_k_nvars, sizeof(__pyx_k_nvars), 0, 0, 1, 1},
   {&__pyx_n_s_outcount, __pyx_k_outcount, sizeof(__pyx_k_outcount), 0, 0, 1, 1},
   {&__pyx_n_s_outfile, __pyx_k_outfile, sizeof(__pyx_k_outfile), 0, 0, 1, 1},
   {&__pyx_n_s_p, __pyx_k_p, sizeof(__pyx_k_p), 0, 0, 1, 1},
   {&__pyx_kp_s_pair_mass, __pyx_k_pair_mass, sizeof(__pyx_k_pair_mass), 0, 0, 1, 0},
   {&__pyx_n_s_pair_mass_2, __pyx_k_pair_mass_2, sizeof(__pyx_k_pair_mass_2), 0, 0, 1, 1},
   {&__pyx_n_s_passI, __pyx_k_passI, sizeof(__pyx_k_passI), 0, 0, 1, 1},
+  {&__pyx_n_s_passed, __pyx_k_passed, sizeof(__pyx_k_passed), 0, 0, 1, 1},
   {&__pyx_n_s_path, __pyx_k_path, sizeof(__pyx_k_path), 0, 0, 1, 1},
   {&__pyx_n_s_print, __pyx_k_print, sizeof(__pyx_k_print), 0, 0, 1, 1},
   {&__pyx_n_s_puTree, __pyx_k_puTree, sizeof(__pyx_k_puTree), 0, 0, 1, 1},
@@ -3737,35 +9296,57 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_replace, __pyx_k_replace, sizeof(__pyx_k_replace), 0, 0, 1, 1},
   {&__pyx_n_s_replace_patterns, __pyx_k_replace_patterns, sizeof(__pyx_k_replace_patterns), 0, 0, 1, 1},
   {&__pyx_kp_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 0},
-  {&__pyx_n_s_s_2, __pyx_k_s_2, sizeof(__pyx_k_s_2), 0, 0, 1, 1},
+  {&__pyx_kp_s_sEntries, __pyx_k_sEntries, sizeof(__pyx_k_sEntries), 0, 0, 1, 0},
+  {&__pyx_kp_s_s_2, __pyx_k_s_2, sizeof(__pyx_k_s_2), 0, 0, 1, 0},
+  {&__pyx_n_s_s_3, __pyx_k_s_3, sizeof(__pyx_k_s_3), 0, 0, 1, 1},
+  {&__pyx_kp_s_s_AdditionalSelection, __pyx_k_s_AdditionalSelection, sizeof(__pyx_k_s_AdditionalSelection), 0, 0, 1, 0},
+  {&__pyx_kp_s_s_Binning, __pyx_k_s_Binning, sizeof(__pyx_k_s_Binning), 0, 0, 1, 0},
   {&__pyx_kp_s_s_Fail, __pyx_k_s_Fail, sizeof(__pyx_k_s_Fail), 0, 0, 1, 0},
   {&__pyx_kp_s_s_Pass, __pyx_k_s_Pass, sizeof(__pyx_k_s_Pass), 0, 0, 1, 0},
-  {&__pyx_kp_s_s_Selection, __pyx_k_s_Selection, sizeof(__pyx_k_s_Selection), 0, 0, 1, 0},
+  {&__pyx_kp_s_s_f_s_1_0, __pyx_k_s_f_s_1_0, sizeof(__pyx_k_s_f_s_1_0), 0, 0, 1, 0},
   {&__pyx_kp_s_s_mcTrue_1, __pyx_k_s_mcTrue_1, sizeof(__pyx_k_s_mcTrue_1), 0, 0, 1, 0},
   {&__pyx_kp_s_s_s, __pyx_k_s_s, sizeof(__pyx_k_s_s), 0, 0, 1, 0},
   {&__pyx_kp_s_s_s_2, __pyx_k_s_s_2, sizeof(__pyx_k_s_s_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_s_s_f_s_1_0, __pyx_k_s_s_f_s_1_0, sizeof(__pyx_k_s_s_f_s_1_0), 0, 0, 1, 0},
   {&__pyx_n_s_sample, __pyx_k_sample, sizeof(__pyx_k_sample), 0, 0, 1, 1},
+  {&__pyx_n_s_selectionList, __pyx_k_selectionList, sizeof(__pyx_k_selectionList), 0, 0, 1, 1},
   {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
-  {&__pyx_kp_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 0},
-  {&__pyx_n_s_sqrt_2, __pyx_k_sqrt_2, sizeof(__pyx_k_sqrt_2), 0, 0, 1, 1},
+  {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
+  {&__pyx_kp_s_sqrt_2, __pyx_k_sqrt_2, sizeof(__pyx_k_sqrt_2), 0, 0, 1, 0},
+  {&__pyx_n_s_stride, __pyx_k_stride, sizeof(__pyx_k_stride), 0, 0, 1, 1},
+  {&__pyx_n_s_sum, __pyx_k_sum, sizeof(__pyx_k_sum), 0, 0, 1, 1},
+  {&__pyx_n_s_sumw2, __pyx_k_sumw2, sizeof(__pyx_k_sumw2), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_title, __pyx_k_title, sizeof(__pyx_k_title), 0, 0, 1, 1},
   {&__pyx_n_s_tree, __pyx_k_tree, sizeof(__pyx_k_tree), 0, 0, 1, 1},
+  {&__pyx_n_s_type, __pyx_k_type, sizeof(__pyx_k_type), 0, 0, 1, 1},
+  {&__pyx_n_s_useBinSearch, __pyx_k_useBinSearch, sizeof(__pyx_k_useBinSearch), 0, 0, 1, 1},
+  {&__pyx_kp_s_using_bin_search_on_s, __pyx_k_using_bin_search_on_s, sizeof(__pyx_k_using_bin_search_on_s), 0, 0, 1, 0},
+  {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
+  {&__pyx_n_s_vals, __pyx_k_vals, sizeof(__pyx_k_vals), 0, 0, 1, 1},
   {&__pyx_n_s_var, __pyx_k_var, sizeof(__pyx_k_var), 0, 0, 1, 1},
+  {&__pyx_n_s_var_edges, __pyx_k_var_edges, sizeof(__pyx_k_var_edges), 0, 0, 1, 1},
+  {&__pyx_n_s_var_formulas, __pyx_k_var_formulas, sizeof(__pyx_k_var_formulas), 0, 0, 1, 1},
+  {&__pyx_n_s_var_isInt, __pyx_k_var_isInt, sizeof(__pyx_k_var_isInt), 0, 0, 1, 1},
+  {&__pyx_n_s_var_strides, __pyx_k_var_strides, sizeof(__pyx_k_var_strides), 0, 0, 1, 1},
+  {&__pyx_n_s_vars, __pyx_k_vars, sizeof(__pyx_k_vars), 0, 0, 1, 1},
   {&__pyx_n_s_weight, __pyx_k_weight, sizeof(__pyx_k_weight), 0, 0, 1, 1},
+  {&__pyx_n_s_weightExpr, __pyx_k_weightExpr, sizeof(__pyx_k_weightExpr), 0, 0, 1, 1},
+  {&__pyx_n_s_weight_formula, __pyx_k_weight_formula, sizeof(__pyx_k_weight_formula), 0, 0, 1, 1},
+  {&__pyx_n_s_writePassFailHistograms, __pyx_k_writePassFailHistograms, sizeof(__pyx_k_writePassFailHistograms), 0, 0, 1, 1},
+  {&__pyx_kp_s_writePassFailHistograms_need_on, __pyx_k_writePassFailHistograms_need_on, sizeof(__pyx_k_writePassFailHistograms_need_on), 0, 0, 1, 0},
   {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
   {&__pyx_n_s_xrange, __pyx_k_xrange, sizeof(__pyx_k_xrange), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 14, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 16, __pyx_L1_error)
   #if PY_MAJOR_VERSION >= 3
-  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_xrange) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_xrange) __PYX_ERR(0, 20, __pyx_L1_error)
   #else
-  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_xrange); if (!__pyx_builtin_xrange) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_builtin_xrange = __Pyx_GetBuiltinName(__pyx_n_s_xrange); if (!__pyx_builtin_xrange) __PYX_ERR(0, 20, __pyx_L1_error)
   #endif
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 81, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 31, __pyx_L1_error)
+  __pyx_builtin_sum = __Pyx_GetBuiltinName(__pyx_n_s_sum); if (!__pyx_builtin_sum) __PYX_ERR(0, 83, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -3775,29 +9356,100 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "histUtils.pyx":10
+  /* "histUtils.pyx":106
+ *         if merged is None:
+ *             merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+ *             for h in ['Pass', 'Fail']:             # <<<<<<<<<<<<<<
+ *                 merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+ *                 merged['%sEntries' % h] = list(contents['%sEntries' % h])
+ */
+  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_n_s_Pass, __pyx_n_s_Fail); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "histUtils.pyx":12
  * 
  * # Check if a string can be a number
  * def is_number(s):             # <<<<<<<<<<<<<<
  *     try:
  *         float(s)
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_n_s_s_2); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_is_number, 10, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_n_s_s_3); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_is_number, 12, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 12, __pyx_L1_error)
 
-  /* "histUtils.pyx":26
+  /* "histUtils.pyx":50
  * ##################################
  * 
  * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
+ *     makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )
+ * 
+ */
+  __pyx_tuple__24 = PyTuple_Pack(4, __pyx_n_s_sample, __pyx_n_s_flag, __pyx_n_s_bindef, __pyx_n_s_var); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 50, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(4, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_makePassFailHistograms, 50, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 50, __pyx_L1_error)
+
+  /* "histUtils.pyx":58
+ * #####################################################
+ * 
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):             # <<<<<<<<<<<<<<
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ */
+  __pyx_tuple__26 = PyTuple_Pack(7, __pyx_n_s_sample, __pyx_n_s_flags, __pyx_n_s_histFiles, __pyx_n_s_bindef, __pyx_n_s_var, __pyx_n_s_binSearch, __pyx_n_s_contents); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(6, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_makePassFailHistogramsMultiFlag, 58, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 58, __pyx_L1_error)
+
+  /* "histUtils.pyx":71
+ * #####################################################
+ * 
+ * def makeEntryChunks( sample, nChunks ):             # <<<<<<<<<<<<<<
+ *     cdef TChain* chain
+ * 
+ */
+  __pyx_tuple__28 = PyTuple_Pack(9, __pyx_n_s_sample, __pyx_n_s_nChunks, __pyx_n_s_chain, __pyx_n_s_entriesPerPath, __pyx_n_s_p, __pyx_n_s_nevts, __pyx_n_s_chunkSize, __pyx_n_s_chunks, __pyx_n_s_firstEntry); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_makeEntryChunks, 71, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 71, __pyx_L1_error)
+
+  /* "histUtils.pyx":101
+ * #####################################################
+ * 
+ * def mergePassFailContents( contentsList ):             # <<<<<<<<<<<<<<
+ *     merged = None
+ *     for contents in contentsList:
+ */
+  __pyx_tuple__30 = PyTuple_Pack(8, __pyx_n_s_contentsList, __pyx_n_s_merged, __pyx_n_s_contents, __pyx_n_s_h, __pyx_n_s_ih, __pyx_n_s_vals, __pyx_n_s_sumw2, __pyx_n_s_i); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(1, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_mergePassFailContents, 101, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 101, __pyx_L1_error)
+
+  /* "histUtils.pyx":124
+ * #####################################################
+ * 
+ * def writePassFailHistograms( histFiles, bindef, var, contents ):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nbins = contents['nbins']
+ */
+  __pyx_tuple__32 = PyTuple_Pack(22, __pyx_n_s_histFiles, __pyx_n_s_bindef, __pyx_n_s_var, __pyx_n_s_contents, __pyx_n_s_nbins, __pyx_n_s_iflag, __pyx_n_s_ib, __pyx_n_s_ih, __pyx_n_s_i, __pyx_n_s_hPass, __pyx_n_s_hFail, __pyx_n_s_outfile, __pyx_n_s_addDirectoryStatus, __pyx_n_s_epass, __pyx_n_s_efail, __pyx_n_s_bin1, __pyx_n_s_bin2, __pyx_n_s_passI, __pyx_n_s_failI, __pyx_n_s_eff, __pyx_n_s_e_eff, __pyx_n_s_itot); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(4, 0, 22, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_writePassFailHistograms, 124, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 124, __pyx_L1_error)
+
+  /* "histUtils.pyx":207
+ * #####################################################
+ * 
+ * def fillPassFailHistograms( sample, flags, bindef, var, firstEntry = 0, nEntries = -1, entriesPerPath = None, binSearch = True ):             # <<<<<<<<<<<<<<
  * 
  *     #####################
  */
-  __pyx_tuple__20 = PyTuple_Pack(37, __pyx_n_s_sample, __pyx_n_s_flag, __pyx_n_s_bindef, __pyx_n_s_var, __pyx_n_s_pair_mass_2, __pyx_n_s_nbins, __pyx_n_s_nevts, __pyx_n_s_frac_of_nevts, __pyx_n_s_index, __pyx_n_s_bnidx, __pyx_n_s_outcount, __pyx_n_s_weight, __pyx_n_s_tree, __pyx_n_s_flag_formula, __pyx_n_s_bin_formulas, __pyx_n_s_hPass, __pyx_n_s_hFail, __pyx_n_s_formulas_list, __pyx_n_s_epass, __pyx_n_s_efail, __pyx_n_s_p, __pyx_n_s_outfile, __pyx_n_s_cutBinList, __pyx_n_s_ib, __pyx_n_s_cuts, __pyx_n_s_cutBin, __pyx_n_s_replace_patterns, __pyx_n_s_branches, __pyx_n_s_br, __pyx_n_s_bin1, __pyx_n_s_bin2, __pyx_n_s_passI, __pyx_n_s_failI, __pyx_n_s_eff, __pyx_n_s_e_eff, __pyx_n_s_itot, __pyx_n_s_x); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 26, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(4, 0, 37, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_makePassFailHistograms, 26, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(69, __pyx_n_s_sample, __pyx_n_s_flags, __pyx_n_s_bindef, __pyx_n_s_var, __pyx_n_s_firstEntry, __pyx_n_s_nEntries, __pyx_n_s_entriesPerPath, __pyx_n_s_binSearch, __pyx_n_s_pair_mass_2, __pyx_n_s_nbins, __pyx_n_s_nflags, __pyx_n_s_nevts, __pyx_n_s_lastEntry, __pyx_n_s_frac_of_nevts, __pyx_n_s_index, __pyx_n_s_bnidx, __pyx_n_s_iflag, __pyx_n_s_ih, __pyx_n_s_outcount, __pyx_n_s_weight, __pyx_n_s_tree, __pyx_n_s_flag_formulas, __pyx_n_s_useBinSearch, __pyx_n_s_nvars, __pyx_n_s_iv, __pyx_n_s_ivbin, __pyx_n_s_var_formulas, __pyx_n_s_var_edges, __pyx_n_s_edges, __pyx_n_s_var_isInt, __pyx_n_s_var_strides, __pyx_n_s_add_formulas, __pyx_n_s_common_formula, __pyx_n_s_weight_formula, __pyx_n_s_natoms, __pyx_n_s_ia, __pyx_n_s_iatom, __pyx_n_s_passed, __pyx_n_s_atom_formulas, __pyx_n_s_bin_atoms, __pyx_n_s_atoms, __pyx_n_s_atom_state, __pyx_n_s_hPass, __pyx_n_s_hFail, __pyx_n_s_formulas_list, __pyx_n_s_addDirectoryStatus, __pyx_n_s_ip, __pyx_n_s_p, __pyx_n_s_cutBinList, __pyx_n_s_selectionList, __pyx_n_s_weightExpr, __pyx_n_s_ib, __pyx_n_s_cuts, __pyx_n_s_cutBin, __pyx_n_s_decomposition, __pyx_n_s_stride, __pyx_n_s_v, __pyx_n_s_b, __pyx_n_s_commonCuts, __pyx_n_s_addFormulaIndex, __pyx_n_s_addCut, __pyx_n_s_atomTree, __pyx_n_s_replace_patterns, __pyx_n_s_branches, __pyx_n_s_br, __pyx_n_s_contents, __pyx_n_s_c, __pyx_n_s_x, __pyx_n_s_i); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 207, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(8, 0, 69, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_histUtils_pyx, __pyx_n_s_fillPassFailHistograms, 207, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 207, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -3808,7 +9460,11 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_20 = PyInt_FromLong(20); if (unlikely(!__pyx_int_20)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_999 = PyInt_FromLong(999); if (unlikely(!__pyx_int_999)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -3973,6 +9629,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_histUtils(PyObject *__pyx_pyinit_m
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -4083,42 +9740,144 @@ if (!__Pyx_RefNanny) {
   /* "histUtils.pyx":2
  * include "ROOT.pxi"
  * import math             # <<<<<<<<<<<<<<
- * #from fitUtils import *
- * 
+ * from binUtils import decomposeBinCuts
+ * from binUtils import cutAtomTree
  */
   __pyx_t_1 = __Pyx_Import(__pyx_n_s_math, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_math, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "histUtils.pyx":10
+  /* "histUtils.pyx":3
+ * include "ROOT.pxi"
+ * import math
+ * from binUtils import decomposeBinCuts             # <<<<<<<<<<<<<<
+ * from binUtils import cutAtomTree
+ * #from fitUtils import *
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_decomposeBinCuts);
+  __Pyx_GIVEREF(__pyx_n_s_decomposeBinCuts);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_decomposeBinCuts);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_binUtils, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_decomposeBinCuts); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_decomposeBinCuts, __pyx_t_1) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "histUtils.pyx":4
+ * import math
+ * from binUtils import decomposeBinCuts
+ * from binUtils import cutAtomTree             # <<<<<<<<<<<<<<
+ * #from fitUtils import *
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_cutAtomTree);
+  __Pyx_GIVEREF(__pyx_n_s_cutAtomTree);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_cutAtomTree);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_binUtils, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_cutAtomTree); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cutAtomTree, __pyx_t_2) < 0) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":12
  * 
  * # Check if a string can be a number
  * def is_number(s):             # <<<<<<<<<<<<<<
  *     try:
  *         float(s)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_1is_number, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_1is_number, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 12, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_number, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_is_number, __pyx_t_1) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "histUtils.pyx":26
+  /* "histUtils.pyx":50
  * ##################################
  * 
  * def makePassFailHistograms( sample, flag, bindef, var ):             # <<<<<<<<<<<<<<
+ *     makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_3makePassFailHistograms, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_makePassFailHistograms, __pyx_t_1) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":58
+ * #####################################################
+ * 
+ * def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):             # <<<<<<<<<<<<<<
+ *     if len(flags) != len(histFiles):
+ *         print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_5makePassFailHistogramsMultiFlag, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_makePassFailHistogramsMultiFlag, __pyx_t_1) < 0) __PYX_ERR(0, 58, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":71
+ * #####################################################
+ * 
+ * def makeEntryChunks( sample, nChunks ):             # <<<<<<<<<<<<<<
+ *     cdef TChain* chain
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_7makeEntryChunks, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_makeEntryChunks, __pyx_t_1) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":101
+ * #####################################################
+ * 
+ * def mergePassFailContents( contentsList ):             # <<<<<<<<<<<<<<
+ *     merged = None
+ *     for contents in contentsList:
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_9mergePassFailContents, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_mergePassFailContents, __pyx_t_1) < 0) __PYX_ERR(0, 101, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":124
+ * #####################################################
+ * 
+ * def writePassFailHistograms( histFiles, bindef, var, contents ):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int nbins = contents['nbins']
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_11writePassFailHistograms, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePassFailHistograms, __pyx_t_1) < 0) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "histUtils.pyx":207
+ * #####################################################
+ * 
+ * def fillPassFailHistograms( sample, flags, bindef, var, firstEntry = 0, nEntries = -1, entriesPerPath = None, binSearch = True ):             # <<<<<<<<<<<<<<
  * 
  *     #####################
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_3makePassFailHistograms, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_9histUtils_13fillPassFailHistograms, NULL, __pyx_n_s_histUtils); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_makePassFailHistograms, __pyx_t_1) < 0) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_fillPassFailHistograms, __pyx_t_1) < 0) __PYX_ERR(0, 207, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "histUtils.pyx":1
  * include "ROOT.pxi"             # <<<<<<<<<<<<<<
  * import math
- * #from fitUtils import *
+ * from binUtils import decomposeBinCuts
  */
   __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -4130,6 +9889,7 @@ if (!__Pyx_RefNanny) {
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     if (__pyx_d) {
       __Pyx_AddTraceback("init histUtils", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -4390,6 +10150,14 @@ bad:
     return -1;
 }
 
+/* None */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
 /* RaiseArgTupleInvalid */
 static void __Pyx_RaiseArgtupleInvalid(
     const char* func_name,
@@ -4531,29 +10299,67 @@ invalid_keyword:
 bad:
     return -1;
 }
-
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
     }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
 }
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
 #endif
+    return __Pyx_GetBuiltinName(name);
+}
 
 /* PyFunctionFastCall */
 #if CYTHON_FAST_PYCALL
@@ -4674,6 +10480,29 @@ done:
 #endif
 #endif
 
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
 /* PyObjectCall */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
@@ -4783,6 +10612,154 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a - b);
+            if (likely((x^a) >= 0 || (x^~b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+            }
+        }
+                x = a - b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla - llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("subtract", return NULL)
+            result = ((double)a) - (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+}
+#endif
+
+/* DictGetItem */
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (!PyErr_Occurred()) {
+            if (unlikely(PyTuple_Check(key))) {
+                PyObject* args = PyTuple_Pack(1, key);
+                if (likely(args)) {
+                    PyErr_SetObject(PyExc_KeyError, args);
+                    Py_DECREF(args);
+                }
+            } else {
+                PyErr_SetObject(PyExc_KeyError, key);
+            }
+        }
+        return NULL;
+    }
+    Py_INCREF(value);
+    return value;
+}
+#endif
+
 /* GetItemInt */
 static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
     PyObject *r;
@@ -4870,36 +10847,143 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
     return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
 }
 
-/* DictGetItem */
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
-static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
-    PyObject *value;
-    value = PyDict_GetItemWithError(d, key);
-    if (unlikely(!value)) {
-        if (!PyErr_Occurred()) {
-            if (unlikely(PyTuple_Check(key))) {
-                PyObject* args = PyTuple_Pack(1, key);
-                if (likely(args)) {
-                    PyErr_SetObject(PyExc_KeyError, args);
-                    Py_DECREF(args);
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    } else {
+        return __Pyx_IterFinish();
+    }
+    return 0;
+}
+
+/* SetItemInt */
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (!j) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
+                                               CYTHON_NCP_UNUSED int wraparound, CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o)))) {
+            PyObject* old = PyList_GET_ITEM(o, n);
+            Py_INCREF(v);
+            PyList_SET_ITEM(o, n, v);
+            Py_DECREF(old);
+            return 1;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_ass_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return -1;
+                    PyErr_Clear();
                 }
-            } else {
-                PyErr_SetObject(PyExc_KeyError, key);
             }
+            return m->sq_ass_item(o, i, v);
         }
-        return NULL;
     }
-    Py_INCREF(value);
-    return value;
-}
+#else
+#if CYTHON_COMPILING_IN_PYPY
+    if (is_list || (PySequence_Check(o) && !PyDict_Check(o)))
+#else
+    if (is_list || PySequence_Check(o))
 #endif
-
-/* StringJoin */
-#if !CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values) {
-    return PyObject_CallMethodObjArgs(sep, __pyx_n_s_join, values, NULL);
-}
+    {
+        return PySequence_SetItem(o, i, v);
+    }
 #endif
+    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
+}
 
 /* BytesEquals */
 static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
@@ -5050,101 +11134,12 @@ return_ne:
 #endif
 }
 
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
-#endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
-}
-#endif
-
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
+/* StringJoin */
+#if !CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values) {
+    return PyObject_CallMethodObjArgs(sep, __pyx_n_s_join, values, NULL);
 }
-
-/* IterFinish */
-static CYTHON_INLINE int __Pyx_IterFinish(void) {
-#if CYTHON_FAST_THREAD_STATE
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject* exc_type = tstate->curexc_type;
-    if (unlikely(exc_type)) {
-        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
-            PyObject *exc_value, *exc_tb;
-            exc_value = tstate->curexc_value;
-            exc_tb = tstate->curexc_traceback;
-            tstate->curexc_type = 0;
-            tstate->curexc_value = 0;
-            tstate->curexc_traceback = 0;
-            Py_DECREF(exc_type);
-            Py_XDECREF(exc_value);
-            Py_XDECREF(exc_tb);
-            return 0;
-        } else {
-            return -1;
-        }
-    }
-    return 0;
-#else
-    if (unlikely(PyErr_Occurred())) {
-        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
-            PyErr_Clear();
-            return 0;
-        } else {
-            return -1;
-        }
-    }
-    return 0;
 #endif
-}
 
 /* set_iter */
 static CYTHON_INLINE PyObject* __Pyx_set_iterator(PyObject* iterable, int is_set,
@@ -5197,20 +11192,323 @@ static CYTHON_INLINE int __Pyx_set_iter_next(
     return 0;
 }
 
-/* None */
-static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
-    long q = a / b;
-    long r = a - q*b;
-    q -= ((r != 0) & ((r ^ b) < 0));
-    return q;
+/* PyIntCompare */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED long inplace) {
+    if (op1 == op2) {
+        Py_RETURN_TRUE;
+    }
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        if (a == b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        int unequal;
+        unsigned long uintval;
+        Py_ssize_t size = Py_SIZE(op1);
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        if (intval == 0) {
+            if (size == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        } else if (intval < 0) {
+            if (size >= 0)
+                Py_RETURN_FALSE;
+            intval = -intval;
+            size = -size;
+        } else {
+            if (size <= 0)
+                Py_RETURN_FALSE;
+        }
+        uintval = (unsigned long) intval;
+#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 4)) {
+            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 3)) {
+            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 2)) {
+            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 1)) {
+            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+        if ((double)a == (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    return (
+        PyObject_RichCompare(op1, op2, Py_EQ));
 }
 
-/* None */
-static CYTHON_INLINE int __Pyx_mod_int(int a, int b) {
-    int r = a % b;
-    r += ((r != 0) & ((r ^ b) < 0)) * b;
-    return r;
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+}
+
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_n_s_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a + b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
 }
+#endif
 
 /* Import */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
@@ -5277,6 +11575,20 @@ bad:
     return module;
 }
 
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
 /* PyErrFetchRestore */
 #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
@@ -5665,7 +11977,38 @@ bad:
         Py_XDECREF(kwargs);
     return -1;
 }
-#endif
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) ((PY_LONG_LONG) 0 - (PY_LONG_LONG) 1), const_zero = (PY_LONG_LONG) 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+    }
+}
 
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
@@ -5924,6 +12267,384 @@ static int __Pyx_PrintOne(PyObject* stream, PyObject *o) {
 }
 #endif
 
+/* CIntFromPy */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *x) {
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) ((PY_LONG_LONG) 0 - (PY_LONG_LONG) 1), const_zero = (PY_LONG_LONG) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (PY_LONG_LONG) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (PY_LONG_LONG) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) >= 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (PY_LONG_LONG) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (PY_LONG_LONG) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(PY_LONG_LONG,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                            return (PY_LONG_LONG) ((((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            PY_LONG_LONG val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (PY_LONG_LONG) -1;
+        }
+    } else {
+        PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (PY_LONG_LONG) -1;
+        val = __Pyx_PyInt_As_PY_LONG_LONG(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+    const size_t neg_one = (size_t) ((size_t) 0 - (size_t) 1), const_zero = (size_t) 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
+        }
+    } else {
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
     const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
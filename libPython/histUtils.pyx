@@ -1,5 +1,7 @@
 include "ROOT.pxi"
 import math
+from binUtils import decomposeBinCuts
+from binUtils import cutAtomTree
 #from fitUtils import *
 
 ##################
@@ -19,11 +21,190 @@ cdef void removeNegativeBins(TH1D* h):
         if (h.GetBinContent(i) < 0):
             h.SetBinContent(i, 0)
 
+# Find the bin of x in the edges of a float variable (binary search)
+# or in the list of values of an int variable, -1 if not found
+cdef int findBin(vector[double]& edges, bool isInt, double x):
+    cdef int lo = 0
+    cdef int hi = edges.size() - 1
+    cdef int mid
+    if isInt:
+        for mid in range(edges.size()):
+            if edges[mid] == x:
+                return mid
+        return -1
+    # same convention as the bin cuts: low edge included, high edge excluded
+    if not (x >= edges[lo] and x < edges[hi]):
+        return -1
+    while hi - lo > 1:
+        mid = (lo + hi) / 2
+        if x >= edges[mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
 ##################################
 # To Fill Tag and Probe histograms
 ##################################
 
 def makePassFailHistograms( sample, flag, bindef, var ):
+    makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var )
+
+#####################################################
+# To Fill Tag and Probe histograms for several flags
+# in a single pass over the tree (one outfile / flag)
+#####################################################
+
+def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, binSearch = True ):
+    if len(flags) != len(histFiles):
+        print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+        return
+
+    contents = fillPassFailHistograms( sample, flags, bindef, var, binSearch = binSearch )
+    writePassFailHistograms( histFiles, bindef, var, contents )
+
+#####################################################
+# Split the entries of a sample in chunks that can be
+# filled in parallel with fillPassFailHistograms
+#####################################################
+
+def makeEntryChunks( sample, nChunks ):
+    cdef TChain* chain
+
+    # with known entries per file, the chain does not need to open
+    # all the files before the first entry of the chunk
+    entriesPerPath = []
+    for p in sample.path:
+        chain = new TChain(sample.tree)
+        chain.Add(str.encode(p))
+        entriesPerPath.append(chain.GetEntries())
+        del chain
+
+    nevts = sum(entriesPerPath)
+    for p in sample.path:
+        if '*' in p or '?' in p:
+            entriesPerPath = None
+            break
+
+    chunkSize = max(1, (nevts + nChunks - 1) / nChunks)
+    chunks = []
+    for firstEntry in range(0, nevts, chunkSize):
+        chunks.append( { 'firstEntry'     : firstEntry,
+                         'nEntries'       : min(chunkSize, nevts - firstEntry),
+                         'entriesPerPath' : entriesPerPath } )
+    return chunks
+
+#####################################################
+# Sum the outputs of fillPassFailHistograms
+#####################################################
+
+def mergePassFailContents( contentsList ):
+    merged = None
+    for contents in contentsList:
+        if merged is None:
+            merged = { 'nflags': contents['nflags'], 'nbins': contents['nbins'] }
+            for h in ['Pass', 'Fail']:
+                merged[h] = [ [ list(vals), list(sumw2) ] for vals, sumw2 in contents[h] ]
+                merged['%sEntries' % h] = list(contents['%sEntries' % h])
+            continue
+        for h in ['Pass', 'Fail']:
+            for ih in range(len(merged[h])):
+                merged['%sEntries' % h][ih] += contents['%sEntries' % h][ih]
+                vals  = merged[h][ih][0]
+                sumw2 = merged[h][ih][1]
+                for i in range(len(vals)):
+                    vals[i]  += contents[h][ih][0][i]
+                    sumw2[i] += contents[h][ih][1][i]
+    return merged
+
+#####################################################
+# Write the pass / fail histograms (one outfile / flag)
+#####################################################
+
+def writePassFailHistograms( histFiles, bindef, var, contents ):
+
+    cdef int nbins = contents['nbins']
+    cdef int iflag
+    cdef int ib
+    cdef int ih
+    cdef int i
+
+    cdef TH1D* hPass
+    cdef TH1D* hFail
+
+    cdef TFile* outfile
+
+    cdef bool addDirectoryStatus
+
+    cdef double epass = -1.0
+    cdef double efail = -1.0
+
+    if len(histFiles) != contents['nflags']:
+        print '[writePassFailHistograms] need one histFile per flag (%d flags, %d files)' % (contents['nflags'], len(histFiles))
+        return
+
+    for iflag in range(len(histFiles)):
+        outfile = new TFile(str.encode(histFiles[iflag]),'recreate')
+        outfile.cd()
+
+        addDirectoryStatus = AddDirectoryStatus()
+        AddDirectory(False)
+
+        for ib in range(nbins):
+            ih = iflag * nbins + ib
+            hPass = new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+            hFail = new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+            hPass.Sumw2()
+            hFail.Sumw2()
+
+            # bin 0 and nbins+1 are the under/overflow
+            for i in range(hPass.GetNbinsX()+2):
+                hPass.SetBinContent(i, contents['Pass'][ih][0][i])
+                hPass.SetBinError(  i, math.sqrt(contents['Pass'][ih][1][i]))
+                hFail.SetBinContent(i, contents['Fail'][ih][0][i])
+                hFail.SetBinError(  i, math.sqrt(contents['Fail'][ih][1][i]))
+
+            removeNegativeBins(hPass)
+            removeNegativeBins(hFail)
+
+            # SetBinContent counts one entry per call, use the number of fills
+            hPass.SetEntries(contents['PassEntries'][ih])
+            hFail.SetEntries(contents['FailEntries'][ih])
+
+            hPass.Write(hPass.GetName())
+            hFail.Write(hFail.GetName())
+
+            bin1 = 1
+            bin2 = hPass.GetXaxis().GetNbins()
+            passI = hPass.IntegralAndError(bin1,bin2,epass)
+            failI = hFail.IntegralAndError(bin1,bin2,efail)
+            eff   = 0
+            e_eff = 0
+            if passI > 0 :
+                itot  = (passI+failI)
+                eff   = passI / (passI+failI)
+                e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
+            #print cuts
+            #print '    ==> pass: %.1f +/- %.1f ; fail : %.1f +/- %.1f : eff: %1.3f +/- %1.3f' % (passI,epass,failI,efail,eff,e_eff)
+
+            del hPass
+            del hFail
+
+        AddDirectory(addDirectoryStatus)
+
+        outfile.Close()
+        del outfile
+        print ' - histograms saved in %s' % histFiles[iflag]
+
+#####################################################
+# Fill the pass / fail histograms of several flags for
+# the entries [firstEntry, firstEntry+nEntries[ of the
+# sample (all entries if nEntries < 0). The contents,
+# sum of weights squared and number of entries are
+# returned as lists indexed as [iflag * nbins + ibin]
+#####################################################
+
+def fillPassFailHistograms( sample, flags, bindef, var, firstEntry = 0, nEntries = -1, entriesPerPath = None, binSearch = True ):
 
     #####################
     # C++ Initializations
@@ -34,25 +215,52 @@ def makePassFailHistograms( sample, flag, bindef, var ):
 
     # For the loop
     cdef int nbins = 0
+    cdef int nflags = 0
     cdef int nevts
+    cdef int lastEntry
     cdef int frac_of_nevts
     cdef int index
     cdef int bnidx
+    cdef int iflag
+    cdef int ih
     cdef int outcount = 0
     cdef double weight
 
     cdef TChain* tree
 
-    cdef TTreeFormula* flag_formula
-    cdef vector[TTreeFormula*] bin_formulas
-
+    cdef vector[TTreeFormula*] flag_formulas
+
+    # For the bin search (binning from createBins with float/int variables only)
+    cdef bool useBinSearch = False
+    cdef int nvars = 0
+    cdef int iv
+    cdef int ivbin
+    cdef vector[TTreeFormula*] var_formulas
+    cdef vector[vector[double]] var_edges
+    cdef vector[double] edges
+    cdef vector[bool] var_isInt
+    cdef vector[int] var_strides
+    cdef vector[TTreeFormula*] add_formulas
+    cdef TTreeFormula* common_formula = NULL
+    cdef TTreeFormula* weight_formula = NULL
+
+    # For the bin selections as && of distinct cut terms (when the bin search is not possible)
+    cdef int natoms = 0
+    cdef int ia
+    cdef int iatom
+    cdef bool passed
+    cdef vector[TTreeFormula*] atom_formulas
+    cdef vector[vector[int]] bin_atoms
+    cdef vector[int] atoms
+    cdef vector[int] atom_state
+
+    # hists are indexed as [iflag * nbins + ibin]
     cdef vector[TH1D*] hPass
     cdef vector[TH1D*] hFail
 
     cdef TList formulas_list
 
-    cdef double epass = -1.0
-    cdef double efail = -1.0
+    cdef bool addDirectoryStatus
 
     ###############################
     # Read in Tag and Probe Ntuples
@@ -61,53 +269,140 @@ def makePassFailHistograms( sample, flag, bindef, var ):
     print(sample.tree)
     tree = new TChain(sample.tree)
 
-    for p in sample.path:
+    for ip in range(len(sample.path)):
+        p = sample.path[ip]
         print ' adding rootfile: ', p
-        tree.Add(str.encode(p))
+        if entriesPerPath is None:
+            tree.Add(str.encode(p))
+        else:
+            tree.Add(str.encode(p), entriesPerPath[ip])
 
     if not sample.puTree is None:
         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
 
-    #################################
-    # Prepare hists, cuts and outfile
-    #################################
-
-    cdef TFile* outfile = new TFile(str.encode(sample.histFile),'recreate')
+    ######################
+    # Prepare hists, cuts
+    ######################
 
     cutBinList = []
+    selectionList = []
 
-    flag_formula = new TTreeFormula('Flag_Selection', str.encode(flag), tree)
+    for iflag in range(len(flags)):
+        flag_formulas.push_back(new TTreeFormula('Flag_Selection_%d' % iflag, str.encode(flags[iflag]), tree))
+        nflags = nflags + 1
 
-    for ib in range(len(bindef['bins'])):
-        hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
-        hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
-        hPass[ib].Sumw2()
-        hFail[ib].Sumw2()
+    if sample.isMC and not sample.weight is None:
+        weightExpr = '%s' % sample.weight
+        if sample.maxWeight < 999:
+            weightExpr = '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight)
+    else:
+        weightExpr = None
 
+    for ib in range(len(bindef['bins'])):
         cuts = bindef['bins'][ib]['cut']
         if sample.mcTruth :
             cuts = '%s && mcTrue==1' % cuts
         if not sample.cut is None :
             cuts = '%s && %s' % (cuts,sample.cut)
 
-        if sample.isMC and not sample.weight is None:
-            cutBin = '( %s ) * %s ' % (cuts, sample.weight)
-            if sample.maxWeight < 999:
-                cutBin = '( %s ) * (%s < %f ? %s : 1.0 )' % (cuts, sample.weight,sample.maxWeight,sample.weight)
+        if not weightExpr is None:
+            cutBin = '( %s ) * %s ' % (cuts, weightExpr)
         else:
             cutBin = '%s' % cuts
 
         cutBinList.append(cutBin)
+        selectionList.append(cuts)
+        nbins = nbins + 1
 
-        bin_formulas.push_back(new TTreeFormula('%s_Selection' % bindef['bins'][ib]['name'], str.encode(cutBin), tree))
+    # Fast path: look up the bin from the binning variables and only evaluate
+    # the common cut and the additional cut of this bin
+    decomposition = None
+    if binSearch:
+        decomposition = decomposeBinCuts( bindef )
+        if decomposition is None:
+            print ' - bin cuts cannot be decomposed, evaluating all bin selections'
+
+    if not decomposition is None:
+        useBinSearch = True
+
+        stride = 1
+        for v in decomposition['vars']:
+            var_formulas.push_back(new TTreeFormula('%s_Binning' % v['var'], str.encode(v['var']), tree))
+            formulas_list.Add(<TObject*>var_formulas.back())
+            edges.clear()
+            for b in v['edges']:
+                edges.push_back(b)
+            var_edges.push_back(edges)
+            var_isInt.push_back(v['type'] == 'int')
+            var_strides.push_back(stride)
+            if v['type'] == 'int':
+                stride = stride * len(v['edges'])
+            else:
+                stride = stride * (len(v['edges']) - 1)
+            nvars = nvars + 1
+
+        commonCuts = [ c for c in [ decomposition['cutBase'], 'mcTrue==1' if sample.mcTruth else None, sample.cut ] if not c is None ]
+        if len(commonCuts) > 0:
+            common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in commonCuts ])), tree)
+            formulas_list.Add(<TObject*>common_formula)
+
+        # bins sharing the same additional cut share the formula
+        addFormulaIndex = {}
+        for ib in range(nbins):
+            addCut = decomposition['additionalCuts'][ib]
+            if addCut is None:
+                add_formulas.push_back(NULL)
+            elif addFormulaIndex.has_key(addCut):
+                add_formulas.push_back(add_formulas[addFormulaIndex[addCut]])
+            else:
+                addFormulaIndex[addCut] = ib
+                add_formulas.push_back(new TTreeFormula('%s_AdditionalSelection' % bindef['bins'][ib]['name'], str.encode(addCut), tree))
+                formulas_list.Add(<TObject*>add_formulas.back())
+
+        print ' - using bin search on %s' % ', '.join([ v['var'] for v in decomposition['vars'] ])
+
+    else:
+        # Generic path: the bin cuts are split in their && terms, the terms common to
+        # all bins are evaluated once, the other ones at most once per event
+        atomTree = cutAtomTree( selectionList )
+        if len(atomTree['common']) > 0:
+            common_formula = new TTreeFormula('Common_Selection', str.encode(' && '.join([ '( %s )' % c for c in atomTree['common'] ])), tree)
+            formulas_list.Add(<TObject*>common_formula)
+
+        for iatom in range(len(atomTree['atoms'])):
+            atom_formulas.push_back(new TTreeFormula('Cut_Term_%d' % iatom, str.encode(atomTree['atoms'][iatom]), tree))
+            formulas_list.Add(<TObject*>atom_formulas.back())
+            natoms = natoms + 1
+
+        for ib in range(nbins):
+            atoms.clear()
+            for iatom in atomTree['bins'][ib]:
+                atoms.push_back(iatom)
+            bin_atoms.push_back(atoms)
+
+        print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (nbins, natoms, len(atomTree['common']))
+
+    if not weightExpr is None:
+        weight_formula = new TTreeFormula('Weight', str.encode(weightExpr), tree)
+        formulas_list.Add(<TObject*>weight_formula)
+
+    for iflag in range(nflags):
+        formulas_list.Add(<TObject*>flag_formulas[iflag])
+    tree.SetNotify(<TObject*> &formulas_list)
 
-        formulas_list.Add(<TObject*>bin_formulas[nbins])
+    # hists are kept in memory, their contents are returned after the loop
+    addDirectoryStatus = AddDirectoryStatus()
+    AddDirectory(False)
 
-        nbins = nbins + 1
+    for iflag in range(nflags):
+        for ib in range(nbins):
+            hPass.push_back(new TH1D('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+            hFail.push_back(new TH1D('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max']))
+            hPass.back().Sumw2()
+            hFail.back().Sumw2()
 
-    formulas_list.Add(<TObject*>flag_formula)
-    tree.SetNotify(<TObject*> &formulas_list)
+    AddDirectory(addDirectoryStatus)
 
     ######################################
     # Deactivate branches and set adresses
@@ -115,7 +410,7 @@ def makePassFailHistograms( sample, flag, bindef, var ):
 
     # Find out with variables are used to activate the corresponding branches
     replace_patterns = ['&', '|', '-', 'cos(', 'sqrt(', 'fabs(', 'abs(', '(', ')', '>', '<', '=', '!', '*', '/', '[', ']']
-    branches = " ".join(cutBinList) + " pair_mass " + flag
+    branches = " ".join(cutBinList) + " pair_mass " + " ".join(flags)
     for p in replace_patterns:
         branches = branches.replace(p, ' ')
 
@@ -136,53 +431,102 @@ def makePassFailHistograms( sample, flag, bindef, var ):
     ################
 
     nevts = tree.GetEntries()
-    frac_of_nevts = nevts/20
+    lastEntry = nevts
+    if nEntries >= 0 and firstEntry + nEntries < nevts:
+        lastEntry = firstEntry + nEntries
+    frac_of_nevts = max(1, (lastEntry - firstEntry)/20)
 
-    print("Starting event loop to fill histograms..")
+    print("Starting event loop to fill histograms for %d flag(s) (entries %d to %d).." % (nflags, firstEntry, lastEntry))
 
-    for index in range(nevts):
-        if index % frac_of_nevts == 0:
+    for index in range(firstEntry, lastEntry):
+        if (index - firstEntry) % frac_of_nevts == 0:
             print outcount, "%", sample.name
             outcount = outcount + 5
 
         tree.GetEntry(index)
 
+        if useBinSearch:
+            # bins are ordered with the first variable running fastest (see createBins)
+            bnidx = 0
+            for iv in range(nvars):
+                ivbin = findBin(var_edges[iv], var_isInt[iv], var_formulas[iv].EvalInstance(0))
+                if ivbin < 0:
+                    bnidx = -1
+                    break
+                bnidx = bnidx + ivbin * var_strides[iv]
+
+            if bnidx < 0:
+                continue
+            if common_formula != NULL and not common_formula.EvalInstance(0):
+                continue
+            if add_formulas[bnidx] != NULL and not add_formulas[bnidx].EvalInstance(0):
+                continue
+
+            weight = 1.0
+            if weight_formula != NULL:
+                weight = weight_formula.EvalInstance(0)
+            if not weight:
+                continue
+
+            for iflag in range(nflags):
+                ih = iflag * nbins + bnidx
+                if flag_formulas[iflag].EvalInstance(0):
+                    hPass[ih].Fill(pair_mass, weight)
+                else:
+                    hFail[ih].Fill(pair_mass, weight)
+            continue
+
+        if common_formula != NULL and not common_formula.EvalInstance(0):
+            continue
+
+        # -1: term not evaluated yet for this event
+        atom_state.assign(natoms, -1)
         for bnidx in range(nbins):
-            weight = bin_formulas[bnidx].EvalInstance(0)
+            passed = True
+            for ia in range(bin_atoms[bnidx].size()):
+                iatom = bin_atoms[bnidx][ia]
+                if atom_state[iatom] < 0:
+                    atom_state[iatom] = 1 if atom_formulas[iatom].EvalInstance(0) else 0
+                if atom_state[iatom] == 0:
+                    passed = False
+                    break
+            if not passed:
+                continue
+
+            weight = 1.0
+            if weight_formula != NULL:
+                weight = weight_formula.EvalInstance(0)
             if weight:
-                if flag_formula.EvalInstance(0):
-                    hPass[bnidx].Fill(pair_mass, weight)
-                else:
-                    hFail[bnidx].Fill(pair_mass, weight)
-                break
+                for iflag in range(nflags):
+                    ih = iflag * nbins + bnidx
+                    if flag_formulas[iflag].EvalInstance(0):
+                        hPass[ih].Fill(pair_mass, weight)
+                    else:
+                        hFail[ih].Fill(pair_mass, weight)
+            break
 
     #####################
     # Deal with the Hists
     #####################
 
-    for ib in range(len(bindef['bins'])):
-        removeNegativeBins(hPass[ib])
-        removeNegativeBins(hFail[ib])
-
-        hPass[ib].Write(hPass[ib].GetName())
-        hFail[ib].Write(hFail[ib].GetName())
-
-        bin1 = 1
-        bin2 = hPass[ib].GetXaxis().GetNbins()
-        passI = hPass[ib].IntegralAndError(bin1,bin2,epass)
-        failI = hFail[ib].IntegralAndError(bin1,bin2,efail)
-        eff   = 0
-        e_eff = 0
-        if passI > 0 :
-            itot  = (passI+failI)
-            eff   = passI / (passI+failI)
-            e_eff = math.sqrt(passI*passI*efail*efail + failI*failI*epass*epass) / (itot*itot)
-        #print cuts
-        #print '    ==> pass: %.1f +/- %.1f ; fail : %.1f +/- %.1f : eff: %1.3f +/- %1.3f' % (passI,epass,failI,efail,eff,e_eff)
+    # bin 0 and nbins+1 are the under/overflow
+    contents = { 'nflags': nflags, 'nbins': nbins, 'Pass': [], 'Fail': [], 'PassEntries': [], 'FailEntries': [] }
+    for ih in range(hPass.size()):
+        contents['PassEntries'].append( hPass[ih].GetEntries() )
+        contents['FailEntries'].append( hFail[ih].GetEntries() )
+        contents['Pass'].append( [ [ hPass[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+                                   [ hPass[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
+        contents['Fail'].append( [ [ hFail[ih].GetBinContent(i) for i in range(var['nbins']+2) ],
+                                   [ hFail[ih].GetBinError(i)**2 for i in range(var['nbins']+2) ] ] )
 
     ##########
     # Clean up
     ##########
 
-    outfile.Close()
+    for ih in range(hPass.size()):
+        del hPass[ih]
+        del hFail[ih]
+
     tree.Delete()
+
+    return contents
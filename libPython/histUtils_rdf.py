@@ -0,0 +1,122 @@
+import ROOT as rt
+from binUtils import cutAtomTree
+
+#############################################################
+# RDataFrame version of histUtils: all the bin x {pass,fail}
+# histograms are booked lazily and filled in a single
+# (implicit multi-threaded) event loop.
+# Note: cuts, flags and weight are jitted as C++ expressions
+#############################################################
+
+def removeNegativeBins(h):
+    for i in xrange(h.GetNbinsX()):
+        if (h.GetBinContent(i) < 0):
+            h.SetBinContent(i, 0)
+
+
+def enableMT( nThreads = 0 ):
+    ### has to be called before the first RDataFrame is built, 0 = all cores
+    if nThreads == 1 or rt.ROOT.IsImplicitMTEnabled():
+        return
+    rt.ROOT.EnableImplicitMT(nThreads)
+    print ' - RDataFrame implicit MT enabled with %d threads' % rt.ROOT.GetThreadPoolSize()
+
+
+def makeDataFrame( sample ):
+    ### the chains have to be kept alive as long as the dataframe
+    tree = rt.TChain(sample.tree)
+    for p in sample.path:
+        print ' adding rootfile: ', p
+        tree.Add(p)
+
+    friend = None
+    if not sample.puTree is None:
+        print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
+        friend = rt.TChain(sample.weight.split('.')[0])
+        friend.Add(sample.puTree)
+        tree.AddFriend(friend)
+
+    return rt.RDataFrame(tree), [tree, friend]
+
+
+def makePassFailHistograms( sample, flag, bindef, var, nThreads = 0 ):
+    makePassFailHistogramsMultiFlag( sample, [flag], [sample.histFile], bindef, var, nThreads )
+
+
+def makePassFailHistogramsMultiFlag( sample, flags, histFiles, bindef, var, nThreads = 0 ):
+    if len(flags) != len(histFiles):
+        print '[makePassFailHistogramsMultiFlag] need one histFile per flag (%d flags, %d files)' % (len(flags), len(histFiles))
+        return
+
+    enableMT( nThreads )
+    df, chains = makeDataFrame( sample )
+
+    weight = None
+    if sample.isMC and not sample.weight is None:
+        weight = 'tnpWeight'
+        if sample.maxWeight < 999:
+            df = df.Define( weight, '(%s < %f ? %s : 1.0 )' % (sample.weight,sample.maxWeight,sample.weight) )
+        else:
+            df = df.Define( weight, '%s' % sample.weight )
+
+    ### one boolean column per flag, shared by all the bins
+    for iflag in range(len(flags)):
+        df = df.Define( 'tnpFlag_%d' % iflag, '(%s) != 0' % flags[iflag] )
+
+    ### bin cuts split in their && terms: the terms common to all the bins are
+    ### one filter, the other ones boolean columns computed once per event
+    selectionList = []
+    for ib in range(len(bindef['bins'])):
+        cuts = bindef['bins'][ib]['cut']
+        if sample.mcTruth :
+            cuts = '%s && mcTrue==1' % cuts
+        if not sample.cut is None :
+            cuts = '%s && %s' % (cuts,sample.cut)
+        selectionList.append( cuts )
+
+    atomTree = cutAtomTree( selectionList )
+    if len(atomTree['common']) > 0:
+        df = df.Filter( ' && '.join([ '( %s )' % c for c in atomTree['common'] ]), 'common' )
+    for iatom in range(len(atomTree['atoms'])):
+        df = df.Define( 'tnpCut_%d' % iatom, '(%s) != 0' % atomTree['atoms'][iatom] )
+    print ' - %d bin selections from %d distinct cut terms (%d common to all bins)' % (len(selectionList), len(atomTree['atoms']), len(atomTree['common']))
+
+    ### hists are indexed as [iflag][ibin]
+    hPass = [ [] for flag in flags ]
+    hFail = [ [] for flag in flags ]
+    for ib in range(len(bindef['bins'])):
+        cuts = ' && '.join([ 'tnpCut_%d' % iatom for iatom in atomTree['bins'][ib] ])
+        if cuts == '':
+            cuts = 'true'
+        dfBin = df.Filter( cuts, bindef['bins'][ib]['name'] )
+        for iflag in range(len(flags)):
+            dfPass = dfBin.Filter( 'tnpFlag_%d' % iflag )
+            dfFail = dfBin.Filter( '!tnpFlag_%d' % iflag )
+            modelPass = rt.RDF.TH1DModel('%s_Pass' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+            modelFail = rt.RDF.TH1DModel('%s_Fail' % bindef['bins'][ib]['name'],bindef['bins'][ib]['title'],var['nbins'],var['min'],var['max'])
+            if weight is None:
+                hPass[iflag].append( dfPass.Histo1D( modelPass, var['name'] ) )
+                hFail[iflag].append( dfFail.Histo1D( modelFail, var['name'] ) )
+            else:
+                hPass[iflag].append( dfPass.Histo1D( modelPass, var['name'], weight ) )
+                hFail[iflag].append( dfFail.Histo1D( modelFail, var['name'], weight ) )
+
+    ### the first access runs the event loop for all the booked histograms
+    print 'Starting event loop to fill histograms for %d flag(s), %d bins..' % (len(flags),len(bindef['bins']))
+    hPass[0][0].GetValue()
+
+    for iflag in range(len(flags)):
+        outfile = rt.TFile(histFiles[iflag],'recreate')
+        for ib in range(len(bindef['bins'])):
+            hp = hPass[iflag][ib].GetPtr()
+            hf = hFail[iflag][ib].GetPtr()
+            hp.Sumw2()
+            hf.Sumw2()
+            removeNegativeBins(hp)
+            removeNegativeBins(hf)
+
+            hp.Write(hp.GetName())
+            hf.Write(hf.GetName())
+        outfile.Close()
+        print ' - histograms saved in %s' % histFiles[iflag]
+
@@ -277,7 +277,40 @@ rhoDataEpoch = {
 
 
 
-def reweight( sample, puType = 0,useCustomW=False  ):
+def puWeightTable( pudata, pumc ):
+### pud/pum for each pu bin (0 if pum <= 0)
+    nbins = min(len(pudata),len(pumc))
+    pud = np.array(pudata[:nbins],dtype=float)
+    pum = np.array(pumc[:nbins]  ,dtype=float)
+    table = np.zeros(nbins)
+    np.divide( pud, pum, out = table, where = pum > 0 )
+    return table
+
+
+def puWeights( mcEvts, puTable, puType = 0, useCustomW = False ):
+### per event (PUweight,totWeight) from the lookup table of an epoch
+    if   puType == 1 and not useCustomW:
+        ipu   = mcEvts['event_nPV'].astype(int)
+        valid = ipu >= 0
+    elif puType == 2 and not useCustomW:
+        ipu   = mcEvts['rho'].astype(int)
+        valid = ipu >= 0
+    else:
+        ipu   = mcEvts['truePU'].astype(int)
+        if useCustomW: valid = (mcEvts['truePU'] > 0) & (mcEvts['truePU'] < 97)
+        else         : valid = (mcEvts['truePU'] > 0) & (mcEvts['truePU'] < 99)
+    valid &= ipu < len(puTable)
+
+    puw = np.zeros(len(mcEvts))
+    puw[valid] = puTable[ipu[valid]]
+
+    weights = np.zeros(len(mcEvts),dtype=[('PUweight',float),('totWeight',float)])
+    weights['PUweight']  = puw
+    weights['totWeight'] = np.where( mcEvts['weight'] > 0, puw, -puw )
+    return weights
+
+
+def reweight( sample, puType = 0,useCustomW=False, chunkSize = 1000000, streaming = True ):
     if sample.path is None:
         print '[puReweighter]: Need to know the MC tree (option --mcTree or sample.path)'
         sys.exit(1)
@@ -339,62 +372,47 @@ def reweight( sample, puType = 0,useCustomW=False  ):
         fpu.Close()
         weights[pu] = []
 
-    mcEvts = tree2array( tmc, branches = ['weight','truePU','event_nPV','rho'] )
-
-
     pumc = puMC[puMCscenario]
     if   puType == 1:  pumc = puMCnVtx
     elif puType == 2:  pumc = puMCrho
     else            :  pumc = puMC[puMCscenario]
 
-    puMax = len(pumc)
-    print '-> nEvtsTot ', len(mcEvts)
-#    print "--------------------------" 
-    for ievt in xrange(len(mcEvts)):
-        if ievt%100000 == 0 :            print 'iEvt:',ievt
-#        print 'iEvt:',ievt
-        evt = mcEvts[ievt]
-        for pu in epochKeys:
-#            print pu
-#AR            customWeights=customWeights_17Nov2017MCv2[pu]
-#            print customWeights_17Nov2017MCv2[pu]
-#            print "--------------------------"
-            pum = -1
-            pud = -1
-            if puType == 1 and evt['event_nPV'] < puMax:
-                pud = puDataArray[pu][evt['event_nPV']]
-                pum = pumc[evt['event_nPV']]
-            if puType == 2 and int(evt['rho']) < puMax:
-                pud = puDataArray[pu][int(evt['rho'])]
-                pum = pumc[int(evt['rho'])]
-            elif puType == 0:
-#                if ievt%1000: print pu, evt['truePU']
-                if evt['truePU']> 0 and evt['truePU']<99: 
-                    pud = puDataArray[pu][evt['truePU']] 
-                    pum = pumc[evt['truePU']]
-            puw = 0
-            if pum > 0: 
-                puw  = pud/pum
-#                if use customized weights
-            if useCustomW:
-                puw=0
-                if  evt['truePU']> 0 and evt['truePU']<97:
-                    puw = customWeights[evt['truePU']]
-                
-#                    print evt['truePU'],puw
-
-            if evt['weight'] > 0 : totw = +puw
-            else                 : totw = -puw
-            weights[pu].append( ( puw,totw) )
-#    print "====================="
-#    print weights[pu]
+### pud/pum lookup table of each epoch, computed once
+    puTables = {}
+    for pu in epochKeys:
+        if useCustomW: puTables[pu] = np.array(customWeights_17Nov2017MCv2[pu],dtype=float)
+        else         : puTables[pu] = puWeightTable( puDataArray[pu], pumc )
 
     newFile    = rt.TFile( sample.puTree, 'recreate')
 
+### in streaming mode each chunk is appended to the output trees (attached to newFile,
+### so their baskets are flushed to disk) and the memory does not depend on the sample size
+    treeWeights = {}
+    if streaming:
+        for pu in epochKeys:
+            treeWeights[pu] = rt.TTree('weights_%s'%pu,'tree with weights')
+
+### read the tree by chunks to bound the memory
+    nEvts = tmc.GetEntries()
+    print '-> nEvtsTot ', nEvts
+    for ievt in xrange(0,nEvts,chunkSize):
+        print 'iEvt:',ievt
+        mcEvts = tree2array( tmc, branches = ['weight','truePU','event_nPV','rho'], start = ievt, stop = ievt+chunkSize )
+        for pu in epochKeys:
+            if streaming:
+                array2tree( puWeights( mcEvts, puTables[pu], puType, useCustomW ), tree = treeWeights[pu] )
+            else:
+                weights[pu].append( puWeights( mcEvts, puTables[pu], puType, useCustomW ) )
+        del mcEvts
+
+    newFile.cd()
     for pu in epochKeys:
-        treeWeight = rt.TTree('weights_%s'%pu,'tree with weights')
-        wpuarray = np.array(weights[pu],dtype=[('PUweight',float),('totWeight',float)])
-        array2tree( wpuarray, tree = treeWeight )
+        if streaming:
+            treeWeight = treeWeights[pu]
+        else:
+            treeWeight = rt.TTree('weights_%s'%pu,'tree with weights')
+            wpuarray = np.concatenate(weights[pu])
+            array2tree( wpuarray, tree = treeWeight )
         treeWeight.Write()
 
     newFile.Close()    
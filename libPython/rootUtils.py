@@ -1,7 +1,9 @@
 import ROOT as rt
 import math
+import os
 from fitUtils import *
 import ctypes
+import numpy as np
 
 def removeNegativeBins(h):
     for i in xrange(h.GetNbinsX()):
@@ -88,6 +90,71 @@ def histPlotter( filename, tnpBin, plotDir ):
     c.Print( '%s/%s.png' % (plotDir,tnpBin['name']))
 
 
+def plotsToUpdate( filename, bins, plotDir, formats = ['png'] ):
+    ### bins with a canvas whose plots are missing or older than the canvas
+    ### (write time of its key: the bins not refitted are not replotted)
+    rootfile = rt.TFile(filename,"read")
+    toUpdate = []
+    for tnpBin in bins:
+        key = rootfile.GetKey( '%s_Canv' % tnpBin['name'] )
+        if not key: continue
+        fitTime = key.GetDatime().Convert()
+        for fmt in formats:
+            plot = '%s/%s.%s' % (plotDir,tnpBin['name'],fmt)
+            if not os.path.exists(plot) or os.path.getmtime(plot) < fitTime:
+                toUpdate.append( tnpBin )
+                break
+    rootfile.Close()
+    return toUpdate
+
+
+#############################################################
+########## canvases of the fits done without plots (--noPlot)
+#############################################################
+def canvasesToRender( filename, bins ):
+    ### bins with a workspace and no canvas of the same fit (fit key of the canvas != fit key)
+    rootfile = rt.TFile(filename,"read")
+    toRender = []
+    for tnpBin in bins:
+        if not rootfile.GetKey( '%s_ws' % tnpBin['name'] ): continue
+        fitKey  = rootfile.Get( '%s_fitKey'  % tnpBin['name'] )
+        canvKey = rootfile.Get( '%s_canvKey' % tnpBin['name'] )
+        if not rootfile.GetKey( '%s_Canv' % tnpBin['name'] ) or not fitKey or not canvKey or canvKey.GetTitle() != fitKey.GetTitle():
+            toRender.append( tnpBin )
+    rootfile.Close()
+    return toRender
+
+
+def renderFitCanvas( filename, tnpBin ):
+    ### rebuilds the canvas of a bin from its workspace and fit results, returns {name: canvas, name: fit key of the canvas}
+    rootfile = rt.TFile(filename,"read")
+    work = rootfile.Get( '%s_ws'   % tnpBin['name'] )
+    resP = rootfile.Get( '%s_resP' % tnpBin['name'] )
+    resF = rootfile.Get( '%s_resF' % tnpBin['name'] )
+    fitKey = rootfile.Get( '%s_fitKey' % tnpBin['name'] )
+    fitter = tnpFitter( work, tnpBin['name'] )
+    rootfile.Close()
+
+    memfile = rt.TMemFile( '%s_canv.root' % tnpBin['name'], 'recreate' )
+    fitter.setOutputFile( memfile )
+    fitter.drawFits( resP, resF )
+    canvas = { '%s_Canv' % tnpBin['name']: memfile.Get( '%s_Canv' % tnpBin['name'] ) }
+    memfile.Close()
+    if fitKey:
+        canvas['%s_canvKey' % tnpBin['name']] = rt.TNamed( '%s_canvKey' % tnpBin['name'], fitKey.GetTitle() )
+    return canvas
+
+
+plotterFiles = {}
+def histPlotterFormats( filename, tnpBin, plotDir, formats = ['png'] ):
+    ### as histPlotter, but the file is opened once per process and all formats are printed
+    if not filename in plotterFiles:
+        plotterFiles[filename] = rt.TFile(filename,"read")
+    c = plotterFiles[filename].Get( '%s_Canv' % tnpBin['name'] )
+    for fmt in formats:
+        c.Print( '%s/%s.%s' % (plotDir,tnpBin['name'],fmt))
+
+
 def computeEffi( n1,n2,e1,e2):
     effout = []
     eff   = n1/(n1+n2)
@@ -100,132 +167,89 @@ def computeEffi( n1,n2,e1,e2):
     return effout
 
 
-import os.path
-def getAllEffi( info, bindef ):
-    effis = {}
-    if not info['mcNominal'] is None and os.path.isfile(info['mcNominal']):
-        rootfile = rt.TFile( info['mcNominal'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-        #bin1 = 1
-        #bin2 = hP.GetXaxis().GetNbins()
-        bin1 = 11
-        bin2 = 70
-        eP = -1.
-        eF = -1.
-        nP = hP.IntegralAndError(bin1,bin2,ctypes.c_double(eP))
-        nF = hF.IntegralAndError(bin1,bin2,ctypes.c_double(eF))
-
-        effis['mcNominal'] = computeEffi(nP,nF,eP,eF)
-        rootfile.Close()
-    else: effis['mcNominal'] = [-1,-1]
-
-    if not info['tagSel'] is None and os.path.isfile(info['tagSel']):
-        rootfile = rt.TFile( info['tagSel'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-      #  bin1 = 1
-      #  bin2 = hP.GetXaxis().GetNbins()
-        bin1 = 11
-        bin2 = 70
-        eP = -1.
-        eF = -1.
-        nP = hP.IntegralAndError(bin1,bin2,ctypes.c_double(eP))
-        nF = hF.IntegralAndError(bin1,bin2,ctypes.c_double(eF))
-
-        effis['tagSel'] = computeEffi(nP,nF,eP,eF)
-        rootfile.Close()
-    else: effis['tagSel'] = [-1,-1]
-        
-    if not info['mcAlt'] is None and os.path.isfile(info['mcAlt']):
-        rootfile = rt.TFile( info['mcAlt'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-        #bin1 = 1
-        #bin2 = hP.GetXaxis().GetNbins()
-        bin1 = 11
-        bin2 = 70
-        eP = -1.
-        eF = -1.
-        nP = hP.IntegralAndError(bin1,bin2,ctypes.c_double(eP))
-        nF = hF.IntegralAndError(bin1,bin2,ctypes.c_double(eF))
-
-        effis['mcAlt'] = computeEffi(nP,nF,eP,eF)
-        rootfile.Close()
-    else: effis['mcAlt'] = [-1,-1]
-
-    if not info['dataNominal'] is None and os.path.isfile(info['dataNominal']) :
-        rootfile = rt.TFile( info['dataNominal'], 'read' )
-        from ROOT import RooFit,RooFitResult
-        fitresP = rootfile.Get( '%s_resP' % bindef['name']  )
-        fitresF = rootfile.Get( '%s_resF' % bindef['name'] )
+def fitEffi( fitresP, fitresF ):
+    ### simultaneous fit: the efficiency is a parameter of the fit
+    effPar = fitresP.floatParsFinal().find('efficiency')
+    if effPar:
+        return [ effPar.getVal(), max( effPar.getError(), 0.001 ) ]
+
+    nP = fitresP.floatParsFinal().find('nSigP').getVal()
+    nF = fitresF.floatParsFinal().find('nSigF').getVal()
+    eP = fitresP.floatParsFinal().find('nSigP').getError()
+    eF = fitresF.floatParsFinal().find('nSigF').getError()
+    return computeEffi(nP,nF,eP,eF)
+
+
+def compareFits( fitRef, fitTest, tnpBin, refName = 'ref', testName = 'test', tolerance = 0.2, minEffTolerance = 0.001 ):
+    ### two fits of the same bin (fit objects {name: object}) agree if their signal yields differ by less
+    ### than tolerance x the error of the reference fit, and their efficiencies by less than
+    ### max(tolerance x error, minEffTolerance)
+    res = {}
+    for fitName, fitResult in [ (refName,fitRef), (testName,fitTest) ]:
+        if fitResult is None or not '%s_resP' % tnpBin['name'] in fitResult or not '%s_resF' % tnpBin['name'] in fitResult:
+            print '[compareFits] no %s fit for bin %s' % (fitName,tnpBin['name'])
+            return False
+        res[fitName] = [ fitResult['%s_resP' % tnpBin['name']], fitResult['%s_resF' % tnpBin['name']] ]
+
+    print '[compareFits] bin %s: %s vs %s (tolerance: %1.2f sigma)' % (tnpBin['name'],refName,testName,tolerance)
+    agree = True
+    ### nSigP, nSigF: separate fits, nSigTot: simultaneous fit
+    for ires, parName in [ (0,'nSigP'), (1,'nSigF'), (0,'nSigTot') ]:
+        parRef  = res[refName ][ires].floatParsFinal().find(parName)
+        parTest = res[testName][ires].floatParsFinal().find(parName)
+        if not parRef or not parTest: continue
+        diff = abs( parTest.getVal() - parRef.getVal() )
+        ok   = diff <= tolerance * parRef.getError()
+        print '   %-10s: %10.1f +/- %7.1f   %10.1f +/- %7.1f   %s' % (parName,parRef.getVal(),parRef.getError(),parTest.getVal(),parTest.getError(),'OK' if ok else 'DIFFERENT')
+        agree = agree and ok
+
+    effRef  = fitEffi( res[refName ][0], res[refName ][1] )
+    effTest = fitEffi( res[testName][0], res[testName][1] )
+    ok = abs( effTest[0] - effRef[0] ) <= max( tolerance * effRef[1], minEffTolerance )
+    print '   %-10s: %10.4f +/- %7.4f   %10.4f +/- %7.4f   %s' % ('efficiency',effRef[0],effRef[1],effTest[0],effTest[1],'OK' if ok else 'DIFFERENT')
+    return agree and ok
 
-        fitP = fitresP.floatParsFinal().find('nSigP')
-        fitF = fitresF.floatParsFinal().find('nSigF')
-        
-        nP = fitP.getVal()
-        nF = fitF.getVal()
-        eP = fitP.getError()
-        eF = fitF.getError()
-        rootfile.Close()
 
-        rootfile = rt.TFile( info['data'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-
-        #if eP > math.sqrt(hP.Integral()) : eP = math.sqrt(hP.Integral())
-        #if eF > math.sqrt(hF.Integral()) : eF = math.sqrt(hF.Integral())
-        rootfile.Close()
-
-        effis['dataNominal'] = computeEffi(nP,nF,eP,eF)
-    else:
-        effis['dataNominal'] = [-1,-1]
-    if not info['dataAltSig'] is None and os.path.isfile(info['dataAltSig']) :
-        rootfile = rt.TFile( info['dataAltSig'], 'read' )
-        from ROOT import RooFit,RooFitResult
-        fitresP = rootfile.Get( '%s_resP' % bindef['name']  )
-        fitresF = rootfile.Get( '%s_resF' % bindef['name'] )
-
-        nP = fitresP.floatParsFinal().find('nSigP').getVal()
-        nF = fitresF.floatParsFinal().find('nSigF').getVal()
-        eP = fitresP.floatParsFinal().find('nSigP').getError()
-        eF = fitresF.floatParsFinal().find('nSigF').getError()
-        rootfile.Close()
-
-        rootfile = rt.TFile( info['data'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-
-        #if eP > math.sqrt(hP.Integral()) : eP = math.sqrt(hP.Integral())
-        #if eF > math.sqrt(hF.Integral()) : eF = math.sqrt(hF.Integral())
-        rootfile.Close()
-
-        effis['dataAltSig'] = computeEffi(nP,nF,eP,eF)
-
-    else:
-        effis['dataAltSig'] = [-1,-1]
-
-    if not info['dataAltBkg'] is None and os.path.isfile(info['dataAltBkg']):
-        rootfile = rt.TFile( info['dataAltBkg'], 'read' )
-        from ROOT import RooFit,RooFitResult
-        fitresP = rootfile.Get( '%s_resP' % bindef['name']  )
-        fitresF = rootfile.Get( '%s_resF' % bindef['name'] )
-
-        nP = fitresP.floatParsFinal().find('nSigP').getVal()
-        nF = fitresF.floatParsFinal().find('nSigF').getVal()
-        eP = fitresP.floatParsFinal().find('nSigP').getError()
-        eF = fitresF.floatParsFinal().find('nSigF').getError()
+import os.path
+def mcEffi( rootfile, bindef ):
+    hP = rootfile.Get('%s_Pass'%bindef['name'])
+    hF = rootfile.Get('%s_Fail'%bindef['name'])
+    #bin1 = 1
+    #bin2 = hP.GetXaxis().GetNbins()
+    bin1 = 11
+    bin2 = 70
+    eP = -1.
+    eF = -1.
+    nP = hP.IntegralAndError(bin1,bin2,ctypes.c_double(eP))
+    nF = hF.IntegralAndError(bin1,bin2,ctypes.c_double(eF))
+    return computeEffi(nP,nF,eP,eF)
+
+
+def getAllEffiBins( info, bins ):
+    ### efficiencies of all the bins, each file is opened once
+    ### returns {measurement: array [ibin] -> [eff,err]} ([-1,-1] if the file is missing)
+    from ROOT import RooFit,RooFitResult
+    effis = {}
+    for sample in [ 'mcNominal', 'tagSel', 'mcAlt', 'dataNominal', 'dataAltSig', 'dataAltBkg' ]:
+        effis[sample] = np.full( (len(bins),2), -1. )
+        if info[sample] is None or not os.path.isfile(info[sample]):
+            continue
+
+        rootfile = rt.TFile( info[sample], 'read' )
+        for ib in range(len(bins)):
+            if sample.startswith('data'):
+                fitresP = rootfile.Get( '%s_resP' % bins[ib]['name'] )
+                fitresF = rootfile.Get( '%s_resF' % bins[ib]['name'] )
+                effis[sample][ib] = fitEffi( fitresP, fitresF )
+            else:
+                effis[sample][ib] = mcEffi( rootfile, bins[ib] )
         rootfile.Close()
+    return effis
 
-        rootfile = rt.TFile( info['data'], 'read' )
-        hP = rootfile.Get('%s_Pass'%bindef['name'])
-        hF = rootfile.Get('%s_Fail'%bindef['name'])
-
-        #if eP > math.sqrt(hP.Integral()) : eP = math.sqrt(hP.Integral())
-        #if eF > math.sqrt(hF.Integral()) : eF = math.sqrt(hF.Integral())
-        rootfile.Close()
 
-        effis['dataAltBkg'] = computeEffi(nP,nF,eP,eF)
-    else:
-        effis['dataAltBkg'] = [-1,-1]
+def getAllEffi( info, bindef ):
+    effisBins = getAllEffiBins( info, [bindef] )
+    effis = {}
+    for sample in effisBins.keys():
+        effis[sample] = list( effisBins[sample][0] )
     return effis
@@ -0,0 +1,126 @@
+import ROOT as rt
+import os
+import re
+import glob
+import json
+import hashlib
+
+#############################################################
+# Local skim of the tag and probe ntuples: only the branches
+# used by the cuts are kept and the pre-selection is applied.
+# The skim is keyed by a hash of the inputs (paths, size and
+# mtime, branches, cuts) and reused as long as it is valid.
+#############################################################
+
+skimTreeName   = 'fitter_tree'
+skimWeightName = 'tnpSkimWeight'
+
+
+def expandPaths( paths ):
+    expanded = []
+    for p in paths:
+        if ('*' in p or '?' in p) and not '://' in p:
+            expanded.extend( sorted(glob.glob(p)) )
+        else:
+            expanded.append( p )
+    return expanded
+
+
+def fileStamp( path ):
+    ### size and modification time, works for local and xrootd files
+    fs = rt.FileStat_t()
+    if rt.gSystem.GetPathInfo( path, fs ) != 0:
+        print '[skimUtils] cannot stat file %s' % path
+        return None
+    return '%d:%d' % (fs.fSize, fs.fMtime)
+
+
+def usedBranches( expressions, columns ):
+    ### identifiers of the expressions that are branches of the tree
+    names = set()
+    for expr in expressions:
+        if expr is None: continue
+        names.update( re.findall( r'[A-Za-z_][A-Za-z0-9_]*', expr ) )
+    return sorted( names & set(columns) )
+
+
+def skimSample( sample, cacheDir, expressions, preCut = None, treeName = None ):
+    ### returns a clone of the sample reading the skim (made if needed) with the
+    ### branches used in expressions, preCut and sample.cut applied and the
+    ### PU weight of the friend tree stored in a plain branch
+    if treeName is None:
+        treeName = sample.tree
+
+    paths = expandPaths( sample.path )
+
+    tree = rt.TChain(treeName)
+    for p in paths:
+        tree.Add(p)
+
+    friend = None
+    if not sample.puTree is None:
+        friend = rt.TChain(sample.weight.split('.')[0])
+        friend.Add(sample.puTree)
+        tree.AddFriend(friend)
+
+    df = rt.RDataFrame(tree)
+    columns = [ str(c) for c in df.GetColumnNames() ]
+
+    allExpressions = list(expressions) + [ preCut, sample.cut ]
+    if sample.mcTruth:
+        allExpressions.append( 'mcTrue' )
+    if not sample.weight is None and sample.puTree is None:
+        allExpressions.append( sample.weight )
+    branches = usedBranches( allExpressions, columns )
+
+    cuts = [ c for c in [ preCut, sample.cut ] if not c is None ]
+    skimCut = ' && '.join( [ '( %s )' % c for c in cuts ] )
+
+    key = {
+        'tree'     : treeName,
+        'paths'    : paths,
+        'stamps'   : [ fileStamp(p) for p in paths ],
+        'puTree'   : sample.puTree,
+        'puStamp'  : fileStamp(sample.puTree) if not sample.puTree is None else None,
+        'weight'   : sample.weight,
+        'branches' : branches,
+        'cut'      : skimCut,
+        }
+    if None in key['stamps'] or (not sample.puTree is None and key['puStamp'] is None):
+        print '[skimUtils] cannot check the inputs of sample %s, not using the skim' % sample.name
+        return sample
+    skimKey = hashlib.sha1( json.dumps( key, sort_keys = True ) ).hexdigest()
+
+    skimFile = '%s/%s_%s.root' % ( cacheDir, sample.name, skimKey[:16] )
+    if os.path.exists( skimFile ):
+        print ' - using skim %s for sample %s' % (skimFile, sample.name)
+    else:
+        print ' - creating skim %s for sample %s (%d branches)' % (skimFile, sample.name, len(branches))
+        if not os.path.isdir( cacheDir ):
+            os.makedirs( cacheDir )
+
+        dfSkim = df
+        if skimCut != '':
+            dfSkim = dfSkim.Filter( skimCut )
+
+        outBranches = rt.std.vector('string')()
+        for b in branches:
+            outBranches.push_back( b )
+        if not sample.weight is None and not sample.puTree is None:
+            dfSkim = dfSkim.Define( skimWeightName, sample.weight )
+            outBranches.push_back( skimWeightName )
+
+        ### write to a temporary file so that an interrupted skim is never reused
+        tmpFile = '%s.tmp%d' % (skimFile, os.getpid())
+        dfSkim.Snapshot( skimTreeName, tmpFile, outBranches )
+        os.rename( tmpFile, skimFile )
+
+    skimmed = sample.clone()
+    skimmed.path   = [ skimFile ]
+    skimmed.tree   = skimTreeName
+    skimmed.cut    = None
+    skimmed.puTree = None
+    if not sample.weight is None and not sample.puTree is None:
+        skimmed.weight = skimWeightName
+    return skimmed
+
@@ -1,5 +1,7 @@
 import os,sys,copy
-#import numpy as np
+import argparse
+from multiprocessing import Pool
+import numpy as np
 from root_numpy import  tree2array, array2tree
 
 sys.path.append("..")
@@ -12,6 +14,10 @@ import ROOT as rt
 from ROOT import gStyle
 from ROOT import gROOT
 
+parser = argparse.ArgumentParser(description='tnp EGM commissioning plots')
+parser.add_argument('--plotOnly' , action='store_true', help = 'only redo the plots from the histoData/histoMC root files')
+parser.add_argument('--forcePlot', action='store_true', help = 'redo all the plots, even if they are newer than the histograms')
+args = parser.parse_args()
 
 
 #################################################################################################
@@ -55,6 +61,13 @@ epochs = [ 'runH' ]
 ### the output directory
 outputdir = 'plots/commissioning/'
 
+### directory of the local skims of the samples (None: read the ntuples directly)
+skimCacheDir = None
+
+### entries read at once per process and number of processes (None: all the cores)
+chunkSize = 500000
+nJobs     = None
+
 
 ### the list of variables to plot (cuts are defined in the loopTree function)
 cutEB = 'EB'
@@ -91,67 +104,122 @@ varList = [
 #################################################################################################
 ########## loop over events and fill histograms
 #################################################################################################
-def loopTree(sample, isMC):
-    
+def treeVariables():
+    treeVars = ['tag_Ele_pt','tag_sc_abseta','passingLoose80X','el_pt','el_sc_abseta',
+                'el_neuIso','el_phoIso','el_chIso',
+                'tag_Ele_q','el_q']
+    for var in varList:
+        if not var.varName() in treeVars: treeVars.append(var.varName())
+    return treeVars
+
+
+def histName(iepoch, isMC, ih):
+    ### histogram names do not depend on the order the chunks are processed
+    ### (same names as when running the epochs, data then MC, in sequence)
+    return 'h_%s_%d' % (varList[ih].varName(), (2*iepoch+isMC)*len(varList)+ih)
+
+
+def histogramList(iepoch, isMC):
+    histList = []
+    for ih in range(len(varList)):
+        hist = copy.deepcopy(varList[ih])
+        hist.set_hname( histName(iepoch,isMC,ih) )
+        histList.append( hist )
+    return histList
+
 
-    tree = rt.TChain(treename)
+def prepareSample(sample, isMC):
+    ### tree and weight to read for the sample (local skim if skimCacheDir is set)
+    sampleTree = treename
+    weightVar  = 'totWeight'
+    if not skimCacheDir is None:
+        import libPython.skimUtils as tnpSkim
+        ### same pre-selection as in the event loop below, which does not apply sample.cut
+        ### (the skim would apply it)
+        sampleNoCut = sample.clone()
+        sampleNoCut.cut = None
+        sample = tnpSkim.skimSample( sampleNoCut, skimCacheDir, treeVariables(), treeName = treename,
+                                     preCut = 'tag_Ele_pt >= 35 && el_pt >= 20 && el_q*tag_Ele_q <= 0' )
+        sampleTree = sample.tree
+        if isMC: weightVar = sample.weight
+    return sample, sampleTree, weightVar
+
+
+def sampleChain(sample, sampleTree):
+    tree = rt.TChain(sampleTree)
     for p in sample.path:
-        print ' adding rootfile: ', p
         tree.Add(p)
 
-    friendTreeName=''
     if not sample.puTree is None:
         print ' - Adding weight tree: %s from file %s ' % (sample.weight.split('.')[0], sample.puTree)
-        friendTreeName = sample.weight.split('.')[0]
         tree.AddFriend(sample.weight.split('.')[0],sample.puTree)
+    return tree
 
-    print "friendTreeName is ", friendTreeName
 
-   
-    if(isMC):
-        friendTree = tree.GetFriend(friendTreeName)
-    
-    treeVars = ['tag_Ele_pt','tag_sc_abseta','passingLoose80X','el_pt','el_sc_abseta',
-                'el_neuIso','el_phoIso','el_chIso',
-                'tag_Ele_q','el_q']
-    histList = []
-    for var in varList:
-        if not var.varName() in treeVars: treeVars.append(var.varName())
-        histList.append( copy.deepcopy(var) )
-
-    if isMC: treeVars.append('totWeight')
+def loopTree(sample, isMC, histList, sampleTree = treename, weightVar = 'totWeight', start = None, stop = None):
+    ### fill the histograms with the entries [start,stop[ of the sample
+    treeVars = treeVariables()
+    tree = sampleChain( sample, sampleTree )
+    if isMC: treeVars.append(weightVar)
         
-    print 'Getting vars: '
-    print treeVars
 #    tree.Print('toponly')
-    events = tree2array( tree, branches = treeVars )
+    events = tree2array( tree, branches = treeVars, start = start, stop = stop )
 
-    nentries = 100000
     nentries = len(events)
-    print 'Nentries: ', nentries
-    for ev in range(nentries):
-        if ev % 100000 == 0 : print ' Nevts: ', ev
-            
-        # combinedProbeIso   = (el_neuIso+el_phoIso+el_chIso)/el_pt
-
-#        print "tag pt : mass : combinedIso ", tag_Ele_pt, " ",pair_mass, " ", combinedTagIso
-        evt = events[ev]
-        if evt['tag_Ele_pt'] < 35 : continue
-        if evt['el_pt']      < 20 : continue
-        if evt['el_q'] * evt['tag_Ele_q'] > 0 : continue
-            
-       # if int(evt['passingLoose80X']) == 0 : continue
-
-        weight = 1
-        if isMC : weight = evt['totWeight']
-        for hist in histList:
-            if   hist.cut is None:
-                hist.get_hist().Fill( evt[hist.var], weight )
-            elif hist.cut == 'EB' and evt['el_sc_abseta'] < 1.479 :
-                hist.get_hist().Fill( evt[hist.var], weight )
-            elif hist.cut == 'EE' and evt['el_sc_abseta'] > 1.479 :
-                hist.get_hist().Fill( evt[hist.var], weight )
+    print 'Nentries: %d (from entry %s)' % (nentries, start)
+
+    ### event selection and EB/EE as masks on the full arrays
+    selection = ( events['tag_Ele_pt'] >= 35 ) & ( events['el_pt'] >= 20 ) & ( events['el_q'] * events['tag_Ele_q'] <= 0 )
+#    selection = selection & ( events['passingLoose80X'] != 0 )
+    print ' Nevts selected: ', np.count_nonzero(selection)
+
+    weights = np.ones( nentries )
+    if isMC : weights = events[weightVar].astype(np.float64)
+    regions = {
+        None : selection,
+        'EB' : selection & ( events['el_sc_abseta'] < 1.479 ),
+        'EE' : selection & ( events['el_sc_abseta'] > 1.479 ),
+        }
+
+    ### one FillN per histogram
+    for hist in histList:
+        mask = regions[hist.cut]
+        values = np.ascontiguousarray( events[hist.var][mask], dtype = np.float64 )
+        w      = np.ascontiguousarray( weights[mask]         , dtype = np.float64 )
+        h = hist.get_hist()
+        if values.size > 0:
+            h.FillN( values.size, values, w )
+
+    return histList
+
 
+def histArrays(h):
+    ### bin contents (with under/overflow), sum of weights^2 and entries of a histogram
+    ncells = h.GetNcells()
+    return [ np.array( [ h.GetBinContent(i) for i in range(ncells) ] ),
+             np.array( [ h.GetSumw2()[i]    for i in range(ncells) ] ),
+             h.GetEntries() ]
+
+
+def fillChunk(job):
+    ### worker: histograms of a chunk of entries of a sample, returned as arrays
+    iepoch, isMC, sample, sampleTree, weightVar, start, stop = job
+    histList = loopTree( sample, isMC, histogramList(iepoch,isMC), sampleTree, weightVar, start, stop )
+    return iepoch, isMC, [ histArrays(hist.get_hist()) for hist in histList ]
+
+
+def mergedHistograms(iepoch, isMC, arrays):
+    ### histograms with the sum of the chunks
+    histList = histogramList(iepoch,isMC)
+    if arrays is None:
+        return histList
+    for ih in range(len(histList)):
+        content, sumw2, entries = arrays[ih]
+        h = histList[ih].get_hist()
+        h.SetContent( content )
+        h.GetSumw2().Set( sumw2.size, sumw2 )
+        h.ResetStats()
+        h.SetEntries( entries )
     return histList
 
 ######For drawing purpose
@@ -246,58 +314,95 @@ def getRatioPlot(histData,histMC ):
 
 
 #################################################################################################
-########## main 
+########## render the data/MC plots from the histogram files
 #################################################################################################
-for epoch in  epochs:
-
-    histListData = loopTree(dataSamples[epoch],0) 
-    histListMC   = loopTree(mcSamples[epoch]  ,1)
-    
-
-    os.system("mkdir -p "+ outputdir + '/' + epoch + '/linear/' )
-    os.system("mkdir -p "+ outputdir + '/' + epoch + '/log/' )
-    fileoutMC   = rt.TFile( outputdir + "/histoMC_%s.root"   %(epoch), "RECREATE")
-    fileoutData = rt.TFile( outputdir + "/histoData_%s.root" %(epoch), "RECREATE")
-
-
-    for ih in range(len(histListMC)):
-        histMC   = histListMC[ih].get_hist()
-        histData = histListData[ih].get_hist()
-        ####save the hists first in a root file which can be used later###
-        fileoutMC.cd()
-        histMC.Write()
-        
-        fileoutData.cd()
-        histData.Write()
-
-        #####linear plots
-        c,pad1,pad2 = setCanvas()
-
-
-        histMC.SetFillColor(rt.kOrange-2)
-        histMC.SetLineColor(rt.kOrange-2)
-        
-        histData.SetLineWidth(2)
-        histData.SetMarkerStyle(20)
-        histData.SetLineColor(1)
-
-        print "Data integral ",histData.Integral()
-        print "MC integral ",histMC.Integral()
-        if not (histMC.Integral() == 0):
-            scale = histData.Integral()/histMC.Integral()
-        
-        if(histMC.Integral() == 0):               
-           print "hist: ",histMC.GetName(), " MC integral is 0 so not plotting"
-           continue
-           
-        histMC.Scale(scale)
+def histFileName(epoch, isMC):
+    if isMC: return outputdir + "/histoMC_%s.root"   %(epoch)
+    return          outputdir + "/histoData_%s.root" %(epoch)
+
+
+### canvas and opened files kept by each rendering process
+renderCanvas = []
+renderFiles  = {}
+
+def renderHist(filename, hname):
+    if not renderFiles.has_key(filename):
+        renderFiles[filename] = rt.TFile(filename,'read')
+    hist = renderFiles[filename].Get(hname)
+    if not hist:
+        return None
+    hist = hist.Clone()
+    hist.SetDirectory(0)
+    return hist
+
+
+def renderPlots(job):
+    ### linear and log plots of variable ih of an epoch, returns the number of plots redone
+    iepoch, ih = job
+    epoch   = epochs[iepoch]
+    pngname = "%s.png" % (varList[ih].title)
+    pngs    = [ outputdir + '/' + epoch + '/linear/' + pngname, outputdir + '/' + epoch + '/log/' + pngname ]
+
+    ### plots newer than their histograms (and than this script) are kept
+    inputs = [ histFileName(epoch,0), histFileName(epoch,1), os.path.abspath(__file__) ]
+    if not args.forcePlot and all( os.path.isfile(png) for png in pngs ):
+        if min( [ os.path.getmtime(png) for png in pngs ] ) > max( [ os.path.getmtime(f) for f in inputs ] ):
+            return 0
+
+    histData = renderHist( histFileName(epoch,0), histName(iepoch,0,ih) )
+    histMC   = renderHist( histFileName(epoch,1), histName(iepoch,1,ih) )
+    if histData is None or histMC is None:
+        print "hist: ", histName(iepoch,1,ih), " not found for %s, not plotting" % epoch
+        return 0
+
+    if len(renderCanvas) == 0:
+        rt.gROOT.SetBatch(True)
+        renderCanvas.extend( setCanvas() )
+    c,pad1,pad2 = renderCanvas
+
+    histMC.SetFillColor(rt.kOrange-2)
+    histMC.SetLineColor(rt.kOrange-2)
         
+    histData.SetLineWidth(2)
+    histData.SetMarkerStyle(20)
+    histData.SetLineColor(1)
+
+    print "Data integral ",histData.Integral()
+    print "MC integral ",histMC.Integral()
+    if(histMC.Integral() == 0):               
+        print "hist: ",histMC.GetName(), " MC integral is 0 so not plotting"
+        return 0
+    scale = histData.Integral()/histMC.Integral()
+    histMC.Scale(scale)
+
+    hratio = getRatioPlot(histData,histMC)
+    hratio.SetTitle('')
+    xlow  = histData.GetXaxis().GetXmin()
+    xhigh = histData.GetXaxis().GetXmax()
+    l = rt.TLine(xlow,1.,xhigh,1.)
+    l.SetLineColor(2)
+    l.SetLineStyle(2)
+    l.SetLineWidth(2)
+
+    leg = setLegend()        
+    leg.AddEntry(histData,"Data","P")
+    leg.AddEntry(histMC, "Z#rightarrow ee (MC)","f")
+
+    #####linear and log plots
+    for logy in [ 0, 1 ]:
+        pad1.Clear()
+        pad2.Clear()
         pad1.cd()
+        pad1.SetLogy(logy)
         gStyle.SetOptStat(0)
         histMC.GetXaxis().SetLabelSize(0)
         histMC.GetXaxis().SetTitleSize(0)
-        histMC.SetMinimum(0)
         histMC.GetYaxis().SetTitle('Events')
+        if logy:
+            histMC.SetMinimum(0.1)
+            histData.SetMinimum(0.1)
+        else:
+            histMC.SetMinimum(0)
         histMC.DrawCopy('hist')
         histData.DrawCopy('same e')
         c.Update()
@@ -305,60 +410,67 @@ for epoch in  epochs:
         #iPeriod = 2
         #iPos = 11
         CMS_lumi.CMS_lumi(pad1, iPeriod, iPos)
-
-        leg = setLegend()        
-        leg.AddEntry(histData,"Data","P")
-        leg.AddEntry(histMC, "Z#rightarrow ee (MC)","f")
         leg.Draw()
         pad1.Update()
 
-        tex = rt.TLatex(0.4,0.85,"Z#rightarrow ee")
-        tex.SetNDC()
-        tex.SetLineWidth(2)
-#        tex.Draw()
-
         pad2.cd()        
-        hratio = getRatioPlot(histData,histMC)
-        hratio.SetTitle('')
         hratio.DrawCopy("E1")
-
-        xlow  = histData.GetXaxis().GetXmin()
-        xhigh = histData.GetXaxis().GetXmax()
-
-        l = rt.TLine(xlow,1.,xhigh,1.)
-        l.SetLineColor(2)
-        l.SetLineStyle(2)
-        l.SetLineWidth(2)
         l.Draw("sames")
         c.Update()
-        
-        pngname = "%s.png" % (histData.GetTitle())
-        print("png name is ",pngname)
-        c.Print( outputdir + '/' + epoch + '/linear/' + pngname )
 
-        ######log plots
-        c,pad1,pad2 = setCanvas()
-        pad1.cd()
-        pad1.SetLogy()
-        histMC.SetMinimum(0.1)
-        histData.SetMinimum(0.1)
-        histMC.DrawCopy('hist')
-        histData.DrawCopy('same e')
-        CMS_lumi.CMS_lumi(pad1, iPeriod, iPos)
-        leg.Draw()
-        
-        pad2.cd()
-        hratio.DrawCopy("E1")
-        l.Draw("sames")
+        print("png name is ",pngs[logy])
+        c.Print( pngs[logy] )
+    return 2
 
-        c.Update()
-        c.Print( outputdir + '/' + epoch + '/log/' + pngname )            
-        ###### end of log plots
-        
 
-    fileoutMC.Write()
-    fileoutData.Write()
-    fileoutMC.Close()
-    fileoutData.Close()
-    
-######end of the function        
+#################################################################################################
+########## main 
+#################################################################################################
+if not args.plotOnly:
+    ### data and MC of all the epochs are read in chunks of entries by a pool of processes
+    jobs = []
+    for iepoch in range(len(epochs)):
+        for isMC, samples in [ (0,dataSamples), (1,mcSamples) ]:
+            sample, sampleTree, weightVar = prepareSample( samples[epochs[iepoch]], isMC )
+            nentries = sampleChain( sample, sampleTree ).GetEntries()
+            print ' %s (%s): %d entries' % (epochs[iepoch], ['data','MC'][isMC], nentries)
+            for start in range(0,nentries,chunkSize):
+                jobs.append( (iepoch, isMC, sample, sampleTree, weightVar, start, min(start+chunkSize,nentries)) )
+    print ' ===> %d chunks of up to %d entries' % (len(jobs),chunkSize)
+
+    ### partial histograms are summed as soon as a chunk is done
+    histSums = {}
+    pool = Pool(nJobs)
+    for iepoch, isMC, arrays in pool.imap_unordered( fillChunk, jobs ):
+        if not histSums.has_key( (iepoch,isMC) ):
+            histSums[(iepoch,isMC)] = arrays
+            continue
+        for ih in range(len(arrays)):
+            for ia in range(3):
+                histSums[(iepoch,isMC)][ih][ia] += arrays[ih][ia]
+    pool.close()
+    pool.join()
+
+    ####save the hists in root files used by the plots
+    os.system("mkdir -p "+ outputdir )
+    for iepoch in range(len(epochs)):
+        for isMC in [ 0, 1 ]:
+            histList = mergedHistograms( iepoch, isMC, histSums.get( (iepoch,isMC) ) )
+            fileout = rt.TFile( histFileName( epochs[iepoch], isMC ), "RECREATE")
+            for hist in histList:
+                hist.get_hist().Write()
+            fileout.Close()
+
+### plots of all variables and epochs, made from the root files only
+renderJobs = []
+for iepoch in range(len(epochs)):
+    os.system("mkdir -p "+ outputdir + '/' + epochs[iepoch] + '/linear/' )
+    os.system("mkdir -p "+ outputdir + '/' + epochs[iepoch] + '/log/' )
+    for ih in range(len(varList)):
+        renderJobs.append( (iepoch, ih) )
+
+pool = Pool(nJobs)
+nPlotted = sum( pool.map( renderPlots, renderJobs ) )
+pool.close()
+pool.join()
+print ' ===> %d/%d plots redone in %s' % (nPlotted, len(renderJobs), outputdir)
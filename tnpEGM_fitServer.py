@@ -0,0 +1,259 @@
+
+### python specific import
+import argparse
+import os
+import sys
+import importlib
+import traceback
+import json
+from multiprocessing import Pool
+
+
+parser = argparse.ArgumentParser(description='tnp EGM fit server: run all the fits of several flags with a single pool of workers')
+parser.add_argument('--flags'      , nargs = '+'          , default = None, help = 'WPs to fit (default: all the flags with a bining)')
+parser.add_argument('--steps'      , nargs = '+'          , default = ['mcNominal','mcAltSig','mcAltBkg','nominal','altSig','altBkg'],
+                    choices = ['mcNominal','mcAltSig','mcAltBkg','nominal','altSig','altBkg'], help = 'fits to run')
+parser.add_argument('--addGaus'    , action='store_true'  , help = 'add gaussian to alternate signal model failing probe')
+parser.add_argument('--forceFit'   , action='store_true'  , help = 'refit all bins, even if their inputs did not change')
+parser.add_argument('--noWarmStart', action='store_true'  , help = 'do not start the data fits from the MC fit results')
+parser.add_argument('--analyticConv', action='store_true' , help = 'nominal fit: analytic gaussian x Z line-shape convolution instead of FFT')
+parser.add_argument('--simFit'     , action='store_true'  , help = 'fit pass and fail simultaneously, with the efficiency as fit parameter')
+parser.add_argument('--simFitShared', nargs = '*'        , default = [], help = 'parameters shared by pass and fail in the simultaneous fit (e.g. mean sigma)')
+parser.add_argument('--noPlot'     , action='store_true'  , help = 'fit without plots (canvases made later by tnpEGM_fitter.py --doPlot)')
+parser.add_argument('--triage'     , action='store_true'  , help = 'check the fits after each phase and refit the bad bins with other strategies')
+parser.add_argument('--maxRetries' , type = int, default = 6     , help = 'triage: maximum number of strategies tried per bad bin')
+parser.add_argument('--maxChi2'    , type = float, default = 3.  , help = 'triage: maximum chi2/ndf of a good fit')
+parser.add_argument('--minCovQual' , type = int, default = 3     , help = 'triage: minimum covariance matrix quality of a good fit')
+parser.add_argument('--triageReport', default = 'fitTriage.json' , help = 'triage: json report')
+parser.add_argument('-j'           , dest = 'nJobs'       , type = int,  default=None, help='number of worker processes (default: all cores)')
+parser.add_argument('settings'     , nargs = '+'          , help = 'setting file(s) [mandatory]')
+
+args = parser.parse_args()
+
+
+####################################################################
+##### settings and samples, cached in each worker
+####################################################################
+settingsCache = {}
+def loadSettings( settings ):
+    if not settings in settingsCache:
+        settingsCache[settings] = importlib.import_module( settings.replace('/','.').split('.py')[0] )
+    return settingsCache[settings]
+
+binsCache = {}
+def loadBins( settings, flag ):
+    if not (settings,flag) in binsCache:
+        tnpConf = loadSettings(settings)
+        binsCache[(settings,flag)] = tnpBiner.loadBining( '%s/%s' % (tnpConf.baseOutDir,flag) )
+    return binsCache[(settings,flag)]
+
+def flagSample( tnpConf, flag, sampleType ):
+    ### same file names as in tnpEGM_fitter.py (samples are cloned as they are shared by all flags)
+    outputDirectory = '%s/%s/' % (tnpConf.baseOutDir,flag)
+    sample = tnpConf.samplesDef[sampleType].clone()
+    setattr( sample, 'tree'      , '%s/fitter_tree' % tnpConf.tnpTreeDir )
+    setattr( sample, 'histFile'  , '%s/%s_%s.root' % ( outputDirectory , sample.name, flag ) )
+    setattr( sample, 'nominalFit', '%s/%s_%s.nominalFit.root' % ( outputDirectory , sample.name, flag ) )
+    setattr( sample, 'altSigFit' , '%s/%s_%s.altSigFit.root'  % ( outputDirectory , sample.name, flag ) )
+    setattr( sample, 'altBkgFit' , '%s/%s_%s.altBkgFit.root'  % ( outputDirectory , sample.name, flag ) )
+    return sample
+
+def fitSamples( tnpConf, flag ):
+    sampleData = flagSample( tnpConf, flag, 'data'  )
+    sampleMC   = flagSample( tnpConf, flag, 'mcNom' )
+    setattr( sampleData, 'mcRef', sampleMC )
+    setattr( sampleMC  , 'mcRef', sampleMC )
+    return sampleData, sampleMC
+
+
+####################################################################
+##### the ROOT macros are compiled and loaded once, before forking
+####################################################################
+import libPython.rootUtils as tnpRoot
+import libPython.binUtils  as tnpBiner
+import libPython.fitTriage as tnpTriage
+
+def runFit( settings, flag, step, ib, useCache, warmStart = True, strategy = {}, keyOnly = False ):
+    ### fit of one bin, returns the fit objects (None if the fit is cached, its cache key with keyOnly)
+    tnpConf = loadSettings( settings )
+    tnpBin  = loadBins( settings, flag )['bins'][ib]
+    sampleData, sampleMC = fitSamples( tnpConf, flag )
+    warmStartBins = None
+    if warmStart:
+        warmStartBins = [ tnpBin ] + tnpBiner.neighbourBins( loadBins( settings, flag ), ib )
+
+    ### parameter lists are copied: the altSig fit modifies them
+    if   step in ['mcNominal','nominal']:
+        sample = sampleMC if step == 'mcNominal' else sampleData
+        return tnpRoot.histFitterNominal( sample, tnpBin, tnpTriage.strategyParams( tnpConf.tnpParNomFit, strategy, ib ), useCache = useCache, inMemory = True, warmStartBins = warmStartBins,
+                                          analyticConv = args.analyticConv, simFit = args.simFit, sharedPars = args.simFitShared, useMinos = strategy.get('minos',True), doPlot = not args.noPlot, keyOnly = keyOnly )
+    elif step in ['mcAltBkg','altBkg']:
+        sample = sampleMC if step == 'mcAltBkg' else sampleData
+        return tnpRoot.histFitterAltBkg(  sample, tnpBin, tnpTriage.strategyParams( tnpConf.tnpParAltBkgFit, strategy, ib ), useCache = useCache, inMemory = True, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot, keyOnly = keyOnly )
+    elif step in ['mcAltSig','altSig']:
+        sample = sampleMC if step == 'mcAltSig' else sampleData
+        if args.addGaus:
+            return tnpRoot.histFitterAltSig( sample, tnpBin, tnpTriage.strategyParams( tnpConf.tnpParAltSigFit_addGaus, strategy, ib ), 1, useCache = useCache, inMemory = True, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot, keyOnly = keyOnly )
+        else:
+            return tnpRoot.histFitterAltSig( sample, tnpBin, tnpTriage.strategyParams( tnpConf.tnpParAltSigFit, strategy, ib ), useCache = useCache, inMemory = True, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot, keyOnly = keyOnly )
+
+def runFitJob( job ):
+    ### the fits are returned to the server, which writes them in the merged files
+    settings, flag, step, ib = job
+    fitResult = None
+    try:
+        fitResult = runFit( settings, flag, step, ib, not args.forceFit, not args.noWarmStart )
+    except Exception:
+        return (job, traceback.format_exc(), None)
+    return (job, None, fitResult)
+
+def runTriageJob( job ):
+    ### refits a bad bin with escalating strategies, returns the best fit (None: keep the current one)
+    ### and the list of attempts [{'strategy', 'issues', 'chi2P', 'chi2F'}]
+    settings, flag, step, ib, nIssues = job
+    tnpBin = loadBins( settings, flag )['bins'][ib]
+    attempts  = []
+    bestFit   = None
+    try:
+        ### the next runs compare their key to the one of the nominal configuration
+        nominalKey = runFit( settings, flag, step, ib, False, not args.noWarmStart, keyOnly = True )
+        for strategy in tnpTriage.triageStrategies[:args.maxRetries]:
+            if   'minos'     in strategy and not step in ['mcNominal','nominal']: continue
+            elif 'warmStart' in strategy and ( step.startswith('mc') or not args.noWarmStart ): continue
+            fitResult = runFit( settings, flag, step, ib, False, not args.noWarmStart or 'warmStart' in strategy, strategy )
+            quality = tnpTriage.fitQuality( fitResult, tnpBin, args.maxChi2, args.minCovQual )
+            quality['strategy'] = strategy['name']
+            attempts.append( quality )
+            if len(quality['issues']) < nIssues:
+                bestFit = fitResult
+                nIssues = len(quality['issues'])
+            if nIssues == 0: break
+        if not bestFit is None:
+            tnpRoot.setFitKey( bestFit, tnpBin, nominalKey )
+    except Exception:
+        return (job, traceback.format_exc(), bestFit, attempts)
+    return (job, None, bestFit, attempts)
+
+def fitFileName( settings, flag, step ):
+    tnpConf = loadSettings( settings )
+    sampleData, sampleMC = fitSamples( tnpConf, flag )
+    if   step == 'nominal'  : return sampleData.nominalFit
+    elif step == 'altBkg'   : return sampleData.altBkgFit
+    elif step == 'altSig'   : return sampleData.altSigFit
+    elif step == 'mcNominal': return sampleMC.nominalFit
+    elif step == 'mcAltSig' : return sampleMC.altSigFit
+    elif step == 'mcAltBkg' : return sampleMC.altBkgFit
+
+
+####################################################################
+##### list the jobs
+####################################################################
+flagsToFit = []
+for settings in args.settings:
+    print('===> settings %s <===' % settings)
+    tnpConf = loadSettings( settings )
+    if tnpConf.samplesDef['data'] is None or tnpConf.samplesDef['mcNom'] is None:
+        print('[tnpEGM_fitServer, prelim checks]: data or MC sample not available... check your settings')
+        sys.exit(1)
+
+    flags = args.flags
+    if flags is None:
+        flags = sorted(tnpConf.flags.keys())
+    for flag in flags:
+        if not flag in tnpConf.flags.keys():
+            print('  --> skipping flag %s: not found in flags definitions' % flag)
+            continue
+        if not tnpBiner.biningExists( '%s/%s' % (tnpConf.baseOutDir,flag) ):
+            print('  --> skipping flag %s: no bining found (run --createBins and --createHists first)' % flag)
+            continue
+        flagsToFit.append( (settings,flag) )
+
+### the data fits use the merged MC fits (altSig: parameters constrained by the
+### MC fit, nominal and altBkg: warm start), so they run in a second phase
+phases = [ [ step for step in ['mcNominal','mcAltSig','mcAltBkg'] if step in args.steps ],
+           [ step for step in ['nominal','altSig','altBkg'] if step in args.steps ] ]
+
+
+####################################################################
+##### run the phases with the same pool of workers
+####################################################################
+pool = Pool( args.nJobs )
+failedJobs = []
+triageReport = {}
+for steps in phases:
+    if len(steps) == 0: continue
+    jobs = []
+    for settings, flag in flagsToFit:
+        nbins = len( loadBins( settings, flag )['bins'] )
+        for step in steps:
+            for ib in range(nbins):
+                jobs.append( (settings, flag, step, ib) )
+
+    print(' ======== Fitting: %s (%d jobs) ========' % (', '.join(steps), len(jobs)))
+    fitResults = {}
+    for job, error, fitResult in pool.imap_unordered( runFitJob, jobs ):
+        if not error is None:
+            print('[tnpEGM_fitServer] fit %s failed:' % str(job))
+            print(error)
+            failedJobs.append( job )
+        fitResults.setdefault( job[:3], [] ).append( fitResult )
+
+    ### one merged file per flag and fit
+    for settings, flag in flagsToFit:
+        for step in steps:
+            tnpRoot.writeFitResults( fitFileName( settings, flag, step ), fitResults.get( (settings,flag,step), [] ) )
+
+    if not args.triage: continue
+
+    ### triage: only the bad bins are refitted, before the next phase uses them
+    jobs = []
+    for settings, flag in flagsToFit:
+        bins = loadBins( settings, flag )['bins']
+        for step in steps:
+            fitFile = fitFileName( settings, flag, step )
+            for ib in range(len(bins)):
+                quality = tnpTriage.fitQuality( tnpTriage.readFitObjects( fitFile, bins[ib] ), bins[ib], args.maxChi2, args.minCovQual )
+                binReport = { 'issues': quality['issues'], 'chi2P': quality['chi2P'], 'chi2F': quality['chi2F'],
+                              'attempts': [], 'status': 'good' }
+                triageReport.setdefault( settings, {} ).setdefault( flag, {} ).setdefault( step, {} )[bins[ib]['name']] = binReport
+                if len(quality['issues']) > 0:
+                    binReport['status'] = 'bad'
+                    jobs.append( (settings, flag, step, ib, len(quality['issues'])) )
+
+    print(' ======== Triage: %s (%d bad bins) ========' % (', '.join(steps), len(jobs)))
+    fitResults = {}
+    for job, error, fitResult, attempts in pool.imap_unordered( runTriageJob, jobs ):
+        settings, flag, step, ib, nIssues = job
+        binReport = triageReport[settings][flag][step][loadBins( settings, flag )['bins'][ib]['name']]
+        binReport['attempts'] = attempts
+        if not error is None:
+            print('[tnpEGM_fitServer] refit %s failed:' % str(job))
+            print(error)
+            binReport['error'] = error
+        if not fitResult is None:
+            ### the refit kept is the first one with the fewest issues
+            best = min( attempts, key = lambda attempt: len(attempt['issues']) )
+            binReport['status']   = 'fixed' if len(best['issues']) == 0 else 'improved'
+            binReport['strategy'] = best['strategy']
+        fitResults.setdefault( job[:3], [] ).append( fitResult )
+
+    for settings, flag in flagsToFit:
+        for step in steps:
+            tnpRoot.writeFitResults( fitFileName( settings, flag, step ), fitResults.get( (settings,flag,step), [] ) )
+
+pool.close()
+pool.join()
+
+if args.triage:
+    json.dump( triageReport, open( args.triageReport, 'w' ), indent = 2, sort_keys = True )
+    print(' ======== triage report in %s ========' % args.triageReport)
+    for settings in sorted( triageReport.keys() ):
+        for flag in sorted( triageReport[settings].keys() ):
+            for step in sorted( triageReport[settings][flag].keys() ):
+                status = [ b['status'] for b in triageReport[settings][flag][step].values() ]
+                print('  %s %s %-8s: %d bad, %d fixed, %d improved' % (settings, flag, step, status.count('bad'), status.count('fixed'), status.count('improved')))
+
+print(' ======== %d failed fit(s) ========' % len(failedJobs))
+for job in failedJobs:
+    print('  %s' % str(job))
+print('plots and efficiencies: python tnpEGM_fitter.py <settings> --flag <flag> [--mcSig] [--altSig|--altBkg] --doPlot / --sumUp')
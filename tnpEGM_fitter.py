@@ -3,7 +3,6 @@
 import argparse
 import os
 import sys
-import pickle
 import shutil
 from multiprocessing import Pool
 
@@ -12,13 +11,26 @@ parser = argparse.ArgumentParser(description='tnp EGM fitter')
 parser.add_argument('--checkBins'  , action='store_true'  , help = 'check  bining definition')
 parser.add_argument('--createBins' , action='store_true'  , help = 'create bining definition')
 parser.add_argument('--createHists', action='store_true'  , help = 'create histograms')
+parser.add_argument('--allFlags'   , action='store_true'  , help = 'create histograms for all flags in a single pass (with --createHists)')
 parser.add_argument('--sample'     , default='all'        , help = 'create histograms (per sample, expert only)')
+parser.add_argument('-j'           , dest = 'nJobs'       , type = int,  default=1, help='number of processes to create histograms (with --createHists)')
+parser.add_argument('--histEngine' , default = 'cython'   , choices = ['cython','rdf','draw'], help = 'backend to create histograms (with --createHists)')
+parser.add_argument('--skimCache'  , default = None       , help = 'directory of the local skims of the samples (with --createHists)')
 parser.add_argument('--altSig'     , action='store_true'  , help = 'alternate signal model fit')
 parser.add_argument('--addGaus'    , action='store_true'  , help = 'add gaussian to alternate signal model failing probe')
 parser.add_argument('--altBkg'     , action='store_true'  , help = 'alternate background model fit')
 parser.add_argument('--doFit'      , action='store_true'  , help = 'fit sample (sample should be defined in settings.py)')
+parser.add_argument('--forceFit'   , action='store_true'  , help = 'refit all bins, even if their inputs did not change (with --doFit)')
+parser.add_argument('--noWarmStart', action='store_true'  , help = 'do not start the data fits from the MC fit results (with --doFit)')
+parser.add_argument('--analyticConv', action='store_true' , help = 'nominal fit: analytic gaussian x Z line-shape convolution instead of FFT (with --doFit)')
+parser.add_argument('--checkConv'  , action='store_true'  , help = 'fit one bin (--iBin, 0 by default) with the FFT and analytic convolutions and compare the signal yields and efficiency')
+parser.add_argument('--simFit'     , action='store_true'  , help = 'fit pass and fail simultaneously, with the efficiency as fit parameter (with --doFit)')
+parser.add_argument('--simFitShared', nargs = '*'        , default = [], help = 'parameters shared by pass and fail in the simultaneous fit (e.g. mean sigma)')
 parser.add_argument('--mcSig'      , action='store_true'  , help = 'fit MC nom [to init fit parama]')
 parser.add_argument('--doPlot'     , action='store_true'  , help = 'plotting')
+parser.add_argument('--plotFormats', nargs = '+'          , default = ['png'], help = 'formats of the fit plots (e.g. png pdf svg)')
+parser.add_argument('--noPlot'     , action='store_true'  , help = 'fit without plots, the canvases are made later with --doPlot (with --doFit)')
+parser.add_argument('--forcePlot'  , action='store_true'  , help = 'redo all the plots, even if they are newer than the fits')
 parser.add_argument('--sumUp'      , action='store_true'  , help = 'sum up efficiencies')
 parser.add_argument('--iBin'       , dest = 'binNumber'   , type = int,  default=-1, help='bin number (to refit individual bin)')
 parser.add_argument('--flag'       , default = None       , help ='WP to test')
@@ -69,15 +81,14 @@ if args.createBins:
     if os.path.exists( outputDirectory ):
             shutil.rmtree( outputDirectory )
     os.makedirs( outputDirectory )
-    tnpBins = tnpBiner.createBins(tnpConf.biningDef,tnpConf.cutBase)
-    tnpBiner.tuneCuts( tnpBins, tnpConf.additionalCuts )
-    pickle.dump( tnpBins, open( '%s/bining.pkl'%(outputDirectory),'wb') )
+    tnpBining = tnpBiner.compiledBining(tnpConf.biningDef,tnpConf.cutBase,tnpConf.additionalCuts)
+    tnpBining.save( '%s/bining.npz'%(outputDirectory) )
     print('created dir: %s ' % outputDirectory)
     print('bining created successfully... ')
     print('Note than any additional call to createBins will overwrite directory %s' % outputDirectory)
     sys.exit(0)
 
-tnpBins = pickle.load( open( '%s/bining.pkl'%(outputDirectory),'rb') )
+tnpBins = tnpBiner.loadBining( outputDirectory )
 
 
 ####################################################################
@@ -93,22 +104,105 @@ for s in tnpConf.samplesDef.keys():
 if args.createHists:
 
     print(" ======== Creating Histograms ========")
-    import libPython.histUtils as tnpHist
+    if args.histEngine == 'cython':
+        import libPython.histUtils as tnpHist
+    elif args.histEngine == 'rdf':
+        import libPython.histUtils_rdf as tnpHist
+
+    ### with --allFlags, all the flags sharing this bining are filled in the same event loop
+    flagsToFill = [args.flag]
+    if args.allFlags:
+        flagsToFill = []
+        for flag in tnpConf.flags.keys():
+            if not tnpBiner.biningExists( '%s/%s' % (tnpConf.baseOutDir,flag) ):
+                print('  --> skipping flag %s: no bining found (run --createBins for this flag first)' % flag)
+                continue
+            if tnpBiner.loadBining( '%s/%s' % (tnpConf.baseOutDir,flag) ) != tnpBins:
+                print('  --> skipping flag %s: bining differs from the one of flag %s' % (flag,args.flag))
+                continue
+            flagsToFill.append(flag)
+        print('  filling flags: %s' % ', '.join(flagsToFill))
+
+    var = { 'name' : 'pair_mass', 'nbins' : 80, 'min' : 50, 'max': 130 }
+    flagCuts = [ tnpConf.flags[flag] for flag in flagsToFill ]
+
+    def sampleHistFiles(sample):
+        return [ '%s/%s/%s_%s.root' % ( tnpConf.baseOutDir, flag, sample.name, flag ) for flag in flagsToFill ]
+
+    samplesToFill = []
+    for k in tnpConf.samplesDef.keys():
+        if tnpConf.samplesDef[k] is None : continue
+        if k == args.sample or args.sample == 'all' :
+            samplesToFill.append(k)
+
+    ### the skim keeps the branches of all the flags so that it can be reused for any flag
+    if not args.skimCache is None:
+        import libPython.skimUtils as tnpSkim
+        skimExpressions = [ b['cut'] for b in tnpBins['bins'] ] + list(tnpConf.flags.values()) + [ var['name'] ]
+        for k in samplesToFill:
+            tnpConf.samplesDef[k] = tnpSkim.skimSample( tnpConf.samplesDef[k], args.skimCache, skimExpressions, preCut = tnpConf.cutBase )
+
+    ### one TTree::Draw per bin and flag
+    def parallel_hists_draw(job):
+        sampleType, iflag = job
+        sample = tnpConf.samplesDef[sampleType]
+        flagSample = sample.clone()
+        flagSample.histFile = sampleHistFiles(sample)[iflag]
+        tnpRoot.makePassFailHistograms( flagSample, flagCuts[iflag], tnpBins, var )
 
     def parallel_hists(sampleType):
         sample =  tnpConf.samplesDef[sampleType]
-        if sample is None : return
-        if sampleType == args.sample or args.sample == 'all' :
+        print('creating histogram for sample ')
+        sample.dump()
+        if args.histEngine == 'draw':
+            for iflag in range(len(flagCuts)):
+                parallel_hists_draw( (sampleType,iflag) )
+        elif args.histEngine == 'rdf':
+            ### -j sets the number of threads of the event loop (default: all cores)
+            tnpHist.makePassFailHistogramsMultiFlag( sample, flagCuts, sampleHistFiles(sample), tnpBins, var,
+                                                     nThreads = args.nJobs if args.nJobs > 1 else 0 )
+        else:
+            tnpHist.makePassFailHistogramsMultiFlag( sample, flagCuts, sampleHistFiles(sample), tnpBins, var )
+
+    ### with -j N, each sample is split in N chunks of entries filled in parallel
+    ### and the partial histograms are summed before being written
+    def parallel_hists_chunk(job):
+        sampleType, chunk = job
+        return tnpHist.fillPassFailHistograms( tnpConf.samplesDef[sampleType], flagCuts, tnpBins, var,
+                                               chunk['firstEntry'], chunk['nEntries'], chunk['entriesPerPath'] )
+
+    if args.nJobs > 1 and args.histEngine == 'cython':
+        jobs = []
+        for k in samplesToFill:
             print('creating histogram for sample ')
-            sample.dump()
-            var = { 'name' : 'pair_mass', 'nbins' : 80, 'min' : 50, 'max': 130 }
-            if sample.mcTruth:
-                var = { 'name' : 'pair_mass', 'nbins' : 80, 'min' : 50, 'max': 130 }
-            tnpHist.makePassFailHistograms( sample, tnpConf.flags[args.flag], tnpBins, var )
-    
-    #pool = Pool()
-    #pool.map(parallel_hists, tnpConf.samplesDef.keys())
-    for k in tnpConf.samplesDef.keys(): parallel_hists(k)
+            tnpConf.samplesDef[k].dump()
+            for chunk in tnpHist.makeEntryChunks( tnpConf.samplesDef[k], args.nJobs ):
+                jobs.append( (k,chunk) )
+
+        pool = Pool(args.nJobs)
+        results = pool.map(parallel_hists_chunk, jobs)
+        pool.close()
+
+        for k in samplesToFill:
+            contents = tnpHist.mergePassFailContents( [ results[ij] for ij in range(len(jobs)) if jobs[ij][0] == k ] )
+            if contents is None:
+                print('  --> no entries found for sample %s' % k)
+                continue
+            tnpHist.writePassFailHistograms( sampleHistFiles(tnpConf.samplesDef[k]), tnpBins, var, contents )
+    elif args.nJobs > 1 and args.histEngine == 'draw':
+        ### with -j N, the samples and flags are drawn by N processes
+        jobs = []
+        for k in samplesToFill:
+            print('creating histogram for sample ')
+            tnpConf.samplesDef[k].dump()
+            for iflag in range(len(flagCuts)):
+                jobs.append( (k,iflag) )
+
+        pool = Pool(args.nJobs)
+        pool.map(parallel_hists_draw, jobs)
+        pool.close()
+    else:
+        for k in samplesToFill: parallel_hists(k)
 
     sys.exit(0)
 
@@ -140,47 +234,100 @@ for s in tnpConf.samplesDef.keys():
 if args.mcSig :
     sampleToFit = tnpConf.samplesDef['mcNom']
 
+fileName = sampleToFit.nominalFit
+fitType  = 'nominalFit'
+if args.altSig : 
+    fileName = sampleToFit.altSigFit
+    fitType  = 'altSigFit'
+if args.altBkg : 
+    fileName = sampleToFit.altBkgFit
+    fitType  = 'altBkgFit'
+
+if args.checkConv:
+    print(" ======== Checking the analytic convolution ========")
+    ### same bin, same starting values: only the convolution differs, nothing is written
+    tnpBin = tnpBins['bins'][max(args.binNumber,0)]
+    convFits = {}
+    for analyticConv in [ False, True ]:
+        convFits[analyticConv] = tnpRoot.histFitterNominal( sampleToFit, tnpBin, list(tnpConf.tnpParNomFit), useCache = False, inMemory = True, analyticConv = analyticConv,
+                                                            simFit = args.simFit, sharedPars = args.simFitShared, doPlot = False )
+    if not tnpRoot.compareFits( convFits[False], convFits[True], tnpBin, 'FFT', 'analytic' ):
+        sys.exit(1)
+    sys.exit(0)
+
 if  args.doFit:
     print(" ======== Fitting ========")
     sampleToFit.dump()
+    ### all bins: the workers return the fits, written by this process in a single file
+    ### one bin (--iBin): the fit is written in its own file, then copied in the merged file
+    inMemory = args.binNumber < 0
     def parallel_fit(ib):
         if (args.binNumber >= 0 and ib == args.binNumber) or args.binNumber < 0:
+            ### bins whose histograms and fit model did not change are not refitted
+            useCache = not args.forceFit
+            ### data fits start from the MC fit of the same bin, or of a neighbouring bin
+            warmStartBins = None
+            if not args.noWarmStart:
+                warmStartBins = [ tnpBins['bins'][ib] ] + tnpBiner.neighbourBins( tnpBins, ib )
             if args.altSig and not args.addGaus:
-                tnpRoot.histFitterAltSig(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltSigFit )
+                return tnpRoot.histFitterAltSig(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltSigFit, useCache = useCache, inMemory = inMemory, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot )
             elif args.altSig and args.addGaus:
-                tnpRoot.histFitterAltSig(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltSigFit_addGaus, 1)
+                return tnpRoot.histFitterAltSig(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltSigFit_addGaus, 1, useCache = useCache, inMemory = inMemory, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot )
             elif args.altBkg:
-                tnpRoot.histFitterAltBkg(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltBkgFit )
+                return tnpRoot.histFitterAltBkg(  sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParAltBkgFit, useCache = useCache, inMemory = inMemory, warmStartBins = warmStartBins, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot )
             else:
-                tnpRoot.histFitterNominal( sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParNomFit )
+                return tnpRoot.histFitterNominal( sampleToFit, tnpBins['bins'][ib], tnpConf.tnpParNomFit, useCache = useCache, inMemory = inMemory, warmStartBins = warmStartBins, analyticConv = args.analyticConv, simFit = args.simFit, sharedPars = args.simFitShared, doPlot = not args.noPlot )
+        return None
     pool = Pool()
-    pool.map(parallel_fit, range(len(tnpBins['bins'])))
+    fitResults = pool.map(parallel_fit, range(len(tnpBins['bins'])))
+    pool.close()
+
+    if inMemory:
+        tnpRoot.writeFitResults( fileName, fitResults )
+    elif os.path.exists( tnpRoot.binFitFile( fileName, tnpBins['bins'][args.binNumber] ) ):
+        tnpRoot.mergeBinFitFile( fileName, tnpBins['bins'][args.binNumber] )
 
-    args.doPlot = True
+    if not args.noPlot:
+        args.doPlot = True
      
 ####################################################################
 ##### dumping plots
 ####################################################################
 if  args.doPlot:
-    fileName = sampleToFit.nominalFit
-    fitType  = 'nominalFit'
-    if args.altSig : 
-        fileName = sampleToFit.altSigFit
-        fitType  = 'altSigFit'
-    if args.altBkg : 
-        fileName = sampleToFit.altBkgFit
-        fitType  = 'altBkgFit'
-        
-    os.system('hadd -f %s %s' % (fileName, fileName.replace('.root', '-*.root')))
+    ### fits made only with one file per bin (older outputs): merge them
+    if not os.path.exists( fileName ):
+        os.system('hadd -f %s %s' % (fileName, fileName.replace('.root', '-*.root')))
 
     plottingDir = '%s/plots/%s/%s' % (outputDirectory,sampleToFit.name,fitType)
     if not os.path.exists( plottingDir ):
         os.makedirs( plottingDir )
     shutil.copy('etc/inputs/index.php.listPlots','%s/index.php' % plottingDir)
 
+    binsToPlot = []
     for ib in range(len(tnpBins['bins'])):
         if (args.binNumber >= 0 and ib == args.binNumber) or args.binNumber < 0:
-            tnpRoot.histPlotter( fileName, tnpBins['bins'][ib], plottingDir )
+            binsToPlot.append( tnpBins['bins'][ib] )
+
+    ### bins fitted with --noPlot: the canvases are made from the stored workspaces
+    binsToRender = tnpRoot.canvasesToRender( fileName, binsToPlot )
+    if len(binsToRender) > 0:
+        print(' - %d canvas(es) to make from the fit workspaces' % len(binsToRender))
+        def parallel_render(tnpBin):
+            return tnpRoot.renderFitCanvas( fileName, tnpBin )
+        pool = Pool()
+        canvases = pool.map(parallel_render, binsToRender)
+        pool.close()
+        tnpRoot.writeFitResults( fileName, canvases )
+    ### plots newer than their fit are kept
+    if not args.forcePlot and args.binNumber < 0:
+        binsToPlot = tnpRoot.plotsToUpdate( fileName, binsToPlot, plottingDir, args.plotFormats )
+    print(' - %d bin(s) to plot' % len(binsToPlot))
+
+    def parallel_plot(tnpBin):
+        tnpRoot.histPlotterFormats( fileName, tnpBin, plottingDir, args.plotFormats )
+    pool = Pool()
+    pool.map(parallel_plot, binsToPlot)
+    pool.close()
 
     print(' ===> Plots saved in <=======')
 #    print 'localhost/%s/' % plottingDir
@@ -206,38 +353,56 @@ if args.sumUp:
     if not tnpConf.samplesDef['tagSel'] is None:
         info['tagSel'   ] = tnpConf.samplesDef['tagSel'].histFile
 
-    effis = None
+    import libPython.efficiencyUtils as effUtil
+    effStore = effUtil.efficiencyStore( tnpBins )
+    ### the txt format has 2 variables, any bining goes in the npz store
+    writeTxt = len(tnpBins['vars']) == 2
+
+    ### all bins at once, each file is opened once
+    effisBins = tnpRoot.getAllEffiBins( info, tnpBins['bins'] )
+    effStore.fillBins( effisBins )
+
     effFileName ='%s/egammaEffi.txt' % outputDirectory 
-    fOut = open( effFileName,'w')
+    if writeTxt:
+        fOut = open( effFileName,'w')
     
-    for ib in range(len(tnpBins['bins'])):
-        effis = tnpRoot.getAllEffi( info, tnpBins['bins'][ib] )
-
-        ### formatting assuming 2D bining -- to be fixed        
-        v1Range = tnpBins['bins'][ib]['title'].split(';')[1].split('<')
-        v2Range = tnpBins['bins'][ib]['title'].split(';')[2].split('<')
-        if ib == 0 :
-            astr = '### var1 : %s' % v1Range[1]
-            print(astr)
-            fOut.write( astr + '\n' )
-            astr = '### var2 : %s' % v2Range[1]
+        for ib in range(len(tnpBins['bins'])):
+            effis = dict( (sample,effisBins[sample][ib]) for sample in effisBins.keys() )
+
+            ### formatting assuming 2D bining
+            v1Range = tnpBins['bins'][ib]['title'].split(';')[1].split('<')
+            v2Range = tnpBins['bins'][ib]['title'].split(';')[2].split('<')
+            if ib == 0 :
+                astr = '### var1 : %s' % v1Range[1]
+                print(astr)
+                fOut.write( astr + '\n' )
+                astr = '### var2 : %s' % v2Range[1]
+                print(astr)
+                fOut.write( astr + '\n' )
+            
+            astr =  '%+8.5f\t%+8.5f\t%+8.5f\t%+8.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f' % (
+                float(v1Range[0]), float(v1Range[2]),
+                float(v2Range[0]), float(v2Range[2]),
+                effis['dataNominal'][0],effis['dataNominal'][1],
+                effis['mcNominal'  ][0],effis['mcNominal'  ][1],
+                effis['dataAltBkg' ][0],
+                effis['dataAltSig' ][0],
+                effis['mcAlt' ][0],
+                effis['tagSel'][0],
+                )
             print(astr)
             fOut.write( astr + '\n' )
-            
-        astr =  '%+8.5f\t%+8.5f\t%+8.5f\t%+8.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f\t%5.5f' % (
-            float(v1Range[0]), float(v1Range[2]),
-            float(v2Range[0]), float(v2Range[2]),
-            effis['dataNominal'][0],effis['dataNominal'][1],
-            effis['mcNominal'  ][0],effis['mcNominal'  ][1],
-            effis['dataAltBkg' ][0],
-            effis['dataAltSig' ][0],
-            effis['mcAlt' ][0],
-            effis['tagSel'][0],
-            )
-        print(astr)
-        fOut.write( astr + '\n' )
-    fOut.close()
-
-    print('Effis saved in file : ',  effFileName)
+        fOut.close()
+        print('Effis saved in file : ',  effFileName)
+
+    effStoreName = '%s/egammaEffi.npz' % outputDirectory
+    effStore.save( effStoreName )
+    print('Effis saved in file : ',  effStoreName)
+
     import libPython.EGammaID_scaleFactors as egm_sf
-    egm_sf.doEGM_SFs(effFileName,sampleToFit.lumi)
+    if writeTxt:
+        egm_sf.doEGM_SFs(effFileName,sampleToFit.lumi)
+        ### the npz store must give the same scale factors
+        egm_sf.checkEGM_SFs_nD(effFileName,effStoreName)
+    else:
+        egm_sf.doEGM_SFs_nD(effStoreName)